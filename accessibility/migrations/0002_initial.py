@@ -0,0 +1,29 @@
+# Generated by Django 4.2.23 on 2026-10-17 16:15
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('accessibility', '0001_initial'),
+        ('employee', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='defaultaccessibility',
+            name='employees',
+            field=models.ManyToManyField(blank=True, related_name='default_accessibility', to='employee.employee'),
+        ),
+        migrations.AddField(
+            model_name='defaultaccessibility',
+            name='modified_by',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By'),
+        ),
+    ]
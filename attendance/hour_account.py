@@ -0,0 +1,237 @@
+"""
+hour_account.py
+
+Hour account (AttendanceOverTime) maintenance.
+
+The worked and pending hours of an hour account are the balance of the
+validated attendances of the month that are not on an approved leave: every
+attendance adds its minimum hour to the required hours and its worked hours,
+capped at the minimum hour, to the worked hours. The overtime of an hour
+account is kept from the approved overtime deltas of its attendances, as it
+can also be edited by hand.
+
+`Attendance.save` and `Attendance.delete` update the hour account of the
+attendance month. Inside an atomic block the overtime is added right away and
+the worked and pending hours are recomputed once the transaction commits, once
+per employee month, so validating a month of attendances recomputes every hour
+account once. `defer_hour_accounts()` coalesces the updates of a block the
+same way outside of a transaction.
+"""
+
+import calendar
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import date
+
+from django.apps import apps
+from django.db import transaction
+
+from attendance.methods.utils import format_time, strtime_seconds
+from horilla.methods import get_horilla_model_class
+
+_deferred_locals = threading.local()
+
+
+def hour_account_key(employee_id, attendance_date):
+    """
+    (employee id, year, month) of the hour account of an attendance
+    """
+    return (employee_id, attendance_date.year, attendance_date.month)
+
+
+def month_hour_balances(year, month, employee_ids=None):
+    """
+    Recompute the hour balances of a month from its attendances.
+
+    Returns:
+        dict: employee id -> (worked seconds, pending seconds, approved
+        overtime seconds)
+    """
+    from attendance.models import Attendance
+
+    start_date = date(year, month, 1)
+    end_date = date(year, month, calendar.monthrange(year, month)[1])
+    attendances = Attendance.objects.entire().filter(
+        attendance_date__range=(start_date, end_date)
+    )
+    leaves = defaultdict(list)
+    if apps.is_installed("leave"):
+        LeaveRequest = get_horilla_model_class(app_label="leave", model="leaverequest")
+        leave_requests = LeaveRequest.objects.entire().filter(
+            status="approved", start_date__lte=end_date, end_date__gte=start_date
+        )
+        if employee_ids is not None:
+            leave_requests = leave_requests.filter(employee_id__in=employee_ids)
+        for employee_id, leave_start, leave_end in leave_requests.values_list(
+            "employee_id", "start_date", "end_date"
+        ):
+            leaves[employee_id].append((leave_start, leave_end or leave_start))
+    if employee_ids is not None:
+        attendances = attendances.filter(employee_id__in=employee_ids)
+
+    balances = defaultdict(lambda: [0, 0, 0])
+    for (
+        employee_id,
+        attendance_date,
+        minimum_hour,
+        at_work_second,
+        validated,
+        approved_overtime_second,
+    ) in attendances.values_list(
+        "employee_id",
+        "attendance_date",
+        "minimum_hour",
+        "at_work_second",
+        "attendance_validated",
+        "approved_overtime_second",
+    ):
+        balance = balances[employee_id]
+        balance[2] += approved_overtime_second or 0
+        if not validated or any(
+            leave_start <= attendance_date <= leave_end
+            for leave_start, leave_end in leaves.get(employee_id, [])
+        ):
+            continue
+        required_second = strtime_seconds(minimum_hour)
+        balance[0] += min(required_second, at_work_second or 0)
+        balance[1] += required_second
+    return {
+        employee_id: (worked, required - worked, overtime)
+        for employee_id, (worked, required, overtime) in balances.items()
+    }
+
+
+def apply_hour_accounts(overtime_deltas):
+    """
+    Recompute the worked and pending hours of the hour accounts and add the
+    overtime deltas, creating the missing hour accounts.
+
+    Args:
+        overtime_deltas (dict): hour account key -> approved overtime seconds
+        to add
+    """
+    from attendance.models import AttendanceOverTime
+
+    months = defaultdict(set)
+    for employee_id, year, month in overtime_deltas:
+        months[(year, month)].add(employee_id)
+
+    for (year, month), employee_ids in months.items():
+        month_name = calendar.month_name[month].lower()
+        balances = month_hour_balances(year, month, employee_ids)
+        accounts = {
+            account.employee_id_id: account
+            for account in AttendanceOverTime.objects.entire().filter(
+                employee_id__in=employee_ids, month=month_name, year=str(year)
+            )
+        }
+        for employee_id in employee_ids:
+            account = accounts.get(employee_id)
+            if account is None:
+                account = AttendanceOverTime(
+                    employee_id_id=employee_id, month=month_name, year=str(year)
+                )
+            worked_second, pending_second, _overtime = balances.get(
+                employee_id, (0, 0, 0)
+            )
+            account.worked_hours = format_time(worked_second)
+            account.pending_hours = format_time(pending_second)
+            overtime_delta = overtime_deltas[(employee_id, year, month)]
+            if overtime_delta:
+                account.overtime = format_time(
+                    strtime_seconds(account.overtime) + overtime_delta
+                )
+            account.save()
+
+
+def add_hour_account_overtime(overtime_deltas):
+    """
+    Add the approved overtime deltas to the hour accounts, creating the
+    missing hour accounts, without recomputing their worked and pending hours
+    """
+    from attendance.models import AttendanceOverTime
+
+    for (employee_id, year, month), overtime_delta in overtime_deltas.items():
+        if not overtime_delta:
+            continue
+        account, _created = AttendanceOverTime.objects.entire().get_or_create(
+            employee_id_id=employee_id,
+            month=calendar.month_name[month].lower(),
+            year=str(year),
+        )
+        account.overtime = format_time(
+            strtime_seconds(account.overtime) + overtime_delta
+        )
+        account.save()
+
+
+class PendingHourAccounts(set):
+    """
+    Keys of the hour accounts updated in a transaction, recomputed once it
+    commits
+    """
+
+    def apply(self):
+        if getattr(_deferred_locals, "pending", None) is self:
+            _deferred_locals.pending = None
+        apply_hour_accounts(dict.fromkeys(self, 0))
+
+
+def queue_hour_accounts(overtime_deltas):
+    """
+    Update the hour accounts. Inside an atomic block the overtime deltas are
+    added right away, so they roll back with the attendances, and the worked
+    and pending hours are recomputed once the transaction commits, once per
+    employee month for the whole transaction.
+    """
+    connection = transaction.get_connection()
+    if not connection.in_atomic_block:
+        apply_hour_accounts(overtime_deltas)
+        return
+    add_hour_account_overtime(overtime_deltas)
+    pending = getattr(_deferred_locals, "pending", None)
+    # The commit hook is dropped when the transaction, or the savepoint it was
+    # registered in, rolls back. A recompute left queued by a rolled back
+    # savepoint reads the committed attendances, so it is harmless.
+    if pending is None or not any(
+        hook[1] == pending.apply for hook in connection.run_on_commit
+    ):
+        pending = PendingHourAccounts()
+        _deferred_locals.pending = pending
+        transaction.on_commit(pending.apply)
+    pending.update(overtime_deltas)
+
+
+def update_hour_account(employee_id, attendance_date, overtime_delta=0):
+    """
+    Update the hour account of the attendance month, once for the whole
+    transaction or block inside `defer_hour_accounts()`
+    """
+    key = hour_account_key(employee_id, attendance_date)
+    deferred = getattr(_deferred_locals, "overtime_deltas", None)
+    if deferred is not None:
+        deferred[key] = deferred.get(key, 0) + overtime_delta
+        return
+    queue_hour_accounts({key: overtime_delta})
+
+
+@contextmanager
+def defer_hour_accounts():
+    """
+    Coalesce the hour account updates of the attendances saved in the block
+    (or the decorated function) into one update per employee month, applied
+    when the block exits
+    """
+    if getattr(_deferred_locals, "overtime_deltas", None) is not None:
+        # Nested, the outermost block applies the updates
+        yield
+        return
+    _deferred_locals.overtime_deltas = {}
+    try:
+        yield
+    finally:
+        overtime_deltas = _deferred_locals.overtime_deltas
+        _deferred_locals.overtime_deltas = None
+        if overtime_deltas and not transaction.get_connection().needs_rollback:
+            queue_hour_accounts(overtime_deltas)
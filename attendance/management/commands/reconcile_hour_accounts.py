@@ -0,0 +1,126 @@
+import calendar
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from attendance.hour_account import month_hour_balances
+from attendance.methods.utils import MONTH_MAPPING, format_time, strtime_seconds
+from attendance.models import Attendance, AttendanceOverTime
+
+
+class Command(BaseCommand):
+    help = (
+        "Verify the hour accounts against a full recompute from the attendances "
+        "of their month, and optionally correct them"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--year", type=int, help="Only check this year")
+        parser.add_argument(
+            "--month", type=int, help="Only check this month (1-12), with --year"
+        )
+        parser.add_argument(
+            "--employee",
+            type=int,
+            action="append",
+            help="Employee id to check, repeatable",
+        )
+        parser.add_argument(
+            "--fix",
+            action="store_true",
+            help="Rewrite the hour accounts that differ, the overtime included "
+            "(hand edited overtime is replaced by the approved overtime)",
+        )
+
+    def handle(self, *args, **options):
+        if options["month"] and not options["year"]:
+            raise CommandError("--month requires --year.")
+
+        accounts = AttendanceOverTime.objects.entire().all()
+        attendances = Attendance.objects.entire().all()
+        if options["year"]:
+            accounts = accounts.filter(year=str(options["year"]))
+            attendances = attendances.filter(attendance_date__year=options["year"])
+        if options["month"]:
+            accounts = accounts.filter(
+                month=calendar.month_name[options["month"]].lower()
+            )
+            attendances = attendances.filter(attendance_date__month=options["month"])
+        if options["employee"]:
+            accounts = accounts.filter(employee_id__in=options["employee"])
+            attendances = attendances.filter(employee_id__in=options["employee"])
+
+        months = defaultdict(dict)
+        for account in accounts:
+            month = MONTH_MAPPING.get(account.month)
+            if month is None or not str(account.year).isdigit():
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"Hour account {account.pk}: invalid month {account.month} "
+                        f"{account.year}"
+                    )
+                )
+                continue
+            months[(int(account.year), month)][account.employee_id_id] = account
+        for attendance_date in attendances.dates("attendance_date", "month"):
+            months.setdefault((attendance_date.year, attendance_date.month), {})
+
+        checked = 0
+        mismatches = 0
+        for (year, month), month_accounts in sorted(months.items()):
+            balances = month_hour_balances(year, month, options["employee"])
+            with transaction.atomic():
+                for employee_id in sorted(set(month_accounts) | set(balances)):
+                    checked += 1
+                    worked, pending, overtime = balances.get(employee_id, (0, 0, 0))
+                    expected = {
+                        "worked_hours": format_time(worked),
+                        "pending_hours": format_time(pending),
+                        "overtime": format_time(overtime),
+                    }
+                    account = month_accounts.get(employee_id)
+                    if account is None:
+                        differences = {"account": ("missing", "created")}
+                        account = AttendanceOverTime(
+                            employee_id_id=employee_id,
+                            month=calendar.month_name[month].lower(),
+                            year=str(year),
+                        )
+                    else:
+                        differences = {
+                            field: (getattr(account, field), value)
+                            for field, value in expected.items()
+                            if strtime_seconds(getattr(account, field) or "00:00")
+                            != strtime_seconds(value)
+                        }
+                    if not differences:
+                        continue
+                    mismatches += 1
+                    self.stdout.write(
+                        f"Employee {employee_id} {calendar.month_name[month]} {year}: "
+                        + ", ".join(
+                            f"{field} {current} != {value}"
+                            for field, (current, value) in differences.items()
+                        )
+                    )
+                    if options["fix"]:
+                        for field, value in expected.items():
+                            setattr(account, field, value)
+                        account.save()
+
+        if not mismatches:
+            self.stdout.write(
+                self.style.SUCCESS(f"{checked} hour accounts match the attendances.")
+            )
+        elif options["fix"]:
+            self.stdout.write(
+                self.style.SUCCESS(f"{mismatches} of {checked} hour accounts fixed.")
+            )
+        else:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{mismatches} of {checked} hour accounts differ, "
+                    "run with --fix to correct them."
+                )
+            )
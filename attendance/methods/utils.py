@@ -5,7 +5,7 @@ This module is used write custom methods
 """
 
 import calendar
-from datetime import datetime, time, timedelta
+from datetime import date, datetime, time, timedelta
 
 import pandas as pd
 from django.core.exceptions import ValidationError
@@ -15,8 +15,8 @@ from django.db.models import Q, Sum
 from django.http import HttpResponse
 from django.utils.translation import gettext_lazy as _
 
-from base.methods import get_pagination
-from base.models import WEEK_DAYS, CompanyLeaves, Holidays
+from base.methods import get_date_range, get_pagination
+from base.work_calendar import get_work_calendar
 from employee.models import Employee
 from horilla.horilla_settings import HORILLA_DATE_FORMATS, HORILLA_TIME_FORMATS
 
@@ -373,58 +373,12 @@ def get_employee_last_name(attendance):
 
 
 def attendance_day_checking(attendance_date, minimum_hour):
-    # Convert the string to a datetime object
-    attendance_datetime = datetime.strptime(attendance_date, "%Y-%m-%d")
-
-    # Extract name of the day
-    attendance_day = attendance_datetime.strftime("%A")
-
-    # Taking all holidays into a list
-    leaves = []
-    holidays = Holidays.objects.all()
-    for holi in holidays:
-        start_date = holi.start_date
-        end_date = holi.end_date
-
-        # Convert start_date and end_date to datetime objects
-        start_date = datetime.strptime(str(start_date), "%Y-%m-%d")
-        end_date = datetime.strptime(str(end_date), "%Y-%m-%d")
-
-        # Add dates in between start date and end date including both
-        current_date = start_date
-        while current_date <= end_date:
-            leaves.append(current_date.strftime("%Y-%m-%d"))
-            current_date += timedelta(days=1)
-
-    # Checking attendance date is in holiday list, if found making the minimum hour to 00:00
-    for leave in leaves:
-        if str(leave) == str(attendance_date):
-            minimum_hour = "00:00"
-            break
-
-    # Making a dictonary contains week day value and leave day pairs
-    company_leaves = {}
-    company_leave = CompanyLeaves.objects.all()
-    for com_leave in company_leave:
-        a = dict(WEEK_DAYS).get(com_leave.based_on_week_day)
-        b = com_leave.based_on_week
-        company_leaves[b] = a
-
-    # Checking the attendance date is in which week
-    week_in_month = str(((attendance_datetime.day - 1) // 7 + 1) - 1)
-
-    # Checking the attendance date is in the company leave or not
-    for pairs in company_leaves.items():
-        # For all weeks based_on_week is None
-        if str(pairs[0]) == "None":
-            if str(pairs[1]) == str(attendance_day):
-                minimum_hour = "00:00"
-                break
-        # Checking with based_on_week and attendance_date week
-        if str(pairs[0]) == week_in_month:
-            if str(pairs[1]) == str(attendance_day):
-                minimum_hour = "00:00"
-                break
+    """
+    This method is used to make the minimum hour 00:00 on holidays and company leaves
+    """
+    attendance_date = datetime.strptime(str(attendance_date), "%Y-%m-%d").date()
+    if not get_work_calendar().is_working_day(attendance_date):
+        minimum_hour = "00:00"
     return minimum_hour
 
 
@@ -438,42 +392,17 @@ def paginator_qry(qryset, page_number):
 
 
 def monthly_leave_days(month, year):
-    leave_dates = []
-    holidays = Holidays.objects.filter(start_date__month=month, start_date__year=year)
-    leave_dates += list(holidays.values_list("start_date", flat=True))
-
-    company_leaves = CompanyLeaves.objects.all()
-    for company_leave in company_leaves:
-        year = year
-        month = month
-        based_on_week = company_leave.based_on_week
-        based_on_week_day = company_leave.based_on_week_day
-        if based_on_week != None:
-            calendar.setfirstweekday(6)
-            month_calendar = calendar.monthcalendar(year, month)
-            weeks = month_calendar[int(based_on_week)]
-            weekdays_in_weeks = [day for day in weeks if day != 0]
-            for day in weekdays_in_weeks:
-                date_name = datetime.strptime(
-                    f"{year}-{month:02}-{day:02}", "%Y-%m-%d"
-                ).date()
-                if (
-                    date_name.weekday() == int(based_on_week_day)
-                    and date_name not in leave_dates
-                ):
-                    leave_dates.append(date_name)
-        else:
-            calendar.setfirstweekday(0)
-            month_calendar = calendar.monthcalendar(year, month)
-            for week in month_calendar:
-                if week[int(based_on_week_day)] != 0:
-                    date_name = datetime.strptime(
-                        f"{year}-{month:02}-{week[int(based_on_week_day)]:02}",
-                        "%Y-%m-%d",
-                    ).date()
-                    if date_name not in leave_dates:
-                        leave_dates.append(date_name)
-    return leave_dates
+    """
+    This method is used to return the holiday and company leave dates of the month
+    """
+    month_start = date(year, month, 1)
+    month_end = date(year, month, calendar.monthrange(year, month)[1])
+    work_calendar = get_work_calendar()
+    return [
+        leave_date
+        for leave_date in get_date_range(month_start, month_end)
+        if not work_calendar.is_working_day(leave_date)
+    ]
 
 
 def validate_time_in_minutes(value):
@@ -13,10 +13,14 @@ from datetime import date, datetime, timedelta
 from django.apps import apps
 from django.core.exceptions import ValidationError
 from django.db import models
-from django.db.models import Q
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
+from attendance.hour_account import (
+    apply_hour_accounts,
+    hour_account_key,
+    update_hour_account,
+)
 from attendance.methods.utils import (
     MONTH_MAPPING,
     attendance_date_validate,
@@ -28,8 +32,8 @@ from attendance.methods.utils import (
     validate_time_in_minutes,
 )
 from base.horilla_company_manager import HorillaCompanyManager
-from base.methods import is_company_leave, is_holiday
 from base.models import Company, EmployeeShift, EmployeeShiftDay, WorkType
+from base.work_calendar import get_work_calendar
 from employee.models import Employee
 from horilla.methods import get_horilla_model_class
 from horilla.models import HorillaModel, upload_path
@@ -306,13 +310,15 @@ class Attendance(HorillaModel):
         ).order_by("id")
         return activities.last()
 
-    def get_at_work_from_activities(self):
+    def get_at_work_from_activities(self, activities=None):
         """
-        This method is used to retun the at work calculated from the activities
+        This method is used to retun the at work calculated from the activities,
+        the activities of the attendance are queried when not given
         """
-        activities = AttendanceActivity.objects.filter(
-            attendance_date=self.attendance_date, employee_id=self.employee_id
-        ).order_by("clock_in")
+        if activities is None:
+            activities = AttendanceActivity.objects.filter(
+                attendance_date=self.attendance_date, employee_id=self.employee_id
+            ).order_by("clock_in")
         at_work_seconds = 0
         now = datetime.now()
         for activity in activities:
@@ -345,7 +351,7 @@ class Attendance(HorillaModel):
         """
         Set minimum_hour to 00:00 if the attendance date falls on a holiday or company leave.
         """
-        if is_holiday(self.attendance_date) or is_company_leave(self.attendance_date):
+        if not get_work_calendar().is_working_day(self.attendance_date):
             self.minimum_hour = "00:00"
             self.is_holiday = True
 
@@ -366,7 +372,12 @@ class Attendance(HorillaModel):
         self.overtime_second = strtime_seconds(self.attendance_overtime)
 
     def handle_overtime_conditions(self):
-        condition = AttendanceValidationCondition.objects.first()
+        self.apply_overtime_conditions(AttendanceValidationCondition.objects.first())
+
+    def apply_overtime_conditions(self, condition):
+        """
+        Apply the overtime cutoff and auto approval of the validation condition
+        """
         if self.is_validate_request:
             self.is_validate_request_approved = self.attendance_validated = False
 
@@ -389,45 +400,48 @@ class Attendance(HorillaModel):
         self.attendance_day = EmployeeShiftDay.objects.get(
             day=self.attendance_date.strftime("%A").lower()
         )
-        prev_attendance_approved = False
         self.adjust_minimum_hour()
 
         # Handle overtime cutoff and auto-approval
         self.handle_overtime_conditions()
 
+        previous = None
         if self.pk is not None:
-            # Get the previous values of the boolean field
-            prev_state = Attendance.objects.get(pk=self.pk)
-            prev_attendance_approved = prev_state.attendance_overtime_approve
-
-        # super().save(*args, **kwargs)  #commend this line, it take too much time to complete
-        employee_ot = self.employee_id.employee_overtime.filter(
-            month=self.attendance_date.strftime("%B").lower(),
-            year=self.attendance_date.year,
-        ).first()
-        if employee_ot:
-            # Update if exists
-            self.update_ot(employee_ot)
-        else:
-            # Create and update in one call
-            employee_ot = self.create_ot()
-            self.update_ot(employee_ot)
-        approved = self.attendance_overtime_approve
-        attendance_account = self.employee_id.employee_overtime.filter(
-            month=self.attendance_date.strftime("%B").lower(),
-            year=self.attendance_date.year,
-        ).first()
-        total_ot_seconds = attendance_account.overtime_second
-        if approved and prev_attendance_approved is False:
+            previous = (
+                Attendance.objects.entire()
+                .filter(pk=self.pk)
+                .values(
+                    "employee_id",
+                    "attendance_date",
+                    "attendance_overtime_approve",
+                    "approved_overtime_second",
+                )
+                .first()
+            )
+
+        overtime_delta = 0
+        if self.attendance_overtime_approve and not (
+            previous and previous["attendance_overtime_approve"]
+        ):
             self.approved_overtime_second = self.overtime_second
-            total_ot_seconds = total_ot_seconds + self.approved_overtime_second
-        elif not approved:
-            total_ot_seconds = total_ot_seconds - self.approved_overtime_second
+            overtime_delta = self.approved_overtime_second
+        elif not self.attendance_overtime_approve:
+            overtime_delta = -self.approved_overtime_second
             self.approved_overtime_second = 0
-        attendance_account.overtime = format_time(total_ot_seconds)
-        attendance_account.save()
         super().save(*args, **kwargs)
 
+        if previous and hour_account_key(
+            previous["employee_id"], previous["attendance_date"]
+        ) != hour_account_key(self.employee_id_id, self.attendance_date):
+            # Moved to another hour account, with its approved overtime
+            update_hour_account(
+                previous["employee_id"],
+                previous["attendance_date"],
+                -previous["approved_overtime_second"],
+            )
+            overtime_delta = self.approved_overtime_second
+        update_hour_account(self.employee_id_id, self.attendance_date, overtime_delta)
+
     def serialize(self):
         """
         Used to serialize attendance instance
@@ -460,91 +474,26 @@ class Attendance(HorillaModel):
             AttendanceActivity.objects.filter(
                 attendance_date=self.attendance_date, employee_id=self.employee_id
             ).delete()
-            employee_ot = self.employee_id.employee_overtime.filter(
-                month=self.attendance_date.strftime("%B").lower(),
-                year=self.attendance_date.strftime("%Y"),
-            )
-        if employee_ot.exists():
-            self.update_ot(employee_ot.first())
         # Call the superclass delete() method to delete the object
-        super().delete(*args, **kwargs)
+        result = super().delete(*args, **kwargs)
 
         # Perform additional operations after deleting the object
-
-    def create_ot(self):
-        """
-        Create a new Hour Account instance if it doesn't exist for a specific month and year.
-        Returns:
-            AttendanceOverTime: The created or fetched AttendanceOverTime instance.
-        """
-        # Create or fetch the AttendanceOverTime instance
-        employee_ot, created = AttendanceOverTime.objects.get_or_create(
-            employee_id=self.employee_id,
-            month=self.attendance_date.strftime("%B").lower(),
-            year=self.attendance_date.year,
+        update_hour_account(
+            self.employee_id_id, self.attendance_date, -self.approved_overtime_second
         )
-
-        # Update only if the fields are available
-        if self.attendance_overtime_approve:
-            employee_ot.overtime = self.attendance_overtime
-
-        if self.attendance_validated:
-            employee_ot.hour_account = self.attendance_worked_hour
-
-        employee_ot.save()
-        return employee_ot
+        return result
 
     def update_ot(self, employee_ot):
         """
-        Update the hour account for the given employee.
+        Recompute the worked and pending hours of the given hour account.
 
         Args:
             employee_ot (obj): AttendanceOverTime instance
         """
-        if apps.is_installed("leave"):
-            approved_leave_requests = self.employee_id.leaverequest_set.filter(
-                start_date__lte=self.attendance_date,
-                end_date__gte=self.attendance_date,
-                status="approved",
-            )
-        else:
-            approved_leave_requests = []
-
-        # Create exclude condition using Q objects
-        exclude_condition = Q()
-        if approved_leave_requests:
-            # Combine multiple conditions for the exclude clause
-            for leave in approved_leave_requests:
-                exclude_condition |= Q(
-                    attendance_date__range=(leave.start_date, leave.end_date)
-                )
-
-        # Filter month attendances in a single query
-        month_attendances = (
-            Attendance.objects.filter(
-                employee_id=self.employee_id,
-                attendance_date__month=self.attendance_date.month,
-                attendance_date__year=self.attendance_date.year,
-                attendance_validated=True,
-            )
-            .exclude(exclude_condition)
-            .values("minimum_hour", "at_work_second")
+        apply_hour_accounts(
+            {hour_account_key(employee_ot.employee_id_id, self.attendance_date): 0}
         )
-
-        # Calculate hour balance and hours pending in a single loop
-        hour_balance = 0
-        minimum_hour_second = 0
-        for attendance in month_attendances:
-            required_work_second = strtime_seconds(attendance["minimum_hour"])
-            at_work_second = min(required_work_second, attendance["at_work_second"])
-            hour_balance += at_work_second
-            minimum_hour_second += required_work_second
-
-        hours_pending = minimum_hour_second - hour_balance
-        employee_ot.worked_hours = format_time(hour_balance)
-        employee_ot.pending_hours = format_time(hours_pending)
-        employee_ot.save()
-
+        employee_ot.refresh_from_db()
         return employee_ot
 
     def clean(self, *args, **kwargs):
@@ -14,10 +14,9 @@ from employee.models import Employee
 from horilla.methods import get_horilla_model_class
 
 
-@receiver(post_save, sender=Attendance)
-def attendance_post_save(sender, instance, **kwargs):
+def update_attendance_work_record(work_record, instance):
     """
-    Handle post-save actions for Attendance model.
+    Fill the work record of the attendance day from the attendance
     """
     min_hour_second = strtime_seconds(instance.minimum_hour)
     at_work_second = strtime_seconds(instance.attendance_worked_hour)
@@ -30,20 +29,6 @@ def attendance_post_save(sender, instance, **kwargs):
         status, message = "HDP", _("Incomplete minimum hour")
     else:
         status, message = "ABS", _("Incomplete half minimum hour")
-    try:
-        work_record, created = WorkRecords.objects.get_or_create(
-            date=instance.attendance_date,
-            employee_id=instance.employee_id,
-        )
-    except WorkRecords.MultipleObjectsReturned:
-        work_records = WorkRecords.objects.filter(
-            date=instance.attendance_date,
-            employee_id=instance.employee_id,
-        )
-        work_record = work_records.first()
-        work_records.exclude(id=work_record.id).delete()
-    except Exception as e:
-        print(e)
 
     work_record.employee_id = instance.employee_id
     work_record.date = instance.attendance_date
@@ -72,6 +57,30 @@ def attendance_post_save(sender, instance, **kwargs):
 
     work_record.work_record_type = status
     work_record.message = message
+    return work_record
+
+
+@receiver(post_save, sender=Attendance)
+def attendance_post_save(sender, instance, **kwargs):
+    """
+    Handle post-save actions for Attendance model.
+    """
+    try:
+        work_record, created = WorkRecords.objects.get_or_create(
+            date=instance.attendance_date,
+            employee_id=instance.employee_id,
+        )
+    except WorkRecords.MultipleObjectsReturned:
+        work_records = WorkRecords.objects.filter(
+            date=instance.attendance_date,
+            employee_id=instance.employee_id,
+        )
+        work_record = work_records.first()
+        work_records.exclude(id=work_record.id).delete()
+    except Exception as e:
+        print(e)
+
+    update_attendance_work_record(work_record, instance)
     work_record.save()
 
 
@@ -1,3 +1,120 @@
+"""test cases"""
+
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import transaction
 from django.test import TestCase
 
-# Create your tests here.
+from attendance.hour_account import PendingHourAccounts, defer_hour_accounts
+from attendance.models import Attendance, AttendanceOverTime
+from base.models import EmployeeShiftDay
+from employee.models import Employee
+
+DAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+
+class HourAccountTest(TestCase):
+    """
+    The hour accounts kept up to date by the attendance saves and deletes
+    match a full recompute from the attendances of their month
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        # The shift days are created on app ready, outside the test database
+        for day in DAYS:
+            EmployeeShiftDay.objects.get_or_create(day=day)
+        cls.employee = Employee.objects.create(
+            employee_first_name="Hour",
+            employee_last_name="Account",
+            email="hour.account@example.com",
+            phone="9999999999",
+        )
+
+    def create_attendance(self, attendance_date, worked_hour="09:00", **fields):
+        attendance = Attendance(
+            employee_id=self.employee,
+            attendance_date=attendance_date,
+            attendance_worked_hour=worked_hour,
+            minimum_hour="08:00",
+            attendance_validated=True,
+            **fields,
+        )
+        attendance.save()
+        return attendance
+
+    def assertReconciled(self):
+        stdout = StringIO()
+        call_command("reconcile_hour_accounts", stdout=stdout)
+        self.assertIn("hour accounts match the attendances", stdout.getvalue())
+
+    def test_save_delete_and_move_month(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                first = self.create_attendance(date(2024, 1, 2))
+                self.create_attendance(
+                    date(2024, 1, 3), "10:00", attendance_overtime_approve=True
+                )
+                moved = self.create_attendance(
+                    date(2024, 1, 4), attendance_overtime_approve=True
+                )
+        self.assertReconciled()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                first.attendance_worked_hour = "07:00"
+                first.save()
+                moved.attendance_date = date(2024, 2, 1)
+                moved.save()
+        self.assertReconciled()
+        self.assertTrue(
+            AttendanceOverTime.objects.entire()
+            .filter(employee_id=self.employee, month="february", year="2024")
+            .exists()
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                first.delete()
+                moved.attendance_overtime_approve = False
+                moved.save()
+        self.assertReconciled()
+
+    def test_updates_coalesce_per_transaction(self):
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with transaction.atomic():
+                for day in range(1, 11):
+                    self.create_attendance(date(2024, 3, day))
+                with defer_hour_accounts():
+                    self.create_attendance(date(2024, 4, 1))
+        recomputes = [
+            callback
+            for callback in callbacks
+            if isinstance(getattr(callback, "__self__", None), PendingHourAccounts)
+        ]
+        self.assertEqual(len(recomputes), 1)
+        self.assertReconciled()
+
+    def test_rolled_back_updates_are_dropped(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with transaction.atomic():
+                self.create_attendance(
+                    date(2024, 5, 2), "10:00", attendance_overtime_approve=True
+                )
+                try:
+                    with transaction.atomic():
+                        self.create_attendance(
+                            date(2024, 6, 3), "10:00", attendance_overtime_approve=True
+                        )
+                        raise ValueError
+                except ValueError:
+                    pass
+        # The overtime of the rolled back attendance is not kept
+        self.assertFalse(
+            AttendanceOverTime.objects.entire()
+            .filter(employee_id=self.employee, month="june", overtime_second__gt=0)
+            .exists()
+        )
+        self.assertReconciled()
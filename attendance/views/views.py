@@ -73,6 +73,7 @@ from attendance.forms import (
     LateComeEarlyOutExportForm,
     NewRequestForm,
 )
+from attendance.hour_account import defer_hour_accounts
 from attendance.methods.utils import (
     Request,
     attendance_day_checking,
@@ -1295,6 +1296,7 @@ def validation_condition_delete(request, obj_id):
 @login_required
 @require_http_methods(["POST"])
 @manager_can_enter("attendance.change_attendance")
+@defer_hour_accounts()
 def validate_bulk_attendance(request):
     """
     This method is used to validate a bulk of attendances.
@@ -1470,6 +1472,7 @@ def approve_overtime(request, obj_id):
 
 @login_required
 @manager_can_enter("attendance.change_attendance")
+@defer_hour_accounts()
 def approve_bulk_overtime(request):
     """
     This method is used to approve bulk of attendance
@@ -6,23 +6,17 @@ This module is used to register context processor`
 
 import re
 
-from django.apps import apps
 from django.contrib import messages
 from django.http import HttpResponse
 from django.urls import path, reverse
 from django.utils.translation import gettext_lazy as _
 
-from base.models import Company, TrackLateComeEarlyOut
+from base.models import Company
+from base.settings_snapshot import get_settings_snapshot
 from base.urls import urlpatterns
-from employee.models import (
-    Employee,
-    EmployeeGeneralSetting,
-    EmployeeWorkInformation,
-    ProfileEditFeature,
-)
+from employee.models import Employee, EmployeeWorkInformation
 from horilla import horilla_apps
 from horilla.decorators import hx_request_required, login_required, permission_required
-from horilla.methods import get_horilla_model_class
 
 
 class AllCompany:
@@ -52,10 +46,9 @@ def get_companies(request):
     """
     This method will return the history additional field form
     """
-    companies = list(
-        [company.id, company.company, company.icon.url, False]
-        for company in Company.objects.all()
-    )
+    companies = [
+        [*company, False] for company in get_settings_snapshot(request)["companies"]
+    ]
     companies = [
         [
             "all",
@@ -184,15 +177,7 @@ def resignation_request_enabled(request):
     """
     Check weather resignation_request enabled of not in offboarding
     """
-    enabled_resignation_request = False
-    first = None
-    if apps.is_installed("offboarding"):
-        OffboardingGeneralSetting = get_horilla_model_class(
-            app_label="offboarding", model="offboardinggeneralsetting"
-        )
-        first = OffboardingGeneralSetting.objects.first()
-    if first:
-        enabled_resignation_request = first.resignation_request
+    enabled_resignation_request = get_settings_snapshot(request)["resignation_request"]
     return {"enabled_resignation_request": enabled_resignation_request}
 
 
@@ -200,15 +185,7 @@ def timerunner_enabled(request):
     """
     Check weather resignation_request enabled of not in offboarding
     """
-    first = None
-    enabled_timerunner = True
-    if apps.is_installed("attendance"):
-        AttendanceGeneralSetting = get_horilla_model_class(
-            app_label="attendance", model="attendancegeneralsetting"
-        )
-        first = AttendanceGeneralSetting.objects.first()
-    if first:
-        enabled_timerunner = first.time_runner
+    enabled_timerunner = get_settings_snapshot(request)["time_runner"]
     return {"enabled_timerunner": enabled_timerunner}
 
 
@@ -216,15 +193,7 @@ def intial_notice_period(request):
     """
     Check weather resignation_request enabled of not in offboarding
     """
-    initial = 30
-    first = None
-    if apps.is_installed("payroll"):
-        PayrollGeneralSetting = get_horilla_model_class(
-            app_label="payroll", model="payrollgeneralsetting"
-        )
-        first = PayrollGeneralSetting.objects.first()
-    if first:
-        initial = first.notice_period
+    initial = get_settings_snapshot(request)["notice_period"]
     return {"get_initial_notice_period": initial}
 
 
@@ -233,16 +202,7 @@ def check_candidate_self_tracking(request):
     This method is used to get the candidate self tracking is enabled or not
     """
 
-    candidate_self_tracking = False
-    if apps.is_installed("recruitment"):
-        RecruitmentGeneralSetting = get_horilla_model_class(
-            app_label="recruitment", model="recruitmentgeneralsetting"
-        )
-        first = RecruitmentGeneralSetting.objects.first()
-    else:
-        first = None
-    if first:
-        candidate_self_tracking = first.candidate_self_tracking
+    candidate_self_tracking = get_settings_snapshot(request)["candidate_self_tracking"]
     return {"check_candidate_self_tracking": candidate_self_tracking}
 
 
@@ -250,16 +210,7 @@ def check_candidate_self_tracking_rating(request):
     """
     This method is used to check enabled/disabled of rating option
     """
-    rating_option = False
-    if apps.is_installed("recruitment"):
-        RecruitmentGeneralSetting = get_horilla_model_class(
-            app_label="recruitment", model="recruitmentgeneralsetting"
-        )
-        first = RecruitmentGeneralSetting.objects.first()
-    else:
-        first = None
-    if first:
-        rating_option = first.show_overall_rating
+    rating_option = get_settings_snapshot(request)["show_overall_rating"]
     return {"check_candidate_self_tracking_rating": rating_option}
 
 
@@ -267,12 +218,9 @@ def get_initial_prefix(request):
     """
     This method is used to get the initial prefix
     """
-    settings = EmployeeGeneralSetting.objects.first()
-    instance_id = None
-    prefix = "PEP"
-    if settings:
-        instance_id = settings.id
-        prefix = settings.badge_id_prefix
+    snapshot = get_settings_snapshot(request)
+    instance_id = snapshot["employee_general_setting_id"]
+    prefix = snapshot["badge_id_prefix"]
     return {"get_initial_prefix": prefix, "prefix_instance_id": instance_id}
 
 
@@ -284,16 +232,14 @@ def biometric_app_exists(request):
 
 
 def enable_late_come_early_out_tracking(request):
-    tracking = TrackLateComeEarlyOut.objects.first()
-    enable = tracking.is_enable if tracking else True
+    enable = get_settings_snapshot(request)["late_come_early_out_tracking"]
     return {"tracking": enable, "late_come_early_out_tracking": enable}
 
 
 def enable_profile_edit(request):
     from accessibility.accessibility import ACCESSBILITY_FEATURE
 
-    profile_edit = ProfileEditFeature.objects.filter().first()
-    enable = True if profile_edit and profile_edit.is_enabled else False
+    enable = bool(get_settings_snapshot(request)["profile_edit"])
     if enable:
         if not any(item[0] == "profile_edit" for item in ACCESSBILITY_FEATURE):
             ACCESSBILITY_FEATURE.append(("profile_edit", _("Profile Edit Access")))
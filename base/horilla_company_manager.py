@@ -1,10 +1,19 @@
 """
 horilla_company_manager.py
+
+The company scoping manager.
+
+The company filter of a model is read from the `company_filter` attribute the
+`CompanyMiddleware` sets for the selected company. Whether that filter joins
+through a to-many relation (and so needs `distinct()`) and which related
+employees must be active are worked out once per model from its fields, so
+building a queryset runs no query.
 """
 
 import logging
 from typing import Coroutine, Sequence
 
+from django.core.exceptions import FieldDoesNotExist
 from django.db import models
 from django.db.models.query import QuerySet
 
@@ -30,6 +39,68 @@ def update(self, *args, **kwargs):
 setattr(QuerySet, "update", update)
 
 
+CHECK_FIELDS = [
+    "employee_id",
+    "requested_employee_id",
+]
+
+_company_plans = {}
+
+
+class CompanyPlan:
+    """
+    Company filter plan of a model
+    """
+
+    def __init__(self, lookup, distinct, active_filter):
+        self.lookup = lookup
+        self.distinct = distinct
+        self.active_filter = active_filter
+
+
+def lookup_fans_out(model, lookup):
+    """
+    Whether filtering the model on the lookup joins through a to-many
+    relation, which can return a row more than once
+    """
+    for name in lookup.split("__"):
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return True
+        if field.many_to_many or field.one_to_many:
+            return True
+        if not field.is_relation:
+            return False
+        model = field.related_model
+    return False
+
+
+def company_plan(model):
+    """
+    The cached company filter plan of the model
+    """
+    plan = _company_plans.get(model)
+    if plan is None:
+        manager = getattr(model, "objects", model._default_manager)
+        if getattr(model, "company_id", None):
+            lookup = "company_id"
+        else:
+            lookup = getattr(manager, "related_company_field", None)
+        check_fields = getattr(manager, "check_fields", CHECK_FIELDS)
+        plan = CompanyPlan(
+            lookup=lookup,
+            distinct=bool(lookup) and lookup_fans_out(model, lookup),
+            active_filter={
+                f"{field.name}__is_active": True
+                for field in model._meta.fields
+                if isinstance(field, models.ForeignKey) and field.name in check_fields
+            },
+        )
+        _company_plans[model] = plan
+    return plan
+
+
 class HorillaCompanyManager(models.Manager):
     """
     HorillaCompanyManager
@@ -38,10 +109,7 @@ class HorillaCompanyManager(models.Manager):
     def __init__(self, related_company_field=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.related_company_field = related_company_field
-        self.check_fields = [
-            "employee_id",
-            "requested_employee_id",
-        ]
+        self.check_fields = list(CHECK_FIELDS)
 
     def get_queryset(self):
         """
@@ -53,50 +121,30 @@ class HorillaCompanyManager(models.Manager):
         selected_company = None
         if request is not None:
             selected_company = request.session.get("selected_company")
+        if selected_company == "all" or not selected_company:
+            return queryset
         try:
-            queryset = (
-                queryset.filter(self.model.company_filter)
-                if selected_company != "all" and selected_company
-                else queryset
-            )
+            queryset = queryset.filter(self.model.company_filter)
         except Exception as e:
             logger.error(e)
-        try:
-            has_duplicates = queryset.count() != queryset.distinct().count()
-            if has_duplicates:
-                queryset = queryset.distinct()
-        except:
-            pass
+            return queryset
+        if company_plan(self.model).distinct:
+            queryset = queryset.distinct()
         return queryset
 
     def all(self):
         """
         Override the all() method
         """
-        queryset = []
-        try:
-            queryset = self.get_queryset()
-            if queryset.exists():
-                try:
-                    model_name = queryset.model._meta.model_name
-                    if model_name == "employee":
-                        request = getattr(_thread_locals, "request", None)
-                        if not getattr(request, "is_filtering", None):
-                            queryset = queryset.filter(is_active=True)
-                    else:
-                        for field in queryset.model._meta.fields:
-                            if isinstance(field, models.ForeignKey):
-                                if field.name in self.check_fields:
-                                    related_model_is_active_filter = {
-                                        f"{field.name}__is_active": True
-                                    }
-                                    queryset = queryset.filter(
-                                        **related_model_is_active_filter
-                                    )
-                except:
-                    pass
-        except:
-            pass
+        queryset = self.get_queryset()
+        if queryset.model._meta.model_name == "employee":
+            request = getattr(_thread_locals, "request", None)
+            if not getattr(request, "is_filtering", None):
+                queryset = queryset.filter(is_active=True)
+            return queryset
+        active_filter = company_plan(queryset.model).active_filter
+        if active_filter:
+            queryset = queryset.filter(**active_filter)
         return queryset
 
     def filter(self, *args, **kwargs):
@@ -0,0 +1,96 @@
+import re
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import NoReverseMatch, reverse
+
+LIST_VIEWS = [
+    "employee-view",
+    "attendance-view",
+    "attendance-overtime-view",
+    "request-view",
+    "work-type-request-view",
+    "shift-request-view",
+    "view-contract",
+    "pipeline",
+]
+
+DUPLICATE_CHECK = re.compile(r"SELECT COUNT\(\*\) FROM \(SELECT DISTINCT", re.I)
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the main list views and report the number of queries they run, "
+        "failing when a view exceeds the query budget or counts duplicate rows"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--user",
+            help="Username to render the views as, the first superuser by default",
+        )
+        parser.add_argument(
+            "--company",
+            default="all",
+            help="Selected company id, or 'all' (default)",
+        )
+        parser.add_argument(
+            "--url",
+            action="append",
+            help="URL name of a view to render instead of the main list views, "
+            "repeatable",
+        )
+        parser.add_argument(
+            "--max-queries",
+            type=int,
+            default=100,
+            help="Most queries a view may run (default 100)",
+        )
+        parser.add_argument(
+            "--host", default="localhost", help="Host header of the requests"
+        )
+
+    def handle(self, *args, **options):
+        if options["user"]:
+            user = User.objects.filter(username=options["user"]).first()
+        else:
+            user = User.objects.filter(is_superuser=True).order_by("id").first()
+        if user is None:
+            raise CommandError("No user to render the views as.")
+
+        client = Client(HTTP_HOST=options["host"])
+        client.force_login(user)
+        session = client.session
+        session["selected_company"] = options["company"]
+        session["otp_code_verified"] = True
+        session.save()
+
+        failures = []
+        for url_name in options["url"] or LIST_VIEWS:
+            try:
+                url = reverse(url_name)
+            except NoReverseMatch:
+                self.stdout.write(self.style.WARNING(f"{url_name}: not installed"))
+                continue
+            with CaptureQueriesContext(connection) as queries:
+                response = client.get(url)
+            duplicate_checks = sum(
+                bool(DUPLICATE_CHECK.search(query["sql"]))
+                for query in queries.captured_queries
+            )
+            self.stdout.write(
+                f"{url_name:<28} {response.status_code}  {len(queries):>4} queries"
+                f"  {duplicate_checks} duplicate checks"
+            )
+            if len(queries) > options["max_queries"] or duplicate_checks:
+                failures.append(url_name)
+
+        if failures:
+            raise CommandError(
+                f"Query budget of {options['max_queries']} exceeded or duplicate "
+                f"rows counted by: {', '.join(failures)}"
+            )
+        self.stdout.write(self.style.SUCCESS("All list views are within budget."))
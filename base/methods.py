@@ -4,8 +4,8 @@ import json
 import os
 import random
 from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 
-import pandas as pd
 import pdfkit
 from django.apps import apps
 from django.conf import settings
@@ -14,7 +14,7 @@ from django.contrib.staticfiles import finders
 from django.core.exceptions import ObjectDoesNotExist
 from django.core.paginator import Paginator
 from django.db import models
-from django.db.models import ForeignKey, ManyToManyField, OneToOneField, Q
+from django.db.models import ForeignKey, ManyToManyField, OuterRef, Q, Subquery
 from django.db.models.functions import Lower
 from django.forms.models import ModelChoiceField
 from django.http import HttpResponse
@@ -22,7 +22,10 @@ from django.template.loader import render_to_string
 from django.utils.translation import gettext as _
 
 from base.models import Company, CompanyLeaves, DynamicPagination, Holidays
+from base.work_calendar import get_work_calendar
+from employee.hierarchy import subordinate_ids, subordinate_ids_query
 from employee.models import Employee, EmployeeWorkInformation
+from horilla.export import export_queryset, stream_csv_response, stream_xlsx_response
 from horilla.horilla_apps import NESTED_SUBORDINATE_VISIBILITY
 from horilla.horilla_middlewares import _thread_locals
 from horilla.horilla_settings import HORILLA_DATE_FORMATS, HORILLA_TIME_FORMATS
@@ -117,17 +120,13 @@ def filtersubordinates(
     if not hasattr(user, "employee_get") or user.employee_get is None:
         return queryset.none()  # No employee associated, return empty
 
-    # Get subordinate employee IDs
-    sub_ids = get_subordinate_employee_ids(request, nested=nested)
-
-    # Include own records explicitly
     own_id = user.employee_get.id
 
-    # Build filter
-    filter_ids = sub_ids + [own_id] if sub_ids else [own_id]
-
-    # Return filtered queryset
-    return queryset.filter(**{f"{field}__id__in": filter_ids})
+    # Own records and the subordinates' ones, the subordinates as a subquery
+    return queryset.filter(
+        Q(**{f"{field}__id": own_id})
+        | Q(**{f"{field}__id__in": subordinate_ids_query(own_id, nested=nested)})
+    )
 
 
 def filter_own_records(request, queryset, perm=None):
@@ -166,31 +165,11 @@ def filtersubordinatesemployeemodel(request, queryset, perm=None):
         return queryset
 
     if NESTED_SUBORDINATE_VISIBILITY:
-        # Initialize the set of subordinates with the current manager(s)
-        current_managers = [
-            request.user.employee_get.id,
-        ]
-        all_subordinates = Q(
-            employee_work_info__reporting_manager_id__in=current_managers
+        # The subordinates in the entire reporting chain
+        return queryset.filter(
+            id__in=subordinate_ids_query(request.user.employee_get.id)
         )
 
-        # Iteratively find subordinates in the chain
-        while True:
-            sub_managers = queryset.filter(
-                employee_work_info__reporting_manager_id__in=current_managers
-            ).values_list("id", flat=True)
-
-            if not sub_managers.exists():
-                break
-
-            current_managers = sub_managers
-            all_subordinates |= Q(
-                employee_work_info__reporting_manager_id__in=sub_managers
-            )
-
-        # Apply the filter to the queryset
-        return queryset.filter(all_subordinates).distinct()
-
     manager = Employee.objects.filter(employee_user_id=user).first()
     queryset = queryset.filter(employee_work_info__reporting_manager_id=manager)
     return queryset
@@ -233,26 +212,9 @@ def choosesubordinates(request, form, perm):
     if not manager:
         return form
 
-    # Start with direct subordinates
-    current_managers = [manager.id]
-    all_subordinates = Q(employee_work_info__reporting_manager_id__in=current_managers)
-
-    if NESTED_SUBORDINATE_VISIBILITY:
-        # Recursively find all subordinates in the chain
-        while True:
-            sub_managers = Employee.objects.filter(
-                employee_work_info__reporting_manager_id__in=current_managers
-            ).values_list("id", flat=True)
-
-            if not sub_managers.exists():
-                break
-
-            current_managers = sub_managers
-            all_subordinates |= Q(
-                employee_work_info__reporting_manager_id__in=sub_managers
-            )
-
-    queryset = Employee.objects.filter(all_subordinates).distinct()
+    queryset = Employee.objects.filter(
+        id__in=subordinate_ids_query(manager.id, nested=NESTED_SUBORDINATE_VISIBILITY)
+    )
 
     # Assign to form field
     if "employee_id" in form.fields:
@@ -272,33 +234,7 @@ def get_subordinate_employee_ids(request, nested=NESTED_SUBORDINATE_VISIBILITY):
     if not hasattr(user, "employee_get"):
         return []
 
-    manager_id = user.employee_get.id
-
-    if nested:
-        # Recursive approach for all levels
-        current_managers = [manager_id]
-        all_sub_ids = set()
-
-        while current_managers:
-            sub_ids = list(
-                Employee.objects.filter(
-                    employee_work_info__reporting_manager_id__in=current_managers
-                ).values_list("id", flat=True)
-            )
-            if not sub_ids:
-                break
-            all_sub_ids.update(sub_ids)
-            current_managers = sub_ids
-
-        return list(all_sub_ids)
-    else:
-        # Only direct subordinates
-        direct_sub_ids = list(
-            Employee.objects.filter(
-                employee_work_info__reporting_manager_id=manager_id
-            ).values_list("id", flat=True)
-        )
-        return direct_sub_ids
+    return subordinate_ids(user.employee_get.id, nested=nested, request=request)
 
 
 def choosesubordinatesemployeemodel(request, form, perm):
@@ -409,102 +345,95 @@ def generate_colors(num_colors):
     return colors
 
 
-def get_key_instances(model, data_dict):
-    # Get all the models in the Django project
-    all_models = apps.get_models()
-
-    # Initialize a list to store related models include the function argument model as foreignkey
-    related_models = []
-
-    # Iterate through all models
-    for other_model in all_models:
-        # Iterate through fields of the model
-        for field in other_model._meta.fields:
-            # Check if the field is a ForeignKey and related to the function argument model
-            if isinstance(field, ForeignKey) and field.related_model == model:
-                related_models.append(other_model)
-                break
-
-    # Iterate through related models to filter instances
-    for related_model in related_models:
-        # Get all fields of the related model
-        related_model_fields = related_model._meta.get_fields()
-
-        # Iterate through fields to find ForeignKey fields
-        for field in related_model_fields:
+@lru_cache(maxsize=None)
+def reverse_relations(model):
+    """
+    Filter keys of the models referencing the model by a foreign key, mapped to
+    the referencing model and the foreign key field the key is looked up by.
+    Built once per process.
+    """
+    relations = {}
+    for other_model in apps.get_models():
+        if not any(
+            isinstance(field, ForeignKey) and field.related_model == model
+            for field in other_model._meta.fields
+        ):
+            continue
+        for field in other_model._meta.get_fields():
             if isinstance(field, ForeignKey):
-                # Get the related name and field name
-                related_name = field.related_query_name()
-                field_name = field.name
-
-                # Check if the related name exists in data_dict
-                if related_name in data_dict:
-                    # Get the related_id from data_dict
-                    related_id_list = data_dict[related_name]
-                    related_id = int(related_id_list[0])
-
-                    # Filter instances based on the field and related_id
-                    filtered_instance = related_model.objects.filter(
-                        **{field_name: related_id}
-                    ).first()
-
-                    # Store the filtered instance back in data_dict
-                    data_dict[related_name] = [str(filtered_instance)]
-
-    # Get all the fields in the argument model
-    model_fields = model._meta.get_fields()
-    foreign_key_field_names = [
-        field.name
-        for field in model_fields
-        if isinstance(field, ForeignKey or OneToOneField)
-    ]
-    # Create a list of field names that are present in data_dict
-    present_foreign_key_field_names = [
-        key for key in foreign_key_field_names if key in data_dict
-    ]
-
-    for field_name in present_foreign_key_field_names:
-        try:
-            # Get the list of integer values from data_dict for the field
-            field_values = [int(value) for value in data_dict[field_name]]
-
-            # Get the related model of the ForeignKey field
-            related_model = model._meta.get_field(field_name).remote_field.model
-
-            # Get the instances of the related model using the field values
-            related_instances = related_model.objects.filter(id__in=field_values)
-
-            # Create a list of string representations of the instances
-            related_strings = [str(instance) for instance in related_instances]
-
-            # Update data_dict with the list of string representations
-            data_dict[field_name] = related_strings
-        except (ObjectDoesNotExist, ValueError):
-            pass
+                relations.setdefault(
+                    field.related_query_name(), (other_model, field.name)
+                )
+    return relations
 
-    # Create a list of field names that are ManyToManyField
-    many_to_many_field_names = [
-        field.name for field in model_fields if isinstance(field, ManyToManyField)
-    ]
-    # Create a list of field names that are present in data_dict for ManyToManyFields
-    present_many_to_many_field_names = [
-        key for key in many_to_many_field_names if key in data_dict
-    ]
 
-    for field_name in present_many_to_many_field_names:
+def resolve_filter_labels(data_dict, lookups):
+    """
+    Replace the ids of the filter keys in data_dict by the records they refer
+    to. lookups maps a filter key to the model and the field its ids are looked
+    up by, and whether only the first record of the first id is shown. One or
+    two queries are run per model and field.
+    """
+    grouped = {}
+    for key, (model, field_name, first_only) in lookups.items():
         try:
-            # Get the related model of the ManyToMany field
-            related_model = model._meta.get_field(field_name).remote_field.model
-            # Get a list of integer values from data_dict for the field
-            field_values = [int(value) for value in data_dict[field_name]]
+            ids = [int(value) for value in data_dict[key]]
+        except (TypeError, ValueError):
+            continue
+        if first_only:
+            ids = ids[:1]
+        grouped.setdefault((model, field_name), {})[key] = (ids, first_only)
+
+    for (model, field_name), keys in grouped.items():
+        ids = {value for key_ids, _first_only in keys.values() for value in key_ids}
+        if field_name == "id":
+            records = {
+                pk: [instance] for pk, instance in model.objects.in_bulk(ids).items()
+            }
+        else:
+            # Only the first referencing record of each id is shown
+            field = model._meta.get_field(field_name)
+            target = field.target_field.attname
+            matching = model.objects.filter(**{field_name: OuterRef(target)})
+            if not matching.ordered:
+                matching = matching.order_by("pk")
+            first_pks = dict(
+                field.related_model._base_manager.filter(**{f"{target}__in": ids})
+                .annotate(first_pk=Subquery(matching.values("pk")[:1]))
+                .values_list(target, "first_pk")
+            )
+            firsts = model.objects.in_bulk(
+                [pk for pk in first_pks.values() if pk is not None]
+            )
+            records = {
+                value: [firsts[pk]] for value, pk in first_pks.items() if pk in firsts
+            }
+
+        for key, (key_ids, first_only) in keys.items():
+            if first_only:
+                instances = records.get(key_ids[0]) if key_ids else None
+                data_dict[key] = [str(instances[0] if instances else None)]
+            else:
+                data_dict[key] = [
+                    str(instance)
+                    for value in key_ids
+                    for instance in records.get(value, [])
+                ]
 
-            # Filter instances of the related model based on the field values
-            related_instances = related_model.objects.filter(id__in=field_values)
 
-            # Update data_dict with the string representations of related instances
-            data_dict[field_name] = [str(instance) for instance in related_instances]
-        except (ObjectDoesNotExist, ValueError):
-            pass
+def get_key_instances(model, data_dict):
+    # Filter keys of the models referencing the model show the first record of
+    # the referencing model, the foreign key and many to many fields of the
+    # model show the records of their ids
+    lookups = {
+        key: (related_model, field_name, True)
+        for key, (related_model, field_name) in reverse_relations(model).items()
+        if key in data_dict
+    }
+    for field in model._meta.get_fields():
+        if isinstance(field, (ForeignKey, ManyToManyField)) and field.name in data_dict:
+            lookups.setdefault(field.name, (field.remote_field.model, "id", False))
+    resolve_filter_labels(data_dict, lookups)
 
     nested_fields = [
         key
@@ -608,7 +537,37 @@ def closest_numbers(numbers: list, input_number: int) -> tuple:
     return (previous_number, next_number)
 
 
-def format_export_value(value, employee):
+EXPORT_FIELDS_MAPPING = {
+    "male": _("Male"),
+    "female": _("Female"),
+    "other": _("Other"),
+    "draft": _("Draft"),
+    "active": _("Active"),
+    "expired": _("Expired"),
+    "terminated": _("Terminated"),
+    "weekly": _("Weekly"),
+    "monthly": _("Monthly"),
+    "after": _("After"),
+    "semi_monthly": _("Semi-Monthly"),
+    "hourly": _("Hourly"),
+    "daily": _("Daily"),
+    "full_day": _("Full Day"),
+    "first_half": _("First Half"),
+    "second_half": _("Second Half"),
+    "requested": _("Requested"),
+    "approved": _("Approved"),
+    "cancelled": _("Cancelled"),
+    "rejected": _("Rejected"),
+    "cancelled_and_rejected": _("Cancelled & Rejected"),
+    "late_come": _("Late Come"),
+    "early_out": _("Early Out"),
+}
+
+
+def get_export_formats(employee):
+    """
+    Returns the (date_format, time_format) of the company of the employee
+    """
     work_info = EmployeeWorkInformation.objects.filter(employee_id=employee).first()
     time_format = (
         work_info.company_id.time_format
@@ -620,6 +579,11 @@ def format_export_value(value, employee):
         if work_info and work_info.company_id
         else "MMM. D, YYYY"
     )
+    return date_format, time_format
+
+
+def format_export_value(value, employee, export_formats=None):
+    date_format, time_format = export_formats or get_export_formats(employee)
 
     if isinstance(value, time):
         # Convert the string to a datetime.time object
@@ -644,42 +608,45 @@ def format_export_value(value, employee):
     return value
 
 
+def export_field_value(obj, field_name, employee, export_formats=None):
+    """
+    Returns the display value of the field path of the object for exports
+    """
+    value = obj
+    nested_attributes = field_name.split("__")
+    for attr in nested_attributes:
+        value = getattr(value, attr, None)
+        if value is None:
+            break
+    if value is True:
+        value = _("Yes")
+    elif value is False:
+        value = _("No")
+    if value in EXPORT_FIELDS_MAPPING:
+        value = EXPORT_FIELDS_MAPPING[value]
+    if value == "None":
+        value = " "
+    if field_name == "month":
+        value = _(value.title())
+
+    # Check if the type of 'value' is time
+    return format_export_value(value, employee, export_formats)
+
+
 def export_data(request, model, form_class, filter_class, file_name, perm=None):
-    fields_mapping = {
-        "male": _("Male"),
-        "female": _("Female"),
-        "other": _("Other"),
-        "draft": _("Draft"),
-        "active": _("Active"),
-        "expired": _("Expired"),
-        "terminated": _("Terminated"),
-        "weekly": _("Weekly"),
-        "monthly": _("Monthly"),
-        "after": _("After"),
-        "semi_monthly": _("Semi-Monthly"),
-        "hourly": _("Hourly"),
-        "daily": _("Daily"),
-        "monthly": _("Monthly"),
-        "full_day": _("Full Day"),
-        "first_half": _("First Half"),
-        "second_half": _("Second Half"),
-        "requested": _("Requested"),
-        "approved": _("Approved"),
-        "cancelled": _("Cancelled"),
-        "rejected": _("Rejected"),
-        "cancelled_and_rejected": _("Cancelled & Rejected"),
-        "late_come": _("Late Come"),
-        "early_out": _("Early Out"),
-    }
+    """
+    Export the filtered records of the model as Excel, or as CSV when the
+    `format` GET parameter is "csv". Rows are streamed from the database so
+    that memory stays flat regardless of the number of records.
+    """
     employee = request.user.employee_get
+    export_formats = get_export_formats(employee)
 
     selected_columns = []
     today_date = date.today().strftime("%Y-%m-%d")
-    file_name = f"{file_name}_{today_date}.xlsx"
-    data_export = {}
+    file_name = f"{file_name}_{today_date}"
 
     form = form_class()
-    model_fields = model._meta.get_fields()
     export_objects = filter_class(request.GET).qs
     if perm:
         export_objects = filtersubordinates(request, export_objects, perm)
@@ -697,46 +664,38 @@ def export_data(request, model, form_class, filter_class, file_name, perm=None):
         if value in selected_fields:
             selected_columns.append((value, key))
 
-    for field_name, verbose_name in selected_columns:
-        if field_name in selected_fields:
-            data_export[verbose_name] = []
-            for obj in export_objects:
-                value = obj
-                nested_attributes = field_name.split("__")
-                for attr in nested_attributes:
-                    value = getattr(value, attr, None)
-                    if value is None:
-                        break
-                if value is True:
-                    value = _("Yes")
-                elif value is False:
-                    value = _("No")
-                if value in fields_mapping:
-                    value = fields_mapping[value]
-                if value == "None":
-                    value = " "
-                if field_name == "month":
-                    value = _(value.title())
-
-                # Check if the type of 'value' is time
-                value = format_export_value(value, employee)
-                data_export[verbose_name].append(value)
-
-    data_frame = pd.DataFrame(data=data_export)
-    styled_data_frame = data_frame.style.applymap(
-        lambda x: "text-align: center", subset=pd.IndexSlice[:, :]
+    field_names = [field_name for field_name, _verbose_name in selected_columns]
+    header = [verbose_name for _field_name, verbose_name in selected_columns]
+    rows = (
+        [
+            export_field_value(obj, field_name, employee, export_formats)
+            for field_name in field_names
+        ]
+        for obj in export_queryset(export_objects, field_names)
     )
 
-    response = HttpResponse(content_type="application/ms-excel")
-    response["Content-Disposition"] = f'attachment; filename="{file_name}"'
+    if request.GET.get("format") == "csv":
+        return stream_csv_response(header, rows, file_name)
+    return stream_xlsx_response(header, rows, file_name, center_cells=True)
 
-    writer = pd.ExcelWriter(response, engine="xlsxwriter")
-    styled_data_frame.to_excel(writer, index=False, sheet_name="Sheet1")
-    worksheet = writer.sheets["Sheet1"]
-    worksheet.set_column("A:Z", 18)
-    writer.close()
 
-    return response
+def choice_queryset(model, selected_company=None):
+    """
+    Queryset of the model offered as choices, limited to the active employees
+    and candidates and to the selected company.
+    """
+    recruitment_installed = apps.is_installed("recruitment")
+    model_filters = {
+        "Employee": {"is_active": True},
+        "Candidate": {"is_active": True} if recruitment_installed else None,
+    }
+    model_name = model.__name__
+
+    if model_name == "Company" and selected_company and selected_company != "all":
+        return model.objects.filter(id=selected_company)
+    if (filters := model_filters.get(model_name)) is not None:
+        return model.objects.filter(**filters)
+    return model.objects.all()
 
 
 def reload_queryset(fields):
@@ -746,25 +705,11 @@ def reload_queryset(fields):
     request = getattr(_thread_locals, "request", None)
     selected_company = request.session.get("selected_company") if request else None
 
-    recruitment_installed = apps.is_installed("recruitment")
-    model_filters = {
-        "Employee": {"is_active": True},
-        "Candidate": {"is_active": True} if recruitment_installed else None,
-    }
-
     for field in fields.values():
         if not isinstance(field, ModelChoiceField):
             continue
 
-        model = field.queryset.model
-        model_name = model.__name__
-
-        if model_name == "Company" and selected_company and selected_company != "all":
-            field.queryset = model.objects.filter(id=selected_company)
-        elif (filters := model_filters.get(model_name)) is not None:
-            field.queryset = model.objects.filter(**filters)
-        else:
-            field.queryset = model.objects.all()
+        field.queryset = choice_queryset(field.queryset.model, selected_company)
 
     return fields
 
@@ -961,61 +906,16 @@ def get_date_range(start_date, end_date):
 
 def get_holiday_dates(range_start: date, range_end: date) -> list:
     """
-    :return: this functions returns a list of all holiday dates.
+    :return: this functions returns a list of all holiday dates between the range.
     """
-    pay_range_dates = get_date_range(start_date=range_start, end_date=range_end)
-    query = Q()
-    for check_date in pay_range_dates:
-        query |= Q(start_date__lte=check_date, end_date__gte=check_date)
-    holidays = Holidays.objects.filter(query)
-    holiday_dates = set([])
-    for holiday in holidays:
-        holiday_dates = holiday_dates | (
-            set(
-                get_date_range(start_date=holiday.start_date, end_date=holiday.end_date)
-            )
-        )
-    return list(set(holiday_dates))
+    return get_work_calendar().holiday_dates_between(range_start, range_end)
 
 
 def get_company_leave_dates(year):
     """
     :return: This function returns a list of all company leave dates
     """
-    company_leaves = CompanyLeaves.objects.all()
-    company_leave_dates = []
-    for company_leave in company_leaves:
-        based_on_week = company_leave.based_on_week
-        based_on_week_day = company_leave.based_on_week_day
-        for month in range(1, 13):
-            if based_on_week is not None:
-                # Set Sunday as the first day of the week
-                calendar.setfirstweekday(6)
-                month_calendar = calendar.monthcalendar(year, month)
-                weeks = month_calendar[int(based_on_week)]
-                weekdays_in_weeks = [day for day in weeks if day != 0]
-                for day in weekdays_in_weeks:
-                    leave_date = datetime.strptime(
-                        f"{year}-{month:02}-{day:02}", "%Y-%m-%d"
-                    ).date()
-                    if (
-                        leave_date.weekday() == int(based_on_week_day)
-                        and leave_date not in company_leave_dates
-                    ):
-                        company_leave_dates.append(leave_date)
-            else:
-                # Set Monday as the first day of the week
-                calendar.setfirstweekday(0)
-                month_calendar = calendar.monthcalendar(year, month)
-                for week in month_calendar:
-                    if week[int(based_on_week_day)] != 0:
-                        leave_date = datetime.strptime(
-                            f"{year}-{month:02}-{week[int(based_on_week_day)]:02}",
-                            "%Y-%m-%d",
-                        ).date()
-                        if leave_date not in company_leave_dates:
-                            company_leave_dates.append(leave_date)
-    return company_leave_dates
+    return sorted(get_work_calendar().company_leave_dates(year))
 
 
 def get_working_days(start_date, end_date):
@@ -1026,42 +926,7 @@ def get_working_days(start_date, end_date):
         start_date (_type_): the start date from the data needed
         end_date (_type_): the end date till the date needed
     """
-
-    holiday_dates = get_holiday_dates(start_date, end_date)
-
-    # appending company/holiday leaves
-    # Note: Duplicate entry may exist
-    company_leave_dates = (
-        list(
-            set(
-                get_company_leave_dates(start_date.year)
-                + get_company_leave_dates(end_date.year)
-            )
-        )
-        + holiday_dates
-    )
-
-    date_range = get_date_range(start_date, end_date)
-
-    # making unique list of company/holiday leave dates then filtering
-    # the leave dates only between the start and end date
-    company_leave_dates = [
-        date
-        for date in list(set(company_leave_dates))
-        if start_date <= date <= end_date
-    ]
-
-    working_days_between_ranges = list(set(date_range) - set(company_leave_dates))
-    total_working_days = len(working_days_between_ranges)
-
-    return {
-        # Total working days on that period
-        "total_working_days": total_working_days,
-        # All the working dates between the start and end date
-        "working_days_on": working_days_between_ranges,
-        # All the company/holiday leave dates between the range
-        "company_leave_dates": company_leave_dates,
-    }
+    return get_work_calendar().working_days(start_date, end_date)
 
 
 def get_next_month_same_date(date_obj):
@@ -12,7 +12,7 @@ from django.utils.translation import gettext_lazy as _
 
 from base.backends import ConfiguredEmailBackend
 from base.context_processors import AllCompany
-from base.horilla_company_manager import HorillaCompanyManager
+from base.horilla_company_manager import company_plan
 from base.models import Company, ShiftRequest, WorkTypeRequest
 from employee.models import (
     DisciplinaryAction,
@@ -97,34 +97,20 @@ class CompanyMiddleware:
                 "id": all_company.id,
             }
 
-    def _add_company_filter(self, model, company_id):
+    def _add_company_filter(self, model, company_id, company_models):
         """
         Add company filter to the model if applicable.
         """
-        is_company_model = model in self._get_company_models()
-        company_field = getattr(model, "company_id", None)
-        is_horilla_manager = isinstance(model.objects, HorillaCompanyManager)
-        related_company_field = getattr(model.objects, "related_company_field", None)
-
-        if is_company_model:
-            if company_field:
-                model.add_to_class("company_filter", Q(company_id=company_id))
-            elif is_horilla_manager and related_company_field:
-                model.add_to_class(
-                    "company_filter", Q(**{related_company_field: company_id})
-                )
+        lookup = company_plan(model).lookup
+        if not lookup:
+            return
+        if model in company_models:
+            model.add_to_class("company_filter", Q(**{lookup: company_id}))
         else:
-            if company_field:
-                model.add_to_class(
-                    "company_filter",
-                    Q(company_id=company_id) | Q(company_id__isnull=True),
-                )
-            elif is_horilla_manager and related_company_field:
-                model.add_to_class(
-                    "company_filter",
-                    Q(**{related_company_field: company_id})
-                    | Q(**{f"{related_company_field}__isnull": True}),
-                )
+            model.add_to_class(
+                "company_filter",
+                Q(**{lookup: company_id}) | Q(**{f"{lookup}__isnull": True}),
+            )
 
     def _get_company_models(self):
         """
@@ -188,8 +174,9 @@ class CompanyMiddleware:
             app_models = [
                 model for model in apps.get_models() if model._meta.app_label in APPS
             ]
+            company_models = set(self._get_company_models())
             for model in app_models:
-                self._add_company_filter(model, company_id)
+                self._add_company_filter(model, company_id, company_models)
 
         response = self.get_response(request)
         return response
@@ -0,0 +1,224 @@
+"""
+settings_snapshot.py
+
+Snapshot of the general settings read by the global context processors.
+
+The flags of every settings model read by the context processors (resignation
+request, time runner, notice period, candidate self tracking, badge id prefix,
+late come early out tracking, profile edit, biometric installation, currency)
+are loaded with one query of scalar subqueries per selected company, and kept
+with the company list in the configured cache backend. The snapshot is
+memoized on the request so the context processors of a page share it, and it
+is dropped whenever one of the settings models is saved, updated or deleted
+(see `base.signals`).
+"""
+
+from django.apps import apps
+from django.core.cache import cache
+from django.db import connection
+from django.db.models import Q
+
+from base.horilla_company_manager import HorillaCompanyManager
+from horilla.horilla_middlewares import _thread_locals
+from horilla.methods import get_horilla_model_class
+
+CACHE_VERSION_KEY = "horilla_settings_snapshot_version"
+CACHE_TIMEOUT = 60 * 60
+
+# (app_label, model, {snapshot key: (field, value when there is no record)})
+SNAPSHOT_SETTINGS = [
+    (
+        "offboarding",
+        "offboardinggeneralsetting",
+        {"resignation_request": ("resignation_request", False)},
+    ),
+    ("attendance", "attendancegeneralsetting", {"time_runner": ("time_runner", True)}),
+    ("payroll", "payrollgeneralsetting", {"notice_period": ("notice_period", 30)}),
+    (
+        "recruitment",
+        "recruitmentgeneralsetting",
+        {
+            "candidate_self_tracking": ("candidate_self_tracking", False),
+            "show_overall_rating": ("show_overall_rating", False),
+        },
+    ),
+    (
+        "employee",
+        "employeegeneralsetting",
+        {
+            "badge_id_prefix": ("badge_id_prefix", "PEP"),
+            "employee_general_setting_id": ("id", None),
+        },
+    ),
+    (
+        "base",
+        "tracklatecomeearlyout",
+        {"late_come_early_out_tracking": ("is_enable", True)},
+    ),
+    ("employee", "profileeditfeature", {"profile_edit": ("is_enabled", False)}),
+    ("base", "biometricattendance", {"biometric_installed": ("is_installed", None)}),
+    (
+        "payroll",
+        "payrollsettings",
+        {
+            "currency_symbol": ("currency_symbol", None),
+            "currency_position": ("position", None),
+        },
+    ),
+]
+
+
+def snapshot_models():
+    """
+    The installed models the snapshot is built from, Company included
+    """
+    models = [get_horilla_model_class(app_label="base", model="company")]
+    for app_label, model_name, _fields in SNAPSHOT_SETTINGS:
+        if apps.is_installed(app_label):
+            models.append(
+                get_horilla_model_class(app_label=app_label, model=model_name)
+            )
+    return models
+
+
+def _selected_company(request):
+    selected_company = None
+    if request is not None and hasattr(request, "session"):
+        selected_company = request.session.get("selected_company")
+    if selected_company in (None, "", "all"):
+        return None
+    return str(selected_company)
+
+
+def _first_queryset(model, company_id):
+    """
+    The queryset `Model.objects.first()` reads, with the company filter the
+    company manager applies for the selected company
+    """
+    if isinstance(model.objects, HorillaCompanyManager):
+        queryset = model.objects.entire()
+        if company_id is not None and hasattr(model, "company_filter"):
+            queryset = queryset.filter(
+                Q(company_id=company_id) | Q(company_id__isnull=True)
+            )
+    else:
+        queryset = model.objects.all()
+    return queryset.order_by(*(model._meta.ordering or ["pk"]))
+
+
+def _load_settings(company_id):
+    """
+    Read the first record of every settings model in one query
+    """
+    columns = []
+    for app_label, model_name, fields in SNAPSHOT_SETTINGS:
+        if not apps.is_installed(app_label):
+            continue
+        model = get_horilla_model_class(app_label=app_label, model=model_name)
+        queryset = _first_queryset(model, company_id)
+        columns.append((model_name, None, model._meta.pk, queryset.values("pk")[:1]))
+        for key, (field_name, _default) in fields.items():
+            columns.append(
+                (
+                    model_name,
+                    key,
+                    model._meta.get_field(field_name),
+                    queryset.values(field_name)[:1],
+                )
+            )
+
+    subqueries = []
+    params = []
+    for _model_name, _key, _field, queryset in columns:
+        sql, query_params = queryset.query.sql_with_params()
+        subqueries.append(f"({sql})")
+        params.extend(query_params)
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT {', '.join(subqueries)}", params)
+        row = cursor.fetchone()
+
+    exists = {}
+    values = {}
+    for (model_name, key, field, _queryset), value in zip(columns, row):
+        if key is None:
+            exists[model_name] = value is not None
+        else:
+            values[key] = field.to_python(value) if value is not None else None
+
+    snapshot = {}
+    for app_label, model_name, fields in SNAPSHOT_SETTINGS:
+        for key, (_field_name, default) in fields.items():
+            snapshot[key] = values[key] if exists.get(model_name) else default
+    return snapshot, exists
+
+
+def _create_missing_settings(snapshot, exists):
+    """
+    Create the biometric and payroll settings records, like the context
+    processors did when there were none
+    """
+    if apps.is_installed("biometric") and not exists.get("biometricattendance"):
+        BiometricAttendance = get_horilla_model_class(
+            app_label="base", model="biometricattendance"
+        )
+        BiometricAttendance.objects.create(is_installed=False)
+        snapshot["biometric_installed"] = False
+    if apps.is_installed("payroll") and not exists.get("payrollsettings"):
+        PayrollSettings = get_horilla_model_class(
+            app_label="payroll", model="payrollsettings"
+        )
+        settings = PayrollSettings(currency_symbol="$")
+        settings.save()
+        snapshot["currency_symbol"] = settings.currency_symbol
+        snapshot["currency_position"] = settings.position
+
+
+def load_settings_snapshot(company_id=None):
+    """
+    Build the settings snapshot of the company (None for all companies)
+    """
+    Company = get_horilla_model_class(app_label="base", model="company")
+    snapshot, exists = _load_settings(company_id)
+    _create_missing_settings(snapshot, exists)
+    snapshot["companies"] = [
+        [company.id, company.company, company.icon.url]
+        for company in Company.objects.all()
+    ]
+    return snapshot
+
+
+def get_settings_snapshot(request):
+    """
+    Return the settings snapshot of the company selected in the request (by
+    default the current request), memoized on the request and cached in the
+    cache backend
+    """
+    if request is None:
+        request = getattr(_thread_locals, "request", None)
+    snapshot = getattr(request, "_settings_snapshot", None)
+    if snapshot is not None:
+        return snapshot
+    company_id = _selected_company(request)
+    version = cache.get(CACHE_VERSION_KEY, 0)
+    cache_key = f"horilla_settings_snapshot_{version}_{company_id or 'all'}"
+    snapshot = cache.get(cache_key)
+    if snapshot is None:
+        snapshot = load_settings_snapshot(company_id)
+        cache.set(cache_key, snapshot, CACHE_TIMEOUT)
+    if request is not None:
+        request._settings_snapshot = snapshot
+    return snapshot
+
+
+def clear_settings_snapshot():
+    """
+    Drop the cached settings snapshots of every process sharing the cache
+    backend, and the one memoized on the current request
+    """
+    request = getattr(_thread_locals, "request", None)
+    if hasattr(request, "_settings_snapshot"):
+        del request._settings_snapshot
+    try:
+        cache.incr(CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(CACHE_VERSION_KEY, 1, None)
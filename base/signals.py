@@ -8,13 +8,16 @@ from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth.signals import user_login_failed
 from django.db.models import Max, Q
-from django.db.models.signals import m2m_changed, post_migrate, post_save
+from django.db.models.signals import m2m_changed, post_delete, post_migrate, post_save
 from django.dispatch import receiver
 from django.http import Http404
 from django.shortcuts import redirect, render
 
-from base.models import Announcement, PenaltyAccounts
+from base.models import Announcement, CompanyLeaves, Holidays, PenaltyAccounts
+from base.settings_snapshot import clear_settings_snapshot, snapshot_models
+from base.work_calendar import clear_work_calendar_cache
 from horilla.methods import get_horilla_model_class
+from horilla.signals import post_bulk_update
 
 
 @receiver(post_save, sender=PenaltyAccounts)
@@ -124,6 +127,48 @@ FAIL2BAN_LOG_ENABLED = os.path.exists(
 # The file will be created only if you set the LOGGING in your settings.py
 
 
+@receiver(post_save, sender=Holidays)
+@receiver(post_delete, sender=Holidays)
+@receiver(post_save, sender=CompanyLeaves)
+@receiver(post_delete, sender=CompanyLeaves)
+def invalidate_work_calendar(sender, instance, **kwargs):
+    """
+    Drop the cached holiday/company leave date sets when they change
+    """
+    clear_work_calendar_cache()
+
+
+@receiver(post_bulk_update, sender=Holidays)
+@receiver(post_bulk_update, sender=CompanyLeaves)
+def invalidate_work_calendar_bulk(sender, queryset, *args, **kwargs):
+    """
+    Drop the cached holiday/company leave date sets when they are updated
+    in bulk
+    """
+    clear_work_calendar_cache()
+
+
+def invalidate_settings_snapshot(sender, **kwargs):
+    """
+    Drop the cached settings snapshot when a settings record changes
+    """
+    clear_settings_snapshot()
+
+
+def connect_settings_snapshot_signals():
+    """
+    Connect the snapshot invalidation to the settings models of the
+    installed apps
+    """
+    for model in snapshot_models():
+        uid = f"invalidate_settings_snapshot_{model._meta.label_lower}"
+        for signal in (post_save, post_delete, post_bulk_update):
+            signal.connect(invalidate_settings_snapshot, sender=model, dispatch_uid=uid)
+
+
+connect_settings_snapshot_signals()
+
+
 @receiver(user_login_failed)
 def log_login_failed(sender, credentials, request, **kwargs):
     """
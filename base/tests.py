@@ -1,3 +1,209 @@
-from django.test import TestCase
+"""test cases"""
 
-# Create your tests here.
+from datetime import date, timedelta
+
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from base.models import Company, EmployeeShift, ShiftRequest, WorkType, WorkTypeRequest
+from employee.models import Employee, EmployeeWorkInformation
+from horilla.horilla_middlewares import _thread_locals
+
+
+def create_company(name):
+    return Company.objects.create(
+        company=name,
+        address="Address",
+        country="Country",
+        state="State",
+        city="City",
+        zip="000000",
+        icon="base/icon/company.png",
+    )
+
+
+def set_company(employees, company):
+    EmployeeWorkInformation.objects.filter(employee_id__in=employees).update(
+        company_id=company
+    )
+
+
+class ListViewQueryCountTest(TestCase):
+    """
+    The main list views, scoped to a selected company, run the same number of
+    queries for one row as for a full page of rows, within a flat budget
+    """
+
+    query_budget = 100
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = create_company("Horilla")
+        cls.admin = Employee.objects.create(
+            employee_first_name="Admin",
+            email="admin.queries@example.com",
+            phone="9999999999",
+        )
+        cls.admin.employee_user_id.is_superuser = True
+        cls.admin.employee_user_id.save()
+        set_company([cls.admin], cls.company)
+        cls.work_type = WorkType.objects.create(work_type="Remote")
+        cls.shift = EmployeeShift.objects.create(employee_shift="Night")
+
+    def setUp(self):
+        self.client.force_login(self.admin.employee_user_id)
+        session = self.client.session
+        session["selected_company"] = str(self.company.pk)
+        session["otp_code_verified"] = True
+        session.save()
+        self.created = 0
+
+    def create_employees(self, count):
+        employees = []
+        for _ in range(count):
+            self.created += 1
+            employees.append(
+                Employee.objects.create(
+                    employee_first_name=f"Employee{self.created}",
+                    employee_last_name="Queries",
+                    email=f"employee{self.created}.queries@example.com",
+                    phone="9999999999",
+                )
+            )
+        set_company(employees, self.company)
+        return employees
+
+    def create_work_type_requests(self, count):
+        for employee in self.create_employees(count):
+            WorkTypeRequest.objects.create(
+                employee_id=employee,
+                work_type_id=self.work_type,
+                requested_date=date.today(),
+                requested_till=date.today() + timedelta(days=1),
+            )
+
+    def create_shift_requests(self, count):
+        for employee in self.create_employees(count):
+            ShiftRequest.objects.create(
+                employee_id=employee,
+                shift_id=self.shift,
+                requested_date=date.today(),
+                requested_till=date.today() + timedelta(days=1),
+            )
+
+    def get_list(self, url_name):
+        # The first request fills the per process caches
+        self.client.get(reverse(url_name))
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse(url_name))
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def assertFlatQueries(self, url_name, create_rows):
+        """
+        Render the list view with 1 and 20 rows, both run the same number of
+        queries within the budget
+        """
+        create_rows(1)
+        queries = self.get_list(url_name)
+        self.assertLessEqual(queries, self.query_budget)
+        create_rows(19)
+        self.client.get(reverse(url_name))
+        with self.assertNumQueries(queries):
+            response = self.client.get(reverse(url_name))
+        self.assertEqual(response.status_code, 200)
+
+    def test_employee_view(self):
+        self.assertFlatQueries("employee-view", self.create_employees)
+
+    def test_work_type_request_view(self):
+        self.assertFlatQueries("work-type-request-view", self.create_work_type_requests)
+
+    def test_shift_request_view(self):
+        self.assertFlatQueries("shift-request-view", self.create_shift_requests)
+
+
+class CompanyQuerysetTest(TestCase):
+    """
+    The company manager scopes the querysets to the selected company without
+    running a query while building them
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = create_company("Horilla")
+        cls.other_company = create_company("Other")
+        cls.work_type = WorkType.objects.create(work_type="Remote")
+        cls.admin = Employee.objects.create(
+            employee_first_name="Admin",
+            email="admin.company@example.com",
+            phone="9999999999",
+        )
+        cls.admin.employee_user_id.is_superuser = True
+        cls.admin.employee_user_id.save()
+        cls.active = Employee.objects.create(
+            employee_first_name="Active",
+            email="active.company@example.com",
+            phone="9999999999",
+        )
+        cls.inactive = Employee.objects.create(
+            employee_first_name="Inactive",
+            email="inactive.company@example.com",
+            phone="9999999999",
+        )
+        cls.other = Employee.objects.create(
+            employee_first_name="Other",
+            email="other.company@example.com",
+            phone="9999999999",
+        )
+        set_company([cls.admin, cls.active, cls.inactive], cls.company)
+        set_company([cls.other], cls.other_company)
+        cls.requests = {
+            employee: WorkTypeRequest.objects.create(
+                employee_id=employee,
+                work_type_id=cls.work_type,
+                requested_date=date.today(),
+                requested_till=date.today() + timedelta(days=1),
+            )
+            for employee in (cls.active, cls.inactive, cls.other)
+        }
+        Employee.objects.entire().filter(pk=cls.inactive.pk).update(is_active=False)
+
+    def setUp(self):
+        self.client.force_login(self.admin.employee_user_id)
+        session = self.client.session
+        session["selected_company"] = str(self.company.pk)
+        session["otp_code_verified"] = True
+        session.save()
+        # The company middleware sets the company filter of the models
+        self.client.get(reverse("employee-view"))
+        request = RequestFactory().get("/")
+        request.session = {"selected_company": str(self.company.pk)}
+        self.previous_request = getattr(_thread_locals, "request", None)
+        _thread_locals.request = request
+
+    def tearDown(self):
+        _thread_locals.request = self.previous_request
+
+    def test_building_querysets_runs_no_query(self):
+        with CaptureQueriesContext(connection) as queries:
+            employees = Employee.objects.all()
+            work_type_requests = WorkTypeRequest.objects.all()
+            work_type_requests.filter(work_type_id=self.work_type)
+            Employee.objects.filter(employee_first_name="Active")
+        self.assertEqual(queries.captured_queries, [])
+        self.assertFalse(employees.query.distinct)
+        self.assertFalse(work_type_requests.query.distinct)
+
+    def test_querysets_are_scoped(self):
+        self.assertEqual(set(Employee.objects.all()), {self.admin, self.active})
+        # Requests of employees of the other company or inactive employees
+        # are left out
+        self.assertEqual(
+            list(WorkTypeRequest.objects.all()), [self.requests[self.active]]
+        )
+        self.assertEqual(
+            set(WorkTypeRequest.objects.entire()), set(self.requests.values())
+        )
@@ -156,6 +156,7 @@ from base.models import (
     WorkTypeRequest,
     WorkTypeRequestComment,
 )
+from base.work_calendar import clear_work_calendar_cache
 from employee.filters import EmployeeFilter
 from employee.forms import ActiontypeForm, EmployeeGeneralSettingPrefixForm
 from employee.models import (
@@ -7028,6 +7029,7 @@ def csv_holiday_import(file):
 
     if holiday_list:
         Holidays.objects.bulk_create(holiday_list)
+        clear_work_calendar_cache()
 
     if os.path.exists(holiday_file):
         os.remove(holiday_file)
@@ -7101,6 +7103,7 @@ def excel_holiday_import(file):
 
     if valid_holidays:
         Holidays.objects.bulk_create(valid_holidays)
+        clear_work_calendar_cache()
 
     return error_list, len(holiday_dicts)
 
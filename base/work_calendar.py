@@ -0,0 +1,226 @@
+"""
+work_calendar.py
+
+Per-company holiday and company leave (week-off) calendar.
+
+Holidays and company leaves are loaded once per company and materialized
+into per-year date sets, so holiday/working day checks are set lookups
+instead of a query (and a `calendar.monthcalendar` rebuild) per call.
+The cached calendars are dropped whenever a `Holidays` or `CompanyLeaves`
+record is saved or deleted (see `base.signals`).
+"""
+
+import threading
+from datetime import date, timedelta
+
+from django.core.cache import cache
+from django.db.models import Q
+
+from horilla.horilla_middlewares import _thread_locals
+
+CACHE_VERSION_KEY = "horilla_work_calendar_version"
+
+_calendars = {}
+_calendars_version = None
+_lock = threading.RLock()
+
+
+def date_range(start_date, end_date):
+    """
+    Return the dates from start_date to end_date (both inclusive)
+    """
+    return [
+        start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1)
+    ]
+
+
+def week_of_month(check_date):
+    """
+    Return the 0-based week of the month of the date, weeks starting on Sunday
+    (the same numbering as `calendar.monthcalendar` with Sunday as first day)
+    """
+    first_day_offset = (check_date.replace(day=1).weekday() + 1) % 7
+    return (check_date.day - 1 + first_day_offset) // 7
+
+
+class WorkCalendar:
+    """
+    Holiday and company leave date sets of one company
+    """
+
+    def __init__(self, holidays, company_leaves):
+        """
+        Args:
+            holidays (iterable): (start_date, end_date, recurring) tuples
+            company_leaves (iterable): (based_on_week, based_on_week_day) tuples
+        """
+        self.holidays = [
+            (start_date, end_date or start_date, recurring)
+            for start_date, end_date, recurring in holidays
+        ]
+        # {weekday: set of week numbers or None for every week}
+        self.week_offs = {}
+        for based_on_week, based_on_week_day in company_leaves:
+            weekday = int(based_on_week_day)
+            if based_on_week is None or based_on_week == "":
+                self.week_offs[weekday] = None
+            elif self.week_offs.get(weekday, set()) is not None:
+                self.week_offs.setdefault(weekday, set()).add(int(based_on_week))
+        self._holiday_dates = {}
+        self._company_leave_dates = {}
+
+    def holiday_dates(self, year):
+        """
+        Return the holiday dates of the year as a frozenset
+        """
+        if year not in self._holiday_dates:
+            year_start, year_end = date(year, 1, 1), date(year, 12, 31)
+            dates = set()
+            for start_date, end_date, recurring in self.holidays:
+                if recurring and start_date.year != year:
+                    try:
+                        duration = end_date - start_date
+                        start_date = start_date.replace(year=year)
+                        end_date = start_date + duration
+                    except ValueError:
+                        # 29th of February on a non leap year
+                        continue
+                start_date = max(start_date, year_start)
+                end_date = min(end_date, year_end)
+                if start_date <= end_date:
+                    dates.update(date_range(start_date, end_date))
+            self._holiday_dates[year] = frozenset(dates)
+        return self._holiday_dates[year]
+
+    def company_leave_dates(self, year):
+        """
+        Return the company leave dates of the year as a frozenset
+        """
+        if year not in self._company_leave_dates:
+            dates = frozenset(
+                check_date
+                for check_date in date_range(date(year, 1, 1), date(year, 12, 31))
+                if self._is_week_off(check_date)
+            )
+            self._company_leave_dates[year] = dates
+        return self._company_leave_dates[year]
+
+    def _is_week_off(self, check_date):
+        weekday = check_date.weekday()
+        if weekday not in self.week_offs:
+            return False
+        weeks = self.week_offs[weekday]
+        return weeks is None or week_of_month(check_date) in weeks
+
+    def is_holiday(self, check_date):
+        return check_date in self.holiday_dates(check_date.year)
+
+    def is_company_leave(self, check_date):
+        return check_date in self.company_leave_dates(check_date.year)
+
+    def is_working_day(self, check_date):
+        return not (self.is_holiday(check_date) or self.is_company_leave(check_date))
+
+    def holiday_dates_between(self, start_date, end_date):
+        """
+        Return the sorted holiday dates between the range
+        """
+        return [day for day in date_range(start_date, end_date) if self.is_holiday(day)]
+
+    def company_leave_dates_between(self, start_date, end_date):
+        """
+        Return the sorted company leave dates between the range
+        """
+        return [
+            day
+            for day in date_range(start_date, end_date)
+            if self.is_company_leave(day)
+        ]
+
+    def working_days_between(self, start_date, end_date):
+        """
+        Return the sorted working dates between the range
+        """
+        return [
+            day for day in date_range(start_date, end_date) if self.is_working_day(day)
+        ]
+
+    def working_days(self, start_date, end_date):
+        """
+        Return the working day summary of the range, in the format of
+        `base.methods.get_working_days`
+        """
+        working_days_on = []
+        company_leave_dates = []
+        for day in date_range(start_date, end_date):
+            if self.is_working_day(day):
+                working_days_on.append(day)
+            else:
+                company_leave_dates.append(day)
+        return {
+            "total_working_days": len(working_days_on),
+            "working_days_on": working_days_on,
+            "company_leave_dates": company_leave_dates,
+        }
+
+
+def _current_company_id():
+    """
+    Company selected in the current request, None for all companies
+    """
+    request = getattr(_thread_locals, "request", None)
+    selected_company = None
+    if request is not None and hasattr(request, "session"):
+        selected_company = request.session.get("selected_company")
+    if selected_company in (None, "", "all"):
+        return None
+    return str(selected_company)
+
+
+def _load_calendar(company_id):
+    from base.models import CompanyLeaves, Holidays
+
+    holidays = Holidays.objects.entire()
+    company_leaves = CompanyLeaves.objects.entire()
+    if company_id is not None:
+        company_filter = Q(company_id=company_id) | Q(company_id__isnull=True)
+        holidays = holidays.filter(company_filter)
+        company_leaves = company_leaves.filter(company_filter)
+    return WorkCalendar(
+        holidays.values_list("start_date", "end_date", "recurring"),
+        company_leaves.values_list("based_on_week", "based_on_week_day"),
+    )
+
+
+def get_work_calendar(company_id=None):
+    """
+    Return the cached work calendar of the company, by default of the company
+    selected in the current request (or of all companies outside a request)
+    """
+    global _calendars_version
+    if company_id is None:
+        company_id = _current_company_id()
+    else:
+        company_id = str(company_id)
+    version = cache.get(CACHE_VERSION_KEY, 0)
+    with _lock:
+        if version != _calendars_version:
+            _calendars.clear()
+            _calendars_version = version
+        work_calendar = _calendars.get(company_id)
+        if work_calendar is None:
+            work_calendar = _load_calendar(company_id)
+            _calendars[company_id] = work_calendar
+    return work_calendar
+
+
+def clear_work_calendar_cache():
+    """
+    Drop the cached work calendars of every process sharing the cache backend
+    """
+    with _lock:
+        _calendars.clear()
+    try:
+        cache.incr(CACHE_VERSION_KEY)
+    except ValueError:
+        cache.set(CACHE_VERSION_KEY, 1, None)
@@ -32,3 +32,23 @@ class BiometricConfig(AppConfig):
         from biometric import sidebar
 
         super().ready()
+
+        from horilla.methods import is_server_process
+
+        if is_server_process():
+            self.start_server_process()
+
+    def start_server_process(self):
+        """
+        Reset the live capture state of the devices, captured by the threads
+        of the previous server processes, and start the device poller when it
+        runs in the server processes
+        """
+        from biometric.models import BiometricDevices
+        from biometric.poller import start_device_poller
+        from horilla.horilla_settings import BIOMETRIC_POLLER_IN_PROCESS
+
+        BiometricDevices.objects.all().update(is_live=False)
+        if BIOMETRIC_POLLER_IN_PROCESS:
+            # Every process starts one, only the holder of the poller lock polls
+            start_device_poller()
@@ -8,16 +8,16 @@ Functions:
     biometric_is_installed(request): Checks if the biometric system is installed.
 """
 
-from base.models import BiometricAttendance
+from base.settings_snapshot import get_settings_snapshot
 
 
 def biometric_is_installed(_request):
     """
     Check if the biometric system is installed.
 
-    This function checks if the biometric system is installed by querying the
-    BiometricAttendance model. If no BiometricAttendance object exists, it
-    creates one with 'is_installed' set to False.
+    This function checks if the biometric system is installed from the
+    BiometricAttendance record of the settings snapshot, which creates one with
+    'is_installed' set to False when none exists.
 
     Args:
         request: The HTTP request object.
@@ -27,9 +27,5 @@ def biometric_is_installed(_request):
         the biometric system is installed. The key is 'is_installed', and the value
         is a boolean indicating the installation status.
     """
-    instance = BiometricAttendance.objects.first()
-    if not instance:
-        BiometricAttendance.objects.create(is_installed=False)
-        instance = BiometricAttendance.objects.first()
-    is_installed = instance.is_installed
+    is_installed = get_settings_snapshot(_request)["biometric_installed"]
     return {"is_installed": is_installed}
@@ -0,0 +1,679 @@
+"""
+ingestion.py
+
+Bulk ingestion of biometric punches.
+
+The device drivers normalize their logs into `Punch` tuples which are ingested
+in one go: the punches are grouped by employee, replayed in memory against the
+shift schedule with the rules of the clock-in/clock-out views
+(`attendance.views.clock_in_out`), and the resulting attendance activities,
+attendances, late come/early out records, hour accounts and work records are
+written with bulk inserts and updates.
+
+Ingestion is idempotent: a punch whose time is already recorded as the check-in
+or check-out of an attendance activity of the employee is skipped, so fetching
+the same logs again creates no duplicates.
+"""
+
+import logging
+from collections import defaultdict, namedtuple
+from datetime import date, time, timedelta
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from simple_history.utils import bulk_create_with_history, bulk_update_with_history
+
+from attendance.hour_account import apply_hour_accounts, hour_account_key
+from attendance.methods.utils import (
+    activity_datetime,
+    format_time,
+    overtime_calculation,
+    strtime_seconds,
+)
+from attendance.models import (
+    Attendance,
+    AttendanceActivity,
+    AttendanceLateComeEarlyOut,
+    AttendanceValidationCondition,
+    GraceTime,
+    WorkRecords,
+)
+from attendance.signals import update_attendance_work_record
+from base.context_processors import enable_late_come_early_out_tracking
+from base.models import EmployeeShiftDay, EmployeeShiftSchedule
+from employee.models import EmployeeWorkInformation
+
+logger = logging.getLogger(__name__)
+
+PUNCH_IN = "in"
+PUNCH_OUT = "out"
+# Check-in when the employee has no open attendance activity, else check-out
+PUNCH_TOGGLE = None
+
+Punch = namedtuple("Punch", ["employee_id", "punch_datetime", "direction"])
+
+MID_DAY_SECONDS = strtime_seconds("12:00")
+BATCH_SIZE = 500
+NEW_OBJECT_ORDER = 10**18
+
+ACTIVITY_UPDATE_FIELDS = ["clock_out", "clock_out_date", "out_datetime"]
+ATTENDANCE_UPDATE_FIELDS = [
+    "attendance_day",
+    "attendance_clock_out",
+    "attendance_clock_out_date",
+    "attendance_worked_hour",
+    "attendance_overtime",
+    "attendance_overtime_approve",
+    "attendance_validated",
+    "minimum_hour",
+    "is_holiday",
+    "at_work_second",
+    "overtime_second",
+    "approved_overtime_second",
+    "is_validate_request_approved",
+]
+WORK_RECORD_UPDATE_FIELDS = [
+    "employee_id",
+    "date",
+    "at_work",
+    "min_hour",
+    "min_hour_second",
+    "at_work_second",
+    "work_record_type",
+    "message",
+    "is_attendance_record",
+    "attendance_id",
+    "shift_id",
+    "day_percentage",
+    "last_update",
+]
+
+
+class EmployeePunchState:
+    """
+    In memory attendance activities and attendances of one employee
+    """
+
+    def __init__(self, ingestion, work_info, activities, attendances, late_early):
+        self.ingestion = ingestion
+        self.work_info = work_info
+        self.employee = work_info.employee_id
+        self.shift = work_info.shift_id
+        self.activities = list(activities)
+        self.attendances = {
+            attendance.attendance_date: attendance for attendance in attendances
+        }
+        # {attendance_date: {"late_come", "early_out"}}
+        self.late_early = late_early
+        self.recorded = {
+            punch_datetime
+            for activity in self.activities
+            for punch_datetime in (activity.in_datetime, activity.out_datetime)
+            if punch_datetime
+        }
+        for instance in self.activities + list(self.attendances.values()):
+            instance.ingestion_order = instance.pk
+        for attendance in self.attendances.values():
+            attendance.ingestion_prev_approved = attendance.attendance_overtime_approve
+
+        self.new_activities = []
+        self.changed_activities = {}
+        self.new_attendances = []
+        self.changed_attendances = {}
+        self.created_late_early = set()
+        self.deleted_early_out = set()
+        self.skipped = 0
+
+    def order(self):
+        self.ingestion.sequence += 1
+        return NEW_OBJECT_ORDER + self.ingestion.sequence
+
+    def activity_changed(self, activity):
+        if activity.pk:
+            self.changed_activities[activity.pk] = activity
+
+    def attendance_changed(self, attendance):
+        if attendance.pk:
+            self.changed_attendances[attendance.pk] = attendance
+
+    def add_late_early(self, attendance_date, type):
+        types = self.late_early.setdefault(attendance_date, set())
+        if type in types:
+            return
+        types.add(type)
+        if (attendance_date, type) in self.deleted_early_out:
+            self.deleted_early_out.discard((attendance_date, type))
+        else:
+            self.created_late_early.add((attendance_date, type))
+
+    def remove_early_out(self, attendance_date):
+        types = self.late_early.get(attendance_date, set())
+        if "early_out" not in types:
+            return
+        types.discard("early_out")
+        if (attendance_date, "early_out") in self.created_late_early:
+            self.created_late_early.discard((attendance_date, "early_out"))
+        else:
+            self.deleted_early_out.add((attendance_date, "early_out"))
+
+    def punch(self, punch):
+        """
+        Replay one punch, skipping the ones already recorded
+        """
+        if punch.punch_datetime in self.recorded:
+            self.skipped += 1
+            return
+        self.recorded.add(punch.punch_datetime)
+        direction = punch.direction
+        if direction is PUNCH_TOGGLE:
+            has_open_activity = any(
+                activity.clock_out is None for activity in self.activities
+            )
+            direction = PUNCH_OUT if has_open_activity else PUNCH_IN
+        if direction == PUNCH_IN:
+            self.clock_in(punch.punch_datetime)
+        else:
+            self.clock_out(punch.punch_datetime)
+
+    def clock_in(self, punch_datetime):
+        """
+        Same as `clock_in_attendance_and_activity` for the punch
+        """
+        ingestion = self.ingestion
+        date_today = punch_datetime.date()
+        now = punch_datetime.strftime("%H:%M")
+        attendance_date = date_today
+        day = ingestion.shift_day(date_today)
+        minimum_hour, start_time_sec, end_time_sec, _night = ingestion.schedule(
+            day, self.shift
+        )
+        if start_time_sec > end_time_sec and MID_DAY_SECONDS > strtime_seconds(now):
+            # Night shift, the attendance belongs to yesterday before noon
+            attendance_date = date_today - timedelta(days=1)
+            day = ingestion.shift_day(attendance_date)
+            minimum_hour, start_time_sec, end_time_sec, _night = ingestion.schedule(
+                day, self.shift
+            )
+
+        open_activity = min(
+            (
+                activity
+                for activity in self.activities
+                if activity.attendance_date == attendance_date
+                and activity.clock_in_date == date_today
+                and activity.shift_day_id == day.pk
+                and activity.clock_out is None
+            ),
+            key=lambda activity: activity.clock_in,
+            default=None,
+        )
+        if open_activity is not None:
+            open_activity.clock_out = punch_datetime.time()
+            open_activity.clock_out_date = date_today
+            self.activity_changed(open_activity)
+
+        activity = AttendanceActivity(
+            employee_id=self.employee,
+            attendance_date=attendance_date,
+            clock_in_date=date_today,
+            shift_day=day,
+            clock_in=punch_datetime.time(),
+            in_datetime=punch_datetime,
+        )
+        activity.ingestion_order = self.order()
+        self.activities.append(activity)
+        self.new_activities.append(activity)
+
+        attendance = self.attendances.get(attendance_date)
+        if attendance is None:
+            attendance = Attendance(
+                employee_id=self.employee,
+                shift_id=self.shift,
+                work_type_id=self.work_info.work_type_id,
+                attendance_date=attendance_date,
+                attendance_day=day,
+                attendance_clock_in=time(punch_datetime.hour, punch_datetime.minute),
+                attendance_clock_in_date=date_today,
+                minimum_hour=minimum_hour,
+            )
+            attendance.adjust_minimum_hour()
+            attendance.ingestion_order = self.order()
+            attendance.ingestion_prev_approved = False
+            self.attendances[attendance_date] = attendance
+            self.new_attendances.append(attendance)
+            if ingestion.is_late_come(
+                attendance, start_time_sec, end_time_sec, self.shift
+            ):
+                self.add_late_early(attendance_date, "late_come")
+        else:
+            attendance.attendance_clock_out = None
+            attendance.attendance_clock_out_date = None
+            self.attendance_changed(attendance)
+            self.remove_early_out(attendance_date)
+
+    def clock_out(self, punch_datetime):
+        """
+        Same as `clock_out_attendance_and_activity` and the early out check
+        of the clock-out view for the punch
+        """
+        ingestion = self.ingestion
+        date_today = punch_datetime.date()
+        now = punch_datetime.strftime("%H:%M")
+        open_activities = [
+            activity for activity in self.activities if activity.clock_out is None
+        ]
+        if not open_activities:
+            logger.error(
+                "No attendance clock in activity found that needs clocking out."
+            )
+            return
+        activity = max(
+            open_activities,
+            key=lambda activity: (
+                activity.attendance_date or date.min,
+                activity.ingestion_order,
+            ),
+        )
+        activity.clock_out = punch_datetime.time()
+        activity.clock_out_date = date_today
+        activity.out_datetime = punch_datetime
+        self.activity_changed(activity)
+
+        duration = 0
+        for other in self.activities:
+            if (
+                other.attendance_date != activity.attendance_date
+                or other.clock_out is None
+            ):
+                continue
+            in_datetime, out_datetime = activity_datetime(other)
+            difference = out_datetime - in_datetime
+            duration += difference.days * 24 * 3600 + difference.seconds
+
+        if not self.attendances:
+            return
+        attendances = list(self.attendances.values())
+        attendance = max(
+            attendances,
+            key=lambda attendance: (
+                attendance.attendance_date,
+                attendance.ingestion_order,
+            ),
+        )
+        last_attendance = max(
+            attendances, key=lambda attendance: attendance.ingestion_order
+        )
+        day = ingestion.shift_days_by_id.get(last_attendance.attendance_day_id)
+        _minimum_hour, start_time_sec, end_time_sec, _night = ingestion.schedule(
+            day, self.shift
+        )
+
+        attendance.attendance_clock_out = time(
+            punch_datetime.hour, punch_datetime.minute
+        )
+        attendance.attendance_clock_out_date = date_today
+        attendance.attendance_worked_hour = format_time(duration)
+        attendance.attendance_overtime = overtime_calculation(attendance)
+        attendance.attendance_validated = ingestion.validation_at_work >= (
+            strtime_seconds(attendance.attendance_worked_hour)
+        )
+        self.attendance_changed(attendance)
+
+        if "early_out" in self.late_early.get(attendance.attendance_date, set()):
+            return
+        is_night_shift = ingestion.schedule(
+            ingestion.shift_days_by_id.get(attendance.attendance_day_id),
+            attendance.shift_id_id,
+        )[3]
+        next_date = attendance.attendance_date + timedelta(days=1)
+        if is_night_shift:
+            check = attendance.attendance_date == date_today or (
+                MID_DAY_SECONDS >= strtime_seconds(now) and date_today == next_date
+            )
+        else:
+            check = attendance.attendance_date == date_today
+        if check and ingestion.is_early_out(
+            attendance, start_time_sec, end_time_sec, self.shift
+        ):
+            self.add_late_early(attendance.attendance_date, "early_out")
+
+
+class PunchIngestion:
+    """
+    Ingests a stream of punches in bulk
+    """
+
+    def __init__(self, punches, batch_size=BATCH_SIZE):
+        self.punches = sorted(punches, key=lambda punch: punch.punch_datetime)
+        self.batch_size = batch_size
+        self.sequence = 0
+
+    def shift_day(self, check_date):
+        return self.shift_days[check_date.strftime("%A").lower()]
+
+    def schedule(self, day, shift):
+        """
+        (minimum_hour, start_time_sec, end_time_sec, is_night_shift) of the
+        shift on the day, like `shift_schedule_today`
+        """
+        shift_id = getattr(shift, "pk", shift)
+        day_id = getattr(day, "pk", None)
+        return self.schedules.get((day_id, shift_id), ("00:00", 0, 0, False))
+
+    def grace_seconds(self, shift, allowed):
+        """
+        Grace seconds of the shift, or of the default grace time
+        """
+        grace_time = getattr(shift, "grace_time_id", None) if shift else None
+        if grace_time:
+            if grace_time.is_active and getattr(grace_time, allowed):
+                return grace_time.allowed_time_in_secs
+            return 0
+        if self.default_grace_time and getattr(self.default_grace_time, allowed):
+            return self.default_grace_time.allowed_time_in_secs
+        return 0
+
+    def is_late_come(self, attendance, start_time, end_time, shift):
+        """
+        Same as `attendance.views.clock_in_out.late_come`
+        """
+        if not self.tracking:
+            return False
+        now_sec = strtime_seconds(attendance.attendance_clock_in.strftime("%H:%M"))
+        now_sec -= self.grace_seconds(shift, "allowed_clock_in")
+        if start_time > end_time:
+            return now_sec < MID_DAY_SECONDS or now_sec > start_time
+        return start_time < now_sec
+
+    def is_early_out(self, attendance, start_time, end_time, shift):
+        """
+        Same as `attendance.views.clock_in_out.early_out`
+        """
+        if not self.tracking:
+            return False
+        now_sec = strtime_seconds(attendance.attendance_clock_out.strftime("%H:%M"))
+        now_sec += self.grace_seconds(shift, "allowed_clock_out")
+        if start_time > end_time:
+            return now_sec >= MID_DAY_SECONDS or now_sec < end_time
+        return end_time > now_sec
+
+    def load(self):
+        """
+        Load the shift schedules and the attendance state of the employees
+        """
+        punches_by_employee = defaultdict(list)
+        for punch in self.punches:
+            punches_by_employee[punch.employee_id].append(punch)
+        employee_ids = list(punches_by_employee)
+        window_start = self.punches[0].punch_datetime.date() - timedelta(days=1)
+
+        work_infos = EmployeeWorkInformation.objects.filter(
+            employee_id__in=employee_ids
+        ).select_related("employee_id", "shift_id__grace_time_id", "work_type_id")
+        shift_days = list(EmployeeShiftDay.objects.filter())
+        self.shift_days = {day.day: day for day in shift_days}
+        self.shift_days_by_id = {day.pk: day for day in shift_days}
+        self.schedules = {}
+        for schedule in EmployeeShiftSchedule.objects.filter().order_by("-id"):
+            self.schedules[(schedule.day_id, schedule.shift_id_id)] = (
+                schedule.minimum_working_hour,
+                (
+                    strtime_seconds(schedule.start_time.strftime("%H:%M"))
+                    if schedule.start_time
+                    else 0
+                ),
+                (
+                    strtime_seconds(schedule.end_time.strftime("%H:%M"))
+                    if schedule.end_time
+                    else 0
+                ),
+                schedule.is_night_shift,
+            )
+        self.default_grace_time = GraceTime.objects.filter(
+            is_default=True, is_active=True
+        ).first()
+        self.tracking = enable_late_come_early_out_tracking(None).get("tracking")
+        self.condition = AttendanceValidationCondition.objects.first()
+        self.validation_at_work = strtime_seconds(
+            self.condition.validation_at_work if self.condition else "09:00"
+        )
+
+        open_dates = set(
+            AttendanceActivity.objects.filter(
+                employee_id__in=employee_ids,
+                clock_out__isnull=True,
+                attendance_date__isnull=False,
+            ).values_list("attendance_date", flat=True)
+        )
+        in_window = Q(attendance_date__gte=window_start) | Q(
+            attendance_date__in=open_dates
+        )
+        activities = defaultdict(list)
+        for activity in AttendanceActivity.objects.filter(
+            Q(employee_id__in=employee_ids),
+            in_window | Q(clock_out__isnull=True),
+        ).order_by("id"):
+            activities[activity.employee_id_id].append(activity)
+        attendances = defaultdict(list)
+        for attendance in Attendance.objects.filter(
+            Q(employee_id__in=employee_ids), in_window
+        ).order_by("id"):
+            attendances[attendance.employee_id_id].append(attendance)
+        attendance_dates = {
+            attendance.pk: (attendance.employee_id_id, attendance.attendance_date)
+            for employee_attendances in attendances.values()
+            for attendance in employee_attendances
+        }
+        late_early = defaultdict(dict)
+        for attendance_id, type in AttendanceLateComeEarlyOut.objects.filter(
+            attendance_id__in=list(attendance_dates)
+        ).values_list("attendance_id", "type"):
+            employee_id, attendance_date = attendance_dates[attendance_id]
+            late_early[employee_id].setdefault(attendance_date, set()).add(type)
+
+        self.states = {
+            work_info.employee_id_id: EmployeePunchState(
+                self,
+                work_info,
+                activities[work_info.employee_id_id],
+                attendances[work_info.employee_id_id],
+                late_early[work_info.employee_id_id],
+            )
+            for work_info in work_infos
+        }
+        return punches_by_employee
+
+    def run(self):
+        """
+        Ingest the punches.
+
+        Returns:
+            dict: the number of punches, skipped punches, and created
+            activities and attendances
+        """
+        result = {"punches": len(self.punches), "skipped": 0}
+        if not self.punches:
+            return {**result, "activities": 0, "attendances": 0}
+        punches_by_employee = self.load()
+        states = []
+        for employee_id, punches in punches_by_employee.items():
+            state = self.states.get(employee_id)
+            if state is None:
+                # Employees without work information cannot clock in
+                result["skipped"] += len(punches)
+                continue
+            try:
+                for punch in punches:
+                    state.punch(punch)
+            except Exception:
+                logger.error(
+                    "Biometric punches of employee %s could not be processed",
+                    employee_id,
+                    exc_info=True,
+                )
+                result["skipped"] += len(punches)
+                continue
+            result["skipped"] += state.skipped
+            states.append(state)
+        self.save(states)
+        result["activities"] = sum(len(state.new_activities) for state in states)
+        result["attendances"] = sum(len(state.new_attendances) for state in states)
+        return result
+
+    def prepare_attendance(self, attendance, overtime_deltas):
+        """
+        Same as the computations of `Attendance.save` before saving
+        """
+        attendance.update_attendance_overtime()
+        attendance.attendance_day = self.shift_day(attendance.attendance_date)
+        attendance.adjust_minimum_hour()
+        attendance.apply_overtime_conditions(self.condition)
+        key = hour_account_key(attendance.employee_id_id, attendance.attendance_date)
+        delta = 0
+        if (
+            attendance.attendance_overtime_approve
+            and attendance.ingestion_prev_approved is False
+        ):
+            attendance.approved_overtime_second = attendance.overtime_second
+            delta = attendance.approved_overtime_second
+        elif not attendance.attendance_overtime_approve:
+            delta = -attendance.approved_overtime_second
+            attendance.approved_overtime_second = 0
+        overtime_deltas[key] = overtime_deltas.get(key, 0) + delta
+        return key
+
+    @transaction.atomic
+    def save(self, states):
+        """
+        Write the replayed activities and attendances in bulk
+        """
+        new_activities = []
+        changed_activities = []
+        new_attendances = []
+        changed_attendances = []
+        for state in states:
+            new_activities += state.new_activities
+            changed_activities += state.changed_activities.values()
+            new_attendances += state.new_attendances
+            changed_attendances += state.changed_attendances.values()
+        attendances = new_attendances + changed_attendances
+        if not (new_activities or changed_activities):
+            return
+
+        overtime_deltas = {}
+        for attendance in sorted(
+            attendances, key=lambda attendance: attendance.ingestion_order
+        ):
+            self.prepare_attendance(attendance, overtime_deltas)
+
+        AttendanceActivity.objects.bulk_create(
+            new_activities, batch_size=self.batch_size
+        )
+        AttendanceActivity.objects.bulk_update(
+            changed_activities, ACTIVITY_UPDATE_FIELDS, batch_size=self.batch_size
+        )
+        bulk_create_with_history(
+            new_attendances, Attendance, batch_size=self.batch_size
+        )
+        if any(attendance.pk is None for attendance in new_attendances):
+            # Backends that do not return the primary keys of bulk inserts
+            ids = {
+                (employee_id, attendance_date): pk
+                for pk, employee_id, attendance_date in Attendance.objects.filter(
+                    employee_id__in=[
+                        attendance.employee_id_id for attendance in new_attendances
+                    ],
+                    attendance_date__in=[
+                        attendance.attendance_date for attendance in new_attendances
+                    ],
+                ).values_list("pk", "employee_id", "attendance_date")
+            }
+            for attendance in new_attendances:
+                attendance.pk = ids.get(
+                    (attendance.employee_id_id, attendance.attendance_date)
+                )
+        bulk_update_with_history(
+            changed_attendances,
+            Attendance,
+            ATTENDANCE_UPDATE_FIELDS,
+            batch_size=self.batch_size,
+        )
+
+        self.save_late_early(states)
+        apply_hour_accounts(overtime_deltas)
+        self.save_work_records(attendances)
+
+    def save_late_early(self, states):
+        late_early = []
+        early_out_ids = []
+        for state in states:
+            for attendance_date, type in state.created_late_early:
+                late_early.append(
+                    AttendanceLateComeEarlyOut(
+                        attendance_id=state.attendances[attendance_date],
+                        employee_id=state.employee,
+                        type=type,
+                    )
+                )
+            for attendance_date, _type in state.deleted_early_out:
+                early_out_ids.append(state.attendances[attendance_date].pk)
+        if early_out_ids:
+            AttendanceLateComeEarlyOut.objects.filter(
+                attendance_id__in=early_out_ids, type="early_out"
+            ).delete()
+        AttendanceLateComeEarlyOut.objects.bulk_create(
+            late_early, batch_size=self.batch_size
+        )
+
+    def save_work_records(self, attendances):
+        """
+        Same as the `attendance_post_save` signal for the attendances
+        """
+        work_records = defaultdict(list)
+        for work_record in WorkRecords.objects.filter(
+            employee_id__in={attendance.employee_id_id for attendance in attendances},
+            date__in={attendance.attendance_date for attendance in attendances},
+        ).order_by("id"):
+            work_records[(work_record.employee_id_id, work_record.date)].append(
+                work_record
+            )
+        new_records = []
+        changed_records = []
+        duplicate_ids = []
+        now = timezone.now()
+        for attendance in attendances:
+            records = work_records.get(
+                (attendance.employee_id_id, attendance.attendance_date)
+            )
+            if records:
+                work_record = records[0]
+                duplicate_ids += [record.pk for record in records[1:]]
+                changed_records.append(work_record)
+            else:
+                work_record = WorkRecords()
+                new_records.append(work_record)
+            update_attendance_work_record(work_record, attendance)
+            work_record.last_update = now
+        if duplicate_ids:
+            WorkRecords.objects.filter(id__in=duplicate_ids).delete()
+        WorkRecords.objects.bulk_create(new_records, batch_size=self.batch_size)
+        WorkRecords.objects.bulk_update(
+            changed_records, WORK_RECORD_UPDATE_FIELDS, batch_size=self.batch_size
+        )
+
+
+def ingest_punches(punches, batch_size=BATCH_SIZE):
+    """
+    Ingest biometric punches in bulk, see `PunchIngestion.run`
+    """
+    result = PunchIngestion(punches, batch_size=batch_size).run()
+    logger.info(
+        "Biometric punches ingested: %s punches, %s skipped, %s activities, "
+        "%s attendances created",
+        result["punches"],
+        result["skipped"],
+        result["activities"],
+        result["attendances"],
+    )
+    return result
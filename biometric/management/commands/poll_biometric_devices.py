@@ -0,0 +1,98 @@
+import signal
+import threading
+
+from django.core.management.base import BaseCommand
+
+from biometric.poller import DevicePoller
+
+
+class Command(BaseCommand):
+    help = (
+        "Poll the attendance logs of every scheduled biometric device from one "
+        "supervised process, only one poller runs at a time"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Maximum number of devices polled at the same time",
+        )
+        parser.add_argument(
+            "--refresh-interval",
+            type=int,
+            default=30,
+            help="Seconds between reloads of the scheduled devices",
+        )
+        parser.add_argument(
+            "--max-backoff",
+            type=int,
+            default=3600,
+            help="Longest delay in seconds before retrying a failing device",
+        )
+        parser.add_argument(
+            "--jitter",
+            type=float,
+            default=0.1,
+            help="Random fraction added to or removed from every poll delay",
+        )
+        parser.add_argument(
+            "--lease-ttl",
+            type=int,
+            default=60,
+            help="Seconds the poller lock is held without being renewed",
+        )
+        parser.add_argument(
+            "--metrics-interval",
+            type=int,
+            default=60,
+            help="Seconds between metrics reports, 0 to disable them",
+        )
+
+    def handle(self, *args, **options):
+        poller = DevicePoller(
+            workers=options["workers"],
+            refresh_interval=options["refresh_interval"],
+            max_backoff=options["max_backoff"],
+            jitter=options["jitter"],
+            lease_ttl=options["lease_ttl"],
+        )
+        signal.signal(signal.SIGTERM, lambda *args: poller.stop())
+        thread = threading.Thread(target=poller.run, name="biometric-device-poller")
+        thread.start()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Biometric device poller {poller.owner} started with "
+                f"{options['workers']} workers."
+            )
+        )
+        try:
+            while thread.is_alive():
+                thread.join(options["metrics_interval"] or None)
+                if thread.is_alive() and options["metrics_interval"]:
+                    self.report(poller.metrics())
+        except KeyboardInterrupt:
+            pass
+        poller.stop()
+        thread.join()
+        self.stdout.write(self.style.SUCCESS("Biometric device poller stopped."))
+
+    def report(self, metrics):
+        latency = metrics["latency"]
+        if not metrics["leader"]:
+            self.stdout.write(
+                self.style.WARNING("Waiting for the poller lock held elsewhere.")
+            )
+            return
+        self.stdout.write(
+            f"devices={metrics['devices']} in_flight={metrics['in_flight']} "
+            f"queue_depth={metrics['queue_depth']} polls={metrics['polls']} "
+            f"errors={metrics['errors']} "
+            f"latency_avg={self.seconds(latency['avg'])} "
+            f"latency_max={self.seconds(latency['max'])}"
+        )
+
+    @staticmethod
+    def seconds(value):
+        return "-" if value is None else f"{value:.2f}s"
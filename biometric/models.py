@@ -5,11 +5,14 @@ and employee attendance within a company.
 """
 
 import uuid
+from datetime import datetime
 
 import requests
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator
 from django.db import models
+from django.db.models import Q
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from base.horilla_company_manager import HorillaCompanyManager
@@ -102,6 +105,7 @@ class BiometricDevices(HorillaModel):
     )
     last_fetch_date = models.DateField(null=True, blank=True)
     last_fetch_time = models.TimeField(null=True, blank=True)
+    fetch_cursor = models.JSONField(default=dict, blank=True, editable=False)
     device_direction = models.CharField(
         max_length=50,
         choices=BIO_DEVICE_DIRECTION,
@@ -121,6 +125,47 @@ class BiometricDevices(HorillaModel):
     def __str__(self):
         return f"{self.name} - {self.machine_type}"
 
+    def get_fetch_cursor(self):
+        """
+        Returns the driver specific high-water mark of the logs already
+        fetched from the device (record count, sequence number and roll-over
+        count, timestamp of the last log).
+
+        Devices fetched before the cursor existed start from their
+        COSEC attendance arguments or last fetch date and time.
+        """
+        cursor = dict(self.fetch_cursor or {})
+        if cursor:
+            return cursor
+        if self.machine_type == "cosec":
+            device_args = COSECAttendanceArguments.objects.filter(
+                device_id=self
+            ).first()
+            if device_args and device_args.last_fetch_seq_number:
+                cursor["roll_over_count"] = int(
+                    device_args.last_fetch_roll_ovr_count or 0
+                )
+                cursor["seq_number"] = int(device_args.last_fetch_seq_number)
+        elif self.last_fetch_date and self.last_fetch_time:
+            cursor["timestamp"] = datetime.combine(
+                self.last_fetch_date, self.last_fetch_time
+            ).isoformat()
+        return cursor
+
+    def advance_fetch_cursor(self, last_log_datetime=None, **cursor):
+        """
+        Move the fetch cursor past the logs processed, recording the
+        timestamp of the last one as the last fetch date and time.
+        """
+        self.fetch_cursor = {**self.get_fetch_cursor(), **cursor}
+        update_fields = ["fetch_cursor"]
+        if last_log_datetime:
+            self.fetch_cursor["timestamp"] = last_log_datetime.isoformat()
+            self.last_fetch_date = last_log_datetime.date()
+            self.last_fetch_time = last_log_datetime.time()
+            update_fields += ["last_fetch_date", "last_fetch_time"]
+        self.save(update_fields=update_fields)
+
     def clean(self, *args, **kwargs):
         super().clean(*args, **kwargs)
         required_fields = {}
@@ -300,3 +345,48 @@ class COSECAttendanceArguments(models.Model):
 
     def __str__(self):
         return f"{self.device_id} - {self.last_fetch_roll_ovr_count} - {self.last_fetch_seq_number}"
+
+
+class BiometricPollerLock(models.Model):
+    """
+    Model: BiometricPollerLock
+
+    Description:
+    A lease making sure only one process polls the scheduled biometric
+    devices. The process holding the lease renews it before it expires and
+    stores the metrics of its poller with it.
+    """
+
+    name = models.CharField(max_length=100, unique=True)
+    owner = models.CharField(max_length=200, null=True, blank=True)
+    expires_at = models.DateTimeField(null=True, blank=True)
+    metrics = models.JSONField(default=dict, blank=True)
+    objects = models.Manager()
+
+    class Meta:
+        verbose_name = _("Biometric Poller Lock")
+        verbose_name_plural = _("Biometric Poller Locks")
+
+    def __str__(self):
+        return f"{self.name} - {self.owner}"
+
+    @classmethod
+    def acquire(cls, name, owner, ttl, metrics=None):
+        """
+        Take or renew the lease for `ttl` (a timedelta), returns whether the
+        owner holds it
+        """
+        now = timezone.now()
+        cls.objects.get_or_create(name=name)
+        return bool(
+            cls.objects.filter(name=name)
+            .filter(Q(owner=owner) | Q(owner__isnull=True) | Q(expires_at__lt=now))
+            .update(owner=owner, expires_at=now + ttl, metrics=metrics or {})
+        )
+
+    @classmethod
+    def release(cls, name, owner):
+        """
+        Give the lease up, if the owner holds it
+        """
+        cls.objects.filter(name=name, owner=owner).update(owner=None, expires_at=None)
@@ -0,0 +1,332 @@
+"""
+poller.py
+
+One supervised poller for the scheduled biometric devices.
+
+`DevicePoller` keeps the due time of every device with a scheduler duration
+and fetches the logs of the due ones on a bounded thread pool, instead of one
+`BackgroundScheduler` per device in every web process. A failing device is
+retried with an exponential backoff and every delay is jittered, so devices
+sharing a duration do not all poll at the same time. Only the process holding
+the `BiometricPollerLock` lease polls; it stores the poll latency and queue
+depth metrics with the lease.
+"""
+
+import logging
+import os
+import random
+import socket
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.db import close_old_connections
+
+from biometric.models import BiometricDevices, BiometricPollerLock
+
+logger = logging.getLogger(__name__)
+
+POLLER_LOCK_NAME = "biometric_device_poller"
+
+_poller_thread = None
+
+
+class DevicePollError(Exception):
+    """
+    Raised when the logs of a device could not be fetched
+    """
+
+
+def fetch_device_logs(device):
+    """
+    Fetch and ingest the new logs of the device, returns the number of logs
+    """
+    from biometric.views import (
+        anviz_biometric_attendance_logs,
+        cosec_biometric_attendance_logs,
+        dahua_biometric_attendance_logs,
+        etimeoffice_biometric_attendance_logs,
+        zk_biometric_attendance_logs,
+    )
+
+    if device.machine_type == "zk":
+        count, error_message = zk_biometric_attendance_logs(device)
+        if error_message:
+            raise DevicePollError(error_message)
+        return count
+    fetchers = {
+        "anviz": anviz_biometric_attendance_logs,
+        "cosec": cosec_biometric_attendance_logs,
+        "dahua": dahua_biometric_attendance_logs,
+        "etimeoffice": etimeoffice_biometric_attendance_logs,
+    }
+    if device.machine_type not in fetchers:
+        raise DevicePollError(f"Unsupported device type {device.machine_type}")
+    count = fetchers[device.machine_type](device)
+    if not isinstance(count, int):
+        raise DevicePollError(f"Could not fetch the logs of {device}")
+    return count
+
+
+class DeviceState:
+    """
+    Poll schedule and statistics of one device
+    """
+
+    def __init__(self, device_id, interval, next_due):
+        self.device_id = device_id
+        self.interval = interval
+        self.next_due = next_due
+        self.failures = 0
+        self.in_flight = False
+        self.polls = 0
+        self.errors = 0
+        self.last_latency = None
+        self.last_error = None
+
+
+class DevicePoller:
+    """
+    Polls the scheduled biometric devices on a bounded worker pool
+    """
+
+    def __init__(
+        self,
+        workers=4,
+        refresh_interval=30,
+        max_backoff=3600,
+        jitter=0.1,
+        lease_ttl=60,
+        tick=1,
+        fetch=fetch_device_logs,
+    ):
+        self.workers = workers
+        self.refresh_interval = refresh_interval
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.lease_ttl = lease_ttl
+        self.tick = tick
+        self.fetch = fetch
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.devices = {}
+        self.leader = False
+        self.stop_event = threading.Event()
+        self._lock = threading.Lock()
+        self._next_refresh = 0
+        self._next_lease = 0
+        self._latencies = []
+
+    def delay(self, state):
+        """
+        Seconds until the next poll of the device, backing off on failures
+        """
+        delay = state.interval
+        if state.failures:
+            delay = min(
+                state.interval * 2**state.failures,
+                max(state.interval, self.max_backoff),
+            )
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def refresh(self, now):
+        """
+        Pick up the devices scheduled, unscheduled or rescheduled since the
+        last refresh
+        """
+        from biometric.views import str_time_seconds
+
+        intervals = {}
+        for device_id, duration in (
+            BiometricDevices.objects.entire()
+            .filter(is_scheduler=True, is_active=True)
+            .values_list("id", "scheduler_duration")
+        ):
+            try:
+                interval = str_time_seconds(duration or "00:00")
+            except ValueError:
+                continue
+            if interval > 0:
+                intervals[device_id] = interval
+
+        with self._lock:
+            for device_id in set(self.devices) - set(intervals):
+                del self.devices[device_id]
+            for device_id, interval in intervals.items():
+                state = self.devices.get(device_id)
+                if state is None:
+                    # Spread the first polls over the interval
+                    self.devices[device_id] = DeviceState(
+                        device_id, interval, now + random.uniform(0, interval)
+                    )
+                elif state.interval != interval:
+                    state.interval = interval
+                    state.next_due = min(state.next_due, now + interval)
+
+    def due(self, now):
+        """
+        The due devices that are not being polled, most overdue first
+        """
+        with self._lock:
+            return sorted(
+                (
+                    state
+                    for state in self.devices.values()
+                    if not state.in_flight and state.next_due <= now
+                ),
+                key=lambda state: state.next_due,
+            )
+
+    def poll(self, state):
+        """
+        Fetch the logs of one device and schedule its next poll
+        """
+        start = time.perf_counter()
+        try:
+            close_old_connections()
+            device = (
+                BiometricDevices.objects.entire()
+                .filter(id=state.device_id, is_scheduler=True)
+                .first()
+            )
+            if device:
+                self.fetch(device)
+            state.failures = 0
+            state.last_error = None
+        except Exception as error:
+            state.failures += 1
+            state.errors += 1
+            state.last_error = str(error)
+            logger.warning(
+                "Biometric device %s poll failed (%s in a row): %s",
+                state.device_id,
+                state.failures,
+                error,
+            )
+        finally:
+            close_old_connections()
+            latency = time.perf_counter() - start
+            with self._lock:
+                state.polls += 1
+                state.last_latency = latency
+                state.next_due = time.monotonic() + self.delay(state)
+                state.in_flight = False
+                self._latencies = (self._latencies + [latency])[-500:]
+
+    def metrics(self):
+        """
+        Poll latency, queue depth and per device statistics
+        """
+        now = time.monotonic()
+        with self._lock:
+            states = list(self.devices.values())
+            latencies = list(self._latencies)
+        in_flight = sum(state.in_flight for state in states)
+        return {
+            "owner": self.owner,
+            "leader": self.leader,
+            "workers": self.workers,
+            "devices": len(states),
+            "in_flight": in_flight,
+            "queue_depth": sum(
+                not state.in_flight and state.next_due <= now for state in states
+            ),
+            "polls": sum(state.polls for state in states),
+            "errors": sum(state.errors for state in states),
+            "latency": {
+                "last": latencies[-1] if latencies else None,
+                "avg": sum(latencies) / len(latencies) if latencies else None,
+                "max": max(latencies) if latencies else None,
+            },
+            "device_stats": {
+                str(state.device_id): {
+                    "interval": state.interval,
+                    "next_poll_in": round(max(state.next_due - now, 0), 1),
+                    "failures": state.failures,
+                    "last_latency": state.last_latency,
+                    "last_error": state.last_error,
+                }
+                for state in states
+            },
+        }
+
+    def renew_lease(self):
+        """
+        Take or renew the poller lock, publishing the metrics with it
+        """
+        try:
+            self.leader = BiometricPollerLock.acquire(
+                POLLER_LOCK_NAME,
+                self.owner,
+                timedelta(seconds=self.lease_ttl),
+                metrics=self.metrics(),
+            )
+        except Exception as error:
+            logger.error("Biometric poller lock error: %s", error)
+            self.leader = False
+        finally:
+            close_old_connections()
+
+    def step(self, pool, now):
+        """
+        One scheduling round, returns the number of polls submitted
+        """
+        if now >= self._next_lease:
+            self.renew_lease()
+            self._next_lease = now + self.lease_ttl / 3
+        if not self.leader:
+            return 0
+        if now >= self._next_refresh:
+            self.refresh(now)
+            self._next_refresh = now + self.refresh_interval
+        with self._lock:
+            free = self.workers - sum(
+                state.in_flight for state in self.devices.values()
+            )
+        submitted = 0
+        for state in self.due(now)[: max(free, 0)]:
+            state.in_flight = True
+            pool.submit(self.poll, state)
+            submitted += 1
+        return submitted
+
+    def run(self):
+        """
+        Poll the devices until `stop()` is called
+        """
+        logger.info("Biometric device poller %s started", self.owner)
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="biometric-poller"
+        ) as pool:
+            while not self.stop_event.is_set():
+                try:
+                    self.step(pool, time.monotonic())
+                except Exception as error:
+                    logger.error("Biometric device poller error: %s", error)
+                self.stop_event.wait(self.tick)
+        if self.leader:
+            BiometricPollerLock.release(POLLER_LOCK_NAME, self.owner)
+            self.leader = False
+        logger.info("Biometric device poller %s stopped", self.owner)
+
+    def stop(self):
+        """
+        Stop polling once the running polls are done
+        """
+        self.stop_event.set()
+
+
+def start_device_poller(**kwargs):
+    """
+    Run a device poller in a daemon thread of this process, once
+    """
+    global _poller_thread
+    if _poller_thread is None:
+        poller = DevicePoller(**kwargs)
+        _poller_thread = threading.Thread(
+            target=poller.run, name="biometric-device-poller", daemon=True
+        )
+        _poller_thread.poller = poller
+        _poller_thread.start()
+    return _poller_thread.poller
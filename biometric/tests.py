@@ -0,0 +1,178 @@
+"""test cases"""
+
+from datetime import datetime, time
+
+from django.test import TestCase
+from django.utils import timezone
+
+from attendance.methods.utils import Request
+from attendance.models import Attendance, AttendanceActivity, AttendanceLateComeEarlyOut
+from attendance.views.clock_in_out import clock_in, clock_out
+from base.models import EmployeeShift, EmployeeShiftDay, EmployeeShiftSchedule
+from biometric.ingestion import PUNCH_IN, PUNCH_OUT, Punch, ingest_punches
+from employee.models import Employee, EmployeeWorkInformation
+
+DAYS = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
+
+ATTENDANCE_FIELDS = [
+    "attendance_date",
+    "attendance_clock_in_date",
+    "attendance_clock_in",
+    "attendance_clock_out_date",
+    "attendance_clock_out",
+    "attendance_worked_hour",
+    "minimum_hour",
+    "attendance_overtime",
+    "attendance_validated",
+    "at_work_second",
+    "overtime_second",
+]
+ACTIVITY_FIELDS = [
+    "attendance_date",
+    "clock_in_date",
+    "clock_in",
+    "clock_out_date",
+    "clock_out",
+]
+
+
+def punch_time(*args):
+    return timezone.make_aware(datetime(*args))
+
+
+# Punches by shift, on whole minutes as the clock-in/clock-out views store
+# the attendance times without seconds
+DAY_PUNCHES = [
+    # Normal day
+    (punch_time(2024, 1, 2, 9, 0), PUNCH_IN),
+    (punch_time(2024, 1, 2, 17, 30), PUNCH_OUT),
+    # Missing clock-out, closed by the clock-in of the next day
+    (punch_time(2024, 1, 3, 9, 10), PUNCH_IN),
+    (punch_time(2024, 1, 4, 8, 55), PUNCH_IN),
+    (punch_time(2024, 1, 4, 17, 0), PUNCH_OUT),
+]
+NIGHT_PUNCHES = [
+    (punch_time(2024, 1, 2, 22, 0), PUNCH_IN),
+    (punch_time(2024, 1, 3, 6, 5), PUNCH_OUT),
+]
+
+
+class PunchIngestionTest(TestCase):
+    """
+    Bulk punch ingestion is idempotent and records the same attendances as
+    the clock-in/clock-out views replayed punch by punch
+    """
+
+    @classmethod
+    def create_shift(cls, name, start_time, end_time):
+        shift = EmployeeShift.objects.create(employee_shift=name)
+        for day in cls.days.values():
+            EmployeeShiftSchedule.objects.create(
+                day=day,
+                shift_id=shift,
+                minimum_working_hour="08:00",
+                start_time=start_time,
+                end_time=end_time,
+            )
+        return shift
+
+    @classmethod
+    def create_employee(cls, name, shift):
+        employee = Employee.objects.create(
+            employee_first_name=name,
+            employee_last_name="Punch",
+            email=f"{name.lower()}.punch@example.com",
+            phone="9999999999",
+        )
+        EmployeeWorkInformation.objects.filter(employee_id=employee).update(
+            shift_id=shift
+        )
+        return employee
+
+    @classmethod
+    def setUpTestData(cls):
+        # The shift days are created on app ready, outside the test database
+        cls.days = {
+            day: EmployeeShiftDay.objects.get_or_create(day=day)[0] for day in DAYS
+        }
+        day_shift = cls.create_shift("Day", time(9, 0), time(17, 0))
+        night_shift = cls.create_shift("Night", time(22, 0), time(6, 0))
+        cls.day_employee = cls.create_employee("Day", day_shift)
+        cls.night_employee = cls.create_employee("Night", night_shift)
+        cls.view_day_employee = cls.create_employee("ViewDay", day_shift)
+        cls.view_night_employee = cls.create_employee("ViewNight", night_shift)
+
+    def punches(self):
+        return [
+            Punch(employee.pk, punch_datetime, direction)
+            for employee, punches in (
+                (self.day_employee, DAY_PUNCHES),
+                (self.night_employee, NIGHT_PUNCHES),
+            )
+            for punch_datetime, direction in punches
+        ]
+
+    def replay_through_views(self, employee, punches):
+        for punch_datetime, direction in punches:
+            local_datetime = timezone.localtime(punch_datetime)
+            view = clock_in if direction == PUNCH_IN else clock_out
+            view(
+                Request(
+                    user=employee.employee_user_id,
+                    date=local_datetime.date(),
+                    time=local_datetime.time(),
+                    datetime=punch_datetime,
+                )
+            )
+
+    def recorded(self, employee):
+        """
+        The attendances, attendance activities and late come/early out records
+        of the employee
+        """
+        return (
+            list(
+                Attendance.objects.entire()
+                .filter(employee_id=employee)
+                .order_by("attendance_date")
+                .values(*ATTENDANCE_FIELDS)
+            ),
+            list(
+                AttendanceActivity.objects.entire()
+                .filter(employee_id=employee)
+                .order_by("in_datetime")
+                .values(*ACTIVITY_FIELDS)
+            ),
+            sorted(
+                AttendanceLateComeEarlyOut.objects.entire()
+                .filter(employee_id=employee)
+                .values_list("attendance_id__attendance_date", "type")
+            ),
+        )
+
+    def test_replay_is_idempotent(self):
+        punches = self.punches()
+        result = ingest_punches(punches)
+        self.assertEqual(result["skipped"], 0)
+        attendances = Attendance.objects.entire().count()
+        activities = AttendanceActivity.objects.entire().count()
+        recorded = self.recorded(self.day_employee)
+
+        result = ingest_punches(punches)
+        self.assertEqual(result["skipped"], len(punches))
+        self.assertEqual(Attendance.objects.entire().count(), attendances)
+        self.assertEqual(AttendanceActivity.objects.entire().count(), activities)
+        self.assertEqual(self.recorded(self.day_employee), recorded)
+
+    def test_matches_clock_in_out_views(self):
+        ingest_punches(self.punches())
+        self.replay_through_views(self.view_day_employee, DAY_PUNCHES)
+        self.replay_through_views(self.view_night_employee, NIGHT_PUNCHES)
+
+        for employee, view_employee in (
+            (self.day_employee, self.view_day_employee),
+            (self.night_employee, self.view_night_employee),
+        ):
+            recorded = self.recorded(employee)
+            self.assertTrue(recorded[0])
+            self.assertEqual(recorded, self.recorded(view_employee))
@@ -153,4 +153,9 @@ urlpatterns = [
         views.cosec_users_bulk_delete,
         name="cosec-users-bulk-delete",
     ),
+    path(
+        "biometric-poller-metrics",
+        views.biometric_poller_metrics,
+        name="biometric-poller-metrics",
+    ),
 ]
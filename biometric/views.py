@@ -13,7 +13,6 @@ from threading import Event, Thread
 from urllib.parse import parse_qs, unquote
 
 import pytz
-from apscheduler.schedulers.background import BackgroundScheduler
 from django.contrib import messages
 from django.http import HttpResponse, JsonResponse
 from django.shortcuts import redirect, render
@@ -25,7 +24,6 @@ from zk import ZK
 from zk import exception as zk_exception
 
 from attendance.methods.utils import Request
-from attendance.models import AttendanceActivity
 from attendance.views.clock_in_out import clock_in, clock_out
 from base.methods import get_key_instances, get_pagination
 from employee.models import Employee, EmployeeWorkInformation
@@ -53,7 +51,9 @@ from .forms import (
     EmployeeBiometricAddForm,
     MapBioUsers,
 )
-from .models import BiometricDevices, BiometricEmployees, COSECAttendanceArguments
+from .ingestion import PUNCH_IN, PUNCH_OUT, PUNCH_TOGGLE, Punch, ingest_punches
+from .models import BiometricDevices, BiometricEmployees, BiometricPollerLock
+from .poller import POLLER_LOCK_NAME
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +69,14 @@ def str_time_seconds(time):
     return sum(a * b for a, b in zip(ftr, map(int, time.split(":"))))
 
 
+def fetch_cursor_datetime(cursor):
+    """
+    Returns the timestamp of the last log fetched from a device, if any
+    """
+    timestamp = cursor.get("timestamp")
+    return datetime.fromisoformat(timestamp) if timestamp else None
+
+
 def paginator_qry(qryset, page_number):
     """
     This method is used to paginate query set
@@ -128,7 +136,9 @@ class ZKBioAttendance(Thread):
     - _stop_event: Event flag to signal thread termination.
 
     Methods:
-    - run(): Overrides the run method of the Thread class to capture live attendance data.
+    - run(): Overrides the run method of the Thread class to capture live attendance data,
+      reconnecting with a backoff when the device resets the connection.
+    - capture(): Captures live attendance data over one connection.
     - stop(): Sets the _stop_event to signal the thread to stop gracefully.
     """
 
@@ -141,85 +151,93 @@ class ZKBioAttendance(Thread):
         self.conn = None
 
     def run(self):
-        try:
-            zk_device = ZK(
-                self.machine_ip,
-                port=self.port_no,
-                timeout=5,
-                password=self.password,
-                force_udp=False,
-                ommit_ping=False,
-            )
-            patch_direction = {"in": 0, "out": 1}
-            conn = zk_device.connect()
-            self.conn = conn
-            if conn:
-                device = BiometricDevices.objects.filter(
-                    machine_ip=self.machine_ip, port=self.port_no
-                ).first()
-                if device and device.is_live:
-                    while not self._stop_event.is_set():
-                        attendances = conn.live_capture()
-                        for attendance in attendances:
-                            if attendance:
-                                user_id = attendance.user_id
-                                punch_code = (
-                                    patch_direction[device.device_direction]
-                                    if device.device_direction in patch_direction
-                                    else attendance.punch
-                                )
-                                date_time = django_timezone.make_aware(
-                                    attendance.timestamp
-                                )
-                                # date_time = attendance.timestamp
-                                date = date_time.date()
-                                time = date_time.time()
-                                device.last_fetch_date = date
-                                device.last_fetch_time = time
-                                device.save()
-                                bio_id = BiometricEmployees.objects.filter(
-                                    user_id=user_id, device_id=device
-                                ).first()
-                                if bio_id:
-                                    if punch_code in {0, 3, 4}:
-                                        try:
-                                            clock_in(
-                                                Request(
-                                                    user=bio_id.employee_id.employee_user_id,
-                                                    date=date,
-                                                    time=time,
-                                                    datetime=date_time,
-                                                )
-                                            )
-                                        except Exception as error:
-                                            logger.error(
-                                                "Got an error in clock_in %s", error
-                                            )
-
-                                            continue
-                                    else:
-                                        try:
-                                            clock_out(
-                                                Request(
-                                                    user=bio_id.employee_id.employee_user_id,
-                                                    date=date,
-                                                    time=time,
-                                                    datetime=date_time,
-                                                )
+        delay = 5
+        while not self._stop_event.is_set():
+            try:
+                self.capture()
+                return
+            except ConnectionResetError as error:
+                # Reconnect in this thread, backing off while the device is down
+                logger.warning("ZK live capture connection reset: %s", error)
+                self._stop_event.wait(delay)
+                delay = min(delay * 2, 300)
+
+    def capture(self):
+        """Capture the live attendance of the device until stopped"""
+        zk_device = ZK(
+            self.machine_ip,
+            port=self.port_no,
+            timeout=5,
+            password=self.password,
+            force_udp=False,
+            ommit_ping=False,
+        )
+        patch_direction = {"in": 0, "out": 1}
+        conn = zk_device.connect()
+        self.conn = conn
+        if conn:
+            device = BiometricDevices.objects.filter(
+                machine_ip=self.machine_ip, port=self.port_no
+            ).first()
+            if device and device.is_live:
+                while not self._stop_event.is_set():
+                    attendances = conn.live_capture()
+                    for attendance in attendances:
+                        if attendance:
+                            user_id = attendance.user_id
+                            punch_code = (
+                                patch_direction[device.device_direction]
+                                if device.device_direction in patch_direction
+                                else attendance.punch
+                            )
+                            date_time = django_timezone.make_aware(attendance.timestamp)
+                            # date_time = attendance.timestamp
+                            date = date_time.date()
+                            time = date_time.time()
+                            device.last_fetch_date = date
+                            device.last_fetch_time = time
+                            device.save()
+                            bio_id = BiometricEmployees.objects.filter(
+                                user_id=user_id, device_id=device
+                            ).first()
+                            if bio_id:
+                                if punch_code in {0, 3, 4}:
+                                    try:
+                                        clock_in(
+                                            Request(
+                                                user=bio_id.employee_id.employee_user_id,
+                                                date=date,
+                                                time=time,
+                                                datetime=date_time,
                                             )
-                                        except Exception as error:
-                                            logger.error(
-                                                "Got an error in clock_out", error
+                                        )
+                                    except Exception as error:
+                                        logger.error(
+                                            "Got an error in clock_in %s", error
+                                        )
+
+                                        continue
+                                else:
+                                    try:
+                                        clock_out(
+                                            Request(
+                                                user=bio_id.employee_id.employee_user_id,
+                                                date=date,
+                                                time=time,
+                                                datetime=date_time,
                                             )
-                                            continue
-                            else:
-                                continue
-        except ConnectionResetError as error:
-            ZKBioAttendance(self.machine_ip, self.port_no, self.password).start()
+                                        )
+                                    except Exception as error:
+                                        logger.error("Got an error in clock_out", error)
+                                        continue
+                        else:
+                            continue
 
     def stop(self):
         """To stop the ZK live capture mode"""
-        self.conn.end_live_capture = True
+        self._stop_event.set()
+        if self.conn:
+            self.conn.end_live_capture = True
 
 
 class COSECBioAttendanceThread(Thread):
@@ -251,16 +269,6 @@ class COSECBioAttendanceThread(Thread):
             if not device.is_live:
                 return
 
-            device_args = COSECAttendanceArguments.objects.filter(
-                device_id=device
-            ).first()
-            last_fetch_roll_ovr_count = (
-                int(device_args.last_fetch_roll_ovr_count) if device_args else 0
-            )
-            last_fetch_seq_number = (
-                int(device_args.last_fetch_seq_number) if device_args else 1
-            )
-
             cosec = COSECBiometric(
                 device.machine_ip,
                 device.port,
@@ -269,8 +277,9 @@ class COSECBioAttendanceThread(Thread):
                 timeout=10,
             )
             while not self._stop_event.is_set():
+                cursor = device.get_fetch_cursor()
                 attendances = cosec.get_attendance_events(
-                    last_fetch_roll_ovr_count, int(last_fetch_seq_number) + 1
+                    cursor.get("roll_over_count", 0), cursor.get("seq_number", 0) + 1
                 )
                 if not isinstance(attendances, list):
                     self._stop_event.wait(5)
@@ -308,16 +317,7 @@ class COSECBioAttendanceThread(Thread):
                         logger.error("Error processing attendance: ", error)
 
                 if attendances:
-                    last_attendance = attendances[-1]
-                    last_fetch_seq_number = last_attendance["seq-No"]
-                    last_fetch_roll_ovr_count = last_attendance["roll-over-count"]
-                    COSECAttendanceArguments.objects.update_or_create(
-                        device_id=device,
-                        defaults={
-                            "last_fetch_roll_ovr_count": last_fetch_roll_ovr_count,
-                            "last_fetch_seq_number": last_fetch_seq_number,
-                        },
-                    )
+                    advance_cosec_cursor(device, attendances[-1])
                 # Sleep to prevent overwhelming the device with requests
                 self._stop_event.wait(2)
 
@@ -429,13 +429,6 @@ def biometric_device_schedule(request, device_id):
                     device.is_scheduler = True
                     device.is_live = False
                     device.save()
-                    scheduler = BackgroundScheduler()
-                    scheduler.add_job(
-                        lambda: zk_biometric_attendance_scheduler(device.id),
-                        "interval",
-                        seconds=str_time_seconds(device.scheduler_duration),
-                    )
-                    scheduler.start()
                     return HttpResponse("<script>window.location.reload()</script>")
                 except Exception as error:
                     logger.error("An error comes in biometric_device_schedule ", error)
@@ -460,13 +453,6 @@ def biometric_device_schedule(request, device_id):
                 device.is_scheduler = True
                 device.scheduler_duration = duration
                 device.save()
-                scheduler = BackgroundScheduler()
-                scheduler.add_job(
-                    lambda: anviz_biometric_attendance_scheduler(device.id),
-                    "interval",
-                    seconds=str_time_seconds(device.scheduler_duration),
-                )
-                scheduler.start()
                 return HttpResponse("<script>window.location.reload()</script>")
             elif device.machine_type == "dahua":
                 duration = request.POST.get("scheduler_duration")
@@ -474,13 +460,6 @@ def biometric_device_schedule(request, device_id):
                 device.is_live = False
                 device.scheduler_duration = duration
                 device.save()
-                scheduler = BackgroundScheduler()
-                scheduler.add_job(
-                    lambda: dahua_biometric_attendance_scheduler(device.id),
-                    "interval",
-                    seconds=str_time_seconds(device.scheduler_duration),
-                )
-                scheduler.start()
                 return HttpResponse("<script>window.location.reload()</script>")
             elif device.machine_type == "cosec":
                 duration = request.POST.get("scheduler_duration")
@@ -488,17 +467,10 @@ def biometric_device_schedule(request, device_id):
                 device.is_live = False
                 device.scheduler_duration = duration
                 device.save()
-                scheduler = BackgroundScheduler()
                 existing_thread = BIO_DEVICE_THREADS.get(device.id)
                 if existing_thread:
                     existing_thread.stop()
                     del BIO_DEVICE_THREADS[device.id]
-                scheduler.add_job(
-                    lambda: cosec_biometric_attendance_scheduler(device.id),
-                    "interval",
-                    seconds=str_time_seconds(device.scheduler_duration),
-                )
-                scheduler.start()
                 return HttpResponse("<script>window.location.reload()</script>")
             elif device.machine_type == "etimeoffice":
                 duration = request.POST.get("scheduler_duration")
@@ -506,13 +478,6 @@ def biometric_device_schedule(request, device_id):
                 device.is_live = False
                 device.scheduler_duration = duration
                 device.save()
-                scheduler = BackgroundScheduler()
-                scheduler.add_job(
-                    lambda: etimeoffice_biometric_attendance_scheduler(device.id),
-                    "interval",
-                    seconds=str_time_seconds(device.scheduler_duration),
-                )
-                scheduler.start()
                 return HttpResponse("<script>window.location.reload()</script>")
             else:
                 return HttpResponse("<script>window.location.reload()</script>")
@@ -527,6 +492,27 @@ def biometric_device_schedule(request, device_id):
     return render(request, "biometric/scheduler_device_form.html", context)
 
 
+@login_required
+@install_required
+@permission_required("biometric.view_biometricdevices")
+def biometric_poller_metrics(request):
+    """
+    Returns the poll latency, queue depth and per device statistics published
+    by the process holding the biometric device poller lock.
+    """
+    lock = BiometricPollerLock.objects.filter(name=POLLER_LOCK_NAME).first()
+    if not lock or not lock.owner:
+        return JsonResponse({"running": False})
+    return JsonResponse(
+        {
+            "running": lock.expires_at > django_timezone.now(),
+            "owner": lock.owner,
+            "expires_at": lock.expires_at,
+            **lock.metrics,
+        }
+    )
+
+
 @login_required
 @install_required
 @hx_request_required
@@ -2168,6 +2154,7 @@ def zk_biometric_attendance_logs(device_or_devices):
 
     errors = []
     combined_attendances = []
+    fetched_devices = []
     patch_direction = {"in": 0, "out": 1}
 
     bio_id_map = {
@@ -2191,29 +2178,33 @@ def zk_biometric_attendance_logs(device_or_devices):
         try:
             conn = zk_device.connect()
             conn.enable_device()
+            cursor = device.get_fetch_cursor()
+            record_count = cursor.get("record_count")
+            conn.read_sizes()
+            if record_count is not None and conn.records == record_count:
+                # Nothing was logged since the last fetch, skip the download
+                continue
             attendances = conn.get_attendance()
             if not attendances:
                 continue
 
-            last_attendance_datetime = attendances[-1].timestamp
-
-            if device.last_fetch_date and device.last_fetch_time:
-                filtered = [
-                    att
-                    for att in attendances
-                    if (att.timestamp.date() > device.last_fetch_date)
-                    or (
-                        att.timestamp.date() == device.last_fetch_date
-                        and att.timestamp.time() > device.last_fetch_time
-                    )
-                ]
+            last_fetched = fetch_cursor_datetime(cursor)
+            if (
+                record_count
+                and record_count <= len(attendances)
+                and attendances[record_count - 1].timestamp == last_fetched
+            ):
+                # The log buffer only grew since the last fetch
+                filtered = attendances[record_count:]
+            elif last_fetched:
+                # The buffer was cleared or rotated, fall back to the timestamp
+                filtered = [att for att in attendances if att.timestamp > last_fetched]
             else:
                 filtered = attendances
 
-            # Update last fetch markers
-            device.last_fetch_date = last_attendance_datetime.date()
-            device.last_fetch_time = last_attendance_datetime.time()
-            device.save()
+            fetched_devices.append(
+                (device, len(attendances), attendances[-1].timestamp)
+            )
             for attendance in filtered:
                 attendance.device = device  # Attach device info
                 attendance.punch = (
@@ -2232,34 +2223,33 @@ def zk_biometric_attendance_logs(device_or_devices):
             if conn:
                 conn.disconnect()
 
-    # Sort all filtered attendances by time
-    combined_attendances.sort(key=lambda a: a.timestamp)
-
+    punches = []
     for attendance in combined_attendances:
-        user_id = attendance.user_id
-        punch_code = attendance.punch
-        date_time = django_timezone.make_aware(attendance.timestamp)
-        date = date_time.date()
-        time = date_time.time()
-        device_id = attendance.device.id
-        bio_id = bio_id_map.get((device_id, user_id))
-        if bio_id:
-            request_data = Request(
-                user=bio_id.employee_id.employee_user_id,
-                date=date,
-                time=time,
-                datetime=date_time,
+        bio_id = bio_id_map.get((attendance.device.id, attendance.user_id))
+        if not bio_id:
+            continue
+        if attendance.punch in {0, 3, 4}:
+            direction = PUNCH_IN
+        elif attendance.punch in {1, 2, 5}:
+            direction = PUNCH_OUT
+        else:
+            continue
+        punches.append(
+            Punch(
+                employee_id=bio_id.employee_id_id,
+                punch_datetime=django_timezone.make_aware(attendance.timestamp),
+                direction=direction,
             )
-            try:
-                if punch_code in {0, 3, 4}:
-                    clock_in(request_data)
-                elif punch_code in {1, 2, 5}:
-                    clock_out(request_data)
-            except Exception:
-                logger.error(
-                    f"[Device: {attendance.device.name}] Punch processing error",
-                    exc_info=True,
-                )
+        )
+    try:
+        ingest_punches(punches)
+    except Exception as e:
+        logger.error("Biometric punch ingestion error", exc_info=True)
+        errors.append(f"Error: {str(e)}")
+    else:
+        # Only move the cursors once the logs are in, a failed run is retried
+        for device, record_count, last_log_datetime in fetched_devices:
+            device.advance_fetch_cursor(last_log_datetime, record_count=record_count)
 
     return len(combined_attendances), "; ".join(errors) if errors else None
 
@@ -2286,45 +2276,55 @@ def anviz_biometric_attendance_logs(device):
         api_secret=device.api_secret,
         anviz_request_id=device.anviz_request_id,
     )
-    begin_time = (
-        datetime.combine(device.last_fetch_date, device.last_fetch_time)
-        if device.last_fetch_date and device.last_fetch_time
-        else current_utc_time.replace(hour=0, minute=0, second=0, microsecond=0)
-    )
+    begin_time = fetch_cursor_datetime(
+        device.get_fetch_cursor()
+    ) or current_utc_time.replace(hour=0, minute=0, second=0, microsecond=0)
     attendance_records = anviz_device.get_attendance_records(
-        begin_time=begin_time, token=device.api_token
+        begin_time=begin_time, end_time=current_utc_time, token=device.api_token
     )
-    device.last_fetch_date, device.last_fetch_time = (
-        current_utc_time.date(),
-        current_utc_time.time(),
-    )
-    device.save()
+    badge_ids = {
+        attendance["employee"]["workno"] for attendance in attendance_records["list"]
+    }
+    employee_ids = {}
+    for employee_id, badge_id in Employee.objects.filter(
+        badge_id__in=badge_ids
+    ).values_list("id", "badge_id"):
+        employee_ids.setdefault(badge_id, employee_id)
+    punches = []
     for attendance in attendance_records["list"]:
-        badge_id = attendance["employee"]["workno"]
-        punch_code = attendance["checktype"]
+        employee_id = employee_ids.get(attendance["employee"]["workno"])
+        if not employee_id:
+            continue
         date_time_utc = datetime.strptime(
             attendance["checktime"], "%Y-%m-%dT%H:%M:%S%z"
         )
-        date_time_obj = date_time_utc.astimezone(django_timezone.get_current_timezone())
-        employee = Employee.objects.filter(badge_id=badge_id).first()
-        if employee:
-            request_data = Request(
-                user=employee.employee_user_id,
-                date=date_time_obj.date(),
-                time=date_time_obj.time(),
-                datetime=date_time_obj,
+        punches.append(
+            Punch(
+                employee_id=employee_id,
+                punch_datetime=date_time_utc.astimezone(
+                    django_timezone.get_current_timezone()
+                ),
+                # 1, 129 check type check out and door close
+                direction=(
+                    PUNCH_IN if attendance["checktype"] in {0, 128} else PUNCH_OUT
+                ),
+            )
+        )
+    try:
+        ingest_punches(punches)
+    except Exception as error:
+        logger.error("Error in biometric punch ingestion ", error)
+    else:
+        if attendance_records["list"]:
+            # Check times are kept in UTC, like the requested time range
+            device.advance_fetch_cursor(
+                max(
+                    datetime.strptime(attendance["checktime"], "%Y-%m-%dT%H:%M:%S%z")
+                    for attendance in attendance_records["list"]
+                )
+                .astimezone(pytz.utc)
+                .replace(tzinfo=None)
             )
-            if punch_code in {0, 128}:
-                try:
-                    clock_in(request_data)
-                except Exception as error:
-                    logger.error("Error in clock in ", error)
-            else:
-                try:
-                    # // 1 , 129 check type check out and door close
-                    clock_out(request_data)
-                except Exception as error:
-                    logger.error("Error in clock out ", error)
     return len(attendance_records["list"])
 
 
@@ -2337,16 +2337,52 @@ def anviz_biometric_attendance_scheduler(device_id):
         anviz_biometric_attendance_logs(device)
 
 
-def cosec_biometric_attendance_logs(device):
+COSEC_EVENTS_PER_REQUEST = 100
+
+
+def cosec_attendance_events(cosec, cursor):
     """
-    Retrieves and processes attendance logs from a COSEC biometric device.
+    Fetch the events logged on a COSEC device after the sequence number and
+    roll-over count of the cursor, a page of events at a time.
+
+    Returns the response of the device when the first page fails.
     """
-    device_args = COSECAttendanceArguments.objects.filter(device_id=device).first()
-    last_fetch_roll_ovr_count = (
-        int(device_args.last_fetch_roll_ovr_count) if device_args else 0
+    roll_over_count = int(cursor.get("roll_over_count", 0))
+    seq_number = int(cursor.get("seq_number", 0))
+    events = []
+    while True:
+        page = cosec.get_attendance_events(
+            roll_over_count, seq_number + 1, no_of_events=COSEC_EVENTS_PER_REQUEST
+        )
+        if not isinstance(page, list):
+            return events or page
+        events.extend(page)
+        if len(page) < COSEC_EVENTS_PER_REQUEST:
+            return events
+        position = (int(page[-1]["roll-over-count"]), int(page[-1]["seq-No"]))
+        if position == (roll_over_count, seq_number):
+            return events
+        roll_over_count, seq_number = position
+
+
+def advance_cosec_cursor(device, last_event):
+    """
+    Move the fetch cursor of a COSEC device past the given event
+    """
+    device.advance_fetch_cursor(
+        datetime.combine(
+            datetime.strptime(last_event["date"], "%d/%m/%Y").date(),
+            datetime.strptime(last_event["time"], "%H:%M:%S").time(),
+        ),
+        roll_over_count=int(last_event["roll-over-count"]),
+        seq_number=int(last_event["seq-No"]),
     )
-    last_fetch_seq_number = int(device_args.last_fetch_seq_number) if device_args else 1
 
+
+def cosec_biometric_attendance_logs(device):
+    """
+    Retrieves and processes attendance logs from a COSEC biometric device.
+    """
     cosec = COSECBiometric(
         device.machine_ip,
         device.port,
@@ -2354,52 +2390,46 @@ def cosec_biometric_attendance_logs(device):
         device.bio_password,
         timeout=10,
     )
-    attendances = cosec.get_attendance_events(
-        last_fetch_roll_ovr_count, int(last_fetch_seq_number) + 1
-    )
+    attendances = cosec_attendance_events(cosec, device.get_fetch_cursor())
 
     if not isinstance(attendances, list):
         return
 
+    bio_employees = {}
+    for bio_employee in BiometricEmployees.objects.filter(
+        ref_user_id__in={attendance["detail-1"] for attendance in attendances}
+    ):
+        bio_employees.setdefault(bio_employee.ref_user_id, bio_employee)
+    punches = []
     for attendance in attendances:
-        ref_user_id = attendance["detail-1"]
-        employee = BiometricEmployees.objects.filter(ref_user_id=ref_user_id).first()
+        employee = bio_employees.get(attendance["detail-1"])
         if not employee:
             continue
-
-        date_str = attendance["date"]
-        time_str = attendance["time"]
-        attendance_date = datetime.strptime(date_str, "%d/%m/%Y").date()
-        attendance_time = datetime.strptime(time_str, "%H:%M:%S").time()
-        attendance_datetime = datetime.combine(attendance_date, attendance_time)
         punch_code = attendance["detail-2"]
-
-        request_data = Request(
-            user=employee.employee_id.employee_user_id,
-            date=attendance_date,
-            time=attendance_time,
-            datetime=django_timezone.make_aware(attendance_datetime),
+        if punch_code in ["1", "3", "5", "7", "9", "0"]:
+            direction = PUNCH_IN
+        elif punch_code in ["2", "4", "6", "8", "10"]:
+            direction = PUNCH_OUT
+        else:
+            continue
+        attendance_datetime = datetime.combine(
+            datetime.strptime(attendance["date"], "%d/%m/%Y").date(),
+            datetime.strptime(attendance["time"], "%H:%M:%S").time(),
         )
-
-        try:
-            if punch_code in ["1", "3", "5", "7", "9", "0"]:
-                clock_in(request_data)
-            elif punch_code in ["2", "4", "6", "8", "10"]:
-                clock_out(request_data)
-            else:
-                pass
-        except Exception as error:
-            logger.error("Error processing attendance: ", error)
-
-    if attendances:
-        last_attendance = attendances[-1]
-        COSECAttendanceArguments.objects.update_or_create(
-            device_id=device,
-            defaults={
-                "last_fetch_roll_ovr_count": last_attendance["roll-over-count"],
-                "last_fetch_seq_number": last_attendance["seq-No"],
-            },
+        punches.append(
+            Punch(
+                employee_id=employee.employee_id_id,
+                punch_datetime=django_timezone.make_aware(attendance_datetime),
+                direction=direction,
+            )
         )
+    try:
+        ingest_punches(punches)
+    except Exception as error:
+        logger.error("Error processing attendance: ", error)
+    else:
+        if attendances:
+            advance_cosec_cursor(device, attendances[-1])
     return len(attendances)
 
 
@@ -2432,10 +2462,10 @@ def dahua_biometric_attendance_logs(device):
     Returns:
         None
     """
+    last_fetched = fetch_cursor_datetime(device.get_fetch_cursor())
     begin_time = (
-        datetime.combine(device.last_fetch_date, device.last_fetch_time)
-        + timedelta(seconds=1)
-        if device.last_fetch_date and device.last_fetch_time
+        last_fetched + timedelta(seconds=1)
+        if last_fetched
         else datetime.combine(datetime.today(), datetime.min.time())
     )
 
@@ -2445,47 +2475,27 @@ def dahua_biometric_attendance_logs(device):
     logs = dahua.get_control_card_rec(start_time=begin_time)
 
     if logs.get("status_code") == 200:
-        for log in logs.get("records", []):
-            user_id = log.get("user_id")
-            if not user_id:
-                continue
-
-            employee = BiometricEmployees.objects.filter(
-                user_id=user_id, device_id=device
-            ).first()
-            if not employee:
-                continue
-
-            attendance_datetime = log.get("create_time")
-            user_tz = pytz.timezone(TIME_ZONE)
-            attendance_datetime = attendance_datetime.astimezone(user_tz)
-
-            last_none_activity = (
-                AttendanceActivity.objects.filter(
-                    employee_id=employee.employee_id,
-                    clock_out=None,
-                )
-                .order_by("in_datetime")
-                .last()
+        employee_ids = dict(
+            BiometricEmployees.objects.filter(device_id=device).values_list(
+                "user_id", "employee_id"
             )
-
-            request_data = Request(
-                user=employee.employee_id.employee_user_id,
-                date=attendance_datetime.date(),
-                time=attendance_datetime.time(),
-                datetime=attendance_datetime,
+        )
+        user_tz = pytz.timezone(TIME_ZONE)
+        punches = [
+            Punch(
+                employee_id=employee_ids[log["user_id"]],
+                punch_datetime=log.get("create_time").astimezone(user_tz),
+                direction=PUNCH_TOGGLE,
             )
-
-            if last_none_activity:
-                clock_out(request_data)
-            else:
-                clock_in(request_data)
+            for log in logs.get("records", [])
+            if log.get("user_id") and log["user_id"] in employee_ids
+        ]
+        ingest_punches(punches)
 
         if logs.get("records"):
-            last_log = logs["records"][-1]
-            device.last_fetch_date = last_log["create_time"].date()
-            device.last_fetch_time = last_log["create_time"].time()
-            device.save()
+            device.advance_fetch_cursor(
+                max(log["create_time"] for log in logs["records"])
+            )
         return len(logs.get("records", []))
     else:
         return "error"
@@ -2510,10 +2520,11 @@ def etimeoffice_biometric_attendance_logs(device):
         password=device.bio_password,
     )
 
+    # The API takes minutes, the punches of the last fetched minute are
+    # requested again and the ones already fetched are dropped
+    last_fetched = fetch_cursor_datetime(device.get_fetch_cursor())
     from_date = (
-        f"{(datetime.combine(device.last_fetch_date, device.last_fetch_time) + timedelta(minutes=1)):%d/%m/%Y_%H:%M}"
-        if device.last_fetch_date and device.last_fetch_time
-        else f"{now:%d/%m/%Y}_00:00"
+        f"{last_fetched:%d/%m/%Y_%H:%M}" if last_fetched else f"{now:%d/%m/%Y}_00:00"
     )
     to_date = f"{now:%d/%m/%Y_%H:%M}"
 
@@ -2521,51 +2532,33 @@ def etimeoffice_biometric_attendance_logs(device):
     if logs.get("Msg") != "Success":
         return "error"
 
-    punch_data = logs.get("PunchData", [])
+    punch_data = [
+        log
+        for log in logs.get("PunchData", [])
+        if isinstance(log.get("PunchDate"), datetime)
+        and (last_fetched is None or log["PunchDate"] > last_fetched)
+    ]
     if not punch_data:
         return 0
 
     user_tz = pytz.timezone(TIME_ZONE)
 
-    employee_map = {
-        emp.user_id: emp for emp in BiometricEmployees.objects.filter(device_id=device)
-    }
-
-    for log in reversed(punch_data):
-        user_id = log.get("Empcode")
-        if not user_id or user_id not in employee_map:
-            continue
-
-        employee = employee_map[user_id]
-        attendance_datetime = log["PunchDate"].astimezone(user_tz)
-
-        request_data = Request(
-            user=employee.employee_id.employee_user_id,
-            date=attendance_datetime.date(),
-            time=attendance_datetime.time(),
-            datetime=attendance_datetime,
+    employee_ids = dict(
+        BiometricEmployees.objects.filter(device_id=device).values_list(
+            "user_id", "employee_id"
         )
-
-        last_none_activity = (
-            AttendanceActivity.objects.filter(
-                employee_id=employee.employee_id,
-                clock_out=None,
-            )
-            .order_by("in_datetime")
-            .last()
-        )
-
-        if last_none_activity:
-            clock_out(request_data)
-        else:
-            clock_in(request_data)
-
-    last_log = punch_data[0]
-    device.last_fetch_date, device.last_fetch_time = (
-        last_log["PunchDate"].date(),
-        last_log["PunchDate"].time(),
     )
-    device.save()
+    punches = [
+        Punch(
+            employee_id=employee_ids[log["Empcode"]],
+            punch_datetime=log["PunchDate"].astimezone(user_tz),
+            direction=PUNCH_TOGGLE,
+        )
+        for log in punch_data
+        if log.get("Empcode") and log["Empcode"] in employee_ids
+    ]
+    ingest_punches(punches)
+    device.advance_fetch_cursor(max(log["PunchDate"] for log in punch_data))
 
     return len(punch_data)
 
@@ -2577,57 +2570,3 @@ def etimeoffice_biometric_attendance_scheduler(device_id):
     device = BiometricDevices.find(device_id)
     if device and device.is_scheduler:
         etimeoffice_biometric_attendance_logs(device)
-
-
-try:
-    devices = BiometricDevices.objects.all().update(is_live=False)
-    for device in BiometricDevices.objects.filter(is_scheduler=True):
-        if device:
-            if str_time_seconds(device.scheduler_duration) > 0:
-                if device.machine_type == "anviz":
-                    scheduler = BackgroundScheduler()
-                    scheduler.add_job(
-                        lambda: anviz_biometric_attendance_scheduler(device.id),
-                        "interval",
-                        seconds=str_time_seconds(device.scheduler_duration),
-                    )
-                    scheduler.start()
-                elif device.machine_type == "zk":
-                    scheduler = BackgroundScheduler()
-                    scheduler.add_job(
-                        lambda: zk_biometric_attendance_scheduler(device.id),
-                        "interval",
-                        seconds=str_time_seconds(device.scheduler_duration),
-                        id=f"biometric_{device.id}",
-                    )
-                    scheduler.start()
-                elif device.machine_type == "dahua":
-                    scheduler = BackgroundScheduler()
-                    scheduler.add_job(
-                        lambda: dahua_biometric_attendance_scheduler(device.id),
-                        "interval",
-                        seconds=str_time_seconds(device.scheduler_duration),
-                    )
-                    scheduler.start()
-
-                elif device.machine_type == "cosec":
-                    scheduler = BackgroundScheduler()
-                    scheduler.add_job(
-                        lambda: cosec_biometric_attendance_scheduler(device.id),
-                        "interval",
-                        seconds=str_time_seconds(device.scheduler_duration),
-                    )
-                    scheduler.start()
-
-                elif device.machine_type == "etimeoffice":
-                    scheduler = BackgroundScheduler()
-                    scheduler.add_job(
-                        lambda: etimeoffice_biometric_attendance_scheduler(device.id),
-                        "interval",
-                        seconds=str_time_seconds(device.scheduler_duration),
-                    )
-                    scheduler.start()
-                else:
-                    pass
-except:
-    pass
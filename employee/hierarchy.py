@@ -0,0 +1,201 @@
+"""
+hierarchy.py
+
+Reporting hierarchy closure table.
+
+`ReportingHierarchy` keeps one row for every (manager, subordinate) pair of
+the reporting chains with the number of levels between them, so all the
+subordinates of a manager are one indexed lookup, usable as a subquery. When
+the reporting manager of an employee changes, the rows linking the employee
+and its own subordinates to their managers are moved. The table is built on
+first use when it is empty, and rebuilt after a bulk update of the reporting
+managers or by the `rebuild_reporting_hierarchy` management command.
+"""
+
+import logging
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from employee.models import EmployeeWorkInformation, ReportingHierarchy
+from horilla.horilla_middlewares import _thread_locals
+from horilla.signals import post_bulk_update
+
+logger = logging.getLogger(__name__)
+
+HIERARCHY_BUILT_KEY = "reporting_hierarchy_built"
+
+_hierarchy_built = False
+
+
+def rebuild_reporting_hierarchy():
+    """
+    Build the closure table again from the reporting managers, returns the
+    number of rows
+    """
+    global _hierarchy_built
+    managers = dict(
+        EmployeeWorkInformation.objects.entire()
+        .filter(employee_id__isnull=False, reporting_manager_id__isnull=False)
+        .values_list("employee_id", "reporting_manager_id")
+    )
+    rows = []
+    for employee_id, manager_id in managers.items():
+        depth = 1
+        chain = {employee_id}
+        # A reporting cycle stops the chain where it closes
+        while manager_id is not None and manager_id not in chain:
+            rows.append(
+                ReportingHierarchy(
+                    manager_id_id=manager_id, employee_id_id=employee_id, depth=depth
+                )
+            )
+            chain.add(manager_id)
+            manager_id = managers.get(manager_id)
+            depth += 1
+    with transaction.atomic():
+        ReportingHierarchy.objects.all().delete()
+        ReportingHierarchy.objects.bulk_create(rows, batch_size=1000)
+    cache.set(HIERARCHY_BUILT_KEY, True, None)
+    _hierarchy_built = True
+    return len(rows)
+
+
+def ensure_reporting_hierarchy():
+    """
+    Build the closure table if it was never built
+    """
+    global _hierarchy_built
+    if _hierarchy_built or cache.get(HIERARCHY_BUILT_KEY):
+        _hierarchy_built = True
+        return
+    if (
+        not ReportingHierarchy.objects.exists()
+        and EmployeeWorkInformation.objects.entire()
+        .filter(reporting_manager_id__isnull=False)
+        .exists()
+    ):
+        rebuild_reporting_hierarchy()
+        return
+    cache.set(HIERARCHY_BUILT_KEY, True, None)
+    _hierarchy_built = True
+
+
+def set_reporting_manager(employee_id, manager_id):
+    """
+    Move the employee and its subordinates under the new reporting manager
+    """
+    current_manager_id = (
+        ReportingHierarchy.objects.filter(employee_id_id=employee_id, depth=1)
+        .values_list("manager_id_id", flat=True)
+        .first()
+    )
+    if current_manager_id == manager_id:
+        return
+    subtree = dict(
+        ReportingHierarchy.objects.filter(manager_id_id=employee_id).values_list(
+            "employee_id_id", "depth"
+        )
+    )
+    subtree[employee_id] = 0
+    if manager_id in subtree:
+        logger.warning(
+            "Employee %s reporting to %s closes a reporting cycle",
+            employee_id,
+            manager_id,
+        )
+        manager_id = None
+    ancestors = {}
+    if manager_id is not None:
+        ancestors = dict(
+            ReportingHierarchy.objects.filter(employee_id_id=manager_id).values_list(
+                "manager_id_id", "depth"
+            )
+        )
+        ancestors = {ancestor: depth + 1 for ancestor, depth in ancestors.items()}
+        ancestors[manager_id] = 1
+    with transaction.atomic():
+        ReportingHierarchy.objects.filter(
+            manager_id_id__in=ReportingHierarchy.objects.filter(
+                employee_id_id=employee_id
+            ).values_list("manager_id_id", flat=True),
+            employee_id_id__in=list(subtree),
+        ).delete()
+        ReportingHierarchy.objects.bulk_create(
+            [
+                ReportingHierarchy(
+                    manager_id_id=ancestor,
+                    employee_id_id=subordinate,
+                    depth=ancestor_depth + subordinate_depth,
+                )
+                for ancestor, ancestor_depth in ancestors.items()
+                for subordinate, subordinate_depth in subtree.items()
+            ],
+            batch_size=1000,
+        )
+
+
+def subordinate_ids_query(manager_id, nested=True):
+    """
+    Ids of the subordinates of the manager, as a queryset to use as a
+    subquery. Only the direct subordinates when not nested.
+    """
+    ensure_reporting_hierarchy()
+    rows = ReportingHierarchy.objects.filter(manager_id_id=manager_id)
+    if not nested:
+        rows = rows.filter(depth=1)
+    return rows.values_list("employee_id_id", flat=True)
+
+
+def subordinate_ids(manager_id, nested=True, request=None):
+    """
+    Ids of the subordinates of the manager, read once per request
+    """
+    request = request or getattr(_thread_locals, "request", None)
+    memo = (
+        request.__dict__.setdefault("_subordinate_ids", {})
+        if request is not None
+        else {}
+    )
+    key = (manager_id, nested)
+    if key not in memo:
+        memo[key] = list(subordinate_ids_query(manager_id, nested))
+    return list(memo[key])
+
+
+def clear_request_memo():
+    request = getattr(_thread_locals, "request", None)
+    if request is not None:
+        request.__dict__.pop("_subordinate_ids", None)
+
+
+@receiver(post_save, sender=EmployeeWorkInformation)
+def work_info_saved(sender, instance, **kwargs):
+    """
+    Follow the reporting manager of the employee in the closure table
+    """
+    if instance.employee_id_id is None:
+        return
+    ensure_reporting_hierarchy()
+    set_reporting_manager(instance.employee_id_id, instance.reporting_manager_id_id)
+    clear_request_memo()
+
+
+@receiver(post_delete, sender=EmployeeWorkInformation)
+def work_info_deleted(sender, instance, **kwargs):
+    if instance.employee_id_id is None:
+        return
+    try:
+        set_reporting_manager(instance.employee_id_id, None)
+    except Exception as error:
+        logger.error("Reporting hierarchy update failed: %s", error)
+    clear_request_memo()
+
+
+@receiver(post_bulk_update, sender=EmployeeWorkInformation)
+def work_info_bulk_updated(sender, queryset, *args, **kwargs):
+    if {"reporting_manager_id", "employee_id"} & set(kwargs.get("kwargs", {})):
+        transaction.on_commit(rebuild_reporting_hierarchy)
+        clear_request_memo()
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from employee.models import Employee
+from horilla.search import fill_search_names
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill the search name of the employees saved before it was kept, or "
+        "updated without save"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of employees updated per query",
+        )
+
+    def handle(self, *args, **options):
+        updated = fill_search_names(
+            Employee.objects.entire(), batch_size=options["batch_size"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Search name filled for {updated} employees.")
+        )
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from employee.hierarchy import rebuild_reporting_hierarchy
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the reporting hierarchy closure table from the reporting "
+        "managers of the employees"
+    )
+
+    def handle(self, *args, **options):
+        rows = rebuild_reporting_hierarchy()
+        self.stdout.write(
+            self.style.SUCCESS(f"Reporting hierarchy rebuilt with {rows} rows.")
+        )
@@ -25,6 +25,7 @@ from base.models import (
     WorkType,
 )
 from employee.models import Employee, EmployeeWorkInformation
+from horilla.search import employee_search_name
 
 logger = logging.getLogger(__name__)
 
@@ -465,6 +466,9 @@ def bulk_create_employee_import(success_lists):
             badge_id=row["Badge ID"],
             employee_first_name=convert_nan("First Name", row),
             employee_last_name=convert_nan("Last Name", row),
+            search_name=employee_search_name(
+                convert_nan("First Name", row), convert_nan("Last Name", row)
+            ),
             email=row["Email"],
             phone=row["Phone"],
             gender=row.get("Gender", "").lower(),
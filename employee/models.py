@@ -31,10 +31,15 @@ from base.models import (
     WorkType,
     validate_time_format,
 )
-from employee.methods.duration_methods import format_time, strtime_seconds
+from employee.today_status import (
+    forecasted_at_work,
+    leave_status,
+    prefetch_today_status,
+)
 from horilla import horilla_middlewares
 from horilla.methods import get_horilla_model_class
 from horilla.models import HorillaModel, has_xss, upload_path
+from horilla.search import employee_search_name
 from horilla_audit.methods import get_diff
 from horilla_audit.models import HorillaAuditInfo, HorillaAuditLog
 
@@ -78,6 +83,9 @@ class Employee(models.Model):
     employee_last_name = models.CharField(
         max_length=200, null=True, blank=True, verbose_name=_("Last Name")
     )
+    search_name = models.CharField(
+        max_length=401, default="", blank=True, editable=False
+    )
     employee_profile = models.ImageField(upload_to=upload_path, null=True, blank=True)
     email = models.EmailField(max_length=254, unique=True)
     phone = models.CharField(
@@ -241,6 +249,13 @@ class Employee(models.Model):
             getattr(self, "employee_work_info", None), "reporting_manager_id", None
         )
 
+    @classmethod
+    def prefetch_page_status(cls, employees):
+        """
+        Compute the today status of a page of employees in bulk
+        """
+        return prefetch_today_status(employees)
+
     def get_avatar(self):
         if self.employee_profile and default_storage.exists(self.employee_profile.name):
             return self.employee_profile.url
@@ -250,70 +265,37 @@ class Employee(models.Model):
         """
         This method is used to get the leave status of the employee
         """
+        if hasattr(self, "_today_status"):
+            return self._today_status["leave_status"]
         today = date.today()
         leaves_requests = (
             self.leaverequest_set.filter(start_date__lte=today, end_date__gte=today)
             if apps.is_installed("leave")
             else QuerySet().none()
         )
-        status = _("Expected working")
-        if leaves_requests.exists():
-            if leaves_requests.filter(status="approved").exists():
-                status = _("On Leave")
-            elif leaves_requests.filter(status="requested"):
-                status = _("Waiting Approval")
-            else:
-                status = _("Canceled / Rejected")
-        elif (
+        return leave_status(
+            set(leaves_requests.values_list("status", flat=True)),
             apps.is_installed("attendance")
             and self.employee_attendances.filter(
                 attendance_date=today,
-            ).exists()
-        ):
-            status = _("On a break")
-        return status
+            ).exists(),
+        )
 
     def get_forecasted_at_work(self):
         """
         This method is used to the employees current day shift status
         """
+        if hasattr(self, "_today_status"):
+            return self._today_status["forecasted_at_work"]
         if apps.is_installed("attendance"):
             today = datetime.today()
             yesterday = today - timedelta(days=1)
-            today_attendance = None
-            yesterday_attendance = None
-            attendances = list(
-                self.employee_attendances.filter(
-                    attendance_date__in=[yesterday, today]
-                ).order_by("attendance_date")
+            attendance = (
+                self.employee_attendances.filter(attendance_date__in=[yesterday, today])
+                .order_by("attendance_date")
+                .last()
             )
-
-            if len(attendances) == 1:
-                yesterday_attendance, today_attendance = attendances[0], None
-            elif len(attendances) == 2:
-                yesterday_attendance, today_attendance = attendances
-            else:
-                yesterday_attendance, today_attendance = None, None
-
-            attendance = today_attendance
-            if not today_attendance:
-                attendance = yesterday_attendance
-            minimum_hour_seconds = strtime_seconds(
-                getattr(attendance, "minimum_hour", "0")
-            )
-            at_work = 0
-            forecasted_pending_hours = 0
-            if attendance:
-                at_work = attendance.get_at_work_from_activities()
-            forecasted_pending_hours = max(0, (minimum_hour_seconds - at_work))
-
-            return {
-                "forecasted_at_work": format_time(at_work),
-                "forecasted_pending_hours": format_time(forecasted_pending_hours),
-                "forecasted_at_work_seconds": at_work,
-                "forecasted_pending_hours_seconds": forecasted_pending_hours,
-                "has_attendance": attendance is not None,
-            }
+            return forecasted_at_work(attendance)
         else:
             return {}
 
@@ -321,6 +303,8 @@ class Employee(models.Model):
         """
         This method will returns employees todays attendance
         """
+        if hasattr(self, "_today_status"):
+            return self._today_status["today_attendance"]
         return self.employee_attendances.filter(
             attendance_date=datetime.today()
         ).first()
@@ -437,6 +421,8 @@ class Employee(models.Model):
         """
         This method is used to check if the user is in the list of online users.
         """
+        if hasattr(self, "_today_status"):
+            return self._today_status["online"]
         if apps.is_installed("attendance"):
             Attendance = get_horilla_model_class("attendance", "attendance")
             request = getattr(horilla_middlewares._thread_locals, "request", None)
@@ -518,6 +504,15 @@ class Employee(models.Model):
         # ...
         # call the parent class's save method to save the object
         prev_employee = Employee.objects.filter(id=self.id).first()
+        self.search_name = employee_search_name(
+            self.employee_first_name, self.employee_last_name
+        )
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {
+            "employee_first_name",
+            "employee_last_name",
+        }.intersection(update_fields):
+            kwargs["update_fields"] = {*update_fields, "search_name"}
         super().save(*args, **kwargs)
         request = getattr(horilla_middlewares._thread_locals, "request", None)
         if request and not self.is_active and self.get_archive_condition() is not False:
@@ -716,6 +711,29 @@ class EmployeeWorkInformation(models.Model):
         return self
 
 
+class ReportingHierarchy(models.Model):
+    """
+    Reporting hierarchy closure table, one row for every manager of an
+    employee in its reporting chain, `depth` 1 being the reporting manager
+    """
+
+    manager_id = models.ForeignKey(
+        Employee, on_delete=models.CASCADE, related_name="hierarchy_subordinates"
+    )
+    employee_id = models.ForeignKey(
+        Employee, on_delete=models.CASCADE, related_name="hierarchy_managers"
+    )
+    depth = models.PositiveSmallIntegerField()
+    objects = models.Manager()
+
+    class Meta:
+        unique_together = ("manager_id", "employee_id")
+        indexes = [models.Index(fields=["employee_id", "depth"])]
+
+    def __str__(self) -> str:
+        return f"{self.manager_id} > {self.employee_id} ({self.depth})"
+
+
 class EmployeeBankDetails(HorillaModel):
     """
     EmployeeBankDetails model
@@ -53,7 +53,9 @@ def not_in_yet(request):
         request,
         "dashboard/not_in_yet.html",
         {
-            "employees": paginator_qry(emps, page_number),
+            "employees": Employee.prefetch_page_status(
+                paginator_qry(emps, page_number)
+            ),
             "pd": previous_data,
         },
     )
@@ -71,7 +73,11 @@ def not_out_yet(request):
         .qs.exclude(employee_work_info__isnull=True)
         .filter(is_active=True)
     )
-    return render(request, "dashboard/not_out_yet.html", {"employees": emps})
+    return render(
+        request,
+        "dashboard/not_out_yet.html",
+        {"employees": Employee.prefetch_page_status(list(emps))},
+    )
 
 
 @login_required
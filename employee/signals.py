@@ -0,0 +1,45 @@
+"""
+employee/signals.py
+
+Keeps the search name of the employees filled when their names change
+without `Employee.save`.
+"""
+
+from django.db.models.signals import post_migrate
+from django.dispatch import receiver
+
+from employee.models import Employee
+from horilla.search import fill_search_names
+from horilla.signals import post_bulk_update, pre_bulk_update
+
+NAME_FIELDS = {"employee_first_name", "employee_last_name"}
+
+
+@receiver(pre_bulk_update, sender=Employee)
+def read_renamed_employees(sender, queryset, *args, **kwargs):
+    """
+    Read the employees whose names a bulk update changes
+    """
+    if NAME_FIELDS & set(kwargs.get("kwargs", {})):
+        queryset.renamed_employee_ids = list(queryset.values_list("pk", flat=True))
+
+
+@receiver(post_bulk_update, sender=Employee)
+def refresh_search_names(sender, queryset, *args, **kwargs):
+    """
+    Refresh the search name of the employees renamed by a bulk update, read
+    by primary key as they may no longer match the queryset
+    """
+    employee_ids = getattr(queryset, "renamed_employee_ids", None)
+    if employee_ids:
+        fill_search_names(sender._base_manager.filter(pk__in=employee_ids))
+
+
+@receiver(post_migrate)
+def fill_missing_search_names(sender, using, **kwargs):
+    """
+    Fill the search name of the employees saved before it was kept
+    """
+    if sender.name != "employee":
+        return
+    fill_search_names(Employee._base_manager.using(using).filter(search_name=""))
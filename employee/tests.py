@@ -1,3 +1,43 @@
+"""test cases"""
+
 from django.test import TestCase
 
-# Create your tests here.
+from employee.models import Employee
+from horilla.search import search_by_name
+
+
+class EmployeeNameSearchTest(TestCase):
+    """
+    Employees are found by their full name after a save, a bulk name update
+    and before their search name is filled
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.employee = Employee.objects.create(
+            employee_first_name="Ada",
+            employee_last_name="Lovelace",
+            email="ada.search@example.com",
+            phone="9999999999",
+        )
+
+    def search(self, value):
+        return list(search_by_name(Employee.objects.entire(), value))
+
+    def test_saved_name(self):
+        self.assertEqual(self.search("ada love"), [self.employee])
+        self.assertEqual(self.search("  LOVELACE "), [self.employee])
+
+    def test_bulk_name_update(self):
+        Employee.objects.entire().filter(employee_first_name="Ada").update(
+            employee_first_name="Augusta"
+        )
+        self.employee.refresh_from_db()
+        self.assertEqual(self.employee.search_name, "augusta lovelace")
+        self.assertEqual(self.search("augusta lovelace"), [self.employee])
+        self.assertEqual(self.search("ada lovelace"), [])
+
+    def test_unfilled_search_name(self):
+        Employee.objects.entire().filter(pk=self.employee.pk).update(search_name="")
+        self.assertEqual(self.search("lovelace"), [self.employee])
+        self.assertEqual(self.search("ada lovelace"), [self.employee])
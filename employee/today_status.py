@@ -0,0 +1,125 @@
+"""
+today_status.py
+
+Today status of a page of employees.
+
+The leave status, online state, today attendance and forecasted work hours of
+an employee each take one to four queries when read from the `Employee`
+methods. `prefetch_today_status` computes them for a page of employees in a
+fixed number of queries and keeps the result on the instances, the methods
+return it instead of querying again.
+"""
+
+from datetime import date, timedelta
+
+from django.apps import apps
+from django.utils.translation import gettext as _
+
+from employee.methods.duration_methods import format_time, strtime_seconds
+
+
+def forecasted_at_work(attendance, activities=None):
+    """
+    Worked and pending hours of the attendance, the attendance activities are
+    queried when not given
+    """
+    minimum_hour_seconds = strtime_seconds(getattr(attendance, "minimum_hour", "0"))
+    at_work = 0
+    if attendance:
+        at_work = attendance.get_at_work_from_activities(activities)
+    forecasted_pending_hours = max(0, (minimum_hour_seconds - at_work))
+    return {
+        "forecasted_at_work": format_time(at_work),
+        "forecasted_pending_hours": format_time(forecasted_pending_hours),
+        "forecasted_at_work_seconds": at_work,
+        "forecasted_pending_hours_seconds": forecasted_pending_hours,
+        "has_attendance": attendance is not None,
+    }
+
+
+def leave_status(leave_statuses, attended_today):
+    """
+    Leave status from the statuses of the leave requests covering today
+    """
+    if leave_statuses:
+        if "approved" in leave_statuses:
+            return _("On Leave")
+        if "requested" in leave_statuses:
+            return _("Waiting Approval")
+        return _("Canceled / Rejected")
+    if attended_today:
+        return _("On a break")
+    return _("Expected working")
+
+
+def prefetch_today_status(employees):
+    """
+    Compute the today status of the employees (a list or a page of them),
+    returns the employees
+    """
+    instances = [employee for employee in employees if employee.pk is not None]
+    if not instances:
+        return employees
+    employee_ids = [employee.pk for employee in instances]
+    today = date.today()
+    yesterday = today - timedelta(days=1)
+
+    leave_statuses = {}
+    if apps.is_installed("leave"):
+        LeaveRequest = apps.get_model("leave", "LeaveRequest")
+        for employee_id, status in LeaveRequest._default_manager.filter(
+            employee_id__in=employee_ids, start_date__lte=today, end_date__gte=today
+        ).values_list("employee_id", "status"):
+            leave_statuses.setdefault(employee_id, set()).add(status)
+
+    attendances = {}
+    activities = {}
+    attendance_installed = apps.is_installed("attendance")
+    if attendance_installed:
+        Attendance = apps.get_model("attendance", "Attendance")
+        AttendanceActivity = apps.get_model("attendance", "AttendanceActivity")
+        for attendance in Attendance._default_manager.filter(
+            employee_id__in=employee_ids, attendance_date__in=[yesterday, today]
+        ).order_by("attendance_date", "pk"):
+            attendances.setdefault(attendance.employee_id_id, []).append(attendance)
+        for activity in AttendanceActivity._default_manager.filter(
+            employee_id__in=employee_ids, attendance_date__in=[yesterday, today]
+        ).order_by("clock_in"):
+            activities.setdefault(
+                (activity.employee_id_id, activity.attendance_date), []
+            ).append(activity)
+
+    for employee in instances:
+        employee_attendances = attendances.get(employee.pk, [])
+        today_attendance = next(
+            (
+                attendance
+                for attendance in employee_attendances
+                if attendance.attendance_date == today
+            ),
+            None,
+        )
+        # The attendance of today, or of yesterday for a night shift
+        attendance = employee_attendances[-1] if employee_attendances else None
+        forecast = {}
+        if attendance_installed:
+            forecast = forecasted_at_work(
+                attendance,
+                (
+                    activities.get((employee.pk, attendance.attendance_date), [])
+                    if attendance
+                    else None
+                ),
+            )
+        employee._today_status = {
+            "leave_status": leave_status(
+                leave_statuses.get(employee.pk), today_attendance is not None
+            ),
+            "forecasted_at_work": forecast,
+            "today_attendance": today_attendance,
+            "online": any(
+                attendance.attendance_clock_out_date is None
+                for attendance in employee_attendances
+            ),
+        }
+    return employees
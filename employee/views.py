@@ -1080,7 +1080,9 @@ def employee_view(request):
         request,
         "employee_personal_info/employee_view.html",
         {
-            "data": paginator_qry(filter_obj, page_number),
+            "data": Employee.prefetch_page_status(
+                paginator_qry(filter_obj, page_number)
+            ),
             "pd": previous_data,
             "f": EmployeeFilter(),
             "update_fields_form": update_fields,
@@ -1809,7 +1811,7 @@ def employee_filter_view(request):
         template = "employee_personal_info/group_by.html"
     else:
         employees = sortby(request, employees, "orderby")
-        employees = paginator_qry(employees, page_number)
+        employees = Employee.prefetch_page_status(paginator_qry(employees, page_number))
 
         # Store the employees in the session
         request.session["filtered_employees"] = [employee.id for employee in employees]
@@ -1859,7 +1861,9 @@ def employee_card(request):
         request,
         "employee_personal_info/employee_card.html",
         {
-            "data": paginator_qry(employees, page_number),
+            "data": Employee.prefetch_page_status(
+                paginator_qry(employees, page_number)
+            ),
             "f": filter_obj,
             "pd": previous_data,
         },
@@ -1898,7 +1902,9 @@ def employee_list(request):
         request,
         "employee_personal_info/employee_list.html",
         {
-            "data": paginator_qry(employees, page_number),
+            "data": Employee.prefetch_page_status(
+                paginator_qry(employees, page_number)
+            ),
             "f": filter_obj,
             "pd": previous_data,
         },
@@ -2276,7 +2282,9 @@ def employee_search(request):
         request,
         template,
         {
-            "data": paginator_qry(employees, page_number),
+            "data": Employee.prefetch_page_status(
+                paginator_qry(employees, page_number)
+            ),
             "pd": previous_data,
             "filter_dict": data_dict,
         },
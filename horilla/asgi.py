@@ -3,6 +3,13 @@ ASGI config for horilla project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Served by an ASGI server (e.g. ``uvicorn horilla.asgi:application``) the live
+notifications are pushed to the browsers through the server-sent events of
+``notifications:live_notification_stream``; under WSGI the browsers poll.
+Run several ASGI processes with the ``RedisBroker`` notification broker
+(``DJANGO_NOTIFICATIONS_CONFIG["BROKER"]``) so every process receives the
+events.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/4.1/howto/deployment/asgi/
 """
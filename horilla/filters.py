@@ -13,7 +13,8 @@ from django_filters.filterset import FILTER_FOR_DBFIELD_DEFAULTS
 
 from base.methods import reload_queryset
 from horilla.horilla_middlewares import _thread_locals
-from horilla_views.templatetags.generic_template_filters import getattribute
+from horilla.search import search_by_name, search_queryset
+from horilla_widgets.widgets.select_widgets import use_autocomplete
 
 FILTER_FOR_DBFIELD_DEFAULTS[models.ForeignKey][
     "filter_class"
@@ -24,25 +25,7 @@ def filter_by_name(queryset, name, value):
     """
     Filter queryset by first name or last name.
     """
-    # Split the search value into first name and last name
-    parts = value.split()
-    first_name = parts[0]
-    last_name = " ".join(parts[1:]) if len(parts) > 1 else ""
-
-    # Filter the queryset by first name and last name
-    if first_name and last_name:
-        queryset = queryset.filter(
-            employee_id__employee_first_name__icontains=first_name,
-            employee_id__employee_last_name__icontains=last_name,
-        )
-    elif first_name:
-        queryset = queryset.filter(
-            employee_id__employee_first_name__icontains=first_name
-        )
-    elif last_name:
-        queryset = queryset.filter(employee_id__employee_last_name__icontains=last_name)
-
-    return queryset
+    return search_by_name(queryset, value, "employee_id__")
 
 
 class FilterSet(django_filters.FilterSet):
@@ -50,6 +33,8 @@ class FilterSet(django_filters.FilterSet):
         super().__init__(*args, **kwargs)
 
         reload_queryset(self.form.fields)
+        for field_name, field in self.form.fields.items():
+            use_autocomplete(field, type(self), field_name)
 
         default_input_class = "oh-input w-100"
         select_class = "oh-select oh-select-2"
@@ -183,10 +168,4 @@ class HorillaFilterSet(FilterSet):
         search_field = self.data.get("search_field")
         if not search_field:
             search_field = self.filters[name].field_name
-
-        def _icontains(instance):
-            result = str(getattribute(instance, search_field)).lower()
-            return instance.pk if search in result else None
-
-        ids = list(filter(None, map(_icontains, queryset)))
-        return queryset.filter(id__in=ids)
+        return search_queryset(queryset, search_field, search)
@@ -38,6 +38,44 @@ HORILLA_TIME_FORMATS = {
 
 BIO_DEVICE_THREADS = {}
 
+"""
+BIOMETRIC_POLLER_IN_PROCESS: bool
+
+Whether the web server processes run the biometric device poller
+themselves, only the process holding the poller lock polls. Off by default,
+the `poll_biometric_devices` management command runs the poller as its own
+service.
+"""
+BIOMETRIC_POLLER_IN_PROCESS = settings.env.bool(
+    "BIOMETRIC_POLLER_IN_PROCESS", default=False
+)
+
+"""
+AUTOMATION_JOBS_IN_PROCESS: bool
+
+Whether the web processes deliver the queued mail automation jobs in a
+background thread. Set it to False when the `run_automation_jobs` management
+command runs as its own service.
+"""
+AUTOMATION_JOBS_IN_PROCESS = settings.env.bool(
+    "AUTOMATION_JOBS_IN_PROCESS", default=True
+)
+
+"""
+VIEW_STATE_TIMEOUT: int
+
+Seconds the per session state of the generic views (saved list filters, sort
+direction, profile view navigation) is kept in the cache backend.
+"""
+VIEW_STATE_TIMEOUT = settings.env.int("VIEW_STATE_TIMEOUT", default=60 * 60 * 12)
+
+"""
+VIEW_STATE_MAX_BYTES: int
+
+Largest serialized view state entry stored, larger entries are dropped.
+"""
+VIEW_STATE_MAX_BYTES = settings.env.int("VIEW_STATE_MAX_BYTES", default=256 * 1024)
+
 DYNAMIC_URL_PATTERNS = []
 
 FILE_STORAGE = FileSystemStorage(location="csv_tmp/")
@@ -1,5 +1,7 @@
 import contextlib
 import importlib
+import os
+import sys
 
 from django.contrib.auth.models import User
 from django.contrib.contenttypes.models import ContentType
@@ -107,3 +109,17 @@ def remove_dynamic_url(path_info):
     # Also remove it from the tracked dynamic paths
     if path_info in DYNAMIC_URL_PATTERNS:
         DYNAMIC_URL_PATTERNS.remove(path_info)
+
+
+SERVER_PROGRAMS = ("gunicorn", "uwsgi", "daphne", "uvicorn")
+
+
+def is_server_process():
+    """
+    Whether this process serves the requests: the development server (its
+    reloaded child when the reloader runs) or a WSGI/ASGI server, not a
+    management command
+    """
+    if len(sys.argv) >= 2 and sys.argv[1] == "runserver":
+        return "--noreload" in sys.argv or os.environ.get("RUN_MAIN") == "true"
+    return os.path.basename(sys.argv[0]) in SERVER_PROGRAMS
@@ -0,0 +1,147 @@
+"""
+horilla/search.py
+
+Employee name search run by the database.
+
+Every employee keeps its full name lowercased in the `search_name` column,
+filled on save and on bulk name updates the way `Employee.get_full_name`
+builds the name. A search box filters with one condition on that column
+instead of building the full name of every row in SQL, or loading every
+employee to compare `get_full_name` in Python. The employee may be reached
+through a relation, given as the lookup prefix (`"employee_id__"`,
+`"managers__"`, ...).
+"""
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Q
+
+from horilla_views.templatetags.generic_template_filters import getattribute
+
+
+def normalize_name(value):
+    """
+    Lowercased value with its words separated by single spaces
+    """
+    return " ".join(str(value or "").lower().split())
+
+
+def employee_search_name(first_name, last_name):
+    """
+    The search name of an employee, the normalized full name
+    """
+    return normalize_name(f"{first_name or ''} {last_name or ''}")
+
+
+def fill_search_names(employees, batch_size=1000):
+    """
+    Set the search name of the employees whose stored search name is not
+    their current name, returns the number of employees updated
+    """
+    model = employees.model
+    changed = []
+    updated = 0
+    for employee in employees.only(
+        "id", "employee_first_name", "employee_last_name", "search_name"
+    ).iterator(chunk_size=batch_size):
+        search_name = employee_search_name(
+            employee.employee_first_name, employee.employee_last_name
+        )
+        if employee.search_name == search_name:
+            continue
+        employee.search_name = search_name
+        changed.append(employee)
+        if len(changed) >= batch_size:
+            model._base_manager.bulk_update(changed, ["search_name"])
+            updated += len(changed)
+            changed = []
+    model._base_manager.bulk_update(changed, ["search_name"])
+    return updated + len(changed)
+
+
+def name_search_q(value, prefix=""):
+    """
+    Condition matching the employees whose full name contains the value, or
+    whose first and last names contain the first word and the rest of it.
+    Employees without a search name yet are matched on their first or last
+    name.
+    """
+    value = normalize_name(value)
+    condition = Q(**{f"{prefix}search_name__contains": value}) | (
+        Q(**{f"{prefix}search_name": ""})
+        & (
+            Q(**{f"{prefix}employee_first_name__icontains": value})
+            | Q(**{f"{prefix}employee_last_name__icontains": value})
+        )
+    )
+    parts = value.split()
+    if len(parts) > 1:
+        condition |= Q(
+            **{
+                f"{prefix}employee_first_name__icontains": parts[0],
+                f"{prefix}employee_last_name__icontains": " ".join(parts[1:]),
+            }
+        )
+    return condition
+
+
+def search_by_name(queryset, value, prefix=""):
+    """
+    Filter the queryset by the name of the employee at the lookup prefix
+    """
+    if not value or not value.strip():
+        return queryset
+    return queryset.filter(name_search_q(value, prefix))
+
+
+def field_lookup(model, path):
+    """
+    The lookup of the text field at the attribute path (`a__b__c`), the lookup
+    prefix of the employee when the path ends with `get_full_name`, None when
+    the path is not made of fields
+    """
+    parts = path.split("__")
+    for position, part in enumerate(parts):
+        if (
+            part == "get_full_name"
+            and position == len(parts) - 1
+            and hasattr(model, "employee_first_name")
+        ):
+            return "name", "".join(f"{name}__" for name in parts[:-1])
+        try:
+            field = model._meta.get_field(part)
+        except FieldDoesNotExist:
+            return None
+        if field.is_relation:
+            if position == len(parts) - 1:
+                return None
+            model = field.related_model
+        elif position != len(parts) - 1:
+            return None
+    return "field", path
+
+
+def search_queryset(queryset, path, value):
+    """
+    Filter the queryset by the records whose value at the attribute path
+    contains the search value. Paths that are not fields (methods,
+    properties) are compared in Python.
+    """
+    lookup = field_lookup(queryset.model, path)
+    if lookup is None:
+        value = value.lower()
+        return queryset.filter(
+            pk__in=[
+                instance.pk
+                for instance in queryset
+                if value in str(getattribute(instance, path)).lower()
+            ]
+        )
+    kind, lookup_path = lookup
+    if kind == "name":
+        condition = name_search_q(value, lookup_path)
+    else:
+        condition = Q(**{f"{lookup_path}__icontains": value})
+    if "__" not in lookup_path.rstrip("_"):
+        return queryset.filter(condition)
+    # A condition through a relation to many records would repeat records
+    return queryset.filter(pk__in=queryset.filter(condition).values("pk"))
@@ -136,6 +136,16 @@ else:
         }
     }
 
+# Cache
+# https://docs.djangoproject.com/en/4.1/topics/cache/
+# Set CACHE_URL to share the cached settings between the worker processes,
+# e.g. redis://127.0.0.1:6379/1, filecache:///var/tmp/horilla_cache or
+# dbcache://horilla_cache_table (after `manage.py createcachetable`).
+
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/4.1/ref/settings/#auth-password-validators
 
@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+from simple_history.models import registered_models
+from simple_history.utils import get_history_model_for_model
+
+from horilla_audit.methods import build_history_changes
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill the history change table from the history recorded before it, "
+        "the history views otherwise fill it object by object when opened"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            action="append",
+            default=[],
+            help="Only the history of this model (app_label.ModelName), repeatable",
+        )
+
+    def handle(self, *args, **options):
+        models = {
+            model._meta.label_lower: model for model in registered_models.values()
+        }
+        if options["model"]:
+            selected = {name.lower() for name in options["model"]}
+            models = {
+                label: model for label, model in models.items() if label in selected
+            }
+        objects = 0
+        for label, model in sorted(models.items()):
+            history_model = get_history_model_for_model(model)
+            pk_name = model._meta.pk.attname
+            object_pks = (
+                history_model._default_manager.order_by()
+                .values_list(pk_name, flat=True)
+                .distinct()
+            )
+            for object_pk in object_pks.iterator():
+                build_history_changes(history_model, object_pk)
+                objects += 1
+            self.stdout.write(f"{label} done")
+        self.stdout.write(
+            self.style.SUCCESS(f"History changes built for {objects} objects.")
+        )
@@ -0,0 +1,56 @@
+from django.core.management.base import BaseCommand
+from simple_history.models import registered_models
+from simple_history.utils import get_history_model_for_model
+
+from horilla_audit.methods import remove_duplicate_histories
+
+
+class Command(BaseCommand):
+    help = (
+        "Delete the history records that record no change from the previous "
+        "record of their object"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of history records read and deleted at a time",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Count the duplicates without deleting them",
+        )
+        parser.add_argument(
+            "--model",
+            action="append",
+            default=[],
+            help="Only the history of this model (app_label.ModelName), repeatable",
+        )
+
+    def handle(self, *args, **options):
+        models = {
+            model._meta.label_lower: model for model in registered_models.values()
+        }
+        if options["model"]:
+            models = {
+                label: model
+                for label, model in models.items()
+                if label in {name.lower() for name in options["model"]}
+            }
+        total = 0
+        for label, model in sorted(models.items()):
+            removed = remove_duplicate_histories(
+                get_history_model_for_model(model),
+                batch_size=options["batch_size"],
+                dry_run=options["dry_run"],
+            )
+            if removed:
+                self.stdout.write(f"{label}: {removed}")
+            total += removed
+        action = "found" if options["dry_run"] else "removed"
+        self.stdout.write(
+            self.style.SUCCESS(f"{total} duplicate history records {action}.")
+        )
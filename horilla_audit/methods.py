@@ -4,9 +4,9 @@ methods.py
 This module is used to write methods related to the history
 """
 
-from django.contrib.auth.models import User
 from django.core.paginator import Paginator
 from django.db import models
+from django.db.models import Q
 from django.shortcuts import render
 
 from horilla.decorators import apply_decorators
@@ -32,6 +32,96 @@ def _check_and_delete(entry1, entry2, dry_run=False):
     return 0
 
 
+def previous_history(history_instance):
+    """
+    The history record written before the given one for the same object
+    """
+    history_model = type(history_instance)
+    pk_name = history_instance.instance_type._meta.pk.attname
+    return (
+        history_model._default_manager.filter(
+            Q(history_date__lt=history_instance.history_date)
+            | Q(
+                history_date=history_instance.history_date,
+                history_id__lt=history_instance.history_id,
+            ),
+            **{pk_name: getattr(history_instance, pk_name)},
+        )
+        .order_by("-history_date", "-history_id")
+        .first()
+    )
+
+
+def remove_duplicate_entry(history_instance, previous=None):
+    """
+    Delete the new history record when it records no change from the previous
+    record of the object, returns whether it is deleted
+    """
+    if history_instance.history_type == "-":
+        return False
+    if previous is None:
+        previous = previous_history(history_instance)
+    if previous is None:
+        return False
+    return bool(_check_and_delete(history_instance, previous))
+
+
+def remove_duplicate_histories(history_model, batch_size=1000, dry_run=False):
+    """
+    Delete the history records that record no change from the previous record
+    of their object, the history is read in batches. Returns the number of
+    duplicates.
+    """
+    from django.contrib.contenttypes.models import ContentType
+
+    from horilla_audit.models import HistoryChange
+
+    pk_name = history_model.instance_type._meta.pk.attname
+    content_type = ContentType.objects.get_for_model(history_model.instance_type)
+    histories = history_model._default_manager.order_by(
+        pk_name, "history_date", "history_id"
+    ).iterator(chunk_size=batch_size)
+    # Duplicate history id by the id of the record it duplicates
+    duplicates = {}
+    removed = 0
+
+    def delete_duplicates():
+        if dry_run or not duplicates:
+            return
+        history_model._default_manager.filter(
+            history_id__in=[
+                history_id for ids in duplicates.values() for history_id in ids
+            ]
+        ).delete()
+        # The changes recorded against a duplicate are the same against the
+        # record it duplicates
+        for history_id, duplicate_ids in duplicates.items():
+            HistoryChange.objects.filter(
+                content_type=content_type, previous_history_id__in=duplicate_ids
+            ).update(previous_history_id=history_id)
+
+    previous = None
+    pending = 0
+    for history in histories:
+        if (
+            previous is not None
+            and getattr(previous, pk_name) == getattr(history, pk_name)
+            and history.history_type != "-"
+            and _check_and_delete(history, previous, dry_run=True)
+        ):
+            duplicates.setdefault(previous.history_id, []).append(history.history_id)
+            pending += 1
+        else:
+            previous = history
+        if pending >= batch_size:
+            delete_duplicates()
+            removed += pending
+            duplicates = {}
+            pending = 0
+    delete_duplicates()
+    return removed + pending
+
+
 def remove_duplicate_history(instance):
     """
     This method is used to remove duplicate entries
@@ -73,83 +163,250 @@ def filter_history(histories, track_fields):
     return histories
 
 
-def get_diff(instance):
+def history_change_rows(history_instance, previous):
     """
-    This method is used to find the differences in the history
+    The `HistoryChange` rows of the fields the history record changed from
+    the previous record
+    """
+    from django.contrib.contenttypes.models import ContentType
+
+    from horilla_audit.models import HistoryChange
+
+    model_class = history_instance.instance_type
+    pk_name = model_class._meta.pk.attname
+    content_type = ContentType.objects.get_for_model(model_class)
+    rows = []
+    for change in history_instance.diff_against(previous).changes:
+        old = change.old
+        new = change.new
+        is_fk = False
+        try:
+            field = model_class._meta.get_field(change.field)
+        except Exception:
+            field = None
+        if isinstance(field, models.fields.CharField) and field.choices and old and new:
+            choices = dict(field.choices)
+            old = choices.get(old, old)
+            new = choices.get(new, new)
+        if isinstance(field, models.ForeignKey):
+            is_fk = True
+        rows.append(
+            HistoryChange(
+                content_type=content_type,
+                object_id=str(getattr(history_instance, pk_name)),
+                history_id=history_instance.history_id,
+                previous_history_id=previous.history_id,
+                history_date=history_instance.history_date,
+                history_user_id=history_instance.history_user_id,
+                field_name=change.field,
+                is_fk=is_fk,
+                old_value=str(old) if old is not None and is_fk else old,
+                new_value=str(new) if new is not None and is_fk else new,
+            )
+        )
+    return rows
+
+
+def record_history_changes(history_instance, previous=None):
+    """
+    Store the field changes of a new history record, computed once here
+    instead of every time the history is shown
+    """
+    from horilla_audit.models import HistoryChange
+
+    if previous is None:
+        previous = previous_history(history_instance)
+    if previous is None:
+        return
+    HistoryChange.objects.bulk_create(history_change_rows(history_instance, previous))
+
+
+def build_history_changes(history_model, object_pk):
+    """
+    Store the field changes of the history records of the object recorded
+    before the change table, duplicates are deleted as they are found
+    """
+    from django.contrib.contenttypes.models import ContentType
+
+    from horilla_audit.models import HistoryChange
+
+    model_class = history_model.instance_type
+    pk_name = model_class._meta.pk.attname
+    histories = history_model._default_manager.filter(**{pk_name: object_pk})
+    history_ids = list(
+        histories.order_by("history_date", "history_id").values_list(
+            "history_id", flat=True
+        )
+    )
+    if len(history_ids) < 2:
+        return
+    recorded_ids = set(
+        HistoryChange.objects.filter(
+            content_type=ContentType.objects.get_for_model(model_class),
+            object_id=str(object_pk),
+        ).values_list("history_id", flat=True)
+    )
+    if recorded_ids.issuperset(history_ids[1:]):
+        return
+    rows = []
+    previous = None
+    for history in histories.order_by("history_date", "history_id"):
+        if previous is not None and history.history_id not in recorded_ids:
+            changes = history_change_rows(history, previous)
+            if not changes and history.history_type != "-":
+                history.delete()
+                continue
+            rows += changes
+        previous = history
+    HistoryChange.objects.bulk_create(rows, batch_size=500)
+
+
+class HistoryTimeline(list):
+    """
+    A page of history entries, next_cursor is the cursor of the next page,
+    None on the last page
+    """
+
+    next_cursor = None
+
+
+def history_timeline(instance, cursor=None, page_size=None, history_model=None):
+    """
+    The history entries of the instance, newest first, read from the change
+    table. With a page size, one page of entries after the cursor. The
+    history model registered for the model is read when none is given.
     """
-    remove_duplicate_history(instance)
-    history = instance.history_set.all()
-    history_list = list(history)
-    pairs = [
-        [history_list[i], history_list[i + 1]] for i in range(len(history_list) - 1)
-    ]
-    delta_changes = []
-    create_history = history.filter(history_type="+").first()
-    for pair in pairs:
-        delta = pair[0].diff_against(pair[1])
-        diffs = []
-        class_name = pair[0].instance.__class__
-        for change in delta.changes:
-            old = change.old
-            new = change.new
-            field = instance._meta.get_field(change.field)
-            is_fk = False
-            if (
-                isinstance(field, models.fields.CharField)
-                and field.choices
-                and old
-                and new
-            ):
-                choices = dict(field.choices)
-                old = choices[old]
-                new = choices[new]
-            if isinstance(field, models.ForeignKey):
-                is_fk = True
-                # old = getattr(pair[0], change.field)
-                # new = getattr(pair[1], change.field)
-            diffs.append(
-                {
-                    "field": get_field_label(class_name, change.field),
-                    "field_name": change.field,
-                    "is_fk": is_fk,
-                    "old": old,
-                    "new": new,
-                }
+    from django.apps import apps
+    from django.contrib.contenttypes.models import ContentType
+    from simple_history.utils import get_history_model_for_model
+
+    from horilla_audit.models import HistoryChange, HistoryTrackingFields
+
+    model_class = type(instance)
+    if history_model is None:
+        history_model = get_history_model_for_model(model_class)
+    build_history_changes(history_model, instance.pk)
+
+    changes = HistoryChange.objects.filter(
+        content_type=ContentType.objects.get_for_model(model_class),
+        object_id=str(instance.pk),
+    )
+    track_fields = None
+    if instance._meta.model_name == "employeeworkinformation":
+        history_tracking_instance = HistoryTrackingFields.objects.first()
+        if history_tracking_instance and history_tracking_instance.tracking_fields:
+            track_fields = history_tracking_instance.tracking_fields["tracking_fields"]
+    if track_fields:
+        changes = changes.filter(field_name__in=track_fields)
+    try:
+        cursor = int(cursor) if cursor else None
+    except ValueError:
+        cursor = None
+    if cursor:
+        cursor_date = (
+            changes.filter(history_id=cursor)
+            .values_list("history_date", flat=True)
+            .first()
+        )
+        if cursor_date is not None:
+            changes = changes.filter(
+                Q(history_date__lt=cursor_date)
+                | Q(history_date=cursor_date, history_id__lt=cursor)
+            )
+
+    entries = (
+        changes.order_by("-history_date", "-history_id")
+        .values_list("history_id", "history_date")
+        .distinct()
+    )
+    if page_size:
+        entries = entries[: page_size + 1]
+    entry_ids = [history_id for history_id, _date in entries]
+    timeline = HistoryTimeline()
+    if page_size and len(entry_ids) > page_size:
+        entry_ids = entry_ids[:page_size]
+        timeline.next_cursor = entry_ids[-1]
+
+    rows = {}
+    for row in changes.filter(history_id__in=entry_ids).order_by("pk"):
+        rows.setdefault(row.history_id, []).append(row)
+    record_ids = set(entry_ids) | {
+        entry_rows[0].previous_history_id for entry_rows in rows.values()
+    }
+    create_history = None
+    if timeline.next_cursor is None and not track_fields:
+        create_history = (
+            history_model._default_manager.filter(
+                **{model_class._meta.pk.attname: instance.pk}, history_type="+"
             )
-        updated_by = (
-            User.objects.get(id=pair[0].history_user.id).employee_get
-            if pair[0].history_user
-            else Bot()
+            .order_by("-history_date", "-history_id")
+            .first()
         )
-        delta_changes.append(
+    records = {
+        record.history_id: record
+        for record in history_model._default_manager.filter(
+            history_id__in=record_ids
+        ).select_related("history_user")
+    }
+
+    user_ids = {
+        entry_rows[0].history_user_id
+        for entry_rows in rows.values()
+        if entry_rows[0].history_user_id
+    }
+    if create_history and create_history.history_user_id:
+        user_ids.add(create_history.history_user_id)
+    employees = {}
+    if user_ids:
+        Employee = apps.get_model("employee", "Employee")
+        employees = {
+            employee.employee_user_id_id: employee
+            for employee in Employee.objects.entire().filter(
+                employee_user_id__in=user_ids
+            )
+        }
+
+    for history_id in entry_ids:
+        entry_rows = rows.get(history_id)
+        if not entry_rows:
+            continue
+        record = records.get(history_id)
+        previous = records.get(entry_rows[0].previous_history_id)
+        if record is None or previous is None:
+            continue
+        timeline.append(
             {
                 "type": "Changes",
-                "pair": pair,
-                "changes": diffs,
-                "updated_by": updated_by,
+                "pair": (record, previous),
+                "changes": [
+                    {
+                        "field": get_field_label(model_class, row.field_name),
+                        "field_name": row.field_name,
+                        "is_fk": row.is_fk,
+                        "old": row.old_value,
+                        "new": row.new_value,
+                    }
+                    for row in entry_rows
+                ],
+                "updated_by": employees.get(entry_rows[0].history_user_id, Bot()),
             }
         )
     if create_history:
-        try:
-            updated_by = create_history.history_user.employee_get
-        except:
-            updated_by = Bot()
-        delta_changes.append(
+        timeline.append(
             {
-                "type": f"{create_history.instance.__class__._meta.verbose_name.capitalize()} created",
+                "type": f"{model_class._meta.verbose_name.capitalize()} created",
                 "pair": (create_history, create_history),
-                "updated_by": updated_by,
+                "updated_by": employees.get(create_history.history_user_id, Bot()),
             }
         )
-    if instance._meta.model_name == "employeeworkinformation":
-        from .models import HistoryTrackingFields
+    return timeline
 
-        history_tracking_instance = HistoryTrackingFields.objects.first()
-        if history_tracking_instance and history_tracking_instance.tracking_fields:
-            track_fields = history_tracking_instance.tracking_fields["tracking_fields"]
-            if track_fields:
-                delta_changes = filter_history(delta_changes, track_fields)
-    return delta_changes
+
+def get_diff(instance, cursor=None, page_size=None):
+    """
+    This method is used to find the differences in the history
+    """
+    return history_timeline(instance, cursor=cursor, page_size=page_size)
 
 
 def history_tracking(request, obj_id, **kwargs):
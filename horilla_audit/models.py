@@ -2,8 +2,12 @@
 models.py
 """
 
+import logging
 from collections.abc import Iterable
 
+from django.contrib.auth.models import User
+from django.contrib.contenttypes.models import ContentType
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.dispatch import receiver
 from simple_history.models import (
@@ -19,7 +23,13 @@ from simple_history.signals import (  # pre_create_historical_m2m_records,; post
 
 # from employee.models import Employee
 from horilla.models import HorillaModel
-from horilla_audit.methods import remove_duplicate_history
+from horilla_audit.methods import (
+    previous_history,
+    record_history_changes,
+    remove_duplicate_entry,
+)
+
+logger = logging.getLogger(__name__)
 
 # Create your models here.
 
@@ -104,6 +114,14 @@ def post_create_horilla_audit_log(sender, instance, *_args, **kwargs):
     """
     Post create horill audit log method
     """
+    try:
+        history_instance = kwargs["history_instance"]
+        previous = previous_history(history_instance)
+        if remove_duplicate_entry(history_instance, previous):
+            return
+        record_history_changes(history_instance, previous)
+    except Exception as error:
+        logger.error("History change recording failed: %s", error)
     try:
         history_instance = kwargs["history_instance"]
         history_instance.history_tags.set(
@@ -111,7 +129,6 @@ def post_create_horilla_audit_log(sender, instance, *_args, **kwargs):
         )
         if isinstance(history_instance, HorillaAuditLog):
             history_instance.history_title = "Demo Title"
-            remove_duplicate_history(instance)
             if instance.skip_history:
                 instance.history_set.filter(pk=history_instance.pk).delete()
             kwargs["history_instance"] = None
@@ -119,6 +136,39 @@ def post_create_horilla_audit_log(sender, instance, *_args, **kwargs):
         pass
 
 
+class HistoryChange(models.Model):
+    """
+    A field change recorded by a history record, against the previous history
+    record of the object
+    """
+
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.CharField(max_length=64)
+    history_id = models.IntegerField()
+    previous_history_id = models.IntegerField()
+    history_date = models.DateTimeField()
+    history_user = models.ForeignKey(
+        User, null=True, on_delete=models.SET_NULL, related_name="+"
+    )
+    field_name = models.CharField(max_length=100)
+    is_fk = models.BooleanField(default=False)
+    old_value = models.JSONField(null=True, encoder=DjangoJSONEncoder)
+    new_value = models.JSONField(null=True, encoder=DjangoJSONEncoder)
+
+    class Meta:
+        """
+        Meta class for aditional info
+        """
+
+        app_label = "horilla_audit"
+        indexes = [
+            models.Index(
+                fields=["content_type", "object_id", "-history_date", "-history_id"]
+            ),
+            models.Index(fields=["content_type", "history_id"]),
+        ]
+
+
 class HistoryTrackingFields(HorillaModel):
     tracking_fields = models.JSONField(null=True, blank=True, editable=False)
     work_info_track = models.BooleanField(default=True)
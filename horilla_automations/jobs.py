@@ -0,0 +1,214 @@
+"""
+horilla_automations/jobs.py
+
+Durable mail automation jobs.
+
+A save or bulk update of a watched model evaluates the automation conditions
+in the saving thread and stores one `AutomationJob` per triggered automation
+and record, in the same transaction as the change. The jobs are delivered by
+the automation job worker: a thread of the web process when
+AUTOMATION_JOBS_IN_PROCESS is set, or the `run_automation_jobs` management
+command. A failed job is retried with a growing delay, a job left running by
+a stopped worker is taken again after JOB_LOCK_TIMEOUT.
+
+The previous state of a saved record is rebuilt from the values it was
+loaded with (kept by `track_loaded_values`) instead of being queried again.
+"""
+
+import copy
+import logging
+import threading
+from datetime import timedelta
+
+from django.contrib.auth.models import AnonymousUser
+from django.db import transaction
+from django.db.models import Q
+from django.http import HttpRequest
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+JOB_BATCH_SIZE = 50
+JOB_MAX_ATTEMPTS = 5
+# Seconds before the first retry, doubled at every attempt
+JOB_RETRY_DELAY = 60
+JOB_LOCK_TIMEOUT = 15 * 60
+JOB_POLL_INTERVAL = 5
+
+job_available = threading.Event()
+
+_tracked_models = set()
+
+
+def track_loaded_values(model_class):
+    """
+    Keep the field values the instances of the model are loaded with
+    """
+    if model_class in _tracked_models:
+        return
+    from_db = model_class.from_db.__func__
+
+    def snapshot_from_db(cls, db, field_names, values):
+        instance = from_db(cls, db, field_names, values)
+        instance._automation_loaded_values = dict(zip(field_names, values))
+        return instance
+
+    model_class.from_db = classmethod(snapshot_from_db)
+    _tracked_models.add(model_class)
+
+
+def previous_instance(instance):
+    """
+    The instance as it is in the database, before the save in progress
+    """
+    loaded_values = getattr(instance, "_automation_loaded_values", None)
+    if loaded_values is None:
+        if instance.pk is None:
+            return instance
+        return type(instance)._base_manager.filter(pk=instance.pk).first()
+    previous = copy.copy(instance)
+    previous._state.fields_cache = {}
+    previous.__dict__.pop("_prefetched_objects_cache", None)
+    previous.__dict__.update(loaded_values)
+    return previous
+
+
+def refresh_loaded_values(instance):
+    """
+    The values being saved are the previous state of the next save
+    """
+    if hasattr(instance, "_automation_loaded_values"):
+        instance._automation_loaded_values = {
+            field.attname: getattr(instance, field.attname)
+            for field in instance._meta.concrete_fields
+            if field.attname in instance.__dict__
+        }
+
+
+def queue_automation_jobs(request, automation, object_ids):
+    """
+    Store the jobs delivering the automation for the records, the worker is
+    woken up once the transaction is committed
+    """
+    from horilla_automations.models import AutomationJob
+
+    if request is None or not object_ids:
+        return
+    user = getattr(request, "user", None)
+    request_info = {}
+    try:
+        request_info = {"host": request.get_host(), "scheme": request.scheme}
+    except Exception:
+        pass
+    AutomationJob.objects.bulk_create(
+        [
+            AutomationJob(
+                automation=automation,
+                object_id=str(object_id),
+                triggered_by_id=getattr(user, "pk", None),
+                request_info=request_info,
+            )
+            for object_id in object_ids
+        ],
+        batch_size=500,
+    )
+    transaction.on_commit(job_available.set)
+
+
+def job_request(job):
+    """
+    Request standing for the request that triggered the job, for the
+    templates and the mail sender
+    """
+    request = HttpRequest()
+    request.user = job.triggered_by or AnonymousUser()
+    request.session = {}
+    if job.request_info.get("host"):
+        request.META["HTTP_HOST"] = job.request_info["host"]
+    scheme = job.request_info.get("scheme", "http")
+    request._get_scheme = lambda: scheme
+    return request
+
+
+def claim_jobs(batch_size=JOB_BATCH_SIZE):
+    """
+    Mark a batch of due jobs as running, a job is only claimed by one worker
+    """
+    from horilla_automations.models import AutomationJob
+
+    now = timezone.now()
+    due_jobs = (
+        AutomationJob.objects.filter(
+            Q(status="pending", run_after__lte=now)
+            | Q(
+                status="running",
+                locked_at__lt=now - timedelta(seconds=JOB_LOCK_TIMEOUT),
+            )
+        )
+        .order_by("run_after", "pk")
+        .values_list("pk", "status", "locked_at")[:batch_size]
+    )
+    claimed_ids = [
+        pk
+        for pk, status, locked_at in due_jobs
+        if AutomationJob.objects.filter(
+            pk=pk, status=status, locked_at=locked_at
+        ).update(status="running", locked_at=now)
+    ]
+    return list(
+        AutomationJob.objects.filter(pk__in=claimed_ids)
+        .select_related("automation", "automation__mail_template", "triggered_by")
+        .order_by("run_after", "pk")
+    )
+
+
+def run_job(job):
+    """
+    Deliver the automation of the job for its record
+    """
+    from horilla_automations.methods.methods import get_model_class
+    from horilla_automations.signals import send_mail
+
+    automation = job.automation
+    if not automation.is_active:
+        return
+    model_class = get_model_class(automation.model)
+    instance = model_class._base_manager.filter(pk=job.object_id).first()
+    if instance is None:
+        # The record is deleted, nothing to send
+        return
+    send_mail(job_request(job), automation, instance)
+
+
+def run_jobs(batch_size=JOB_BATCH_SIZE):
+    """
+    Run a batch of due jobs, returns the number of jobs run
+    """
+    jobs = claim_jobs(batch_size)
+    for job in jobs:
+        try:
+            run_job(job)
+        except Exception as error:
+            logger.error("Automation job %s failed: %s", job.pk, error)
+            job.attempts += 1
+            job.last_error = str(error)
+            job.locked_at = None
+            if job.attempts >= JOB_MAX_ATTEMPTS:
+                job.status = "failed"
+            else:
+                job.status = "pending"
+                job.run_after = timezone.now() + timedelta(
+                    seconds=JOB_RETRY_DELAY * 2 ** (job.attempts - 1)
+                )
+            job.save(
+                update_fields=[
+                    "attempts",
+                    "last_error",
+                    "locked_at",
+                    "status",
+                    "run_after",
+                ]
+            )
+        else:
+            job.delete()
+    return len(jobs)
@@ -0,0 +1,45 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from horilla_automations.jobs import JOB_BATCH_SIZE, JOB_POLL_INTERVAL, run_jobs
+
+
+class Command(BaseCommand):
+    help = (
+        "Deliver the queued mail automation jobs, as a long running worker or "
+        "once with --once"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Deliver the due jobs and exit",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=JOB_BATCH_SIZE,
+            help=f"Jobs claimed at a time (default {JOB_BATCH_SIZE})",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=JOB_POLL_INTERVAL,
+            help=f"Seconds between checks for due jobs (default {JOB_POLL_INTERVAL})",
+        )
+
+    def handle(self, *args, **options):
+        total = 0
+        while True:
+            close_old_connections()
+            count = run_jobs(options["batch_size"])
+            total += count
+            if count:
+                continue
+            if options["once"]:
+                break
+            time.sleep(options["interval"])
+        self.stdout.write(self.style.SUCCESS(f"{total} automation jobs run."))
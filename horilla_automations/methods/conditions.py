@@ -0,0 +1,224 @@
+"""
+horilla_automations/methods/conditions.py
+
+Mail automation conditions compiled once per automation.
+
+The condition query string of an automation is parsed into a
+`CompiledAutomation` when the automation is loaded: the attribute paths, the
+operators and the values are resolved once, and the fields of the model the
+conditions read are collected so an update that does not change them is
+skipped without evaluating anything.
+"""
+
+import logging
+
+from django.db import models
+from django.db.models.query import QuerySet
+
+from horilla_automations.methods.methods import (
+    get_model_class,
+    operator_map,
+    split_query_string,
+)
+
+logger = logging.getLogger(__name__)
+
+_compiled_automations = {}
+
+
+class CompiledCondition:
+    """
+    One `attr operator value` condition of an automation, with the logic
+    joining it to the previous condition
+    """
+
+    def __init__(self, model_class, attr, operator_str, value, logic=None):
+        if operator_str not in operator_map:
+            raise ValueError(f"Invalid operator: {operator_str}")
+        if value == "on":
+            value = True
+        elif value == "off":
+            value = False
+        self.attr = attr
+        self.operator = operator_map[operator_str]
+        self.value = value
+        self.logic = operator_map[logic] if logic else None
+        self.is_and = logic == "and"
+
+        self.field = None
+        first_part = attr.split("__")[0]
+        try:
+            field = model_class._meta.get_field(first_part)
+        except Exception:
+            field = None
+        if field is not None and field.concrete and not field.many_to_many:
+            self.field = field
+        # A single foreign key is compared by its id, without loading the
+        # related record
+        self.foreign_key_id = (
+            self.field is not None and self.field.many_to_one and "__" not in attr
+        )
+
+    def resolve(self, instance):
+        """
+        Value of the condition attribute of the instance, related records as
+        their primary key
+        """
+        from horilla_views.templatetags.generic_template_filters import getattribute
+
+        if instance is None:
+            return ""
+        if self.foreign_key_id:
+            value = getattr(instance, self.field.attname)
+            return str(value) if value is not None else None
+        value = getattribute(instance, self.attr)
+        if isinstance(value, models.Model) and value.pk:
+            return str(value.pk)
+        if isinstance(value, QuerySet):
+            return tuple(value.values_list("pk", flat=True))
+        if isinstance(value, list):
+            return tuple(value)
+        return value
+
+    def evaluate(self, value):
+        return self.operator(value, self.value)
+
+
+class CompiledAutomation:
+    """
+    The conditions and trigger of a mail automation
+    """
+
+    def __init__(self, automation):
+        self.automation = automation
+        self.pk = automation.pk
+        self.trigger = automation.trigger
+        self.model_class = get_model_class(automation.model)
+        self.condition_querystring = automation.condition_querystring or ""
+        self.conditions = []
+        for condition in split_query_string(
+            self.condition_querystring.replace("automation_multiple_", "")
+        ):
+            parts = condition.getlist("condition")
+            if parts:
+                self.conditions.append(
+                    CompiledCondition(
+                        self.model_class,
+                        parts[0],
+                        parts[1],
+                        parts[2],
+                        condition.get("logic"),
+                    )
+                )
+        # Attribute names of the model fields the conditions read, None when
+        # a condition reads a method or a many to many field
+        self.watched_fields = set()
+        for condition in self.conditions:
+            if condition.field is None:
+                self.watched_fields = None
+                break
+            self.watched_fields.add(condition.field.attname)
+
+    def fields_changed(self, instance, previous_instance, update_fields=None):
+        """
+        Whether the save may change a value the conditions read
+        """
+        if self.watched_fields is None:
+            return True
+        if update_fields is not None:
+            try:
+                update_attnames = {
+                    self.model_class._meta.get_field(name).attname
+                    for name in update_fields
+                }
+            except Exception:
+                return True
+            if not update_attnames & self.watched_fields:
+                return False
+        if previous_instance is None or previous_instance is instance:
+            return True
+        return any(
+            getattr(instance, attname, None)
+            != getattr(previous_instance, attname, None)
+            for attname in self.watched_fields
+        )
+
+    def applicable(self, created, instance, previous_instance, update_fields=None):
+        """
+        Whether the save of the instance triggers the automation
+        """
+        if created:
+            if self.trigger != "on_create":
+                return False
+        elif self.trigger != "on_update" or not self.fields_changed(
+            instance, previous_instance, update_fields
+        ):
+            return False
+
+        applicable = False
+        and_exists = False
+        false_exists = False
+        instance_values = []
+        previous_instance_values = []
+        for condition in self.conditions:
+            instance_value = condition.resolve(instance)
+            instance_values.append(instance_value)
+            if not created:
+                previous_instance_values.append(condition.resolve(previous_instance))
+            if condition.logic is None:
+                applicable = condition.evaluate(instance_value)
+            else:
+                applicable = condition.logic(
+                    applicable, condition.evaluate(instance_value)
+                )
+            if not applicable:
+                false_exists = True
+            if condition.is_and:
+                and_exists = True
+            if false_exists and and_exists:
+                return False
+        if not applicable:
+            return False
+        if created:
+            return True
+        # An update only triggers the automation when the values actually
+        # changed
+        return set(map(hashable, previous_instance_values)) != set(
+            map(hashable, instance_values)
+        )
+
+
+def hashable(value):
+    try:
+        hash(value)
+    except TypeError:
+        return str(value)
+    return value
+
+
+def compile_automation(automation):
+    """
+    The compiled conditions of the automation, cached until its conditions
+    change. None when they cannot be compiled.
+    """
+    compiled = _compiled_automations.get(automation.pk)
+    if (
+        compiled is not None
+        and compiled.condition_querystring == (automation.condition_querystring or "")
+        and compiled.trigger == automation.trigger
+        and compiled.automation.model == automation.model
+    ):
+        compiled.automation = automation
+        return compiled
+    try:
+        compiled = CompiledAutomation(automation)
+    except Exception as error:
+        logger.error("Automation %s conditions are invalid: %s", automation, error)
+        _compiled_automations.pop(automation.pk, None)
+        return None
+    _compiled_automations[automation.pk] = compiled
+    return compiled
+
+
+def forget_automation(automation_pk):
+    _compiled_automations.pop(automation_pk, None)
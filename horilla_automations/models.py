@@ -1,5 +1,6 @@
 from django.db import models
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _trans
 
 from base.methods import eval_validate
@@ -143,3 +144,38 @@ class MailAutomation(HorillaModel):
     def trigger_display(self):
         """"""
         return self.get_trigger_display()
+
+
+class AutomationJob(models.Model):
+    """
+    A triggered mail automation waiting to be delivered by the automation
+    job worker
+    """
+
+    STATUS = [
+        ("pending", _trans("Pending")),
+        ("running", _trans("Running")),
+        ("failed", _trans("Failed")),
+    ]
+
+    automation = models.ForeignKey(
+        MailAutomation, on_delete=models.CASCADE, related_name="jobs"
+    )
+    object_id = models.CharField(max_length=100)
+    triggered_by = models.ForeignKey(
+        "auth.User", on_delete=models.SET_NULL, null=True, blank=True
+    )
+    request_info = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS, default="pending")
+    attempts = models.PositiveSmallIntegerField(default=0)
+    run_after = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    objects = models.Manager()
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "run_after"])]
+
+    def __str__(self) -> str:
+        return f"{self.automation} #{self.object_id} ({self.status})"
@@ -3,11 +3,7 @@ horilla_automation/signals.py
 
 """
 
-import copy
 import logging
-import threading
-import time
-import types
 
 from bs4 import BeautifulSoup
 from django import template
@@ -15,10 +11,16 @@ from django.core.mail import EmailMessage
 from django.db import models
 from django.db.models.query import QuerySet
 from django.db.models.signals import post_delete, post_save, pre_save
-from django.dispatch import receiver
 
 from horilla.horilla_middlewares import _thread_locals
+from horilla.horilla_settings import AUTOMATION_JOBS_IN_PROCESS
 from horilla.signals import post_bulk_update, pre_bulk_update
+from horilla_automations.jobs import (
+    previous_instance,
+    queue_automation_jobs,
+    refresh_loaded_values,
+    track_loaded_values,
+)
 from notifications.signals import notify
 
 logger = logging.getLogger(__name__)
@@ -35,315 +37,188 @@ def from_list(cls, object_list):
 
 setattr(QuerySet, "from_list", from_list)
 
-SIGNAL_HANDLERS = []
-INSTANCE_HANDLERS = []
+AUTOMATIONS = {}
 REFRESH_METHODS = {}
 
 
-def start_automation():
+def automation_pre_save(sender, instance, **kwargs):
     """
-    Automation signals
+    Signal handler for pre-save events of the automation model instances,
+    keeps the previous state of the instance on it
     """
-    from base.models import HorillaMailTemplate
-    from horilla_automations.methods.methods import get_model_class, split_query_string
-    from horilla_automations.models import MailAutomation
+    instance._automation_previous = previous_instance(instance)
+    refresh_loaded_values(instance)
 
-    @receiver(post_delete, sender=MailAutomation)
-    @receiver(post_save, sender=MailAutomation)
-    def automation_signal(sender, instance, **kwargs):
-        """
-        signal method to handle automation post save
-        """
-        start_connection()
-        track_previous_instance()
-
-    @receiver(post_delete, sender=HorillaMailTemplate)
-    @receiver(post_save, sender=HorillaMailTemplate)
-    def template_signal(sender, instance, **kwargs):
-        """
-        signal method to handle automation post save
-        """
-        start_connection()
-        track_previous_instance()
-
-    def clear_connection():
-        """
-        Method to clear signals handlers
-        """
-        for handler in SIGNAL_HANDLERS:
-            post_save.disconnect(handler, sender=handler.model_class)
-            post_bulk_update.disconnect(handler, sender=handler.model_class)
-        SIGNAL_HANDLERS.clear()
-
-    REFRESH_METHODS["clear_connection"] = clear_connection
-
-    def create_post_bulk_update_handler(automation, model_class, query_strings):
-        def post_bulk_update_handler(sender, queryset, *args, **kwargs):
-            def _bulk_update_thread_handler(
-                queryset, previous_queryset_copy, automation
-            ):
-                request = getattr(queryset, "request", None)
-
-                if request:
-                    for index, instance in enumerate(queryset):
-                        previous_instance = previous_queryset_copy[index]
-                        send_automated_mail(
-                            request,
-                            False,
-                            automation,
-                            query_strings,
-                            instance,
-                            previous_instance,
-                        )
-
-            previous_bulk_record = getattr(_thread_locals, "previous_bulk_record", None)
-            previous_queryset_copy = []
-            if previous_bulk_record:
-                previous_queryset = previous_bulk_record.get("queryset", None)
-                previous_queryset_copy = previous_bulk_record.get("queryset_copy", [])
 
-            bulk_thread = threading.Thread(
-                target=_bulk_update_thread_handler,
-                args=(queryset, previous_queryset_copy, automation),
-            )
-            bulk_thread.start()
+def automation_post_save(sender, instance, created, update_fields=None, **kwargs):
+    """
+    Signal handler for post-save events of the automation model instances,
+    queues the automations of the model the save triggers
+    """
+    request = getattr(_thread_locals, "request", None)
+    if request is None:
+        return
+    previous = getattr(instance, "_automation_previous", None)
+    for compiled in list(AUTOMATIONS.get(sender, {}).values()):
+        if compiled.applicable(created, instance, previous, update_fields):
+            queue_automation_jobs(request, compiled.automation, [instance.pk])
 
-        func_name = f"{automation.method_title}_post_bulk_signal_handler"
 
-        # Dynamically create a function with a unique name
-        handler = types.FunctionType(
-            post_bulk_update_handler.__code__,
-            globals(),
-            name=func_name,
-            argdefs=post_bulk_update_handler.__defaults__,
-            closure=post_bulk_update_handler.__closure__,
+def automation_pre_bulk_update(sender, queryset, *args, **kwargs):
+    """
+    Read the records before a bulk update that may trigger an automation of
+    the model
+    """
+    if getattr(queryset, "request", None) is None:
+        return
+    update_fields = set(kwargs.get("kwargs", {}))
+    if any(
+        compiled.trigger == "on_update"
+        and compiled.fields_changed(None, None, update_fields)
+        for compiled in AUTOMATIONS.get(sender, {}).values()
+    ):
+        queryset.automation_previous = {
+            instance.pk: instance for instance in queryset.all()
+        }
+
+
+def automation_post_bulk_update(sender, queryset, *args, **kwargs):
+    """
+    Evaluate the automations of the model for the updated records at once,
+    read by primary key as they may no longer match the queryset
+    """
+    previous_instances = getattr(queryset, "automation_previous", None)
+    if not previous_instances:
+        return
+    update_fields = set(kwargs.get("kwargs", {}))
+    instances = list(sender._base_manager.filter(pk__in=list(previous_instances)))
+    for compiled in list(AUTOMATIONS.get(sender, {}).values()):
+        queue_automation_jobs(
+            queryset.request,
+            compiled.automation,
+            [
+                instance.pk
+                for instance in instances
+                if compiled.applicable(
+                    False,
+                    instance,
+                    previous_instances.get(instance.pk),
+                    update_fields,
+                )
+            ],
         )
 
-        # Set additional attributes on the function
-        handler.model_class = model_class
-        handler.automation = automation
 
-        return handler
+def connect_model(model_class):
+    """
+    Connect the automation handlers of a model, once for all its automations
+    """
+    track_loaded_values(model_class)
+    uid = f"automation_{model_class._meta.label_lower}"
+    pre_save.connect(automation_pre_save, sender=model_class, dispatch_uid=uid)
+    post_save.connect(automation_post_save, sender=model_class, dispatch_uid=uid)
+    pre_bulk_update.connect(
+        automation_pre_bulk_update, sender=model_class, dispatch_uid=uid
+    )
+    post_bulk_update.connect(
+        automation_post_bulk_update, sender=model_class, dispatch_uid=uid
+    )
 
-    def start_connection():
-        """
-        Method to start signal connection accordingly to the automation
-        """
-        clear_connection()
-        automations = MailAutomation.objects.filter(is_active=True)
-        for automation in automations:
 
-            condition_querystring = automation.condition_querystring.replace(
-                "automation_multiple_", ""
-            )
+def disconnect_model(model_class):
+    uid = f"automation_{model_class._meta.label_lower}"
+    for signal in (pre_save, post_save, pre_bulk_update, post_bulk_update):
+        signal.disconnect(sender=model_class, dispatch_uid=uid)
 
-            query_strings = split_query_string(condition_querystring)
 
-            model_path = automation.model
-            model_class = get_model_class(model_path)
+def unload_automation(automation_pk):
+    """
+    Stop the automation, disconnecting its model when it was the last one
+    """
+    for model_class, automations in list(AUTOMATIONS.items()):
+        if automations.pop(automation_pk, None) is not None and not automations:
+            del AUTOMATIONS[model_class]
+            disconnect_model(model_class)
 
-            handler = create_post_bulk_update_handler(
-                automation, model_class, query_strings
-            )
-            SIGNAL_HANDLERS.append(handler)
-
-            post_bulk_update.connect(handler, sender=model_class)
-
-            def create_signal_handler(name, automation, query_strings):
-                def signal_handler(sender, instance, created, **kwargs):
-                    """
-                    Signal handler for post-save events of the model instances.
-                    """
-                    request = getattr(_thread_locals, "request", None)
-                    previous_record = getattr(_thread_locals, "previous_record", None)
-                    previous_instance = None
-                    if previous_record:
-                        previous_instance = previous_record["instance"]
-
-                    args = (
-                        request,
-                        created,
-                        automation,
-                        query_strings,
-                        instance,
-                        previous_instance,
-                    )
-                    thread = threading.Thread(
-                        target=lambda: send_automated_mail(*args),
-                    )
-                    thread.start()
 
-                signal_handler.__name__ = name
-                signal_handler.model_class = model_class
-                signal_handler.automation = automation
-                return signal_handler
+def load_automation(automation):
+    """
+    Start or reload one automation, the other automations are kept as they
+    are
+    """
+    from horilla_automations.methods.conditions import compile_automation
 
-            # Create and connect the signal handler
-            handler_name = f"{automation.method_title}_signal_handler"
-            dynamic_signal_handler = create_signal_handler(
-                handler_name, automation, query_strings
-            )
-            SIGNAL_HANDLERS.append(dynamic_signal_handler)
-            post_save.connect(
-                dynamic_signal_handler, sender=dynamic_signal_handler.model_class
-            )
+    unload_automation(automation.pk)
+    if not automation.is_active:
+        return
+    compiled = compile_automation(automation)
+    if compiled is None:
+        return
+    automations = AUTOMATIONS.setdefault(compiled.model_class, {})
+    if not automations:
+        connect_model(compiled.model_class)
+    automations[automation.pk] = compiled
 
-    REFRESH_METHODS["start_connection"] = start_connection
-
-    def create_pre_bulk_update_handler(automation, model_class):
-        def pre_bulk_update_handler(sender, queryset, *args, **kwargs):
-            request = getattr(_thread_locals, "request", None)
-            if request:
-                queryset_copy = queryset.none()
-                if queryset.count():
-                    queryset_copy = QuerySet.from_list(copy.deepcopy(list(queryset)))
-                _thread_locals.previous_bulk_record = {
-                    "automation": automation,
-                    "queryset": queryset,
-                    "queryset_copy": queryset_copy,
-                }
-
-        func_name = f"{automation.method_title}_pre_bulk_signal_handler"
-
-        # Dynamically create a function with a unique name
-        handler = types.FunctionType(
-            pre_bulk_update_handler.__code__,
-            globals(),
-            name=func_name,
-            argdefs=pre_bulk_update_handler.__defaults__,
-            closure=pre_bulk_update_handler.__closure__,
-        )
 
-        # Set additional attributes on the function
-        handler.model_class = model_class
-        handler.automation = automation
-
-        return handler
-
-    def track_previous_instance():
-        """
-        method to add signal to track the automations model previous instances
-        """
-
-        def clear_instance_signal_connection():
-            """
-            Method to clear instance handler signals
-            """
-            for handler in INSTANCE_HANDLERS:
-                pre_save.disconnect(handler, sender=handler.model_class)
-                pre_bulk_update.disconnect(handler, sender=handler.model_class)
-            INSTANCE_HANDLERS.clear()
-
-        clear_instance_signal_connection()
-        automations = MailAutomation.objects.filter(is_active=True)
-        for automation in automations:
-            model_class = get_model_class(automation.model)
-
-            handler = create_pre_bulk_update_handler(automation, model_class)
-            INSTANCE_HANDLERS.append(handler)
-            pre_bulk_update.connect(handler, sender=model_class)
-
-            @receiver(pre_save, sender=model_class)
-            def instance_handler(sender, instance, **kwargs):
-                """
-                Signal handler for pres-save events of the model instances.
-                """
-                # prevented storing the scheduled activities
-                request = getattr(_thread_locals, "request", None)
-                if instance.pk:
-                    # to get the previous instance
-                    instance = model_class.objects.filter(id=instance.pk).first()
-                if request:
-                    _thread_locals.previous_record = {
-                        "automation": automation,
-                        "instance": instance,
-                    }
-                instance_handler.__name__ = (
-                    f"{automation.method_title}_instance_handler"
-                )
-                return instance_handler
+def clear_connection():
+    """
+    Method to clear signals handlers
+    """
+    for model_class in list(AUTOMATIONS):
+        disconnect_model(model_class)
+    AUTOMATIONS.clear()
 
-            instance_handler.model_class = model_class
-            instance_handler.automation = automation
 
-            INSTANCE_HANDLERS.append(instance_handler)
+def start_connection():
+    """
+    Method to start signal connection accordingly to the automation
+    """
+    from horilla_automations.models import MailAutomation
 
-    track_previous_instance()
-    start_connection()
+    clear_connection()
+    for automation in MailAutomation.objects.filter(is_active=True):
+        load_automation(automation)
 
 
-def send_automated_mail(
-    request,
-    created,
-    automation,
-    query_strings,
-    instance,
-    previous_instance,
-):
-    from horilla_automations.methods.methods import evaluate_condition, operator_map
-    from horilla_views.templatetags.generic_template_filters import getattribute
+REFRESH_METHODS["clear_connection"] = clear_connection
+REFRESH_METHODS["start_connection"] = start_connection
 
-    applicable = False
-    and_exists = False
-    false_exists = False
-    instance_values = []
-    previous_instance_values = []
-    for condition in query_strings:
-        if condition.getlist("condition"):
-            attr = condition.getlist("condition")[0]
-            operator = condition.getlist("condition")[1]
-            value = condition.getlist("condition")[2]
-
-            if value == "on":
-                value = True
-            elif value == "off":
-                value = False
-            instance_value = getattribute(instance, attr)
-            previous_instance_value = getattribute(previous_instance, attr)
-            # The send mail method only trigger when actually any changes
-            # b/w the previous, current instance's `attr` field's values and
-            # if applicable for the automation
-            if getattr(instance_value, "pk", None) and isinstance(
-                instance_value, models.Model
-            ):
-                instance_value = str(getattr(instance_value, "pk", None))
-                previous_instance_value = str(
-                    getattr(previous_instance_value, "pk", None)
-                )
-            elif isinstance(instance_value, QuerySet):
-                instance_value = list(instance_value.values_list("pk", flat=True))
-                previous_instance_value = list(
-                    previous_instance_value.values_list("pk", flat=True)
-                )
 
-            instance_values.append(instance_value)
+def automation_saved(sender, instance, **kwargs):
+    """
+    signal method to reload the saved automation
+    """
+    load_automation(instance)
 
-            previous_instance_values.append(previous_instance_value)
 
-            if not condition.get("logic"):
+def automation_deleted(sender, instance, **kwargs):
+    """
+    signal method to stop the deleted automation
+    """
+    from horilla_automations.methods.conditions import forget_automation
 
-                applicable = evaluate_condition(instance_value, operator, value)
-            logic = condition.get("logic")
-            if logic:
-                applicable = operator_map[logic](
-                    applicable,
-                    evaluate_condition(instance_value, operator, value),
-                )
-            if not applicable:
-                false_exists = True
-            if logic == "and":
-                and_exists = True
-            if false_exists and and_exists:
-                applicable = False
-                break
-    if applicable:
-        if created and automation.trigger == "on_create":
-            send_mail(request, automation, instance)
-        elif (automation.trigger == "on_update") and (
-            set(previous_instance_values) != set(instance_values)
-        ):
-
-            send_mail(request, automation, instance)
+    unload_automation(instance.pk)
+    forget_automation(instance.pk)
+
+
+def start_automation():
+    """
+    Automation signals
+    """
+    from horilla_automations.models import MailAutomation
+
+    post_save.connect(
+        automation_saved, sender=MailAutomation, dispatch_uid="automation_saved"
+    )
+    post_delete.connect(
+        automation_deleted, sender=MailAutomation, dispatch_uid="automation_deleted"
+    )
+    start_connection()
+
+    if AUTOMATION_JOBS_IN_PROCESS:
+        from horilla_automations.threading import start_job_worker
+
+        start_job_worker()
 
 
 def send_mail(request, automation, instance):
@@ -363,11 +238,6 @@ def send_mail(request, automation, instance):
     employees = []
     to_emails = []
 
-    if instance.pk:
-        # refreshing instance due to m2m fields are not loading here some times
-        time.sleep(0.1)
-        instance = instance._meta.model.objects.get(pk=instance.pk)
-
     pk_or_text = getattribute(instance, automation.mail_details)
     model_class = get_model_class(automation.model)
     model_class = get_related_field_model(model_class, automation.mail_details)
@@ -482,15 +352,6 @@ def send_mail(request, automation, instance):
 
         email.attachments = attachments
 
-        def _send_mail(email):
-            try:
-                email.send()
-                logger.info(
-                    f"Automation <Mail> {automation.title} is triggered by {request.user.employee_get}"
-                )
-            except Exception as e:
-                logger.error(e)
-
         def _send_notification(text):
             notify.send(
                 sender,
@@ -498,22 +359,21 @@ def send_mail(request, automation, instance):
                 verb=f"{text}",
                 icon="person-remove",
                 redirect="",
+                queued=True,
             )
             logger.info(
-                f"Automation <Notification> {automation.title} is triggered by {request.user.employee_get}"
+                f"Automation <Notification> {automation.title} is triggered by {request.user}"
             )
 
         if automation.delivery_channel != "notification":
-            thread = threading.Thread(
-                target=lambda: _send_mail(email),
+            # Raised errors are retried by the automation job worker
+            email.send()
+            logger.info(
+                f"Automation <Mail> {automation.title} is triggered by {request.user}"
             )
-            thread.start()
 
         if automation.delivery_channel != "email":
-            thread = threading.Thread(
-                target=lambda: _send_notification(plain_text),
-            )
-            thread.start()
+            _send_notification(plain_text)
         logger.info(
             f"Automation Triggered | {automation.get_delivery_channel_display()} | {automation}"
         )
@@ -0,0 +1,47 @@
+import logging
+from threading import Lock, Thread
+
+from django.db import close_old_connections
+
+from horilla_automations.jobs import JOB_POLL_INTERVAL, job_available, run_jobs
+
+logger = logging.getLogger(__name__)
+
+
+class AutomationJobWorker(Thread):
+    """
+    Delivers the automation jobs in the background of the web process, woken
+    up when jobs are queued and every JOB_POLL_INTERVAL seconds
+    """
+
+    def __init__(self):
+        Thread.__init__(self, name="automation-jobs", daemon=True)
+
+    def run(self):
+        while True:
+            job_available.wait(JOB_POLL_INTERVAL)
+            job_available.clear()
+            try:
+                close_old_connections()
+                while run_jobs():
+                    pass
+            except Exception as error:
+                logger.error("Automation job worker error: %s", error)
+            finally:
+                close_old_connections()
+
+
+_worker = None
+_worker_lock = Lock()
+
+
+def start_job_worker():
+    """
+    Start the automation job worker of this process, once
+    """
+    global _worker
+    with _worker_lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = AutomationJobWorker()
+            _worker.start()
+    return _worker
@@ -9,10 +9,12 @@ from io import BytesIO
 from typing import Any
 from urllib.parse import urlencode
 from venv import logger
+from zipfile import BadZipFile
 
+import pandas as pd
+from bs4 import BeautifulSoup
 from django import forms, template
 from django.contrib import messages
-from django.core.cache import cache as CACHE
 from django.core.paginator import Paginator
 from django.db import models
 from django.db.models.fields.related import ForeignKey
@@ -31,13 +33,20 @@ from django.utils.functional import lazy
 from django.utils.html import format_html
 from django.utils.safestring import SafeString
 from django.utils.translation import gettext_lazy as _
-from openpyxl import Workbook
+from openpyxl import Workbook, load_workbook
 from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
 from openpyxl.utils import get_column_letter
+from openpyxl.utils.exceptions import InvalidFileException
 
 from horilla import settings
 from horilla.horilla_middlewares import _thread_locals
 from horilla_views.templatetags.generic_template_filters import getattribute
+from horilla_views.view_state import (
+    get_query_state,
+    get_view_state,
+    set_query_state,
+    set_view_state,
+)
 
 FIELD_WIDGET_MAP = {
     models.CharField: forms.TextInput(attrs={"class": "oh-input w-100"}),
@@ -314,6 +323,19 @@ def paginator_qry(qryset, page_number, records_per_page=50):
     return qryset
 
 
+def prefetch_page(page):
+    """
+    Let the model of the page records compute the values shown for them
+    in bulk, through its `prefetch_page_status` classmethod
+    """
+    page.object_list = list(page.object_list)
+    if page.object_list:
+        prefetch = getattr(type(page.object_list[0]), "prefetch_page_status", None)
+        if prefetch is not None:
+            prefetch(page.object_list)
+    return page
+
+
 def get_short_uuid(length: int, prefix: str = "hlv"):
     """
     Short uuid generating method
@@ -331,14 +353,6 @@ def update_initial_cache(request: object, cache: dict, view: object):
     return
 
 
-class Reverse:
-    reverse: bool = True
-    page: str = ""
-
-    def __str__(self) -> str:
-        return str(self.reverse)
-
-
 def getmodelattribute(value: models.Model, attr: str):
     """
     Gets an attribute of a model dynamically, handling related fields.
@@ -367,13 +381,8 @@ def sortby(
     """
     request = getattr(_thread_locals, "request", None)
     sort_key = query_dict[key]
-    if not CACHE.get(request.session.session_key + "cbvsortby"):
-        CACHE.set(request.session.session_key + "cbvsortby", Reverse())
-        CACHE.get(request.session.session_key + "cbvsortby").page = (
-            "1" if not query_dict.get(page) else query_dict.get(page)
-        )
-    reverse_object = CACHE.get(request.session.session_key + "cbvsortby")
-    reverse = reverse_object.reverse
+    sort_state = get_view_state(request, "sortby", default={})
+    reverse = sort_state.get("reverse", True)
     none_ids = []
     none_queryset = []
     model = queryset.model
@@ -397,16 +406,16 @@ def sortby(
     current_page = query_dict.get(page)
     if current_page or is_first_sort:
         order = not order
-        if reverse_object.page == current_page and not is_first_sort:
+        if sort_state.get("page", "") == current_page and not is_first_sort:
             order = not order
-        reverse_object.page = current_page
+        sort_state["page"] = current_page
     try:
         queryset = sorted(queryset, key=_sortby, reverse=order)
     except TypeError:
         none_queryset = list(queryset.filter(id__in=none_ids))
         queryset = sorted(queryset.exclude(id__in=none_ids), key=_sortby, reverse=order)
 
-    reverse_object.reverse = order
+    sort_state["reverse"] = order
     if order:
         order = "asc"
         queryset = list(queryset) + list(none_queryset)
@@ -415,32 +424,22 @@ def sortby(
         order = "desc"
     setattr(request, "sort_order", order)
     setattr(request, "sort_key", sort_key)
-    CACHE.set(request.session.session_key + "cbvsortby", reverse_object)
+    set_view_state(request, "sortby", value=sort_state)
     return queryset
 
 
-def update_saved_filter_cache(request, cache):
+def update_saved_filter_cache(request):
     """
-    Method to save filter on cache
+    Method to save the applied filter of the list view path
     """
-    if cache.get(request.session.session_key + request.path + "cbv"):
-        cache.get(request.session.session_key + request.path + "cbv").update(
-            {
-                "path": request.path,
-                "query_dict": request.GET,
-                # "request": request,
-            }
-        )
-        return cache
-    cache.set(
-        request.session.session_key + request.path + "cbv",
-        {
-            "path": request.path,
-            "query_dict": request.GET,
-            # "request": request,
-        },
-    )
-    return cache
+    set_query_state(request, "saved_filter", request.path, query_dict=request.GET)
+
+
+def get_saved_filter_cache(request):
+    """
+    Method to get the saved filter of the list view path, None if not saved
+    """
+    return get_query_state(request, "saved_filter", request.path)
 
 
 def get_nested_field(model_class: models.Model, field_name: str) -> object:
@@ -553,6 +552,47 @@ def flatten_dict(d, parent_key=""):
     return dict(items)
 
 
+def clean_export_text(text):
+    """
+    Clean the text:
+    - If it's a <select> element, extract the selected option's value.
+    - If it's an <input> or <textarea>, extract its 'value'.
+    - Otherwise, remove blank spaces, keep line breaks, and handle <li> tags.
+    """
+    soup = BeautifulSoup(str(text), "html.parser")
+
+    # Handle <select> tag
+    select_tag = soup.find("select")
+    if select_tag:
+        selected_option = select_tag.find("option", selected=True)
+        if selected_option:
+            return selected_option["value"]
+        else:
+            first_option = select_tag.find("option")
+            return first_option["value"] if first_option else ""
+
+    # Handle <input> tag
+    input_tag = soup.find("input")
+    if input_tag:
+        return input_tag.get("value", "")
+
+    # Handle <textarea> tag
+    textarea_tag = soup.find("textarea")
+    if textarea_tag:
+        return textarea_tag.text.strip()
+
+    # Default: clean normal text and <li> handling
+    for li in soup.find_all("li"):
+        li.insert_before("\n")
+        li.unwrap()
+
+    text = soup.get_text()
+    lines = text.splitlines()
+    non_blank_lines = [line.strip() for line in lines if line.strip()]
+    cleaned_text = "\n".join(non_blank_lines)
+    return cleaned_text
+
+
 def export_xlsx(json_data, columns, file_name="quick_export"):
     """
     Quick export method
@@ -782,6 +822,115 @@ def generate_import_excel(
     return wb
 
 
+def clean_import_value(value):
+    """
+    Normalize a cell value of the import sheet
+    """
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def iter_import_chunks(excel_file, field_column_mapping, chunk_size=1000):
+    """
+    Read the import sheet row by row, yields lists of at most chunk_size
+    records keyed by the model field of their columns
+    """
+    try:
+        workbook = load_workbook(excel_file, read_only=True, data_only=True)
+    except (InvalidFileException, BadZipFile):
+        # Not an xlsx workbook, leave the format to pandas
+        excel_file.seek(0)
+        dataframe = pd.read_excel(excel_file, dtype=object)
+        columns = [
+            (model_field, excel_col)
+            for model_field, excel_col in field_column_mapping.items()
+            if excel_col in dataframe.columns
+        ]
+        for start in range(0, len(dataframe), chunk_size):
+            rows = dataframe.iloc[start : start + chunk_size].to_dict("records")
+            yield [
+                {
+                    model_field: clean_import_value(row[excel_col])
+                    for model_field, excel_col in columns
+                }
+                for row in rows
+            ]
+        return
+
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        positions = {}
+        for position, excel_col in enumerate(next(rows, ())):
+            if excel_col is not None:
+                positions.setdefault(str(excel_col), position)
+        columns = [
+            (model_field, positions[excel_col])
+            for model_field, excel_col in field_column_mapping.items()
+            if excel_col in positions
+        ]
+        chunk = []
+        for row in rows:
+            if all(value is None for value in row):
+                continue
+            chunk.append(
+                {
+                    model_field: (
+                        clean_import_value(row[position])
+                        if position < len(row)
+                        else None
+                    )
+                    for model_field, position in columns
+                }
+            )
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    finally:
+        workbook.close()
+
+
+def nest_import_record(row):
+    """
+    Nest the related model fields (`field__related_field`) of an import record
+    """
+    record = {}
+    for model_field, value in row.items():
+        parts = model_field.split("__")
+        current = record
+        for part in parts[:-1]:
+            current = current.setdefault(part, {})
+        current[parts[-1]] = value
+    return record
+
+
+def import_lookup_map(queryset, field):
+    """
+    Map of the field value, as string, to the records of the queryset
+    """
+    lookup_map = {}
+    for instance in queryset:
+        value = getattr(instance, field, None)
+        if value is not None:
+            lookup_map.setdefault(str(value), instance)
+    return lookup_map
+
+
+def lookup_import_value(lookup_map, value):
+    """
+    The record of the lookup map for the imported value
+    """
+    if value is None:
+        return None
+    return lookup_map.get(str(value))
+
+
 def split_by_import_reference(employee_data):
     with_import_reference = []
     without_import_reference = []
@@ -899,28 +1048,15 @@ def assign_related(
             for field, value in record[reverse_field].items():
                 full_field = reverse_field + "__" + field
                 if full_field in pk_values_mapping:
-                    reverse_obj_dict.update(
-                        {
-                            field: data
-                            for data in pk_values_mapping[full_field]
-                            if getattr(data, pk_field_mapping[full_field], None)
-                            == value
-                        }
-                    )
+                    instance = lookup_import_value(pk_values_mapping[full_field], value)
+                    if instance is not None:
+                        reverse_obj_dict[field] = instance
                 else:
                     reverse_obj_dict[field] = value
         else:
-            instances = [
-                data
-                for data in pk_values_mapping[reverse_field]
-                if getattr(
-                    data,
-                    pk_field_mapping[reverse_field],
-                    record[reverse_field],
-                )
-                == record[reverse_field]
-            ]
-            if instances:
-                instance = instances[0]
+            instance = lookup_import_value(
+                pk_values_mapping.get(reverse_field, {}), record[reverse_field]
+            )
+            if instance is not None:
                 reverse_obj_dict.update({reverse_field: instance})
     return reverse_obj_dict
@@ -24,6 +24,7 @@ class HorillaHistoryView(DetailView):
     has_perm_to_revert = False
     fields: list = []
     history_related_name = "history"
+    history_page_size = 20
 
     def get_context_data(self, **kwargs):
         """
@@ -31,7 +32,12 @@ class HorillaHistoryView(DetailView):
         """
         context = super().get_context_data(**kwargs)
         instance = self.get_object()
-        context["tracking"] = get_diff(instance, self.history_related_name)
+        context["tracking"] = get_diff(
+            instance,
+            self.history_related_name,
+            cursor=self.request.GET.get("cursor"),
+            page_size=self.history_page_size,
+        )
         context["model"] = (
             f"{self.model._meta.app_label}.{self.model._meta.object_name}"
         )
@@ -9,16 +9,11 @@ import traceback
 from typing import Any
 from urllib.parse import parse_qs, urlencode
 
-import pandas as pd
-from bs4 import BeautifulSoup
 from django import forms
 from django.contrib import messages
-from django.core.cache import cache as CACHE
 from django.core.exceptions import FieldDoesNotExist
 from django.core.paginator import Page
 from django.db import transaction
-from django.db.models import CharField, F
-from django.db.models.functions import Cast
 from django.http import HttpRequest, HttpResponse, JsonResponse, QueryDict
 from django.shortcuts import render
 from django.template.loader import render_to_string
@@ -29,6 +24,7 @@ from django.views.generic import DetailView, FormView, ListView, TemplateView
 from xhtml2pdf import pisa
 
 from base.methods import closest_numbers, eval_validate, get_key_instances
+from horilla.export import export_queryset, stream_csv_response, stream_xlsx_response
 from horilla.filters import FilterSet
 from horilla.group_by import group_by_queryset
 from horilla.horilla_middlewares import _thread_locals
@@ -36,12 +32,19 @@ from horilla.signals import post_generic_import, pre_generic_import
 from horilla_views import models
 from horilla_views.cbv_methods import (  # update_initial_cache,
     assign_related,
+    clean_export_text,
     export_xlsx,
     generate_import_excel,
+    get_saved_filter_cache,
     get_short_uuid,
     get_verbose_name_from_field_path,
     hx_request_required,
+    import_lookup_map,
+    iter_import_chunks,
+    lookup_import_value,
+    nest_import_record,
     paginator_qry,
+    prefetch_page,
     sortby,
     split_by_import_reference,
     structured,
@@ -49,6 +52,13 @@ from horilla_views.cbv_methods import (  # update_initial_cache,
 )
 from horilla_views.forms import DynamicBulkUpdateForm, ToggleColumnForm
 from horilla_views.templatetags.generic_template_filters import getattribute
+from horilla_views.view_state import (
+    class_path,
+    get_query_state,
+    get_view_state,
+    model_label,
+    set_view_state,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -92,6 +102,7 @@ class HorillaListView(ListView):
     import_help: dict = {}
     fk_o2o_field_in_base_model: list = []
     individual_update: bool = False
+    import_chunk_size: int = 1000
     o2o_related_name_mapping: dict = {}
 
     custom_empty_template: str = ""
@@ -326,6 +337,8 @@ class HorillaListView(ListView):
         """
         Method to import records
         """
+        imported = 0
+        updated = 0
         try:
             if not self.import_accessibility():
                 messages.info(request, "You dont have permission")
@@ -345,212 +358,251 @@ class HorillaListView(ListView):
             if not excel_file:
                 return JsonResponse({"error": "No file uploaded"}, status=400)
 
-            df = pd.read_excel(excel_file)
-
-            serialized = []
-            field_column_mapping_values = {}
-            for _, row in df.iterrows():
-                record = {}
-                for model_field, excel_col in field_column_mapping.items():
-                    if excel_col in row:
-                        value = row[excel_col]
-                        if model_field in (
-                            list(self.primary_key_mapping.keys())
-                            + list(self.import_related_model_column_mapping.keys())
-                        ) and not pd.isna(value):
-                            field_column_mapping_values[model_field] = (
-                                field_column_mapping_values.get(
-                                    model_field, set({})
-                                ).union({value})
-                            )
-                        if pd.isna(value):
-                            value = None
-                        if isinstance(value, str):
-                            value = value.strip()
-                        parts = model_field.split("__")
-                        current = record
-                        for part in parts[:-1]:
-                            current = current.setdefault(part, {})
-                        if isinstance(value, float) and value.is_integer():
-                            value = int(value)
-                        current[parts[-1]] = value
-                serialized.append(record)
-            with_ref, without_ref = split_by_import_reference(serialized)
-
+            lookup_fields = set(self.primary_key_mapping) | set(
+                self.import_related_model_column_mapping
+            )
             error_records = []
+            chunks = []
+            for number, rows in enumerate(
+                iter_import_chunks(
+                    excel_file, field_column_mapping, self.import_chunk_size
+                ),
+                start=1,
+            ):
+                serialized = []
+                field_column_mapping_values = {}
+                for row in rows:
+                    for model_field in lookup_fields.intersection(row):
+                        if row[model_field] is not None:
+                            field_column_mapping_values.setdefault(
+                                model_field, set()
+                            ).add(row[model_field])
+                    serialized.append(nest_import_record(row))
+                with transaction.atomic():
+                    chunk_imported, chunk_updated, chunk_errors = self.import_chunk(
+                        serialized, field_column_mapping_values, update_reference_key
+                    )
+                imported += chunk_imported
+                updated += chunk_updated
+                error_records += chunk_errors
+                chunks.append(
+                    {
+                        "number": number,
+                        "rows": len(rows),
+                        "imported": chunk_imported,
+                        "updated": chunk_updated,
+                        "errors": len(chunk_errors),
+                    }
+                )
+                logger.info(
+                    "Import of %s: chunk %s, %s rows, %s imported, %s updated, "
+                    "%s errors",
+                    self.model._meta.label,
+                    number,
+                    len(rows),
+                    chunk_imported,
+                    chunk_updated,
+                    len(chunk_errors),
+                )
 
-            error_records = []
-            pk_values_mapping = {}
-            fk_values_mapping = {}
-
-            for mapping, values in field_column_mapping_values.items():
-                related_model = self.import_related_model_column_mapping[mapping]
-                if mapping in self.primary_key_mapping:
-                    field = self.primary_key_mapping[mapping]
-                    if hasattr(related_model.objects, "entire"):
-                        existing_objects = (
-                            related_model.objects.entire()
-                            .filter(**{f"{field}__in": list(values)})
-                            .only("pk", field)
-                        )
-                    else:
-                        existing_objects = related_model.objects.filter(
-                            **{f"{field}__in": list(values)}
-                        ).only("pk", field)
-
-                    existing_values = existing_objects.annotate(
-                        field_as_str=Cast(F(field), CharField())
-                    ).values_list("field_as_str", flat=True)
-
-                    to_create = [
-                        related_model(**{field: value})
-                        for value in values
-                        if str(value) not in existing_values
-                    ]
+            status = "Success"
+            if error_records:
+                status = "Error Found"
 
-                    if to_create:
-                        pre_generic_import.send(
-                            sender=related_model,
-                            records=to_create,
-                            view=self,
-                        )
-                        related_model.objects.bulk_create(to_create)
-                        post_generic_import.send(
-                            sender=related_model,
-                            records=to_create,
-                            view=self,
-                        )
-                    pk_values_mapping[mapping] = pk_values_mapping.get(
-                        mapping, []
-                    ) + list(existing_objects)
-                elif mapping in self.fk_mapping:
-                    field = self.fk_mapping[mapping]
-                    related_model = self.import_related_model_column_mapping[mapping]
-                    existing_objects = related_model.objects.filter(
-                        **{f"{field}__in": list(values)}
-                    ).only("pk", field)
-                    existing_values = existing_objects.values_list(field, flat=True)
-                    to_create = [
-                        related_model(**{field: value})
-                        for value in values
-                        if value not in existing_values
-                    ]
-                    if to_create:
-                        pre_generic_import.send(
-                            sender=related_model,
-                            records=to_create,
-                            view=self,
+            return render(
+                request,
+                "cbv/import_response.html",
+                context={
+                    "view_id": self.view_id,
+                    "status": status,
+                    "imported": imported,
+                    "updated": updated,
+                    "chunks": chunks if len(chunks) > 1 else [],
+                    "errors": error_records[:10],  # Optional: truncate if too large
+                    "total_errors": error_records,  # Optional: truncate if too large
+                    "more_error": len(error_records) > 10,
+                },
+            )
+        except Exception as e:
+            traceback_message = traceback.format_exc()
+            error = e
+        return render(
+            request,
+            "cbv/import_response.html",
+            context={
+                "view_id": self.view_id,
+                "status": "Error Found",
+                "imported": imported,
+                "updated": updated,
+                "errors": 0,  # Optional: truncate if too large
+                "error_message": error,  # Optional: truncate if too large
+                "traceback_message": traceback_message,  # Optional: truncate if too large
+            },
+        )
+
+    def import_lookup_maps(self, field_column_mapping_values):
+        """
+        Load the related records the imported values refer to, creating the
+        missing ones, as maps of the lookup value to the record
+        """
+        pk_values_mapping = {}
+        fk_values_mapping = {}
+        for mapping, values in field_column_mapping_values.items():
+            if mapping in self.primary_key_mapping:
+                field = self.primary_key_mapping[mapping]
+                values_mapping = pk_values_mapping
+            elif mapping in self.fk_mapping:
+                field = self.fk_mapping[mapping]
+                values_mapping = fk_values_mapping
+            else:
+                continue
+            related_model = self.import_related_model_column_mapping[mapping]
+            manager = related_model.objects
+            if mapping in self.primary_key_mapping and hasattr(manager, "entire"):
+                queryset = manager.entire()
+            else:
+                queryset = manager.all()
+            queryset = queryset.only("pk", field)
+            lookup_map = import_lookup_map(
+                queryset.filter(**{f"{field}__in": list(values)}), field
+            )
+            missing_values = [value for value in values if str(value) not in lookup_map]
+            if missing_values:
+                to_create = [
+                    related_model(**{field: value}) for value in missing_values
+                ]
+                pre_generic_import.send(
+                    sender=related_model,
+                    records=to_create,
+                    view=self,
+                )
+                related_model.objects.bulk_create(to_create)
+                post_generic_import.send(
+                    sender=related_model,
+                    records=to_create,
+                    view=self,
+                )
+                # Read back, the primary keys of bulk created records are not
+                # set on every database
+                for key, instance in import_lookup_map(
+                    queryset.filter(**{f"{field}__in": missing_values}), field
+                ).items():
+                    lookup_map.setdefault(key, instance)
+            values_mapping[mapping] = lookup_map
+        return pk_values_mapping, fk_values_mapping
+
+    def import_chunk(
+        self, serialized, field_column_mapping_values, update_reference_key
+    ):
+        """
+        Import a chunk of the sheet records, returns the number of records
+        imported and updated and the records failed
+        """
+        with_ref, without_ref = split_by_import_reference(serialized)
+
+        error_records = []
+        pk_values_mapping, fk_values_mapping = self.import_lookup_maps(
+            field_column_mapping_values
+        )
+        if without_ref:
+            with transaction.atomic():
+                records_to_import = []
+                for record in without_ref:
+                    try:
+                        for reverse_field in (
+                            list(self.reverse_model_relation_to_base_model.keys())
+                            + self.fk_o2o_field_in_base_model
+                        ):
+                            if reverse_field in list(
+                                self.primary_key_mapping.keys()
+                            ) + list(self.reverse_model_relation_to_base_model.keys()):
+                                result = assign_related(
+                                    record,
+                                    reverse_field,
+                                    pk_values_mapping,
+                                    self.primary_key_mapping,
+                                )
+                                record[reverse_field] = result
+                            elif reverse_field in self.fk_mapping:
+                                related_instance = lookup_import_value(
+                                    fk_values_mapping.get(reverse_field, {}),
+                                    record[reverse_field],
+                                )
+                                if related_instance is not None:
+                                    record[reverse_field] = related_instance
+                        records_to_import.append(record)
+
+                    except Exception as e:
+                        error_records.append(
+                            {
+                                "record": record.get(next(iter(record)), "Unknown"),
+                                "error": str(e),
+                            }
                         )
-                        related_model.objects.bulk_create(to_create)
-                        post_generic_import.send(
-                            sender=related_model,
-                            records=to_create,
-                            view=self,
+                bulk_base_fk_grouping = {}
+                bulk_create_reverse_related_grouping = {}
+                bulk_create_base_grouping = []
+                items = []
+
+                related_fields = list(self.reverse_model_relation_to_base_model.keys())
+                fk_fields = self.fk_o2o_field_in_base_model
+
+                for record in records_to_import:
+                    if record.get(update_reference_key):
+                        del record[update_reference_key]
+                    instance_record = record.copy()
+                    if update_reference_key in instance_record:
+                        del instance_record[update_reference_key]
+                    for relation in related_fields:
+                        if relation in instance_record:
+                            del instance_record[relation]
+                    for fk_field in self.fk_o2o_field_in_base_model:
+                        if (
+                            fk_field in instance_record
+                            and fk_field not in self.fk_mapping
+                        ):
+                            del instance_record[fk_field]
+
+                    instance = self.model(**instance_record)
+                    for relation in related_fields:
+                        related_record = record[relation]
+                        related_record[
+                            self.reverse_model_relation_to_base_model[relation]
+                        ] = instance
+                        related_instance = self.import_related_model_column_mapping[
+                            relation
+                        ](**related_record)
+                        bulk_create_reverse_related_grouping.setdefault(
+                            relation, []
+                        ).append(related_instance)
+
+                    for fk_field in fk_fields:
+                        fk_record = record[fk_field]
+                        if isinstance(fk_record, dict):
+                            fk_instance = self.import_related_model_column_mapping[
+                                fk_field
+                            ](**fk_record)
+                        else:
+                            fk_instance = fk_record
+                        bulk_base_fk_grouping.setdefault(fk_field, []).append(
+                            fk_instance
                         )
-                    fk_values_mapping[mapping] = fk_values_mapping.get(
-                        mapping, []
-                    ) + list(existing_objects)
-            if without_ref:
-                with transaction.atomic():
-                    records_to_import = []
-                    for record in without_ref:
-                        try:
-                            for reverse_field in (
-                                list(self.reverse_model_relation_to_base_model.keys())
-                                + self.fk_o2o_field_in_base_model
-                            ):
-                                if reverse_field in list(
-                                    self.primary_key_mapping.keys()
-                                ) + list(
-                                    self.reverse_model_relation_to_base_model.keys()
-                                ):
-                                    result = assign_related(
-                                        record,
-                                        reverse_field,
-                                        pk_values_mapping,
-                                        self.primary_key_mapping,
-                                    )
-                                    record[reverse_field] = result
-                                elif reverse_field in self.fk_mapping:
-                                    record.update(
-                                        {
-                                            reverse_field: data
-                                            for data in fk_values_mapping[reverse_field]
-                                            if getattr(
-                                                data,
-                                                self.fk_mapping[reverse_field],
-                                                None,
-                                            )
-                                            == record[reverse_field]
-                                        }
-                                    )
-                            records_to_import.append(record)
-
-                        except Exception as e:
-                            error_records.append(
-                                {
-                                    "record": record.get(next(iter(record)), "Unknown"),
-                                    "error": str(e),
-                                }
-                            )
-                    bulk_base_fk_grouping = {}
-                    bulk_create_reverse_related_grouping = {}
-                    bulk_create_base_grouping = []
-                    items = []
+                        setattr(instance, fk_field, fk_instance)
 
-                    related_fields = list(
-                        self.reverse_model_relation_to_base_model.keys()
-                    )
-                    fk_fields = self.fk_o2o_field_in_base_model
-
-                    for record in records_to_import:
-                        if record.get(update_reference_key):
-                            del record[update_reference_key]
-                        instance_record = record.copy()
-                        if update_reference_key in instance_record:
-                            del instance_record[update_reference_key]
-                        for relation in related_fields:
-                            if relation in instance_record:
-                                del instance_record[relation]
-                        for fk_field in self.fk_o2o_field_in_base_model:
-                            if (
-                                fk_field in instance_record
-                                and fk_field not in self.fk_mapping
-                            ):
-                                del instance_record[fk_field]
-
-                        instance = self.model(**instance_record)
-                        for relation in related_fields:
-                            related_record = record[relation]
-                            related_record[
-                                self.reverse_model_relation_to_base_model[relation]
-                            ] = instance
-                            related_instance = self.import_related_model_column_mapping[
-                                relation
-                            ](**related_record)
-                            bulk_create_reverse_related_grouping[relation] = (
-                                bulk_create_reverse_related_grouping.get(relation, [])
-                                + [related_instance]
-                            )
+                    bulk_create_base_grouping.append(instance)
 
-                        for fk_field in fk_fields:
-                            fk_record = record[fk_field]
-                            if isinstance(fk_record, dict):
-                                fk_instance = self.import_related_model_column_mapping[
+                for fk_field in self.fk_o2o_field_in_base_model:
+                    if fk_field not in self.fk_mapping:
+                        for relation, items in bulk_base_fk_grouping.items():
+                            pre_generic_import.send(
+                                sender=self.import_related_model_column_mapping[
                                     fk_field
-                                ](**fk_record)
-                            else:
-                                fk_instance = fk_record
-                            bulk_base_fk_grouping[fk_field] = bulk_base_fk_grouping.get(
-                                fk_field, []
-                            ) + [fk_instance]
-                            setattr(instance, fk_field, fk_instance)
-
-                        bulk_create_base_grouping.append(instance)
+                                ],
+                                records=items,
+                                view=self,
+                            )
 
-                    for fk_field in self.fk_o2o_field_in_base_model:
-                        if fk_field not in self.fk_mapping:
-                            for relation, items in bulk_base_fk_grouping.items():
+                            if relation not in self.fk_mapping:
                                 pre_generic_import.send(
                                     sender=self.import_related_model_column_mapping[
                                         fk_field
@@ -558,419 +610,348 @@ class HorillaListView(ListView):
                                     records=items,
                                     view=self,
                                 )
-
-                                if relation not in self.fk_mapping:
-                                    pre_generic_import.send(
-                                        sender=self.import_related_model_column_mapping[
-                                            fk_field
-                                        ],
-                                        records=items,
-                                        view=self,
-                                    )
-                                    self.import_related_model_column_mapping[
+                                self.import_related_model_column_mapping[
+                                    fk_field
+                                ].objects.bulk_create(items)
+                                post_generic_import.send(
+                                    sender=self.import_related_model_column_mapping[
                                         fk_field
-                                    ].objects.bulk_create(items)
-                                    post_generic_import.send(
-                                        sender=self.import_related_model_column_mapping[
-                                            fk_field
-                                        ],
-                                        records=items,
-                                        view=self,
-                                    )
+                                    ],
+                                    records=items,
+                                    view=self,
+                                )
+
+                if not items:
+                    items = bulk_create_base_grouping
+                pre_generic_import.send(
+                    sender=self.model,
+                    records=items,
+                    view=self,
+                )
+
+                self.model.objects.bulk_create(bulk_create_base_grouping)
 
-                    if not items:
-                        items = bulk_create_base_grouping
+                post_generic_import.send(
+                    sender=self.model,
+                    records=items,
+                    view=self,
+                )
+                for related, items in bulk_create_reverse_related_grouping.items():
                     pre_generic_import.send(
-                        sender=self.model,
+                        sender=self.import_related_model_column_mapping[related],
                         records=items,
                         view=self,
                     )
-
-                    self.model.objects.bulk_create(bulk_create_base_grouping)
-
+                    self.import_related_model_column_mapping[
+                        related
+                    ].objects.bulk_create(items)
                     post_generic_import.send(
-                        sender=self.model,
+                        sender=self.import_related_model_column_mapping[related],
                         records=items,
                         view=self,
                     )
-                    for related, items in bulk_create_reverse_related_grouping.items():
-                        pre_generic_import.send(
-                            sender=self.import_related_model_column_mapping[related],
-                            records=items,
-                            view=self,
-                        )
-                        self.import_related_model_column_mapping[
-                            related
-                        ].objects.bulk_create(items)
-                        post_generic_import.send(
-                            sender=self.import_related_model_column_mapping[related],
-                            records=items,
-                            view=self,
-                        )
-            if with_ref:
-                base_instance_ids = [item["id_import_reference"] for item in with_ref]
-                fields = (
-                    list(self.reverse_model_relation_to_base_model)
-                    + ["pk"]
+        if with_ref:
+            base_instance_ids = [item["id_import_reference"] for item in with_ref]
+            fields = (
+                list(self.reverse_model_relation_to_base_model)
+                + ["pk"]
+                + self.fk_o2o_field_in_base_model
+            )
+            mapped_ids_queryset = (
+                self.model.objects.filter(pk__in=base_instance_ids)
+                .only(*fields)
+                .values(*fields)
+            )
+            mapped_ids_with_reverse = {
+                item["pk"]: {
+                    key: item[key]
+                    for key in list(self.reverse_model_relation_to_base_model.keys())
                     + self.fk_o2o_field_in_base_model
-                )
-                mapped_ids_queryset = (
-                    self.model.objects.filter(pk__in=base_instance_ids)
-                    .only(*fields)
-                    .values(*fields)
-                )
-                mapped_ids_with_reverse = {
-                    item["pk"]: {
-                        key: item[key]
-                        for key in list(
-                            self.reverse_model_relation_to_base_model.keys()
-                        )
-                        + self.fk_o2o_field_in_base_model
-                        if key not in self.fk_mapping
-                    }
-                    for item in mapped_ids_queryset
+                    if key not in self.fk_mapping
                 }
-                field_to_update_o2o = {}
-                o2o_to_create = []
-                o2o_create_base_mapping = {}
-                with transaction.atomic():
-                    records_to_update = []
-                    for record in with_ref:
-                        try:
-                            for reverse_field in (
-                                list(self.reverse_model_relation_to_base_model.keys())
-                                + self.fk_o2o_field_in_base_model
-                            ):
-                                if reverse_field in list(
-                                    self.primary_key_mapping.keys()
-                                ) + list(
-                                    self.reverse_model_relation_to_base_model.keys()
-                                ):
-                                    result = assign_related(
-                                        record,
-                                        reverse_field,
-                                        pk_values_mapping,
-                                        self.primary_key_mapping,
-                                    )
-                                    if list(result.keys())[0] not in self.fk_mapping:
-                                        if (
-                                            reverse_field
-                                            in self.fk_o2o_field_in_base_model
-                                        ):
-                                            result["main_instance_id"] = record[
-                                                "id_import_reference"
-                                            ]
-                                        record[reverse_field] = result
-                                    else:
-                                        record[list(result.keys())[0]] = list(
-                                            result.values()
-                                        )[0]
-                                elif reverse_field in self.fk_mapping:
-                                    record.update(
-                                        {
-                                            reverse_field: data
-                                            for data in fk_values_mapping[reverse_field]
-                                            if getattr(
-                                                data,
-                                                self.fk_mapping[reverse_field],
-                                                None,
-                                            )
-                                            == record[reverse_field]
-                                        }
-                                    )
-                            records_to_update.append(record)
+                for item in mapped_ids_queryset
+            }
+            field_to_update_o2o = {}
+            o2o_to_create = []
+            o2o_create_base_mapping = {}
+            with transaction.atomic():
+                records_to_update = []
+                for record in with_ref:
+                    try:
+                        for reverse_field in (
+                            list(self.reverse_model_relation_to_base_model.keys())
+                            + self.fk_o2o_field_in_base_model
+                        ):
+                            if reverse_field in list(
+                                self.primary_key_mapping.keys()
+                            ) + list(self.reverse_model_relation_to_base_model.keys()):
+                                result = assign_related(
+                                    record,
+                                    reverse_field,
+                                    pk_values_mapping,
+                                    self.primary_key_mapping,
+                                )
+                                if list(result.keys())[0] not in self.fk_mapping:
+                                    if reverse_field in self.fk_o2o_field_in_base_model:
+                                        result["main_instance_id"] = record[
+                                            "id_import_reference"
+                                        ]
+                                    record[reverse_field] = result
+                                else:
+                                    record[list(result.keys())[0]] = list(
+                                        result.values()
+                                    )[0]
+                            elif reverse_field in self.fk_mapping:
+                                related_instance = lookup_import_value(
+                                    fk_values_mapping.get(reverse_field, {}),
+                                    record[reverse_field],
+                                )
+                                if related_instance is not None:
+                                    record[reverse_field] = related_instance
+                        records_to_update.append(record)
 
-                        except Exception as e:
-                            logger.error(traceback.format_exc())
-                            error_records.append(
-                                {
-                                    "record": record[list(record.keys())[0]],
-                                    "error": str(e),
-                                }
-                            )
-                    bulk_base_fk_grouping = {}
-                    bulk_update_reverse_related_grouping = {}
-                    bulk_create_from_update_reverse_related_grouping = {}
-                    bulk_update_base_grouping = []
+                    except Exception as e:
+                        logger.error(traceback.format_exc())
+                        error_records.append(
+                            {
+                                "record": record[list(record.keys())[0]],
+                                "error": str(e),
+                            }
+                        )
+                bulk_base_fk_grouping = {}
+                bulk_update_reverse_related_grouping = {}
+                bulk_create_from_update_reverse_related_grouping = {}
+                bulk_update_base_grouping = []
+
+                related_fields = list(self.reverse_model_relation_to_base_model.keys())
+                fk_fields = self.fk_o2o_field_in_base_model
+                related_update_fields = {}
+                for record in records_to_update:
+                    instance_record = record.copy()
+                    for relation in related_fields:
+                        if relation in instance_record:
+                            del instance_record[relation]
+                    for fk_field in self.fk_o2o_field_in_base_model:
+                        if (
+                            fk_field in instance_record
+                            and fk_field not in self.fk_mapping
+                        ):
+                            del instance_record[fk_field]
+
+                    instance_record["id"] = instance_record["id_import_reference"]
+                    instance_record["pk"] = instance_record["id_import_reference"]
+                    del instance_record["id_import_reference"]
+                    instance = self.model(**instance_record)
+                    for relation in related_fields:
+                        related_update_fields[relation] = record[relation].keys()
+
+                    for relation in related_fields:
+                        related_record = record[relation]
+                        related_record[
+                            self.reverse_model_relation_to_base_model[relation]
+                        ] = instance
+                        related_record["id"] = mapped_ids_with_reverse[instance.id][
+                            relation
+                        ]
+                        related_record["pk"] = mapped_ids_with_reverse[instance.id][
+                            relation
+                        ]
+                        related_instance = self.import_related_model_column_mapping[
+                            relation
+                        ](**related_record)
+                        if related_instance.pk is not None:
+                            bulk_update_reverse_related_grouping.setdefault(
+                                relation, []
+                            ).append(related_instance)
+                        else:
+                            bulk_create_from_update_reverse_related_grouping.setdefault(
+                                relation, []
+                            ).append(related_instance)
 
-                    related_fields = list(
-                        self.reverse_model_relation_to_base_model.keys()
-                    )
-                    fk_fields = self.fk_o2o_field_in_base_model
-                    related_update_fields = {}
-                    for record in records_to_update:
-                        instance_record = record.copy()
-                        for relation in related_fields:
-                            if relation in instance_record:
-                                del instance_record[relation]
-                        for fk_field in self.fk_o2o_field_in_base_model:
-                            if (
-                                fk_field in instance_record
-                                and fk_field not in self.fk_mapping
-                            ):
-                                del instance_record[fk_field]
-
-                        instance_record["id"] = instance_record["id_import_reference"]
-                        instance_record["pk"] = instance_record["id_import_reference"]
-                        del instance_record["id_import_reference"]
-                        instance = self.model(**instance_record)
-                        for relation in related_fields:
-                            related_update_fields[relation] = record[relation].keys()
-
-                        for relation in related_fields:
-                            related_record = record[relation]
-                            related_record[
-                                self.reverse_model_relation_to_base_model[relation]
-                            ] = instance
-                            related_record["id"] = mapped_ids_with_reverse[instance.id][
-                                relation
-                            ]
-                            related_record["pk"] = mapped_ids_with_reverse[instance.id][
-                                relation
+                    for fk_field in fk_fields:
+                        if fk_field not in self.fk_mapping:
+                            fk_record = record[fk_field]
+                            pk = mapped_ids_with_reverse[fk_record["main_instance_id"]][
+                                fk_field
                             ]
-                            related_instance = self.import_related_model_column_mapping[
-                                relation
-                            ](**related_record)
-                            if related_instance.pk is not None:
-                                bulk_update_reverse_related_grouping[relation] = (
-                                    bulk_update_reverse_related_grouping.get(
-                                        relation, []
-                                    )
-                                    + [related_instance]
+                            del fk_record["main_instance_id"]
+                            if pk is None:
+                                fk_record[self.o2o_related_name_mapping[fk_field]] = (
+                                    self.model(pk=pk, id=pk)
                                 )
-                            else:
-                                bulk_create_from_update_reverse_related_grouping[
-                                    relation
-                                ] = bulk_update_reverse_related_grouping.get(
-                                    relation, []
-                                ) + [
-                                    related_instance
-                                ]
-
-                        for fk_field in fk_fields:
-                            if fk_field not in self.fk_mapping:
-                                fk_record = record[fk_field]
-                                pk = mapped_ids_with_reverse[
-                                    fk_record["main_instance_id"]
-                                ][fk_field]
-                                del fk_record["main_instance_id"]
-                                if pk is None:
-                                    fk_record[
-                                        self.o2o_related_name_mapping[fk_field]
-                                    ] = self.model(pk=pk, id=pk)
-                                    o2o_related_instance = (
-                                        self.import_related_model_column_mapping[
-                                            fk_field
-                                        ](**fk_record)
-                                    )
-                                    setattr(instance, fk_field, o2o_related_instance)
-                                    o2o_to_create.append(o2o_related_instance)
-                                    continue
-                                fk_record["pk"] = pk
-                                fk_record["id"] = pk
-                                if fk_field not in field_to_update_o2o:
-                                    field_to_update_o2o[fk_field] = list(
-                                        fk_record.keys()
+                                o2o_related_instance = (
+                                    self.import_related_model_column_mapping[fk_field](
+                                        **fk_record
                                     )
-                                fk_instance = self.import_related_model_column_mapping[
-                                    fk_field
-                                ](**fk_record)
-                                bulk_base_fk_grouping[fk_field] = (
-                                    bulk_base_fk_grouping.get(fk_field, [])
-                                    + [fk_instance]
                                 )
-                                setattr(instance, fk_field, fk_instance)
-                        bulk_update_base_grouping.append(instance)
-            if with_ref and bulk_update_base_grouping:
-                for o2o_field, records in bulk_base_fk_grouping.items():
-                    field_to_update_o2o = [
-                        field
-                        for field in field_to_update_o2o[o2o_field]
-                        if field not in ["pk", "id"]
-                    ]
-                    related_model = self.import_related_model_column_mapping[o2o_field]
-                    pre_generic_import.send(
-                        sender=related_model,
-                        records=records,
-                        view=self,
-                    )
-                    if not self.individual_update:
-                        related_model.objects.bulk_update(
-                            records,
-                            field_to_update_o2o,
-                        )
-                        if o2o_to_create:
-                            pre_generic_import.send(
-                                sender=related_model,
-                                records=o2o_to_create,
-                                view=self,
-                            )
-                            related_model.objects.bulk_create(o2o_to_create)
-                            post_generic_import.send(
-                                sender=related_model,
-                                records=o2o_to_create,
-                                view=self,
-                            )
-                    else:
-                        if o2o_to_create:
-                            pre_generic_import.send(
-                                sender=related_model,
-                                records=o2o_to_create,
-                                view=self,
-                            )
-                            related_model.objects.bulk_create(o2o_to_create)
-                            post_generic_import.send(
-                                sender=related_model,
-                                records=o2o_to_create,
-                                view=self,
-                            )
-                        for o2o_instance in records:
-                            related_model.objects.update_or_create(
-                                id=o2o_instance.id,
-                                defaults={
-                                    field: getattr(o2o_instance, field)
-                                    for field in field_to_update_o2o
-                                },
+                                setattr(instance, fk_field, o2o_related_instance)
+                                o2o_to_create.append(o2o_related_instance)
+                                continue
+                            fk_record["pk"] = pk
+                            fk_record["id"] = pk
+                            if fk_field not in field_to_update_o2o:
+                                field_to_update_o2o[fk_field] = list(fk_record.keys())
+                            fk_instance = self.import_related_model_column_mapping[
+                                fk_field
+                            ](**fk_record)
+                            bulk_base_fk_grouping.setdefault(fk_field, []).append(
+                                fk_instance
                             )
-                    post_generic_import.send(
-                        sender=related_model,
-                        records=records,
-                        view=self,
-                    )
-                field_to_update = [
-                    key for key in instance_record.keys() if key not in ["id", "pk"]
-                ] + [key for key in self.o2o_related_name_mapping]
+                            setattr(instance, fk_field, fk_instance)
+                    bulk_update_base_grouping.append(instance)
+        if with_ref and bulk_update_base_grouping:
+            for o2o_field, records in bulk_base_fk_grouping.items():
+                field_to_update_o2o = [
+                    field
+                    for field in field_to_update_o2o[o2o_field]
+                    if field not in ["pk", "id"]
+                ]
+                related_model = self.import_related_model_column_mapping[o2o_field]
                 pre_generic_import.send(
-                    sender=self.model,
-                    records=bulk_update_base_grouping,
+                    sender=related_model,
+                    records=records,
                     view=self,
                 )
                 if not self.individual_update:
-                    self.model.objects.bulk_update(
-                        bulk_update_base_grouping, field_to_update
+                    related_model.objects.bulk_update(
+                        records,
+                        field_to_update_o2o,
                     )
-                else:
-                    for model_obj in bulk_update_base_grouping:
-                        self.model.objects.update_or_create(
-                            id=model_obj.id,
-                            defaults={
-                                field: getattr(model_obj, field)
-                                for field in field_to_update
-                            },
-                        )
-                post_generic_import.send(
-                    sender=self.model,
-                    records=bulk_update_base_grouping,
-                    view=self,
-                )
-
-            if with_ref and related_update_fields:
-                for field in related_fields:
-                    related_model = self.import_related_model_column_mapping[field]
-                    if field in bulk_update_reverse_related_grouping:
-                        update_fields = [
-                            key
-                            for key in related_update_fields[field]
-                            if key not in ["id", "pk"]
-                        ]
+                    if o2o_to_create:
                         pre_generic_import.send(
                             sender=related_model,
-                            records=bulk_update_reverse_related_grouping[field],
+                            records=o2o_to_create,
                             view=self,
                         )
-                        if not self.individual_update:
-                            related_model.objects.bulk_update(
-                                bulk_update_reverse_related_grouping[field],
-                                update_fields,
-                            )
-                        else:
-                            for (
-                                reverse_related_obj
-                            ) in bulk_update_reverse_related_grouping[field]:
-                                related_model.objects.update_or_create(
-                                    id=reverse_related_obj.id,
-                                    defaults={
-                                        field: getattr(reverse_related_obj, field)
-                                        for field in update_fields
-                                    },
-                                )
+                        related_model.objects.bulk_create(o2o_to_create)
                         post_generic_import.send(
                             sender=related_model,
-                            records=bulk_update_reverse_related_grouping[field],
+                            records=o2o_to_create,
                             view=self,
                         )
-
-                    elif field in bulk_create_from_update_reverse_related_grouping:
-                        update_fields = [
-                            key
-                            for key in related_update_fields[field]
-                            if key not in ["id", "pk"]
-                        ]
+                else:
+                    if o2o_to_create:
                         pre_generic_import.send(
                             sender=related_model,
-                            records=bulk_create_from_update_reverse_related_grouping[
-                                field
-                            ],
+                            records=o2o_to_create,
                             view=self,
                         )
-                        if not self.individual_update:
-                            related_model.objects.bulk_create(
-                                bulk_create_from_update_reverse_related_grouping[field]
-                            )
-                        else:
-                            for (
-                                reverse_related_obj
-                            ) in bulk_create_from_update_reverse_related_grouping[
-                                field
-                            ]:
-                                # reverse_related_obj.save()
-                                related_model.objects.update_or_create(
-                                    id=reverse_related_obj.id,
-                                    defaults={
-                                        field: getattr(reverse_related_obj, field)
-                                        for field in update_fields
-                                    },
-                                )
+                        related_model.objects.bulk_create(o2o_to_create)
                         post_generic_import.send(
                             sender=related_model,
-                            records=bulk_create_from_update_reverse_related_grouping[
-                                field
-                            ],
+                            records=o2o_to_create,
                             view=self,
                         )
-            status = "Success"
-            if error_records:
-                status = "Error Found"
-
-            return render(
-                request,
-                "cbv/import_response.html",
-                context={
-                    "view_id": self.view_id,
-                    "status": status,
-                    "imported": len(without_ref),
-                    "updated": len(with_ref),
-                    "errors": error_records[:10],  # Optional: truncate if too large
-                    "total_errors": error_records,  # Optional: truncate if too large
-                    "more_error": len(error_records) > 10,
-                },
+                    for o2o_instance in records:
+                        related_model.objects.update_or_create(
+                            id=o2o_instance.id,
+                            defaults={
+                                field: getattr(o2o_instance, field)
+                                for field in field_to_update_o2o
+                            },
+                        )
+                post_generic_import.send(
+                    sender=related_model,
+                    records=records,
+                    view=self,
+                )
+            field_to_update = [
+                key for key in instance_record.keys() if key not in ["id", "pk"]
+            ] + [key for key in self.o2o_related_name_mapping]
+            pre_generic_import.send(
+                sender=self.model,
+                records=bulk_update_base_grouping,
+                view=self,
             )
-        except Exception as e:
-            traceback_message = traceback.format_exc()
-            error = e
-        return render(
-            request,
-            "cbv/import_response.html",
-            context={
-                "view_id": self.view_id,
-                "status": "Error Found",
-                "imported": 0,
-                "updated": 0,
-                "errors": 0,  # Optional: truncate if too large
-                "error_message": error,  # Optional: truncate if too large
-                "traceback_message": traceback_message,  # Optional: truncate if too large
-            },
-        )
+            if not self.individual_update:
+                self.model.objects.bulk_update(
+                    bulk_update_base_grouping, field_to_update
+                )
+            else:
+                for model_obj in bulk_update_base_grouping:
+                    self.model.objects.update_or_create(
+                        id=model_obj.id,
+                        defaults={
+                            field: getattr(model_obj, field)
+                            for field in field_to_update
+                        },
+                    )
+            post_generic_import.send(
+                sender=self.model,
+                records=bulk_update_base_grouping,
+                view=self,
+            )
+
+        if with_ref and related_update_fields:
+            for field in related_fields:
+                related_model = self.import_related_model_column_mapping[field]
+                if field in bulk_update_reverse_related_grouping:
+                    update_fields = [
+                        key
+                        for key in related_update_fields[field]
+                        if key not in ["id", "pk"]
+                    ]
+                    pre_generic_import.send(
+                        sender=related_model,
+                        records=bulk_update_reverse_related_grouping[field],
+                        view=self,
+                    )
+                    if not self.individual_update:
+                        related_model.objects.bulk_update(
+                            bulk_update_reverse_related_grouping[field],
+                            update_fields,
+                        )
+                    else:
+                        for reverse_related_obj in bulk_update_reverse_related_grouping[
+                            field
+                        ]:
+                            related_model.objects.update_or_create(
+                                id=reverse_related_obj.id,
+                                defaults={
+                                    field: getattr(reverse_related_obj, field)
+                                    for field in update_fields
+                                },
+                            )
+                    post_generic_import.send(
+                        sender=related_model,
+                        records=bulk_update_reverse_related_grouping[field],
+                        view=self,
+                    )
+
+                if field in bulk_create_from_update_reverse_related_grouping:
+                    update_fields = [
+                        key
+                        for key in related_update_fields[field]
+                        if key not in ["id", "pk"]
+                    ]
+                    pre_generic_import.send(
+                        sender=related_model,
+                        records=bulk_create_from_update_reverse_related_grouping[field],
+                        view=self,
+                    )
+                    if not self.individual_update:
+                        related_model.objects.bulk_create(
+                            bulk_create_from_update_reverse_related_grouping[field]
+                        )
+                    else:
+                        for (
+                            reverse_related_obj
+                        ) in bulk_create_from_update_reverse_related_grouping[field]:
+                            # reverse_related_obj.save()
+                            related_model.objects.update_or_create(
+                                id=reverse_related_obj.id,
+                                defaults={
+                                    field: getattr(reverse_related_obj, field)
+                                    for field in update_fields
+                                },
+                            )
+                    post_generic_import.send(
+                        sender=related_model,
+                        records=bulk_create_from_update_reverse_related_grouping[field],
+                        view=self,
+                    )
+
+        return len(without_ref), len(with_ref), error_records
 
     def get_queryset(self, queryset=None, filtered=False, *args, **kwargs):
         if not self.queryset:
@@ -997,15 +978,9 @@ class HorillaListView(ListView):
                     self.request.session["prev_path"] = self.request.path
 
                 if "filter_applied" in query_dict.keys():
-                    update_saved_filter_cache(self.request, CACHE)
-                elif CACHE.get(
-                    str(self.request.session.session_key) + self.request.path + "cbv"
-                ):
-                    query_dict = CACHE.get(
-                        str(self.request.session.session_key)
-                        + self.request.path
-                        + "cbv"
-                    )["query_dict"]
+                    update_saved_filter_cache(self.request)
+                else:
+                    query_dict = get_saved_filter_cache(self.request) or query_dict
 
                 default_filter = models.SavedFilter.objects.filter(
                     path=self.request.path,
@@ -1142,8 +1117,10 @@ class HorillaListView(ListView):
             for instance in queryset:
                 ordered_ids.append(instance.pk)
         self.request.session[self.ordered_ids_key] = ordered_ids
-        context["queryset"] = paginator_qry(
-            queryset, self._saved_filters.get("page"), self.records_per_page
+        context["queryset"] = prefetch_page(
+            paginator_qry(
+                queryset, self._saved_filters.get("page"), self.records_per_page
+            )
         )
 
         if request and self._saved_filters.get("field"):
@@ -1271,59 +1248,10 @@ class HorillaListView(ListView):
 
             def remove_extra_spaces(self, text, field_tuple):
                 """
-                Clean the text:
-                - If it's a <select> element, extract the selected option's value.
-                - If it's an <input> or <textarea>, extract its 'value'.
-                - Otherwise, remove blank spaces, keep line breaks, and handle <li> tags.
+                Clean the exported text
                 """
-                soup = BeautifulSoup(str(text), "html.parser")
-
-                # Handle <select> tag
-                select_tag = soup.find("select")
-                if select_tag:
-                    selected_option = select_tag.find("option", selected=True)
-                    if selected_option:
-                        return selected_option["value"]
-                    else:
-                        first_option = select_tag.find("option")
-                        return first_option["value"] if first_option else ""
-
-                # Handle <input> tag
-                input_tag = soup.find("input")
-                if input_tag:
-                    return input_tag.get("value", "")
-
-                # Handle <textarea> tag
-                textarea_tag = soup.find("textarea")
-                if textarea_tag:
-                    return textarea_tag.text.strip()
-
-                # Default: clean normal text and <li> handling
-                for li in soup.find_all("li"):
-                    li.insert_before("\n")
-                    li.unwrap()
-
-                text = soup.get_text()
-                lines = text.splitlines()
-                non_blank_lines = [line.strip() for line in lines if line.strip()]
-                cleaned_text = "\n".join(non_blank_lines)
-                return cleaned_text
+                return clean_export_text(text)
 
-        book_resource = HorillaListViewResorce()
-
-        # Export the data using the resource
-        dataset = book_resource.export(queryset)
-
-        # excel_data = dataset.export("xls")
-
-        # Set the response headers
-        # file_name = self.export_file_name
-        # if not file_name:
-        #     file_name = "quick_export"
-        # response = HttpResponse(excel_data, content_type="application/vnd.ms-excel")
-        # response["Content-Disposition"] = f'attachment; filename="{file_name}.xls"'
-        # return response
-        json_data = json.loads(dataset.export("json"))
         merged = []
 
         for item in _columns:
@@ -1364,6 +1292,41 @@ class HorillaListView(ListView):
                 column = (column[0], column[1])
             columns.append(column)
 
+        # Plain columns are streamed row by row, nested columns need every
+        # row to discover their sub columns
+        if export_format in ("csv", "xlsx") and not any(
+            len(column) == 3 for column in columns
+        ):
+            field_names = [field_tuple[1] for field_tuple in _columns]
+            header = [field_tuple[0] for field_tuple in _columns]
+            instances = export_queryset(queryset, field_names)
+            if export_format == "csv":
+                rows = (
+                    [instance.pk]
+                    + [
+                        clean_export_text(getattribute(instance, field_name))
+                        for field_name in field_names
+                    ]
+                    for instance in instances
+                )
+                return stream_csv_response(["ID", *header], rows, self.export_file_name)
+            rows = (
+                [
+                    clean_export_text(getattribute(instance, field_name))
+                    for field_name in field_names
+                ]
+                for instance in instances
+            )
+            return stream_xlsx_response(
+                header, rows, self.export_file_name, header_fill="FFD700"
+            )
+
+        book_resource = HorillaListViewResorce()
+
+        # Export the data using the resource
+        dataset = book_resource.export(queryset)
+        json_data = json.loads(dataset.export("json"))
+
         if export_format == "json":
             response = HttpResponse(
                 json.dumps(json_data, indent=4), content_type="application/json"
@@ -1657,15 +1620,9 @@ class HorillaCardView(ListView):
             if self.filter_class:
                 query_dict = self.request.GET
                 if "filter_applied" in query_dict.keys():
-                    update_saved_filter_cache(self.request, CACHE)
-                elif CACHE.get(
-                    str(self.request.session.session_key) + self.request.path + "cbv"
-                ):
-                    query_dict = CACHE.get(
-                        str(self.request.session.session_key)
-                        + self.request.path
-                        + "cbv"
-                    )["query_dict"]
+                    update_saved_filter_cache(self.request)
+                else:
+                    query_dict = get_saved_filter_cache(self.request) or query_dict
 
                 self._saved_filters = query_dict
                 self.request.exclude_filter_form = True
@@ -1738,8 +1695,8 @@ class HorillaCardView(ListView):
                 referrer=referrer, created_by=self.request.user
             )
         ).distinct()
-        context["queryset"] = paginator_qry(
-            queryset, self.request.GET.get("page"), self.records_per_page
+        context["queryset"] = prefetch_page(
+            paginator_qry(queryset, self.request.GET.get("page"), self.records_per_page)
         )
         return context
 
@@ -1781,12 +1738,14 @@ def save(self: forms.ModelForm, commit=True, *args, **kwargs):
     if commit:
         response = super(type(self), self).save(*args, **kwargs)
         new_isntance_pk = self.instance.pk
-        CACHE.set(
-            request.session.session_key + "cbv" + dynamic_field,
-            {
+        set_view_state(
+            request,
+            "dynamic_field",
+            dynamic_field,
+            value={
                 "dynamic_field": dynamic_field,
                 "value": new_isntance_pk,
-                "model": self._meta.model,
+                "model": model_label(self._meta.model),
             },
         )
     return response
@@ -1957,7 +1916,6 @@ class HorillaFormView(FormView):
                     additional_data_fields = []
                     if len(dynamic_tuple) == 3:
                         additional_data_fields = dynamic_tuple[2]
-                    key = self.request.session.session_key + "cbv" + field
                     field_instance = form.instance._meta.get_field(field)
                     value = form.initial.get(field, [])
 
@@ -1972,12 +1930,14 @@ class HorillaFormView(FormView):
                             )
                     else:
                         value = getattr(getattribute(form.instance, field), "pk", value)
-                    CACHE.set(
-                        key,
-                        {
+                    set_view_state(
+                        self.request,
+                        "dynamic_field",
+                        field,
+                        value={
                             "dynamic_field": field,
                             "value": value,
-                            "model": form._meta.model,
+                            "model": model_label(form._meta.model),
                         },
                     )
 
@@ -2027,12 +1987,11 @@ class HorillaFormView(FormView):
                     field = dynamic_tuple[0]
                     onchange = form.fields[field].widget.attrs.get("onchange", "")
                     if onchange:
-                        CACHE.set(
-                            self.request.session.session_key
-                            + "cbv"
-                            + field
-                            + "onchange",
-                            onchange,
+                        set_view_state(
+                            self.request,
+                            "dynamic_field_onchange",
+                            field,
+                            value=onchange,
                         )
 
             if pk:
@@ -2161,14 +2120,11 @@ class HorillaNavView(TemplateView):
         context["search_in"] = self.search_in
         context["apply_first_filter"] = self.apply_first_filter
         context["filter_instance_context_name"] = self.filter_instance
-        last_filter = CACHE.get(
-            self.request.session.session_key
-            + "last-applied-filter"
-            + self.request.path,
-            {},
+        last_filter = get_query_state(
+            self.request, "last_applied_filter", self.request.path
         )
         context["empty_inputs"] = self.empty_inputs + ["nav_url"]
-        context["last_filter"] = dict(last_filter)
+        context["last_filter"] = dict(last_filter or {})
         if self.filter_instance:
             context[self.filter_form_context_name] = self.filter_instance.form
         context["active_view"] = models.ActiveView.objects.filter(
@@ -2311,14 +2267,11 @@ class HorillaProfileView(DetailView):
         instance_ids = self.request.session.get(self.ordered_ids_key, [])
 
         if instance_ids:
-            CACHE.set(
-                f"{self.request.session.session_key}hpv-instance-ids", instance_ids
-            )
+            set_view_state(self.request, "profile_instance_ids", value=instance_ids)
         else:
-            instance_ids = CACHE.get(
-                f"{self.request.session.session_key}hpv-instance-ids"
+            instance_ids = get_view_state(
+                self.request, "profile_instance_ids", default=[]
             )
-            instance_ids = instance_ids if instance_ids else []
         instances = self.model.objects.filter(id__in=instance_ids)
         context["instances"] = instances
         balance_count = instances.count() - 6
@@ -2348,12 +2301,15 @@ class HorillaProfileView(DetailView):
         context["display_count"] = display_count
         context["actions"] = self.actions
         context["filter_class"] = self.filter_class
-        cache = {
-            "instances": context["instances"],
-            "instance_ids": context["instance_ids"],
-            "filter_class": context["filter_class"],
-            "view_id": context["view_id"],
-            "object": context["object"],
-        }
-        CACHE.set(f"{self.request.session.session_key}search_in_instance_ids", cache)
+        set_view_state(
+            self.request,
+            "search_in_instance_ids",
+            value={
+                "model": model_label(self.model),
+                "instance_ids": instance_ids,
+                "filter_class": class_path(self.filter_class),
+                "view_id": context["view_id"],
+                "object": context["object"].pk,
+            },
+        )
         return context
@@ -4,12 +4,11 @@ methods.py
 This module is used to write methods related to the history
 """
 
-from django.contrib.auth.models import User
 from django.core.paginator import Paginator
-from django.db import models
 from django.shortcuts import render
 
 from horilla.decorators import apply_decorators
+from horilla_audit.methods import history_timeline
 
 
 class Bot:
@@ -76,83 +75,17 @@ def filter_history(histories, track_fields):
     return histories
 
 
-def get_diff(instance, history_related_name):
+def get_diff(instance, history_related_name, cursor=None, page_size=None):
     """
-    This method is used to find the differences in the history
+    This method is used to find the differences in the history, read from the
+    change table filled as the history is written
     """
-    remove_duplicate_history(instance, history_related_name)
-    history = getattr(instance, history_related_name).all()
-    history_list = list(history)
-    pairs = [
-        [history_list[i], history_list[i + 1]] for i in range(len(history_list) - 1)
-    ]
-    delta_changes = []
-    create_history = history.filter(history_type="+").first()
-    for pair in pairs:
-        delta = pair[0].diff_against(pair[1])
-        diffs = []
-        class_name = pair[0].instance.__class__
-        for change in delta.changes:
-            old = change.old
-            new = change.new
-            field = instance._meta.get_field(change.field)
-            is_fk = False
-            if (
-                isinstance(field, models.fields.CharField)
-                and field.choices
-                and old
-                and new
-            ):
-                choices = dict(field.choices)
-                old = choices[old]
-                new = choices[new]
-            if isinstance(field, models.ForeignKey):
-                is_fk = True
-                # old = getattr(pair[0], change.field)
-                # new = getattr(pair[1], change.field)
-            diffs.append(
-                {
-                    "field": get_field_label(class_name, change.field),
-                    "field_name": change.field,
-                    "is_fk": is_fk,
-                    "old": old,
-                    "new": new,
-                }
-            )
-        updated_by = (
-            User.objects.get(id=pair[0].history_user.id).employee_get
-            if pair[0].history_user
-            else Bot()
-        )
-        delta_changes.append(
-            {
-                "type": "Changes",
-                "pair": pair,
-                "changes": diffs,
-                "updated_by": updated_by,
-            }
-        )
-    if create_history:
-        try:
-            updated_by = create_history.history_user.employee_get
-        except:
-            updated_by = Bot()
-        delta_changes.append(
-            {
-                "type": f"{create_history.instance.__class__._meta.verbose_name.capitalize()} created",
-                "pair": (create_history, create_history),
-                "updated_by": updated_by,
-            }
-        )
-    if instance._meta.model_name == "employeeworkinformation":
-        from .models import HistoryTrackingFields
-
-        history_tracking_instance = HistoryTrackingFields.objects.first()
-        if history_tracking_instance and history_tracking_instance.tracking_fields:
-            track_fields = history_tracking_instance.tracking_fields["tracking_fields"]
-            if track_fields:
-                delta_changes = filter_history(delta_changes, track_fields)
-    return delta_changes
+    return history_timeline(
+        instance,
+        cursor=cursor,
+        page_size=page_size,
+        history_model=getattr(instance, history_related_name).model,
+    )
 
 
 def history_tracking(request, obj_id, **kwargs):
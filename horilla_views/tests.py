@@ -1,3 +1,174 @@
-from django.test import TestCase
+"""test cases"""
 
-# Create your tests here.
+from io import BytesIO
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import RequestFactory, TestCase
+from openpyxl import Workbook
+
+from base.models import Department
+from employee.models import Employee, EmployeeWorkInformation
+from horilla_views.cbv_methods import get_verbose_name_from_field_path
+from horilla_views.generic.cbv.views import HorillaListView
+
+
+class EmployeeImportView(HorillaListView):
+    """
+    Employee import with the work information as reverse related record and
+    the department looked up by name
+    """
+
+    model = Employee
+    import_fields = [
+        "employee_first_name",
+        "employee_last_name",
+        "email",
+        "phone",
+        "employee_work_info__department_id",
+    ]
+    update_reference = "id"
+    import_related_model_column_mapping = {
+        "employee_work_info": EmployeeWorkInformation,
+        "employee_work_info__department_id": Department,
+    }
+    primary_key_mapping = {"employee_work_info__department_id": "department"}
+    reverse_model_relation_to_base_model = {"employee_work_info": "employee_id"}
+    import_chunk_size = 2
+
+
+class ListViewImportTest(TestCase):
+    """
+    Sheet import of the generic list view, read in chunks
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser(
+            username="import.admin", email="import.admin@example.com", password="x"
+        )
+        cls.sales = Department.objects.create(department="Sales")
+
+    def import_sheet(self, rows):
+        """
+        Import the rows, given by import field with an optional "id"
+        reference, through the view
+        """
+        view = EmployeeImportView()
+        fields = ["id"] + view.import_fields
+        headers = [
+            get_verbose_name_from_field_path(
+                Employee, field, view.import_related_model_column_mapping
+            )
+            for field in fields
+        ]
+        headers[0] = f"{headers[0]} | Reference"
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(headers)
+        for row in rows:
+            sheet.append([row.get(field) for field in fields])
+        content = BytesIO()
+        workbook.save(content)
+
+        request = RequestFactory().post(
+            "/import",
+            {"file": SimpleUploadedFile("import.xlsx", content.getvalue())},
+        )
+        request.user = self.user
+        request.session = self.client.session
+        view.request = request
+        view.kwargs = {}
+        return view.import_records(request)
+
+    def employee_row(self, number, department="Sales", **row):
+        return {
+            "employee_first_name": f"Imported{number}",
+            "employee_last_name": "Employee",
+            "email": f"imported{number}@example.com",
+            "phone": "9999999999",
+            "employee_work_info__department_id": department,
+            **row,
+        }
+
+    def test_create_across_chunks(self):
+        # 5 rows in chunks of 2, the new department is created by the first
+        # chunk and looked up by the next ones
+        rows = [
+            self.employee_row(number, department="Sales" if number % 2 else "Ops")
+            for number in range(5)
+        ]
+        self.import_sheet(rows)
+
+        employees = Employee.objects.entire().filter(
+            email__endswith="@example.com", employee_first_name__startswith="Imported"
+        )
+        self.assertEqual(employees.count(), 5)
+        self.assertEqual(Department.objects.filter(department="Ops").count(), 1)
+        self.assertEqual(Department.objects.filter(department="Sales").count(), 1)
+        for number in range(5):
+            work_info = EmployeeWorkInformation.objects.get(
+                employee_id__email=f"imported{number}@example.com"
+            )
+            self.assertEqual(
+                work_info.department_id.department,
+                "Sales" if number % 2 else "Ops",
+            )
+
+    def test_update_by_reference(self):
+        employee = Employee.objects.create(
+            employee_first_name="Existing",
+            employee_last_name="Employee",
+            email="existing@example.com",
+            phone="9999999999",
+        )
+        self.import_sheet(
+            [
+                self.employee_row(
+                    1,
+                    id=employee.pk,
+                    email="existing@example.com",
+                    employee_last_name="Renamed",
+                    department="Ops",
+                )
+            ]
+        )
+
+        employee.refresh_from_db()
+        self.assertEqual(employee.employee_first_name, "Imported1")
+        self.assertEqual(employee.employee_last_name, "Renamed")
+        self.assertEqual(
+            EmployeeWorkInformation.objects.get(
+                employee_id=employee
+            ).department_id.department,
+            "Ops",
+        )
+        self.assertFalse(
+            Employee.objects.entire().filter(email="imported1@example.com").exists()
+        )
+
+    def test_update_creates_missing_related_records(self):
+        # Employees without work information, updated across two chunks:
+        # every one of them gets its work information
+        employees = Employee.objects.bulk_create(
+            [
+                Employee(
+                    employee_first_name=f"Bare{number}",
+                    email=f"bare{number}@example.com",
+                    phone="9999999999",
+                )
+                for number in range(3)
+            ]
+        )
+        self.import_sheet(
+            [
+                self.employee_row(
+                    number, id=employee.pk, email=employee.email, department="Sales"
+                )
+                for number, employee in enumerate(employees)
+            ]
+        )
+
+        for employee in employees:
+            work_info = EmployeeWorkInformation.objects.get(employee_id=employee)
+            self.assertEqual(work_info.department_id, self.sales)
@@ -0,0 +1,138 @@
+"""
+view_state.py
+
+Per session state of the generic views: saved list filters, sort direction,
+last applied navbar filter, profile view navigation ids and dynamic create
+field values.
+
+The state is stored as JSON in the configured cache backend, so it is shared
+by every process when the backend is (see `CACHE_URL`). Only plain data is
+kept: query strings, ids, model labels and the import path of filter classes,
+never querysets, model instances or classes. Every entry expires after
+`VIEW_STATE_TIMEOUT` seconds and entries larger than `VIEW_STATE_MAX_BYTES`
+are not stored.
+"""
+
+import hashlib
+import importlib
+import json
+import logging
+
+from django.apps import apps
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import QueryDict
+
+from horilla.horilla_settings import VIEW_STATE_MAX_BYTES, VIEW_STATE_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "horilla_view_state"
+
+
+def view_state_key(request, name, *parts):
+    """
+    Cache key of the named state of the request session
+    """
+    session_key = getattr(getattr(request, "session", None), "session_key", None)
+    digest = hashlib.md5(
+        "\x00".join(str(part) for part in parts).encode(), usedforsecurity=False
+    ).hexdigest()
+    return f"{KEY_PREFIX}:{session_key}:{name}:{digest}"
+
+
+def get_view_state(request, name, *parts, default=None):
+    """
+    Return the named state of the request session
+    """
+    value = cache.get(view_state_key(request, name, *parts))
+    if value is None:
+        return default
+    try:
+        return json.loads(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def set_view_state(request, name, *parts, value, timeout=VIEW_STATE_TIMEOUT):
+    """
+    Store the named state of the request session, returns False when the
+    value is not serializable or too large to be stored
+    """
+    key = view_state_key(request, name, *parts)
+    try:
+        data = json.dumps(value, cls=DjangoJSONEncoder, separators=(",", ":"))
+    except TypeError as error:
+        logger.warning("View state %s not stored: %s", name, error)
+        cache.delete(key)
+        return False
+    if len(data) > VIEW_STATE_MAX_BYTES:
+        logger.warning(
+            "View state %s not stored, %s bytes exceeds %s",
+            name,
+            len(data),
+            VIEW_STATE_MAX_BYTES,
+        )
+        cache.delete(key)
+        return False
+    cache.set(key, data, timeout)
+    return True
+
+
+def delete_view_state(request, name, *parts):
+    """
+    Drop the named state of the request session
+    """
+    cache.delete(view_state_key(request, name, *parts))
+
+
+def get_query_state(request, name, *parts):
+    """
+    Return the stored query string state as a QueryDict, None if not stored
+    """
+    query_string = get_view_state(request, name, *parts)
+    if query_string is None:
+        return None
+    return QueryDict(query_string)
+
+
+def set_query_state(request, name, *parts, query_dict, timeout=VIEW_STATE_TIMEOUT):
+    """
+    Store a QueryDict as query string state
+    """
+    return set_view_state(
+        request, name, *parts, value=query_dict.urlencode(), timeout=timeout
+    )
+
+
+def class_path(klass):
+    """
+    Import path of the class, None for None
+    """
+    if klass is None:
+        return None
+    return f"{klass.__module__}.{klass.__qualname__}"
+
+
+def import_class(path):
+    """
+    Import the class from its import path, None for None
+    """
+    if not path:
+        return None
+    module_name, class_name = path.rsplit(".", 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def model_label(model):
+    """
+    `app_label.ModelName` label of the model
+    """
+    return model._meta.label
+
+
+def get_model(label):
+    """
+    Model of the `app_label.ModelName` label
+    """
+    return apps.get_model(label)
@@ -5,7 +5,6 @@ from django import forms
 from django.apps import apps
 from django.contrib import messages
 from django.contrib.admin.utils import NestedObjects
-from django.core.cache import cache as CACHE
 from django.db import router
 from django.http import HttpResponse, JsonResponse
 from django.shortcuts import render
@@ -19,6 +18,12 @@ from horilla_views import models
 from horilla_views.cbv_methods import get_short_uuid, login_required, merge_dicts
 from horilla_views.forms import SavedFilterForm
 from horilla_views.generic.cbv.views import HorillaFormView, HorillaListView
+from horilla_views.view_state import (
+    get_model,
+    get_view_state,
+    import_class,
+    set_query_state,
+)
 
 # Create your views here.
 
@@ -71,14 +76,12 @@ class ReloadField(View):
         module = importlib.import_module(module_name)
         parent_form = getattr(module, class_name)()
 
-        dynamic_cache = CACHE.get(request.session.session_key + "cbv" + reload_field)
-        onchange = CACHE.get(
-            request.session.session_key + "cbv" + reload_field + "onchange"
+        dynamic_cache = get_view_state(request, "dynamic_field", reload_field)
+        onchange = get_view_state(
+            request, "dynamic_field_onchange", reload_field, default=""
         )
-        if not onchange:
-            onchange = ""
 
-        model: models.HorillaModel = dynamic_cache["model"]
+        model: models.HorillaModel = get_model(dynamic_cache["model"])
         value = dynamic_cache.get("value", "")
 
         cache_field = dynamic_cache["dynamic_field"]
@@ -252,9 +255,21 @@ class SearchInIds(View):
         """
         Search in instance ids method
         """
-        cache_key = f"{self.request.session.session_key}search_in_instance_ids"
-        context: dict = CACHE.get(cache_key)
-        context["instances"] = context["filter_class"](self.request.GET).qs
+        state = get_view_state(self.request, "search_in_instance_ids")
+        if not state:
+            return HttpResponse("")
+        model = get_model(state["model"])
+        queryset = model.objects.filter(id__in=state["instance_ids"])
+        filter_class = import_class(state["filter_class"])
+        if filter_class:
+            queryset = filter_class(self.request.GET, queryset).qs
+        context = {
+            "instances": queryset,
+            "instance_ids": str(state["instance_ids"]),
+            "filter_class": filter_class,
+            "view_id": state["view_id"],
+            "object": model.objects.filter(pk=state["object"]).first(),
+        }
         return render(self.request, "generic/filter_result.html", context)
 
 
@@ -273,9 +288,11 @@ class LastAppliedFilter(View):
             "nav_url",
         )
         if nav_path:
-            CACHE.set(
-                self.request.session.session_key + "last-applied-filter" + nav_path,
-                self.request.GET,
+            set_query_state(
+                self.request,
+                "last_applied_filter",
+                nav_path,
+                query_dict=self.request.GET,
                 timeout=600,
             )
         return HttpResponse("success")
@@ -8,4 +8,9 @@ from horilla_widgets import views
 
 urlpatterns = [
     path("get-filter-form", views.get_filter_form, name="get-filter-form"),
+    path(
+        "autocomplete-choices",
+        views.autocomplete_choices,
+        name="autocomplete-choices",
+    ),
 ]
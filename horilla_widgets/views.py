@@ -1,9 +1,19 @@
+import importlib
+
+from django import forms
+from django.db import models
+from django.db.models import Q
+from django.http import HttpResponseBadRequest, JsonResponse
 from django.shortcuts import render
 
 from horilla.decorators import login_required
+from horilla.filters import FilterSet
+from horilla.search import name_search_q
 from horilla_widgets.widgets.select_widgets import (
     ALL_INSTANCES,
+    AutocompleteMixin,
     HorillaMultiSelectWidget,
+    autocomplete_field,
 )
 
 # Create your views here.
@@ -29,3 +39,91 @@ def get_filter_form(request):
     widget_instance = ALL_INSTANCES[str(request.user.id)]
     template_path = request.GET["template_path"]
     return render(request, template_path, {"f": widget_instance.filter_class()})
+
+
+# Fields never searched by the autocomplete endpoint, whatever their name
+SENSITIVE_FIELD_PARTS = ("password", "secret", "token", "key", "hash", "otp")
+
+
+def autocomplete_search_fields(model):
+    """
+    The name and title fields of the model the autocomplete endpoint searches
+    """
+    return [
+        field.name
+        for field in model._meta.concrete_fields
+        if isinstance(field, models.CharField)
+        and field.name.endswith(("name", "title"))
+        and not any(part in field.name for part in SENSITIVE_FIELD_PARTS)
+    ]
+
+
+def autocomplete_search_q(model, term):
+    """
+    Condition matching the records of the model whose name contains the
+    search term
+    """
+    condition = Q()
+    if hasattr(model, "employee_first_name"):
+        condition |= name_search_q(term)
+    for field_name in autocomplete_search_fields(model):
+        condition |= Q(**{f"{field_name}__icontains": term})
+    return condition
+
+
+def autocomplete_queryset(token, user_id):
+    """
+    Queryset of the filter set field the autocomplete token refers to, as
+    the filter set builds it for the request. None when the token is not valid
+    for the user.
+    """
+    reference = autocomplete_field(token, user_id)
+    if reference is None:
+        return None
+    filterset_path, field_name = reference
+    module_name, class_name = filterset_path.rsplit(".", 1)
+    try:
+        filterset_class = getattr(importlib.import_module(module_name), class_name)
+    except (ImportError, AttributeError):
+        return None
+    if not isinstance(filterset_class, type) or not issubclass(
+        filterset_class, FilterSet
+    ):
+        return None
+    field = filterset_class().form.fields.get(field_name)
+    if not isinstance(field, forms.ModelChoiceField):
+        return None
+    return field.queryset
+
+
+@login_required
+def autocomplete_choices(request):
+    """
+    This method returns a page of the choices of an autocomplete select,
+    in the select2 format
+    """
+    queryset = autocomplete_queryset(request.GET.get("token", ""), request.user.pk)
+    if queryset is None:
+        return HttpResponseBadRequest()
+    model = queryset.model
+    term = (request.GET.get("term") or request.GET.get("q") or "").strip()
+    if term:
+        queryset = queryset.filter(autocomplete_search_q(model, term))
+    if not queryset.ordered:
+        queryset = queryset.order_by("pk")
+    try:
+        page = max(int(request.GET.get("page", 1)), 1)
+    except ValueError:
+        page = 1
+    page_size = AutocompleteMixin.page_size
+    start = (page - 1) * page_size
+    instances = list(queryset[start : start + page_size + 1])
+    return JsonResponse(
+        {
+            "results": [
+                {"id": instance.pk, "text": str(instance)}
+                for instance in instances[:page_size]
+            ],
+            "pagination": {"more": len(instances) > page_size},
+        }
+    )
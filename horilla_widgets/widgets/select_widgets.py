@@ -4,9 +4,13 @@ select_widgets.py
 This module is used to write horilla form select widgets
 """
 
+import importlib
 import uuid
 
 from django import forms
+from django.core import signing
+from django.core.exceptions import ValidationError
+from django.urls import reverse
 
 from horilla import horilla_middlewares
 
@@ -37,7 +41,7 @@ class HorillaMultiSelectWidget(forms.Widget):
         required=False,
         form=None,
         help_text=None,
-        **kwargs
+        **kwargs,
     ) -> None:
         self.filter_route_name = filter_route_name
         self.required = required
@@ -86,3 +90,147 @@ class HorillaMultiSelectWidget(forms.Widget):
         ALL_INSTANCES[str(request.user.id)] = self
 
         return context
+
+
+AUTOCOMPLETE_SALT = "horilla-widgets.autocomplete"
+AUTOCOMPLETE_TOKEN_MAX_AGE = 60 * 60 * 12
+
+
+def class_path(klass):
+    """
+    Import path of the class, None when the class can not be imported by it
+    """
+    path = f"{klass.__module__}.{klass.__qualname__}"
+    try:
+        module = importlib.import_module(klass.__module__)
+    except ImportError:
+        return None
+    if getattr(module, klass.__qualname__, None) is not klass:
+        return None
+    return path
+
+
+def autocomplete_token(filterset_path, field_name, user_id):
+    """
+    Signed reference to the filter set field an autocomplete widget loads
+    choices from, for the user the form was shown to. The endpoint only
+    serves fields a form offered to the requesting user.
+    """
+    return signing.dumps(
+        {"filterset": filterset_path, "field": field_name, "user": user_id},
+        salt=AUTOCOMPLETE_SALT,
+    )
+
+
+def autocomplete_field(token, user_id):
+    """
+    The filter set path and field name of an autocomplete token, None when
+    it is not valid, expired or signed for another user
+    """
+    try:
+        data = signing.loads(
+            token, salt=AUTOCOMPLETE_SALT, max_age=AUTOCOMPLETE_TOKEN_MAX_AGE
+        )
+    except signing.BadSignature:
+        return None
+    if data.get("user") != user_id:
+        return None
+    return data["filterset"], data["field"]
+
+
+class AutocompleteMixin:
+    """
+    Select widget of a model choice field loading its choices page by page
+    from the autocomplete endpoint. Only the selected choices are rendered.
+    """
+
+    page_size = 20
+    filterset_path = None
+    field_name = None
+
+    def build_attrs(self, base_attrs, extra_attrs=None):
+        attrs = super().build_attrs(base_attrs, extra_attrs)
+        if not hasattr(self.choices, "queryset"):
+            return attrs
+        request = getattr(horilla_middlewares._thread_locals, "request", None)
+        if request is None or not request.user.is_authenticated:
+            return attrs
+        url = reverse("autocomplete-choices")
+        token = autocomplete_token(
+            self.filterset_path, self.field_name, request.user.pk
+        )
+        attrs.update(
+            {
+                "data-ajax--url": f"{url}?token={token}",
+                "data-ajax--delay": 250,
+                "data-ajax--cache": "true",
+            }
+        )
+        return attrs
+
+    def selected_choices(self, value):
+        """
+        Choices of the selected values, the values that are not records are
+        left out
+        """
+        iterator = self.choices
+        field = iterator.field
+        choices = []
+        if field.empty_label is not None and not self.allow_multiple_selected:
+            choices.append(("", field.empty_label))
+        value = [item for item in value if item not in ("", None)]
+        if not value:
+            return choices
+        key = field.to_field_name or "pk"
+        try:
+            instances = list(iterator.queryset.filter(**{f"{key}__in": value}))
+        except (ValueError, TypeError, ValidationError):
+            return choices
+        return choices + [iterator.choice(instance) for instance in instances]
+
+    def optgroups(self, name, value, attrs=None):
+        choices = self.choices
+        if not hasattr(choices, "queryset"):
+            return super().optgroups(name, value, attrs)
+        self.choices = self.selected_choices(value)
+        try:
+            return super().optgroups(name, value, attrs)
+        finally:
+            self.choices = choices
+
+
+class AutocompleteSelect(AutocompleteMixin, forms.Select):
+    """
+    Single select loading its choices from the autocomplete endpoint
+    """
+
+
+class AutocompleteSelectMultiple(AutocompleteMixin, forms.SelectMultiple):
+    """
+    Multiple select loading its choices from the autocomplete endpoint
+    """
+
+
+def use_autocomplete(field, filterset_class, field_name):
+    """
+    Swap the select widget of the model choice field of the filter set for the
+    autocomplete widget, keeping its attributes
+    """
+    if not isinstance(field, forms.ModelChoiceField) or field.to_field_name:
+        return field
+    widget_class = {
+        forms.Select: AutocompleteSelect,
+        forms.SelectMultiple: AutocompleteSelectMultiple,
+    }.get(type(field.widget))
+    if widget_class is None:
+        return field
+    filterset_path = class_path(filterset_class)
+    if filterset_path is None:
+        return field
+    widget = widget_class(attrs=field.widget.attrs)
+    widget.choices = field.choices
+    widget.is_required = field.widget.is_required
+    widget.filterset_path = filterset_path
+    widget.field_name = field_name
+    field.widget = widget
+    return field
@@ -0,0 +1,220 @@
+"""
+clashes.py
+
+Incremental leave clash index.
+
+A leave request clashes with every other active request (not cancelled or
+rejected) of the same company whose date range overlaps it and whose
+employee shares either the department or the job position. Instead of
+issuing one COUNT query per leave request, the index loads the active
+requests of a date window once and answers clash counts with bisect lookups
+over per-bucket sorted start/end dates.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+
+from django.db.models import Q
+
+INACTIVE_STATUSES = ["cancelled", "rejected"]
+
+CLASH_FIELDS = (
+    "id",
+    "status",
+    "start_date",
+    "end_date",
+    "employee_id__employee_work_info__id",
+    "employee_id__employee_work_info__company_id",
+    "employee_id__employee_work_info__department_id",
+    "employee_id__employee_work_info__job_position_id",
+)
+
+
+class _Bucket:
+    """
+    Sorted start and end dates of the intervals sharing one bucket key
+    """
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+
+    def add(self, start_date, end_date):
+        self.starts.append(start_date)
+        self.ends.append(end_date)
+
+    def freeze(self):
+        self.starts.sort()
+        self.ends.sort()
+
+    def overlapping(self, start_date, end_date):
+        """
+        Number of intervals with start <= end_date and end >= start_date
+        """
+        return bisect_right(self.starts, end_date) - bisect_left(self.ends, start_date)
+
+
+class LeaveClashIndex:
+    """
+    Date-bucketed clash index keyed by company/department/job position
+    """
+
+    def __init__(self, rows):
+        self.rows = {}
+        self.by_department = defaultdict(_Bucket)
+        self.by_job_position = defaultdict(_Bucket)
+        self.by_both = defaultdict(_Bucket)
+        for row in rows:
+            row = _normalize(row)
+            self.rows[row["id"]] = row
+            if row["status"] in INACTIVE_STATUSES:
+                continue
+            start_date, end_date = row["start_date"], row["end_date"]
+            company, department, job_position = _keys(row)
+            self.by_department[(company, department)].add(start_date, end_date)
+            self.by_job_position[(company, job_position)].add(start_date, end_date)
+            self.by_both[(company, department, job_position)].add(start_date, end_date)
+        for buckets in (self.by_department, self.by_job_position, self.by_both):
+            for bucket in buckets.values():
+                bucket.freeze()
+
+    @classmethod
+    def for_window(cls, start_date=None, end_date=None):
+        """
+        Build the index from the leave requests overlapping the given window,
+        or from every leave request when no window is given.
+        """
+        from leave.models import LeaveRequest
+
+        queryset = LeaveRequest.objects.entire()
+        if start_date is not None and end_date is not None:
+            queryset = queryset.filter(
+                start_date__lte=end_date, end_date__gte=start_date
+            )
+        return cls(queryset.values(*CLASH_FIELDS))
+
+    def count(self, row):
+        """
+        Number of active leave requests clashing with the given row
+        """
+        row = _normalize(row)
+        if row["status"] in INACTIVE_STATUSES:
+            return 0
+        if row["employee_id__employee_work_info__id"] is None:
+            # employee without work information
+            return 0
+        company, department, job_position = _keys(row)
+        start_date, end_date = row["start_date"], row["end_date"]
+        clashes = self._overlapping(
+            self.by_department, (company, department), start_date, end_date
+        )
+        clashes += self._overlapping(
+            self.by_job_position, (company, job_position), start_date, end_date
+        )
+        # requests sharing both were counted twice
+        clashes -= self._overlapping(
+            self.by_both, (company, department, job_position), start_date, end_date
+        )
+        if clashes and row["id"] in self.rows:
+            # the request itself is part of the index
+            clashes -= 1
+        return max(clashes, 0)
+
+    @staticmethod
+    def _overlapping(buckets, key, start_date, end_date):
+        if key not in buckets:
+            return 0
+        return buckets[key].overlapping(start_date, end_date)
+
+    def counts(self, ids=None):
+        """
+        Clash counts for the given ids (or every indexed row) as {id: count}
+        """
+        ids = self.rows.keys() if ids is None else ids
+        return {id: self.count(self.rows[id]) for id in ids if id in self.rows}
+
+
+def _normalize(row):
+    if row["end_date"] is None:
+        row = dict(row, end_date=row["start_date"])
+    return row
+
+
+def _keys(row):
+    return (
+        row["employee_id__employee_work_info__company_id"],
+        row["employee_id__employee_work_info__department_id"],
+        row["employee_id__employee_work_info__job_position_id"],
+    )
+
+
+def refresh_leave_clashes(ranges, exclude_ids=None):
+    """
+    Recompute the clash count of every leave request overlapping one of the
+    given (start_date, end_date) ranges.
+
+    Only the requests whose date ranges overlap the changed request are
+    touched, which is the set whose clash count can change.
+
+    Returns the number of updated leave requests.
+    """
+    from leave.models import LeaveRequest
+
+    ranges = [
+        (start_date, end_date or start_date)
+        for start_date, end_date in ranges
+        if start_date is not None
+    ]
+    if not ranges:
+        return 0
+    overlap = Q()
+    for start_date, end_date in ranges:
+        overlap |= Q(start_date__lte=end_date, end_date__gte=start_date)
+    affected = (
+        LeaveRequest.objects.entire()
+        .filter(overlap)
+        .exclude(status__in=INACTIVE_STATUSES)
+        .exclude(id__in=exclude_ids or [])
+        .values("id", "start_date", "end_date", "leave_clashes_count")
+    )
+    affected = list(affected)
+    if not affected:
+        return 0
+
+    window_start = min(row["start_date"] for row in affected)
+    window_end = max(row["end_date"] or row["start_date"] for row in affected)
+    index = LeaveClashIndex.for_window(window_start, window_end)
+    counts = index.counts([row["id"] for row in affected])
+
+    leave_requests_to_update = [
+        LeaveRequest(id=row["id"], leave_clashes_count=counts[row["id"]])
+        for row in affected
+        if row["id"] in counts and counts[row["id"]] != row["leave_clashes_count"]
+    ]
+    LeaveRequest.objects.bulk_update(
+        leave_requests_to_update, ["leave_clashes_count"], batch_size=500
+    )
+    return len(leave_requests_to_update)
+
+
+def rebuild_leave_clashes(batch_size=500):
+    """
+    Rebuild the clash count of every leave request from scratch.
+
+    Returns the number of updated leave requests.
+    """
+    from leave.models import LeaveRequest
+
+    index = LeaveClashIndex.for_window()
+    current = dict(
+        LeaveRequest.objects.entire().values_list("id", "leave_clashes_count")
+    )
+    leave_requests_to_update = [
+        LeaveRequest(id=id, leave_clashes_count=count)
+        for id, count in index.counts().items()
+        if current.get(id) != count
+    ]
+    LeaveRequest.objects.bulk_update(
+        leave_requests_to_update, ["leave_clashes_count"], batch_size=batch_size
+    )
+    return len(leave_requests_to_update)
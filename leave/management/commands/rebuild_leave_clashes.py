@@ -0,0 +1,75 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from leave.clashes import LeaveClashIndex, rebuild_leave_clashes
+from leave.models import LeaveRequest
+
+
+class Command(BaseCommand):
+    help = "Rebuild the leave clash count of every leave request from scratch"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of leave requests written per bulk update",
+        )
+        parser.add_argument(
+            "--benchmark",
+            action="store_true",
+            help=(
+                "Compare the clash index against the per-request COUNT "
+                "recompute without writing anything"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        if options["benchmark"]:
+            self.benchmark()
+            return
+
+        start = time.perf_counter()
+        updated = rebuild_leave_clashes(batch_size=options["batch_size"])
+        elapsed = time.perf_counter() - start
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Leave clash index rebuilt in {elapsed:.2f}s, "
+                f"{updated} leave requests updated."
+            )
+        )
+
+    def benchmark(self):
+        start = time.perf_counter()
+        leave_requests = LeaveRequest.objects.entire().exclude(
+            status__in=["cancelled", "rejected"]
+        )
+        full_recompute = {
+            leave_request.id: leave_request.count_leave_clashes()
+            for leave_request in leave_requests
+        }
+        full_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        index_counts = LeaveClashIndex.for_window().counts(full_recompute.keys())
+        index_elapsed = time.perf_counter() - start
+
+        mismatches = [
+            id for id, count in full_recompute.items() if index_counts.get(id) != count
+        ]
+        self.stdout.write(f"Leave requests:      {len(full_recompute)}")
+        self.stdout.write(f"Full recompute:      {full_elapsed:.3f}s")
+        self.stdout.write(f"Clash index rebuild: {index_elapsed:.3f}s")
+        if index_elapsed:
+            self.stdout.write(
+                f"Speedup:             {full_elapsed / index_elapsed:.1f}x"
+            )
+        if mismatches:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{len(mismatches)} leave requests differ, e.g. {mismatches[:10]}"
+                )
+            )
+        else:
+            self.stdout.write(self.style.SUCCESS("Clash counts match."))
@@ -1,5 +1,4 @@
-import calendar
-from datetime import date, datetime, timedelta
+from datetime import date, datetime
 
 import pandas as pd
 from django.apps import apps
@@ -29,58 +28,6 @@ def calculate_requested_days(
     return middle_days + start_day_value + end_day_value
 
 
-def holiday_dates_list(holidays):
-    """
-    :return: This function returns a list of all holiday dates.
-    """
-    holiday_dates = []
-    for holiday in holidays:
-        holiday_start_date = holiday.start_date
-        holiday_end_date = holiday.end_date or holiday_start_date
-        holiday_dates.extend(
-            holiday_start_date + timedelta(i)
-            for i in range((holiday_end_date - holiday_start_date).days + 1)
-        )
-    return holiday_dates
-
-
-def company_leave_dates_list(company_leaves, start_date):
-    """
-    :return: This function returns a list of all company leave dates
-    """
-    company_leave_dates = set()
-    year = start_date.year
-    for company_leave in company_leaves:
-        based_on_week = company_leave.based_on_week
-        based_on_week_day = company_leave.based_on_week_day
-
-        for month in range(1, 13):
-            month_calendar = calendar.monthcalendar(year, month)
-
-            if based_on_week is not None:
-                # Set Sunday as the first day of the week
-                calendar.setfirstweekday(6)
-                try:
-                    week_days = [
-                        day for day in month_calendar[int(based_on_week)] if day != 0
-                    ]
-                    for day in week_days:
-                        date = datetime(year, month, day)
-                        if date.weekday() == int(based_on_week_day):
-                            company_leave_dates.add(date.date())
-                except IndexError:
-                    pass
-            else:
-                # Set Monday as the first day of the week
-                calendar.setfirstweekday(0)
-                for week in month_calendar:
-                    if week[int(based_on_week_day)] != 0:
-                        date = datetime(year, month, week[int(based_on_week_day)])
-                        company_leave_dates.add(date.date())
-
-    return list(company_leave_dates)
-
-
 def get_leave_day_attendance(employee, comp_id=None):
     """
     This function returns a queryset of attendance on leave dates
@@ -17,23 +17,19 @@ from django.utils.translation import gettext_lazy as _
 from base.horilla_company_manager import HorillaCompanyManager
 from base.models import (
     Company,
-    CompanyLeaves,
     Department,
-    Holidays,
     JobPosition,
     MultipleApprovalCondition,
     clear_messages,
 )
+from base.work_calendar import get_work_calendar
 from employee.models import Employee, EmployeeWorkInformation
 from horilla import horilla_middlewares
 from horilla.models import HorillaModel, upload_path
 from horilla_audit.methods import get_diff
 from horilla_audit.models import HorillaAuditInfo, HorillaAuditLog
-from leave.methods import (
-    calculate_requested_days,
-    company_leave_dates_list,
-    holiday_dates_list,
-)
+from leave.clashes import refresh_leave_clashes
+from leave.methods import calculate_requested_days
 
 logger = logging.getLogger(__name__)
 
@@ -595,9 +591,10 @@ def cal_effective_requested_days(start_date, end_date, leave_type_id, requested_
     holidays and company leave days.
     """
     requested_dates = leave_requested_dates(start_date, end_date)
-    holidays = set(holiday_dates_list(Holidays.objects.all()))
+    work_calendar = get_work_calendar()
+    holidays = set(work_calendar.holiday_dates_between(start_date, end_date))
     company_leave_dates = set(
-        company_leave_dates_list(CompanyLeaves.objects.all(), start_date)
+        work_calendar.company_leave_dates_between(start_date, end_date)
     )
 
     if (
@@ -743,67 +740,19 @@ class LeaveRequest(HorillaModel):
 
     def holiday_dates(self):
         """
-        :return: this functions returns a list of all holiday dates.
+        :return: this functions returns a list of the holiday dates of the request.
         """
-        holiday_dates = []
-        holidays = Holidays.objects.all()
-        for holiday in holidays:
-            holiday_start_date = holiday.start_date
-            holiday_end_date = holiday.end_date
-            if holiday_end_date is None:
-                holiday_end_date = holiday_start_date
-            holiday_days = holiday_end_date - holiday_start_date
-            for i in range(holiday_days.days + 1):
-                date = holiday_start_date + timedelta(i)
-                holiday_dates.append(date)
-        return holiday_dates
+        return get_work_calendar().holiday_dates_between(
+            self.start_date, self.end_date or self.start_date
+        )
 
     def company_leave_dates(self):
         """
-        :return: This function returns a list of all company leave dates"""
-        from datetime import date
-
-        company_leaves = CompanyLeaves.objects.all()
-        company_leave_dates = []
-        for company_leave in company_leaves:
-            if self:
-                year = self.start_date.year
-            else:
-                year = date.today().year
-            based_on_week = company_leave.based_on_week
-            based_on_week_day = company_leave.based_on_week_day
-            for month in range(1, 13):
-                if based_on_week != None:
-                    # Set Sunday as the first day of the week
-                    calendar.setfirstweekday(6)
-                    month_calendar = calendar.monthcalendar(year, month)
-                    try:
-                        weeks = month_calendar[int(based_on_week)]
-                        weekdays_in_weeks = [day for day in weeks if day != 0]
-                        for day in weekdays_in_weeks:
-                            date = datetime.strptime(
-                                f"{year}-{month:02}-{day:02}", "%Y-%m-%d"
-                            ).date()
-                            if (
-                                date.weekday() == int(based_on_week_day)
-                                and date not in company_leave_dates
-                            ):
-                                company_leave_dates.append(date)
-                    except IndexError:
-                        pass
-                else:
-                    # Set Monday as the first day of the week
-                    calendar.setfirstweekday(0)
-                    month_calendar = calendar.monthcalendar(year, month)
-                    for week in month_calendar:
-                        if week[int(based_on_week_day)] != 0:
-                            date = datetime.strptime(
-                                f"{year}-{month:02}-{week[int(based_on_week_day)]:02}",
-                                "%Y-%m-%d",
-                            ).date()
-                            if date not in company_leave_dates:
-                                company_leave_dates.append(date)
-        return company_leave_dates
+        :return: This function returns a list of the company leave dates of the request.
+        """
+        return get_work_calendar().company_leave_dates_between(
+            self.start_date, self.end_date or self.start_date
+        )
 
     def leaveoverlapping(self):
         """
@@ -851,9 +800,18 @@ class LeaveRequest(HorillaModel):
         else:
             self.leave_clashes_count = self.count_leave_clashes()
 
+        previous_range = None
+        if self.pk:
+            previous_range = (
+                LeaveRequest.objects.entire()
+                .filter(pk=self.pk)
+                .values_list("start_date", "end_date")
+                .first()
+            )
+
         super().save(*args, **kwargs)
 
-        self.update_leave_clashes_count()
+        self.update_leave_clashes_count(previous_range)
         work_info = EmployeeWorkInformation.objects.filter(employee_id=self.employee_id)
         department_id = None
         conditions = None
@@ -1145,21 +1103,15 @@ class LeaveRequest(HorillaModel):
                     _("The {} leave request cannot be deleted !").format(self.status),
                 )
 
-    def update_leave_clashes_count(self):
+    def update_leave_clashes_count(self, previous_range=None):
         """
-        Update the leave clashes count for all leave requests.
+        Update the leave clashes count of the leave requests overlapping this
+        request's current (and previous) date range.
         """
-        leave_requests_to_update = LeaveRequest.objects.exclude(
-            Q(id=self.id) | Q(status="cancelled") | Q(status="rejected")
-        )
-
-        for leave_request in leave_requests_to_update:
-            leave_request.leave_clashes_count = leave_request.count_leave_clashes()
-
-        # Bulk update leave clashes count for all leave requests
-        LeaveRequest.objects.bulk_update(
-            leave_requests_to_update, ["leave_clashes_count"]
-        )
+        ranges = [(self.start_date, self.end_date)]
+        if previous_range:
+            ranges.append(previous_range)
+        return refresh_leave_clashes(ranges, exclude_ids=[self.id] if self.id else [])
 
     def count_leave_clashes(self):
         """
@@ -38,7 +38,8 @@ from base.methods import (
     is_reportingmanager,
     sortby,
 )
-from base.models import CompanyLeaves, Holidays, PenaltyAccounts
+from base.models import Holidays, PenaltyAccounts
+from base.work_calendar import get_work_calendar
 from employee.models import Employee
 from horilla.decorators import (
     hx_request_required,
@@ -57,9 +58,7 @@ from leave.forms import *
 from leave.methods import (
     attendance_days,
     calculate_requested_days,
-    company_leave_dates_list,
     filter_conditional_leave_request,
-    holiday_dates_list,
     parse_excel_date,
 )
 from leave.models import *
@@ -2205,10 +2204,13 @@ def user_leave_request(request, id):
         )
         requested_dates = leave_requested_dates(start_date, end_date)
         requested_dates = [date.date() for date in requested_dates]
-        holidays = Holidays.objects.all()
-        holiday_dates = holiday_dates_list(holidays)
-        company_leaves = CompanyLeaves.objects.all()
-        company_leave_dates = company_leave_dates_list(company_leaves, start_date)
+        work_calendar = get_work_calendar()
+        holiday_dates = work_calendar.holiday_dates_between(
+            start_date.date(), end_date.date()
+        )
+        company_leave_dates = work_calendar.company_leave_dates_between(
+            start_date.date(), end_date.date()
+        )
         if (
             leave_type.exclude_company_leave == "yes"
             and leave_type.exclude_holiday == "yes"
@@ -2382,11 +2384,12 @@ def user_request_update(request, id):
                         start_date, end_date, start_date_breakdown, end_date_breakdown
                     )
                     requested_dates = leave_requested_dates(start_date, end_date)
-                    holidays = Holidays.objects.all()
-                    holiday_dates = holiday_dates_list(holidays)
-                    company_leaves = CompanyLeaves.objects.all()
-                    company_leave_dates = company_leave_dates_list(
-                        company_leaves, start_date
+                    work_calendar = get_work_calendar()
+                    holiday_dates = work_calendar.holiday_dates_between(
+                        start_date, end_date
+                    )
+                    company_leave_dates = work_calendar.company_leave_dates_between(
+                        start_date, end_date
                     )
                     if (
                         leave_type.exclude_company_leave == "yes"
@@ -14,3 +14,7 @@ class Config(AppConfig):
         import notifications.signals
 
         notifications.notify = notifications.signals.notify
+
+        from notifications.live import connect_live_signals
+
+        connect_live_signals()
@@ -17,6 +17,7 @@ from model_utils import Choices
 from swapper import load_model
 
 from notifications import settings as notifications_settings
+from notifications.fanout import fan_out, get_recipient_ids, queue_fan_out
 from notifications.signals import notify
 from notifications.utils import id2slug
 
@@ -273,6 +274,10 @@ class AbstractNotification(models.Model):
 def notify_handler(verb, **kwargs):
     """
     Handler function to create Notification instance upon action signal call.
+
+    The notifications of all the recipients are inserted in chunks. Pass
+    `queued=True`, or more recipients than the ASYNC_RECIPIENTS setting, to
+    create them in the background once the transaction is committed.
     """
     # Pull the options out of kwargs
     kwargs.pop("signal", None)
@@ -284,6 +289,7 @@ def notify_handler(verb, **kwargs):
     public = bool(kwargs.pop("public", True))
     description = kwargs.pop("description", None)
     timestamp = kwargs.pop("timestamp", timezone.now())
+    queued = kwargs.pop("queued", False)
     Notification = load_model("notifications", "Notification")
     level = kwargs.pop("level", Notification.LEVELS.info)
 
@@ -294,41 +300,36 @@ def notify_handler(verb, **kwargs):
         recipients = recipient
     else:
         recipients = [recipient]
-
-    new_notifications = []
-
-    for recipient in recipients:
-        newnotify = Notification(
-            recipient=recipient,
-            actor_content_type=ContentType.objects.get_for_model(actor),
-            actor_object_id=actor.pk,
-            verb=str(verb),
-            public=public,
-            description=description,
-            timestamp=timestamp,
-            level=level,
-        )
-
-        # Set optional objects
-        for obj, opt in optional_objs:
-            if obj is not None:
-                setattr(newnotify, "%s_object_id" % opt, obj.pk)
-                setattr(
-                    newnotify,
-                    "%s_content_type" % opt,
-                    ContentType.objects.get_for_model(obj),
-                )
-
-        if kwargs and EXTRA_DATA:
-            newnotify.data = kwargs
-            newnotify.verb_ar = newnotify.data.get("verb_ar", None)
-            newnotify.verb_de = newnotify.data.get("verb_de", None)
-            newnotify.verb_es = newnotify.data.get("verb_es", None)
-            newnotify.verb_fr = newnotify.data.get("verb_fr", None)
-        newnotify.save()
-        new_notifications.append(newnotify)
-
-    return new_notifications
+    recipient_ids = get_recipient_ids(recipients)
+
+    fields = {
+        "actor_content_type": ContentType.objects.get_for_model(actor),
+        "actor_object_id": actor.pk,
+        "verb": str(verb),
+        "public": public,
+        "description": description,
+        "timestamp": timestamp,
+        "level": level,
+    }
+
+    # Set optional objects
+    for obj, opt in optional_objs:
+        if obj is not None:
+            fields["%s_object_id" % opt] = obj.pk
+            fields["%s_content_type" % opt] = ContentType.objects.get_for_model(obj)
+
+    if kwargs and EXTRA_DATA:
+        fields["data"] = kwargs
+        fields["verb_ar"] = kwargs.get("verb_ar", None)
+        fields["verb_de"] = kwargs.get("verb_de", None)
+        fields["verb_es"] = kwargs.get("verb_es", None)
+        fields["verb_fr"] = kwargs.get("verb_fr", None)
+
+    async_recipients = notifications_settings.get_config()["ASYNC_RECIPIENTS"]
+    if queued or (async_recipients and len(recipient_ids) > async_recipients):
+        queue_fan_out(recipient_ids, fields)
+        return []
+    return fan_out(recipient_ids, fields)
 
 
 # connect the signal
@@ -0,0 +1,137 @@
+""" Django notifications live push broker file """
+
+# -*- coding: utf-8 -*-
+import asyncio
+import json
+import logging
+import threading
+
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+
+from notifications import settings as notifications_settings
+
+logger = logging.getLogger(__name__)
+
+
+class InProcessBroker:
+    """
+    Delivers the user events to the live streams of this process.
+
+    Good for a single ASGI process; use a broker sharing the events between
+    processes (e.g. `RedisBroker`) when the site runs on several.
+    """
+
+    def __init__(self, **options):
+        self.subscribers = {}
+        self.lock = threading.Lock()
+
+    def subscribe(self, user_id):
+        """
+        Register a stream of the user, returns the asyncio queue its events
+        are put in
+        """
+        queue = asyncio.Queue(maxsize=100)
+        with self.lock:
+            self.subscribers.setdefault(user_id, set()).add(
+                (queue, asyncio.get_running_loop())
+            )
+        return queue
+
+    def unsubscribe(self, user_id, queue):
+        with self.lock:
+            streams = self.subscribers.get(user_id, set())
+            for stream in [stream for stream in streams if stream[0] is queue]:
+                streams.discard(stream)
+            if not streams:
+                self.subscribers.pop(user_id, None)
+
+    def deliver(self, user_id, event):
+        """
+        Put the event in the queues of the streams of the user in this process
+        """
+        with self.lock:
+            streams = list(self.subscribers.get(user_id, ()))
+        for queue, loop in streams:
+            try:
+                loop.call_soon_threadsafe(self._put, queue, event)
+            except RuntimeError:
+                # The loop of the stream is closed
+                self.unsubscribe(user_id, queue)
+
+    @staticmethod
+    def _put(queue, event):
+        if queue.full():
+            # The stream only needs the latest state, drop the oldest event
+            queue.get_nowait()
+        queue.put_nowait(event)
+
+    def publish(self, user_id, event):
+        """
+        Send an event to every live stream of the user
+        """
+        self.deliver(user_id, event)
+
+
+class RedisBroker(InProcessBroker):
+    """
+    Shares the user events between processes through Redis pub/sub, for
+    sites running several ASGI processes or nodes
+    """
+
+    channel_prefix = "horilla_notifications:"
+
+    def __init__(self, url="redis://localhost:6379/0", **options):
+        super().__init__(**options)
+        try:
+            import redis  # type: ignore
+        except ImportError as error:
+            raise ImproperlyConfigured(
+                "RedisBroker requires the redis package (pip install redis)"
+            ) from error
+        self.redis = redis.Redis.from_url(url)
+        self.listener = None
+
+    def subscribe(self, user_id):
+        with self.lock:
+            if self.listener is None or not self.listener.is_alive():
+                self.listener = threading.Thread(
+                    target=self.listen, name="notification-broker", daemon=True
+                )
+                self.listener.start()
+        return super().subscribe(user_id)
+
+    def listen(self):
+        pubsub = self.redis.pubsub(ignore_subscribe_messages=True)
+        pubsub.psubscribe(f"{self.channel_prefix}*")
+        for message in pubsub.listen():
+            try:
+                user_id = int(message["channel"].decode()[len(self.channel_prefix) :])
+                self.deliver(user_id, json.loads(message["data"]))
+            except Exception as error:
+                logger.error("Notification broker message error: %s", error)
+
+    def publish(self, user_id, event):
+        try:
+            self.redis.publish(f"{self.channel_prefix}{user_id}", json.dumps(event))
+        except Exception as error:
+            logger.error("Notification broker publish error: %s", error)
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    """
+    The broker configured by the BROKER and BROKER_OPTIONS notification
+    settings
+    """
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                config = notifications_settings.get_config()
+                broker_class = import_string(config["BROKER"])
+                _broker = broker_class(**config["BROKER_OPTIONS"])
+    return _broker
@@ -0,0 +1,127 @@
+""" Django notifications bulk fan-out file """
+
+# -*- coding: utf-8 -*-
+import logging
+import queue
+import threading
+
+from django.db import close_old_connections, router, transaction
+from django.db.models.query import QuerySet
+from django.db.models.signals import post_save, pre_save
+from swapper import load_model
+
+from notifications import settings as notifications_settings
+
+logger = logging.getLogger(__name__)
+
+
+def get_recipient_ids(recipients):
+    """
+    Primary keys of the recipient users, read with one query for a queryset
+    """
+    if isinstance(recipients, QuerySet):
+        return list(recipients.values_list("pk", flat=True))
+    return [
+        getattr(recipient, "pk", recipient)
+        for recipient in recipients
+        if recipient is not None
+    ]
+
+
+def _create_notifications(Notification, notifications, using):
+    """
+    Insert a chunk of notifications, sending the save signals of each one
+    """
+    send_signals = pre_save.has_listeners(Notification) or post_save.has_listeners(
+        Notification
+    )
+    if send_signals:
+        for notification in notifications:
+            pre_save.send(
+                sender=Notification,
+                instance=notification,
+                raw=False,
+                using=using,
+                update_fields=None,
+            )
+    Notification.objects.using(using).bulk_create(notifications)
+    if send_signals:
+        for notification in notifications:
+            post_save.send(
+                sender=Notification,
+                instance=notification,
+                created=True,
+                raw=False,
+                using=using,
+                update_fields=None,
+            )
+    return notifications
+
+
+def fan_out(recipient_ids, fields, batch_size=None):
+    """
+    Create one notification with the fields for every recipient, inserted
+    in chunks of `batch_size`
+    """
+    Notification = load_model("notifications", "Notification")
+    batch_size = batch_size or notifications_settings.get_config()["BULK_BATCH_SIZE"]
+    using = router.db_for_write(Notification)
+    new_notifications = []
+    for start in range(0, len(recipient_ids), batch_size):
+        new_notifications += _create_notifications(
+            Notification,
+            [
+                Notification(recipient_id=recipient_id, **fields)
+                for recipient_id in recipient_ids[start : start + batch_size]
+            ],
+            using,
+        )
+    return new_notifications
+
+
+class FanOutWorker:
+    """
+    Background worker creating the queued notification fan-outs one after
+    the other
+    """
+
+    def __init__(self):
+        self.queue = queue.Queue()
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def put(self, recipient_ids, fields):
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(
+                    target=self.run, name="notification-fan-out", daemon=True
+                )
+                self.thread.start()
+        self.queue.put((recipient_ids, fields))
+
+    def run(self):
+        while True:
+            recipient_ids, fields = self.queue.get()
+            try:
+                close_old_connections()
+                fan_out(recipient_ids, fields)
+            except Exception as error:
+                logger.error(
+                    "Notification fan-out to %s recipients failed: %s",
+                    len(recipient_ids),
+                    error,
+                )
+            finally:
+                close_old_connections()
+                self.queue.task_done()
+
+
+worker = FanOutWorker()
+
+
+def queue_fan_out(recipient_ids, fields):
+    """
+    Create the notifications in the background once the current transaction
+    is committed
+    """
+    transaction.on_commit(lambda: worker.put(recipient_ids, fields))
@@ -0,0 +1,126 @@
+""" Django notifications live updates file """
+
+# -*- coding: utf-8 -*-
+from django.core.cache import DEFAULT_CACHE_ALIAS, cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.forms import model_to_dict
+from swapper import load_model
+
+from horilla.signals import post_bulk_update, pre_bulk_update
+from notifications import settings as notifications_settings
+from notifications.broker import get_broker
+from notifications.utils import id2slug
+
+
+def unread_count_key(user_id):
+    return f"notifications_unread_count_{user_id}"
+
+
+def shared_cache():
+    """
+    Whether the cache is shared by the worker processes, a process local
+    cache can not be invalidated by the process writing a notification
+    """
+    return not isinstance(caches[DEFAULT_CACHE_ALIAS], (LocMemCache, DummyCache))
+
+
+def get_unread_count(user):
+    """
+    Unread notification count of the user, cached until a notification of
+    the user changes when the cache is shared by the worker processes
+    """
+    if not shared_cache():
+        return user.notifications.unread().count()
+    key = unread_count_key(user.pk)
+    count = cache.get(key)
+    if count is None:
+        count = user.notifications.unread().count()
+        cache.set(
+            key, count, notifications_settings.get_config()["UNREAD_COUNT_TIMEOUT"]
+        )
+    return count
+
+
+def notifications_changed(user_id):
+    """
+    Drop the cached unread count of the user and tell the live streams of
+    the user to refresh
+    """
+    cache.delete(unread_count_key(user_id))
+    get_broker().publish(user_id, {"event": "changed"})
+
+
+def unread_notification_data(user, num_to_fetch, mark_as_read=False):
+    """
+    Unread count and latest unread notifications of the user, as returned
+    by the live endpoints
+    """
+    unread_list = []
+    for notification in user.notifications.unread().prefetch_related(
+        "actor", "target", "action_object"
+    )[0:num_to_fetch]:
+        struct = model_to_dict(notification)
+        struct["slug"] = id2slug(notification.id)
+        if notification.actor:
+            struct["actor"] = str(notification.actor)
+        if notification.target:
+            struct["target"] = str(notification.target)
+        if notification.action_object:
+            struct["action_object"] = str(notification.action_object)
+        if notification.data:
+            struct["data"] = notification.data
+        unread_list.append(struct)
+        if mark_as_read:
+            notification.mark_as_read()
+    return {
+        "unread_count": get_unread_count(user),
+        "unread_list": unread_list,
+    }
+
+
+def notification_saved(sender, instance, **kwargs):
+    transaction.on_commit(lambda: notifications_changed(instance.recipient_id))
+
+
+def notifications_updating(sender, queryset, **kwargs):
+    """
+    Read the recipients before the update, the updated rows may no longer
+    match the queryset afterwards
+    """
+    queryset.notification_recipient_ids = set(
+        queryset.values_list("recipient_id", flat=True).distinct()
+    )
+
+
+def notifications_updated(sender, queryset, **kwargs):
+    recipient_ids = getattr(queryset, "notification_recipient_ids", set())
+    transaction.on_commit(
+        lambda: [notifications_changed(user_id) for user_id in recipient_ids]
+    )
+
+
+def connect_live_signals():
+    """
+    Keep the unread counters and the live streams in step with the
+    notifications, including the ones created by a fan-out
+    """
+    Notification = load_model("notifications", "Notification")
+    post_save.connect(
+        notification_saved, sender=Notification, dispatch_uid="notification_saved"
+    )
+    post_delete.connect(
+        notification_saved, sender=Notification, dispatch_uid="notification_deleted"
+    )
+    pre_bulk_update.connect(
+        notifications_updating,
+        sender=Notification,
+        dispatch_uid="notifications_updating",
+    )
+    post_bulk_update.connect(
+        notifications_updated,
+        sender=Notification,
+        dispatch_uid="notifications_updated",
+    )
@@ -8,6 +8,20 @@ CONFIG_DEFAULTS = {
     "USE_JSONFIELD": False,
     "SOFT_DELETE": False,
     "NUM_TO_FETCH": 10,
+    # Notifications inserted per query by a fan-out
+    "BULK_BATCH_SIZE": 500,
+    # Fan-outs to more recipients are created in the background, 0 to disable
+    "ASYNC_RECIPIENTS": 1000,
+    # Seconds the unread count of a user stays cached
+    "UNREAD_COUNT_TIMEOUT": 300,
+    # Broker delivering the live events, RedisBroker when running several
+    # ASGI processes, e.g. {"url": "redis://localhost:6379/0"} as options
+    "BROKER": "notifications.broker.InProcessBroker",
+    "BROKER_OPTIONS": {},
+    # Seconds between keep-alive comments and before a live stream is
+    # closed, the browser opens it again
+    "STREAM_KEEPALIVE": 30,
+    "STREAM_TIMEOUT": 600,
 }
 
 
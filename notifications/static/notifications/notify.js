@@ -5,6 +5,8 @@ var notify_fetch_count;
 var notify_unread_url;
 var notify_mark_all_unread_url;
 var notify_refresh_period = 15000;
+var notify_stream_url;
+var notify_streaming = false;
 var consecutive_misfires = 0;
 var registered_functions = [];
 
@@ -40,7 +42,40 @@ function register_notifier(func) {
     registered_functions.push(func);
 }
 
+function notify_registered(data) {
+    for (var i = 0; i < registered_functions.length; i++) {
+        registered_functions[i](data);
+    }
+}
+
+function start_notification_stream() {
+    // Receive the notifications pushed by the server, polling stays as the
+    // fallback when the stream is not served (WSGI) or not supported
+    if (!notify_stream_url || typeof EventSource === "undefined") {
+        return false;
+    }
+    var source = new EventSource(
+        notify_stream_url + "?max=" + notify_fetch_count
+    );
+    notify_streaming = true;
+    source.onmessage = function (event) {
+        consecutive_misfires = 0;
+        notify_registered(JSON.parse(event.data));
+    };
+    source.onerror = function () {
+        if (source.readyState === EventSource.CLOSED) {
+            // The browser gave up reconnecting, go back to polling
+            notify_streaming = false;
+            setTimeout(fetch_api_data, notify_refresh_period);
+        }
+    };
+    return true;
+}
+
 function fetch_api_data() {
+    if (notify_streaming) {
+        return;
+    }
     if (registered_functions.length > 0) {
         //only fetch data if a function is setup
         var r = new XMLHttpRequest();
@@ -48,10 +83,7 @@ function fetch_api_data() {
             if (this.readyState === 4) {
                 if (this.status === 200) {
                     consecutive_misfires = 0;
-                    var data = JSON.parse(r.responseText);
-                    for (var i = 0; i < registered_functions.length; i++) {
-                        registered_functions[i](data);
-                    }
+                    notify_registered(JSON.parse(r.responseText));
                 } else {
                     consecutive_misfires++;
                 }
@@ -73,4 +105,8 @@ function fetch_api_data() {
     }
 }
 
-setTimeout(fetch_api_data, 1000);
+setTimeout(function () {
+    if (registered_functions.length === 0 || !start_notification_stream()) {
+        fetch_api_data();
+    }
+}, 1000);
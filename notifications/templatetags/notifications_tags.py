@@ -9,6 +9,8 @@ from django import get_version
 from django.template import Library
 from django.utils.html import format_html
 
+from notifications.live import get_unread_count
+
 try:
     from django.urls import reverse
 except ImportError:
@@ -23,7 +25,7 @@ def notifications_unread(context):
     user = user_context(context)
     if not user:
         return ""
-    return user.notifications.unread().count()
+    return get_unread_count(user)
 
 
 if StrictVersion(get_version()) >= StrictVersion("2.0"):
@@ -52,13 +54,16 @@ def register_notify_callbacks(
     callbacks="",
     api_name="list",
     fetch=5,
+    stream=True,
 ):
     refresh_period = int(refresh_period) * 1000
 
     if api_name == "list":
         api_url = reverse("notifications:live_unread_notification_list")
+        stream_url = reverse("notifications:live_notification_stream") if stream else ""
     elif api_name == "count":
         api_url = reverse("notifications:live_unread_notification_count")
+        stream_url = ""
     else:
         return ""
     definitions = """
@@ -69,6 +74,7 @@ def register_notify_callbacks(
         notify_unread_url='{unread_url}';
         notify_mark_all_unread_url='{mark_all_unread_url}';
         notify_refresh_period={refresh};
+        notify_stream_url='{stream_url}';
     """.format(
         badge_class=badge_class,
         menu_class=menu_class,
@@ -77,6 +83,7 @@ def register_notify_callbacks(
         unread_url=reverse("notifications:unread"),
         mark_all_unread_url=reverse("notifications:mark_all_as_read"),
         fetch_count=fetch,
+        stream_url=stream_url,
     )
 
     script = "<script>" + definitions
@@ -93,7 +100,7 @@ def live_notify_badge(context, badge_class="live_notify_badge"):
         return ""
 
     html = "<span class='{badge_class}'>{unread}</span>".format(
-        badge_class=badge_class, unread=user.notifications.unread().count()
+        badge_class=badge_class, unread=get_unread_count(user)
     )
     return format_html(html)
 
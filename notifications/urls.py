@@ -40,6 +40,11 @@ urlpatterns = [
         views.live_unread_notification_list,
         name="live_unread_notification_list",
     ),
+    pattern(
+        r"^api/stream/$",
+        views.live_notification_stream,
+        name="live_notification_stream",
+    ),
     pattern(
         r"^api/all_list/",
         views.live_all_notification_list,
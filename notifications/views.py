@@ -1,13 +1,18 @@
 # -*- coding: utf-8 -*-
 """ Django Notifications example views """
+import asyncio
+import json
 from distutils.version import (  # pylint: disable=no-name-in-module,import-error
     StrictVersion,
 )
 
+from asgiref.sync import sync_to_async
 from django import get_version
 from django.contrib.auth.decorators import login_required
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
 from django.forms import model_to_dict
-from django.http import HttpResponse  # noqa
+from django.http import HttpResponse, StreamingHttpResponse  # noqa
 from django.shortcuts import get_object_or_404, redirect
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import never_cache
@@ -16,6 +21,8 @@ from swapper import load_model
 
 from base.models import NotificationSound
 from notifications import settings
+from notifications.broker import get_broker
+from notifications.live import get_unread_count, unread_notification_data
 from notifications.settings import get_config
 from notifications.utils import id2slug, slug2id
 
@@ -25,8 +32,6 @@ if StrictVersion(get_version()) >= StrictVersion("1.7.0"):
     from django.http import JsonResponse  # noqa
 else:
     # Django 1.6 doesn't have a proper JsonResponse
-    import json
-
     def date_handler(obj):
         return obj.isoformat() if hasattr(obj, "isoformat") else obj
 
@@ -143,7 +148,7 @@ def live_unread_notification_count(request):
         data = {"unread_count": 0}
     else:
         data = {
-            "unread_count": request.user.notifications.unread().count(),
+            "unread_count": get_unread_count(request.user),
         }
     return JsonResponse(data)
 
@@ -170,29 +175,75 @@ def live_unread_notification_list(request):
     except ValueError:  # If casting to an int fails.
         num_to_fetch = default_num_to_fetch
 
-    unread_list = []
-
-    for notification in request.user.notifications.unread()[0:num_to_fetch]:
-        struct = model_to_dict(notification)
-        struct["slug"] = id2slug(notification.id)
-        if notification.actor:
-            struct["actor"] = str(notification.actor)
-        if notification.target:
-            struct["target"] = str(notification.target)
-        if notification.action_object:
-            struct["action_object"] = str(notification.action_object)
-        if notification.data:
-            struct["data"] = notification.data
-        unread_list.append(struct)
-        if request.GET.get("mark_as_read"):
-            notification.mark_as_read()
-    data = {
-        "unread_count": request.user.notifications.unread().count(),
-        "unread_list": unread_list,
-    }
+    data = unread_notification_data(
+        request.user, num_to_fetch, bool(request.GET.get("mark_as_read"))
+    )
     return JsonResponse(data)
 
 
+async def live_notification_events(user, num_to_fetch):
+    """
+    Server-sent events with the unread notification list of the user, sent
+    when the stream opens and whenever the notifications of the user change
+    """
+    config = get_config()
+    broker = get_broker()
+    queue = broker.subscribe(user.pk)
+    loop = asyncio.get_running_loop()
+    closes_at = loop.time() + config["STREAM_TIMEOUT"]
+    try:
+        while True:
+            data = await sync_to_async(unread_notification_data)(user, num_to_fetch)
+            yield f"data: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n"
+            while True:
+                remaining = closes_at - loop.time()
+                if remaining <= 0:
+                    return
+                try:
+                    await asyncio.wait_for(
+                        queue.get(), min(config["STREAM_KEEPALIVE"], remaining)
+                    )
+                    break
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+            # Send one update for the events received meanwhile
+            while not queue.empty():
+                queue.get_nowait()
+    finally:
+        broker.unsubscribe(user.pk, queue)
+
+
+async def live_notification_stream(request):
+    """
+    Push the unread notification list to the browser. Only served by ASGI,
+    without it the browser keeps polling the live_unread_notification_list
+    endpoint.
+    """
+    if not isinstance(request, ASGIRequest):
+        return HttpResponse(status=204)
+    user = await sync_to_async(
+        lambda: request.user if request.user.is_authenticated else None
+    )()
+    if user is None:
+        return HttpResponse(status=204)
+
+    default_num_to_fetch = get_config()["NUM_TO_FETCH"]
+    try:
+        num_to_fetch = int(request.GET.get("max", default_num_to_fetch))
+        if not (1 <= num_to_fetch <= 100):
+            num_to_fetch = default_num_to_fetch
+    except ValueError:
+        num_to_fetch = default_num_to_fetch
+
+    response = StreamingHttpResponse(
+        live_notification_events(user, num_to_fetch),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
 @never_cache
 def live_all_notification_list(request):
     """Return a json with a unread notification list"""
@@ -10,6 +10,7 @@ import django_filters
 from django import forms
 
 from base.filters import FilterSet
+from horilla.search import name_search_q
 from offboarding.models import (
     Offboarding,
     OffboardingEmployee,
@@ -60,7 +61,9 @@ class PipelineFilter(FilterSet):
             queryset.filter(title__icontains=value)
             | queryset.filter(offboardingstage__title__icontains=value)
             | queryset.filter(
-                offboardingstage__offboardingemployee__employee_id__employee_first_name__icontains=value
+                name_search_q(
+                    value, "offboardingstage__offboardingemployee__employee_id__"
+                )
             )
         ).distinct()
 
@@ -87,7 +90,7 @@ class PipelineStageFilter(FilterSet):
         return (
             queryset.filter(title__icontains=value)
             | queryset.filter(
-                offboardingemployee__employee_id__employee_first_name__icontains=value
+                name_search_q(value, "offboardingemployee__employee_id__")
             )
             | queryset.filter(offboarding_id__title__icontains=value)
         ).distinct()
@@ -129,7 +132,7 @@ class PipelineEmployeeFilter(FilterSet):
         This method is used to add custom search condition
         """
         return (
-            queryset.filter(employee_id__employee_first_name__icontains=value)
+            queryset.filter(name_search_q(value, "employee_id__"))
             | queryset.filter(stage_id__title__icontains=value)
             | queryset.filter(stage_id__offboarding_id__title__icontains=value)
         ).distinct()
@@ -4,8 +4,8 @@ context_processor.py
 This module is used to register context processor`
 """
 
+from base.settings_snapshot import get_settings_snapshot
 from employee.models import Employee
-from payroll.models import tax_models as models
 from payroll.models.models import Deduction
 
 
@@ -13,12 +13,9 @@ def default_currency(request):
     """
     This method will return the currency
     """
-    if models.PayrollSettings.objects.first() is None:
-        settings = models.PayrollSettings()
-        settings.currency_symbol = "$"
-        settings.save()
-    symbol = models.PayrollSettings.objects.first().currency_symbol
-    position = models.PayrollSettings.objects.first().position
+    snapshot = get_settings_snapshot(request)
+    symbol = snapshot["currency_symbol"]
+    position = snapshot["currency_position"]
     return {
         "currency": request.session.get("currency", symbol),
         "position": request.session.get("position", position),
@@ -0,0 +1,142 @@
+import time
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from employee.models import Employee
+from payroll.methods.batch import compute_payslips
+from payroll.views.component_views import payroll_calculation
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the batched payroll engine against the per-employee payroll "
+        "calculation, checking that both produce identical payslip data"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("start_date", help="Pay period start date (YYYY-MM-DD)")
+        parser.add_argument("end_date", help="Pay period end date (YYYY-MM-DD)")
+        parser.add_argument(
+            "--company",
+            type=int,
+            action="append",
+            help="Company id to compute the payslips for, repeatable",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            help="Compute the payslips of the first N employees only",
+        )
+        parser.add_argument(
+            "--sizes",
+            type=int,
+            nargs="+",
+            help=(
+                "Repeat the comparison for the first N employees of every "
+                "given size to show how both paths scale"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        try:
+            start_date = datetime.strptime(options["start_date"], "%Y-%m-%d").date()
+            end_date = datetime.strptime(options["end_date"], "%Y-%m-%d").date()
+        except ValueError as error:
+            raise CommandError(error)
+
+        employees = Employee.objects.filter(
+            contract_set__contract_status="active"
+        ).distinct()
+        if options["company"]:
+            employees = employees.filter(
+                employee_work_info__company_id__in=options["company"]
+            )
+
+        if options["sizes"]:
+            self.stdout.write(
+                f"{'Employees':>10} {'Per employee':>22} {'Batch':>22} {'Speedup':>8}"
+            )
+            for size in options["sizes"]:
+                result = self.compare(
+                    self.first_employees(employees, size), start_date, end_date
+                )
+                self.stdout.write(
+                    f"{result['payslips']:>10} "
+                    f"{result['single_elapsed']:>10.3f}s {result['single_queries']:>7} q "
+                    f"{result['batch_elapsed']:>10.3f}s {result['batch_queries']:>7} q "
+                    f"{result['speedup']:>7.1f}x"
+                )
+                self.write_mismatches(result["mismatches"])
+            return
+
+        if options["limit"]:
+            employees = self.first_employees(employees, options["limit"])
+        result = self.compare(employees, start_date, end_date)
+
+        self.stdout.write(f"Payslips:             {result['payslips']}")
+        self.stdout.write(
+            f"Per employee:         {result['single_elapsed']:.3f}s, "
+            f"{result['single_queries']} queries"
+        )
+        self.stdout.write(
+            f"Batch:                {result['batch_elapsed']:.3f}s, "
+            f"{result['batch_queries']} queries"
+        )
+        if result["batch_elapsed"]:
+            self.stdout.write(f"Speedup:              {result['speedup']:.1f}x")
+        self.write_mismatches(result["mismatches"])
+
+    @staticmethod
+    def first_employees(employees, count):
+        return employees.filter(
+            id__in=list(employees.order_by("id").values_list("id", flat=True))[:count]
+        )
+
+    def compare(self, employees, start_date, end_date):
+        """
+        Compute the payslips of the employees through the batch and through
+        the per employee calculation, with the timings and query counts
+        """
+        with CaptureQueriesContext(connection) as batch_queries:
+            start = time.perf_counter()
+            batch_results = compute_payslips(employees, start_date, end_date)
+            batch_elapsed = time.perf_counter() - start
+
+        with CaptureQueriesContext(connection) as single_queries:
+            start = time.perf_counter()
+            single_results = [
+                payroll_calculation(
+                    result["employee"], result["start_date"], result["end_date"]
+                )
+                for result in batch_results
+            ]
+            single_elapsed = time.perf_counter() - start
+
+        return {
+            "payslips": len(batch_results),
+            "batch_elapsed": batch_elapsed,
+            "batch_queries": len(batch_queries),
+            "single_elapsed": single_elapsed,
+            "single_queries": len(single_queries),
+            "speedup": single_elapsed / batch_elapsed if batch_elapsed else 0,
+            "mismatches": [
+                batch_result["employee"].pk
+                for batch_result, single_result in zip(batch_results, single_results)
+                if batch_result["json_data"] != single_result["json_data"]
+                or set(batch_result["installments"])
+                != set(single_result["installments"])
+            ],
+        }
+
+    def write_mismatches(self, mismatches):
+        if mismatches:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{len(mismatches)} payslips differ, e.g. employees {mismatches[:10]}"
+                )
+            )
+        else:
+            self.stdout.write(self.style.SUCCESS("Payslip data is identical."))
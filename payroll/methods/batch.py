@@ -0,0 +1,448 @@
+"""
+batch.py
+
+Batched payroll engine.
+
+`PayrollBatch` prefetches everything the payslip rules read for a pay period
+(contracts, allowances, deductions, loan installments, attendances, approved
+leaves, tax brackets and the employee fields read by condition based
+components) for a whole set of employees in a handful of
+queries. While a batch is active, the functions in `payroll.methods` answer
+from the prefetched data instead of querying per employee, so the existing
+rules in `payslip_calc` run unchanged over in-memory data.
+"""
+
+import json
+import logging
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+
+from django.apps import apps
+from django.db import transaction
+from django.db.models import Prefetch, Q
+
+from horilla.methods import get_horilla_model_class
+from payroll.methods.conditions import ConditionEvaluator
+from payroll.models.models import (
+    Allowance,
+    Contract,
+    Deduction,
+    MultipleCondition,
+    Payslip,
+)
+from payroll.models.tax_models import TaxBracket
+
+logger = logging.getLogger(__name__)
+
+_batch_locals = threading.local()
+
+
+def get_payroll_batch(employee, start_date, end_date):
+    """
+    Return the active payroll batch if it holds the data of the employee
+    for the given period, otherwise None.
+    """
+    batch = getattr(_batch_locals, "batch", None)
+    if batch is None or not batch.covers(employee, start_date, end_date):
+        return None
+    return batch
+
+
+def get_active_payroll_batch():
+    """
+    Return the active payroll batch of the current thread, if any
+    """
+    return getattr(_batch_locals, "batch", None)
+
+
+def _employee_id(employee):
+    return getattr(employee, "pk", employee)
+
+
+def _relation_ids(components, field_name):
+    """
+    Employee ids of the many to many field of the components, one per row of
+    the relation table, by component id
+    """
+    relation_ids = defaultdict(list)
+    if not components:
+        return relation_ids
+    field = type(components[0])._meta.get_field(field_name)
+    component_column = field.m2m_column_name()
+    employee_column = field.m2m_reverse_name()
+    for component_id, employee_id in (
+        field.remote_field.through.objects.filter(
+            **{f"{component_column}__in": [component.pk for component in components]}
+        )
+        .order_by(component_column, employee_column)
+        .values_list(component_column, employee_column)
+    ):
+        relation_ids[component_id].append(employee_id)
+    return relation_ids
+
+
+class PayrollBatch:
+    """
+    Prefetched payroll data of a pay period for a set of employees
+    """
+
+    def __init__(self, employees, start_date, end_date):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.employees = list(
+            employees.select_related(
+                "employee_work_info",
+                "employee_work_info__department_id",
+                "employee_work_info__job_position_id",
+                "employee_work_info__job_role_id",
+                "employee_work_info__work_type_id",
+                "employee_work_info__shift_id",
+                "employee_work_info__company_id",
+            )
+            if hasattr(employees, "select_related")
+            else employees
+        )
+        self.employee_ids = {employee.pk for employee in self.employees}
+        ids = self.employee_ids
+
+        # Contracts, lowest id first like `.first()` on the unordered queryset
+        self.contracts = defaultdict(list)
+        for contract in (
+            Contract.objects.filter(employee_id__in=ids, contract_status="active")
+            .select_related("filing_status")
+            .order_by("id")
+        ):
+            self.contracts[contract.employee_id_id].append(contract)
+
+        # Allowances and deductions (loans and installments included)
+        candidates = (
+            Q(specific_employees__in=ids)
+            | Q(is_condition_based=True)
+            | Q(include_active_employees=True)
+        )
+        period = ~Q(one_time_date__lt=start_date) & ~Q(one_time_date__gt=end_date)
+        # in id order, the table order the per employee union querysets
+        # return them in
+        conditions = Prefetch(
+            "other_conditions", queryset=MultipleCondition.objects.order_by("id")
+        )
+        self.allowances = list(
+            Allowance.objects.filter(candidates, period)
+            .distinct()
+            .order_by("id")
+            .prefetch_related(conditions)
+        )
+        self.deductions = list(
+            Deduction.objects.filter(candidates, period)
+            .distinct()
+            .order_by("id")
+            .prefetch_related(conditions)
+        )
+        for components in (self.allowances, self.deductions):
+            specific_ids = _relation_ids(components, "specific_employees")
+            exclude_ids = _relation_ids(components, "exclude_employees")
+            for component in components:
+                component.batch_specific_ids = specific_ids.get(component.pk, [])
+                component.batch_exclude_ids = set(exclude_ids.get(component.pk, []))
+        self.deductions_by_id = {
+            deduction.pk: deduction for deduction in self.deductions
+        }
+
+        # Condition based components, compiled once with the employee fields
+        # they read loaded for every employee
+        self.conditions = ConditionEvaluator(self.employees)
+        self.conditions.compile(self.allowances + self.deductions)
+
+        # Attendances of the period
+        self.attendances = defaultdict(list)
+        if apps.is_installed("attendance"):
+            Attendance = get_horilla_model_class(
+                app_label="attendance", model="attendance"
+            )
+            for attendance in Attendance.objects.filter(
+                employee_id__in=ids,
+                attendance_date__range=(start_date, end_date),
+            ).only(
+                "employee_id",
+                "attendance_date",
+                "shift_id",
+                "work_type_id",
+                "attendance_validated",
+                "attendance_overtime_approve",
+                "at_work_second",
+                "overtime_second",
+            ):
+                self.attendances[attendance.employee_id_id].append(attendance)
+
+        # Approved leaves overlapping the period
+        self.approved_leaves = defaultdict(list)
+        if apps.is_installed("leave"):
+            LeaveRequest = get_horilla_model_class(
+                app_label="leave", model="leaverequest"
+            )
+            for leave_request in (
+                LeaveRequest.objects.filter(
+                    employee_id__in=ids,
+                    status="approved",
+                    start_date__lte=end_date,
+                    end_date__gte=start_date,
+                )
+                .select_related("leave_type_id")
+                .order_by("-id")
+            ):
+                self.approved_leaves[leave_request.employee_id_id].append(leave_request)
+
+        # Tax brackets of the filing statuses in use
+        filing_ids = {
+            contract.filing_status_id
+            for contracts in self.contracts.values()
+            for contract in contracts
+            if contract.filing_status_id
+        }
+        self.tax_brackets = defaultdict(list)
+        for bracket in (
+            TaxBracket.objects.filter(filing_status_id__in=filing_ids)
+            .order_by("min_income")
+            .values("filing_status_id", "tax_rate", "min_income", "max_income")
+        ):
+            filing_id = bracket.pop("filing_status_id")
+            self.tax_brackets[filing_id].append(bracket)
+
+    def covers(self, employee, start_date, end_date):
+        """
+        Whether the batch holds the data of the employee for the period
+        """
+        return (
+            _employee_id(employee) in self.employee_ids
+            and self.start_date <= start_date
+            and end_date <= self.end_date
+        )
+
+    @contextmanager
+    def activate(self):
+        """
+        Make the payroll methods of the current thread read from this batch
+        """
+        previous = getattr(_batch_locals, "batch", None)
+        _batch_locals.batch = self
+        try:
+            yield self
+        finally:
+            _batch_locals.batch = previous
+
+    def contract(self, employee, is_active=None):
+        """
+        The active contract of the employee
+        """
+        for contract in self.contracts.get(_employee_id(employee), []):
+            if is_active is None or contract.is_active == is_active:
+                return contract
+        return None
+
+    def get_leaves(self, employee, start_date, end_date):
+        """
+        Approved leave requests of the employee overlapping the period
+        """
+        return [
+            leave_request
+            for leave_request in self.approved_leaves.get(_employee_id(employee), [])
+            if leave_request.start_date <= end_date
+            and (leave_request.end_date or leave_request.start_date) >= start_date
+        ]
+
+    def get_attendances(self, employee, start_date, end_date, **filters):
+        """
+        Attendances of the employee in the period matching the given
+        attendance filter keyword arguments (e.g. `shift_id__id`,
+        `attendance_validated`)
+        """
+        attributes = {
+            key.replace("__id", "_id"): value
+            for key, value in filters.items()
+            if key not in ("employee_id", "attendance_date__range")
+        }
+        return [
+            attendance
+            for attendance in self.attendances.get(_employee_id(employee), [])
+            if start_date <= attendance.attendance_date <= end_date
+            and all(
+                getattr(attendance, attribute) == value
+                for attribute, value in attributes.items()
+            )
+        ]
+
+    @staticmethod
+    def _occurrences(component, employee_id, condition_based):
+        """
+        Number of rows of the component in the per employee union of the
+        specific, (condition based) and all active employee querysets.
+
+        The union left joins the specific employees, so a component taken
+        by the condition based or all active branch comes once per specific
+        employee of the component.
+        """
+        if employee_id not in component.batch_exclude_ids and (
+            component.include_active_employees
+            or (condition_based and component.is_condition_based)
+        ):
+            return max(len(component.batch_specific_ids), 1)
+        return int(employee_id in component.batch_specific_ids)
+
+    @staticmethod
+    def _in_period(component, start_date, end_date):
+        one_time_date = component.one_time_date
+        return one_time_date is None or start_date <= one_time_date <= end_date
+
+    def get_allowances(self, employee, start_date, end_date):
+        """
+        Allowances that may apply to the employee in the period
+        """
+        employee_id = _employee_id(employee)
+        return [
+            allowance
+            for allowance in self.allowances
+            if self._in_period(allowance, start_date, end_date)
+            and self._occurrences(allowance, employee_id, condition_based=True)
+        ]
+
+    def get_deductions(
+        self, employee, start_date, end_date, is_pretax, is_tax, condition_based=True
+    ):
+        """
+        Deductions that may apply to the employee in the period, excluding
+        the ones that update the basic, gross or net pay, repeated like the
+        rows of the per employee queryset
+        """
+        employee_id = _employee_id(employee)
+        return [
+            deduction
+            for deduction in self.deductions
+            if deduction.is_pretax == is_pretax
+            and deduction.is_tax == is_tax
+            and deduction.update_compensation is None
+            and self._in_period(deduction, start_date, end_date)
+            for _ in range(self._occurrences(deduction, employee_id, condition_based))
+        ]
+
+    def get_compensation_deductions(
+        self, employee, compensation_type, start_date, end_date
+    ):
+        """
+        Deductions of the employee that update the basic, gross or net pay
+        """
+        employee_id = _employee_id(employee)
+        return [
+            deduction
+            for deduction in self.deductions
+            if deduction.update_compensation == compensation_type
+            and employee_id in deduction.batch_specific_ids
+            and self._in_period(deduction, start_date, end_date)
+        ]
+
+    def get_deduction(self, deduction_id):
+        return self.deductions_by_id.get(deduction_id)
+
+    def get_tax_brackets(self, filing_status):
+        """
+        Tax brackets of the filing status as `values()` rows
+        """
+        return [
+            dict(bracket) for bracket in self.tax_brackets.get(filing_status.pk, [])
+        ]
+
+
+def payslip_data(payslip, status="draft", group_name=None):
+    """
+    Build the `save_payslip` keyword arguments from a payroll calculation
+    """
+    from payroll.methods.methods import calculate_employer_contribution
+
+    data = {
+        "employee": payslip["employee"],
+        "group_name": group_name,
+        "start_date": payslip["start_date"],
+        "end_date": payslip["end_date"],
+        "status": status,
+        "contract_wage": payslip["contract_wage"],
+        "basic_pay": payslip["basic_pay"],
+        "gross_pay": payslip["gross_pay"],
+        "deduction": payslip["total_deductions"],
+        "net_pay": payslip["net_pay"],
+        "pay_data": json.loads(payslip["json_data"]),
+    }
+    calculate_employer_contribution(data)
+    data["installments"] = payslip["installments"]
+    return data
+
+
+def compute_payslips(employees, start_date, end_date):
+    """
+    Run the payroll calculation of every employee with an active contract
+    over one prefetched batch.
+
+    The period start is moved to the contract start date for contracts
+    starting inside the period; employees whose contract starts after the
+    period are skipped.
+
+    Returns:
+        list: `payroll_calculation` results
+    """
+    from payroll.views.component_views import payroll_calculation
+
+    batch = PayrollBatch(employees, start_date, end_date)
+    results = []
+    with batch.activate():
+        for employee in batch.employees:
+            contract = batch.contract(employee)
+            if contract is None or end_date < contract.contract_start_date:
+                continue
+            employee_start_date = max(start_date, contract.contract_start_date)
+            results.append(payroll_calculation(employee, employee_start_date, end_date))
+    return results
+
+
+def generate_payslips(
+    employees, start_date, end_date, status="draft", group_name=None, batch_size=500
+):
+    """
+    Compute and bulk create the payslips of the employees for the period.
+
+    Employees that already have a payslip for the period are skipped.
+
+    Returns:
+        list: the created Payslip instances
+    """
+    from simple_history.utils import bulk_create_with_history
+
+    from payroll.methods.methods import build_payslip
+
+    existing = set(
+        Payslip.objects.filter(
+            employee_id__in=employees, end_date=end_date
+        ).values_list("employee_id", "start_date")
+    )
+    payslips = []
+    installments = []
+    for payslip in compute_payslips(employees, start_date, end_date):
+        if (payslip["employee"].pk, payslip["start_date"]) in existing:
+            continue
+        data = payslip_data(payslip, status=status, group_name=group_name)
+        payslips.append(build_payslip(Payslip(), **data))
+        installments.append(data["installments"])
+
+    with transaction.atomic():
+        payslips = bulk_create_with_history(payslips, Payslip, batch_size=batch_size)
+        Through = Payslip.installment_ids.through
+        Through.objects.bulk_create(
+            [
+                Through(payslip_id=instance.pk, deduction_id=deduction.pk)
+                for instance, deductions in zip(payslips, installments)
+                for deduction in deductions
+            ],
+            batch_size=batch_size,
+        )
+    logger.info(
+        "%s payslips generated for %s - %s", len(payslips), start_date, end_date
+    )
+    return payslips
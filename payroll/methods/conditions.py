@@ -0,0 +1,196 @@
+"""
+conditions.py
+
+Compiled conditions of condition based allowances and deductions.
+
+The conditions of a component are compiled once into a `ComponentRule` that
+knows which employee fields it reads. `ConditionEvaluator` loads those fields
+for a set of employees with one `values()` query (one more for contract
+fields) and evaluates the rules against the flat rows, instead of walking the
+attribute path of every condition with `dynamic_attr` for every employee and
+every component.
+"""
+
+from collections import defaultdict
+
+from django.core.exceptions import FieldDoesNotExist
+
+from employee.models import Employee
+from payroll.models.models import Contract
+
+CONTRACT_PREFIX = "contract_set__"
+
+
+def get_component_conditions(component):
+    """
+    Returns the (field, condition, value) conditions of a condition based
+    allowance or deduction, the main condition last.
+    """
+    conditions = [
+        (condition.field, condition.condition, condition.value)
+        for condition in sorted(component.other_conditions.all(), key=lambda c: c.pk)
+    ]
+    conditions.append(
+        (
+            component.field,
+            component.condition,
+            component.value.lower().replace(" ", "_"),
+        )
+    )
+    return conditions
+
+
+def is_values_path(model, path):
+    """
+    Whether the attribute path resolves to a single concrete value per
+    instance of the model, so that it can be loaded with `values()`
+    """
+    *relations, field_name = path.split("__")
+    try:
+        for name in relations:
+            field = model._meta.get_field(name)
+            if not (field.many_to_one or field.one_to_one):
+                return False
+            model = field.related_model
+        field = model._meta.get_field(field_name)
+    except FieldDoesNotExist:
+        return False
+    return field.concrete and not field.is_relation
+
+
+class CompiledCondition:
+    """
+    One (field, condition, value) condition
+    """
+
+    def __init__(self, field, condition, value):
+        from payroll.methods.payslip_calc import operator_mapping
+
+        self.field = field
+        self.operator_func = operator_mapping.get(condition)
+        self.value = value
+        self.converted_values = {}
+
+    def __call__(self, employee_value):
+        if employee_value is None:
+            return False
+        value_type = type(employee_value)
+        if value_type not in self.converted_values:
+            self.converted_values[value_type] = value_type(self.value)
+        return bool(
+            self.operator_func(employee_value, self.converted_values[value_type])
+        )
+
+
+class ComponentRule:
+    """
+    The compiled conditions of an allowance or deduction
+    """
+
+    def __init__(self, component, main_only=False):
+        conditions = get_component_conditions(component)
+        if main_only:
+            conditions = conditions[-1:]
+        self.conditions = [CompiledCondition(*condition) for condition in conditions]
+        self.fields = {condition.field for condition in self.conditions}
+
+    def evaluate(self, row):
+        """
+        Whether the employee fields of the row satisfy every condition
+        """
+        return all(condition(row.get(condition.field)) for condition in self.conditions)
+
+
+class ConditionEvaluator:
+    """
+    Evaluates the condition based components of a set of employees
+    """
+
+    def __init__(self, employees):
+        self.employees = {employee.pk: employee for employee in employees}
+        self.rules = {}
+        self.rows = defaultdict(dict)
+        self.loaded_fields = set()
+
+    def rule(self, component, main_only=False):
+        """
+        Returns the compiled rule of the component
+        """
+        key = (component._meta.model_name, component.pk, main_only)
+        if key not in self.rules:
+            self.rules[key] = ComponentRule(component, main_only=main_only)
+        return self.rules[key]
+
+    def compile(self, components, main_only=False):
+        """
+        Compile the condition based components and load the employee fields
+        they read in one go
+        """
+        rules = [
+            self.rule(component, main_only=main_only)
+            for component in components
+            if component.is_condition_based
+        ]
+        self.load({field for rule in rules for field in rule.fields})
+
+    def load(self, fields):
+        """
+        Load the given employee fields of every employee
+        """
+        from payroll.methods.payslip_calc import dynamic_attr
+
+        fields = set(fields) - self.loaded_fields
+        if not fields:
+            return
+        employee_ids = list(self.employees)
+        employee_fields = []
+        contract_fields = {}
+        dynamic_fields = []
+        for field in fields:
+            if field.startswith(CONTRACT_PREFIX):
+                path = field[len(CONTRACT_PREFIX) :]
+                if is_values_path(Contract, path):
+                    contract_fields[field] = path
+                    continue
+            elif is_values_path(Employee, field):
+                employee_fields.append(field)
+                continue
+            dynamic_fields.append(field)
+
+        if employee_fields:
+            for row in (
+                Employee.objects.entire()
+                .filter(id__in=employee_ids)
+                .values("id", *employee_fields)
+            ):
+                self.rows[row.pop("id")].update(row)
+
+        if contract_fields:
+            # The first active contract, like `dynamic_attr` does
+            seen = set()
+            for row in (
+                Contract.objects.filter(employee_id__in=employee_ids, is_active=True)
+                .order_by("id")
+                .values("employee_id", *contract_fields.values())
+            ):
+                employee_id = row["employee_id"]
+                if employee_id in seen:
+                    continue
+                seen.add(employee_id)
+                self.rows[employee_id].update(
+                    {field: row[path] for field, path in contract_fields.items()}
+                )
+
+        for field in dynamic_fields:
+            for employee_id, employee in self.employees.items():
+                self.rows[employee_id][field] = dynamic_attr(employee, field)
+
+        self.loaded_fields.update(fields)
+
+    def applies(self, employee, component, main_only=False):
+        """
+        Whether the condition based component applies to the employee
+        """
+        rule = self.rule(component, main_only=main_only)
+        self.load(rule.fields)
+        return rule.evaluate(self.rows[employee.pk])
@@ -4,6 +4,7 @@ deductions.py
 This module is used to compute the deductions of employees
 """
 
+from payroll.methods.batch import get_payroll_batch
 from payroll.models.models import Deduction
 
 
@@ -16,14 +17,20 @@ def update_compensation_deduction(
     Args:
         compensation_amount (_type_): Gross pay or Basic pay or employee
     """
-    deduction_heads = (
-        Deduction.objects.filter(
-            update_compensation=compensation_type, specific_employees=employee
+    batch = get_payroll_batch(employee, start_date, end_date)
+    if batch is not None:
+        deduction_heads = batch.get_compensation_deductions(
+            employee, compensation_type, start_date, end_date
+        )
+    else:
+        deduction_heads = (
+            Deduction.objects.filter(
+                update_compensation=compensation_type, specific_employees=employee
+            )
+            .exclude(one_time_date__lt=start_date)
+            .exclude(one_time_date__gt=end_date)
+            # .exclude(exclude_employees=employee)
         )
-        .exclude(one_time_date__lt=start_date)
-        .exclude(one_time_date__gt=end_date)
-        # .exclude(exclude_employees=employee)
-    )
     deductions = []
     temp = compensation_amount
     for deduction in deduction_heads:
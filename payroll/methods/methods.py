@@ -13,15 +13,10 @@ from django.core.paginator import Paginator
 from django.db.models import F, Q
 
 # from attendance.models import Attendance
-from base.methods import (
-    get_company_leave_dates,
-    get_date_range,
-    get_holiday_dates,
-    get_pagination,
-    get_working_days,
-)
-from base.models import CompanyLeaves, Holidays
+from base.methods import get_date_range, get_pagination, get_working_days
+from base.work_calendar import get_work_calendar
 from horilla.methods import get_horilla_model_class
+from payroll.methods.batch import get_active_payroll_batch, get_payroll_batch
 from payroll.models.models import Contract, Deduction, Payslip
 
 
@@ -46,6 +41,79 @@ def get_total_days(start_date, end_date):
     return total_days
 
 
+def get_active_contract(employee, start_date, end_date, is_active=None):
+    """
+    This method is used to return the active contract of the employee
+
+    Args:
+        employee (obj): Employee model instance
+        start_date (obj): start date of the period
+        end_date (obj): end date of the period
+        is_active (bool): filter on the is_active flag of the contract
+    """
+    batch = get_payroll_batch(employee, start_date, end_date)
+    if batch is not None:
+        return batch.contract(employee, is_active=is_active)
+    contracts = Contract.objects.filter(employee_id=employee, contract_status="active")
+    if is_active is not None:
+        contracts = contracts.filter(is_active=is_active)
+    return contracts.first()
+
+
+def get_unpaid_half_day_leaves(employee, start_date, end_date):
+    """
+    This method is used to return the number of approved unpaid leaves
+    starting and ending with a half day between the period.
+
+    Returns:
+        tuple: (half day leaves on the start date, half day leaves on the end date)
+    """
+    batch = get_payroll_batch(employee, start_date, end_date)
+    if batch is not None:
+        unpaid_leaves = [
+            leave_request
+            for leave_request in batch.get_leaves(employee, start_date, end_date)
+            if leave_request.leave_type_id.payment == "unpaid"
+        ]
+        start_date_leaves = sum(
+            start_date <= leave_request.start_date <= end_date
+            and leave_request.start_date_breakdown != "full_day"
+            for leave_request in unpaid_leaves
+        )
+        end_date_leaves = sum(
+            leave_request.end_date is not None
+            and start_date <= leave_request.end_date <= end_date
+            and leave_request.end_date_breakdown != "full_day"
+            and leave_request.start_date != leave_request.end_date
+            for leave_request in unpaid_leaves
+        )
+        return start_date_leaves, end_date_leaves
+    if not apps.is_installed("leave"):
+        return 0, 0
+
+    date_range = get_date_range(start_date, end_date)
+    start_date_leaves = (
+        employee.leaverequest_set.filter(
+            leave_type_id__payment="unpaid",
+            start_date__in=date_range,
+            status="approved",
+        )
+        .exclude(start_date_breakdown="full_day")
+        .count()
+    )
+    end_date_leaves = (
+        employee.leaverequest_set.filter(
+            leave_type_id__payment="unpaid",
+            end_date__in=date_range,
+            status="approved",
+        )
+        .exclude(end_date_breakdown="full_day")
+        .exclude(start_date=F("end_date"))
+        .count()
+    )
+    return start_date_leaves, end_date_leaves
+
+
 def get_leaves(employee, start_date, end_date):
     """
     This method is used to return all the leaves taken by the employee
@@ -56,7 +124,10 @@ def get_leaves(employee, start_date, end_date):
         start_date (obj): the start date from the data needed
         end_date (obj): the end date till the date needed
     """
-    if apps.is_installed("leave"):
+    batch = get_payroll_batch(employee, start_date, end_date)
+    if batch is not None:
+        approved_leaves = batch.get_leaves(employee, start_date, end_date)
+    elif apps.is_installed("leave"):
         approved_leaves = employee.leaverequest_set.filter(status="approved")
     else:
         approved_leaves = None
@@ -68,7 +139,7 @@ def get_leaves(employee, start_date, end_date):
     unpaid_leave_dates = []
     company_leave_dates = get_working_days(start_date, end_date)["company_leave_dates"]
 
-    if approved_leaves and approved_leaves.exists():
+    if approved_leaves:
         for instance in approved_leaves:
             if instance.leave_type_id.payment == "paid":
                 # if the taken leave is paid
@@ -122,12 +193,20 @@ if apps.is_installed("attendance"):
             start_date (obj): start date of the period
             end_date (obj): end date of the period
         """
-        Attendance = get_horilla_model_class(app_label="attendance", model="attendance")
-        attendances_on_period = Attendance.objects.filter(
-            employee_id=employee,
-            attendance_date__range=(start_date, end_date),
-            attendance_validated=True,
-        )
+        batch = get_payroll_batch(employee, start_date, end_date)
+        if batch is not None:
+            attendances_on_period = batch.get_attendances(
+                employee, start_date, end_date, attendance_validated=True
+            )
+        else:
+            Attendance = get_horilla_model_class(
+                app_label="attendance", model="attendance"
+            )
+            attendances_on_period = Attendance.objects.filter(
+                employee_id=employee,
+                attendance_date__range=(start_date, end_date),
+                attendance_validated=True,
+            )
         present_on = [
             attendance.attendance_date for attendance in attendances_on_period
         ]
@@ -140,17 +219,9 @@ if apps.is_installed("attendance"):
             - set(attendances_on_period)
             - set(leave_dates)
         )
+        work_calendar = get_work_calendar()
         conflict_dates = conflict_dates + [
-            date
-            for date in present_on
-            if date in get_holiday_dates(start_date, end_date)
-            or date
-            in list(
-                set(
-                    get_company_leave_dates(start_date.year)
-                    + get_company_leave_dates(end_date.year)
-                )
-            )
+            date for date in present_on if not work_calendar.is_working_day(date)
         ]
 
         return {
@@ -238,37 +309,19 @@ def daily_computation(employee, wage, start_date, end_date):
 
     leave_data = get_leaves(employee, start_date, end_date)
 
-    contract = employee.contract_set.filter(contract_status="active").first()
     basic_pay = wage * total_working_days
     loss_of_pay = 0
 
-    date_range = get_date_range(start_date, end_date)
-    half_day_leaves_between_period_on_start_date = (
-        employee.leaverequest_set.filter(
-            leave_type_id__payment="unpaid",
-            start_date__in=date_range,
-            status="approved",
-        )
-        .exclude(start_date_breakdown="full_day")
-        .count()
-    )
-
-    half_day_leaves_between_period_on_end_date = (
-        employee.leaverequest_set.filter(
-            leave_type_id__payment="unpaid", end_date__in=date_range, status="approved"
-        )
-        .exclude(end_date_breakdown="full_day")
-        .exclude(start_date=F("end_date"))
-        .count()
-    )
+    (
+        half_day_leaves_between_period_on_start_date,
+        half_day_leaves_between_period_on_end_date,
+    ) = get_unpaid_half_day_leaves(employee, start_date, end_date)
     unpaid_half_leaves = (
         half_day_leaves_between_period_on_start_date
         + half_day_leaves_between_period_on_end_date
     ) * 0.5
 
-    contract = employee.contract_set.filter(
-        is_active=True, contract_status="active"
-    ).first()
+    contract = get_active_contract(employee, start_date, end_date, is_active=True)
 
     unpaid_leaves = leave_data["unpaid_leaves"] - unpaid_half_leaves
     if contract.calculate_daily_leave_amount:
@@ -431,32 +484,10 @@ def monthly_computation(employee, wage, start_date, end_date, *args, **kwargs):
             data["working_days_on_period"] * data["per_day_amount"]
         )
 
-    contract = employee.contract_set.filter(contract_status="active").first()
     loss_of_pay = 0
-    date_range = get_date_range(start_date, end_date)
-    if apps.is_installed("leave"):
-        start_date_leaves = (
-            employee.leaverequest_set.filter(
-                leave_type_id__payment="unpaid",
-                start_date__in=date_range,
-                status="approved",
-            )
-            .exclude(start_date_breakdown="full_day")
-            .count()
-        )
-        end_date_leaves = (
-            employee.leaverequest_set.filter(
-                leave_type_id__payment="unpaid",
-                end_date__in=date_range,
-                status="approved",
-            )
-            .exclude(end_date_breakdown="full_day")
-            .exclude(start_date=F("end_date"))
-            .count()
-        )
-    else:
-        start_date_leaves = 0
-        end_date_leaves = 0
+    start_date_leaves, end_date_leaves = get_unpaid_half_day_leaves(
+        employee, start_date, end_date
+    )
 
     half_day_leaves_between_period_on_start_date = start_date_leaves
 
@@ -467,9 +498,7 @@ def monthly_computation(employee, wage, start_date, end_date, *args, **kwargs):
         + half_day_leaves_between_period_on_end_date
     ) * 0.5
 
-    contract = employee.contract_set.filter(
-        is_active=True, contract_status="active"
-    ).first()
+    contract = get_active_contract(employee, start_date, end_date, is_active=True)
     unpaid_leaves = abs(leave_data["unpaid_leaves"] - unpaid_half_leaves)
     paid_days = month_data[0]["working_days_on_period"] - unpaid_leaves
     daily_computed_salary = get_daily_salary(wage=wage, wage_date=start_date)[
@@ -502,9 +531,7 @@ def compute_salary_on_period(employee, start_date, end_date, wage=None):
         start_date (obj): start date of the period
         end_date (obj): end date of the period
     """
-    contract = Contract.objects.filter(
-        employee_id=employee, contract_status="active"
-    ).first()
+    contract = get_active_contract(employee, start_date, end_date)
     if contract is None:
         return contract
 
@@ -555,9 +582,14 @@ def calculate_employer_contribution(data):
                     deduction.get("deduction_id")
                     and deduction.get("employer_contribution_rate", 0) > 0
                 ):
-                    object = Deduction.objects.filter(
-                        id=deduction.get("deduction_id")
-                    ).first()
+                    batch = get_active_payroll_batch()
+                    object = batch and batch.get_deduction(
+                        deduction.get("deduction_id")
+                    )
+                    if object is None:
+                        object = Deduction.objects.filter(
+                            id=deduction.get("deduction_id")
+                        ).first()
                     if object:
                         amount = pay_head_data.get(object.based_on)
                         employer_contribution_amount = (
@@ -580,6 +612,16 @@ def save_payslip(**kwargs):
         end_date=kwargs["end_date"],
     ).first()
     instance = filtered_instance if filtered_instance is not None else Payslip()
+    build_payslip(instance, **kwargs)
+    instance.save()
+    instance.installment_ids.set(kwargs["installments"])
+    return instance
+
+
+def build_payslip(instance, **kwargs):
+    """
+    This method is used to set the generated payslip values on the instance
+    """
     instance.employee_id = kwargs["employee"]
     instance.group_name = kwargs.get("group_name")
     instance.start_date = kwargs["start_date"]
@@ -591,6 +633,4 @@ def save_payslip(**kwargs):
     instance.deduction = round(kwargs["deduction"], 2)
     instance.net_pay = round(kwargs["net_pay"], 2)
     instance.pay_head_data = kwargs["pay_data"]
-    instance.save()
-    instance.installment_ids.set(kwargs["installments"])
     return instance
@@ -12,6 +12,8 @@ from django.apps import apps
 
 # from attendance.models import Attendance
 from horilla.methods import get_horilla_model_class
+from payroll.methods.batch import get_payroll_batch
+from payroll.methods.conditions import ConditionEvaluator
 from payroll.methods.deductions import update_compensation_deduction
 from payroll.methods.limits import compute_limit
 from payroll.models import models
@@ -201,6 +203,44 @@ def dynamic_attr(obj, attribute_path):
     return obj
 
 
+def get_condition_evaluator(employee, start_date, end_date):
+    """
+    Returns the condition evaluator of the active payroll batch, or one for
+    the employee alone.
+    """
+    batch = get_payroll_batch(employee, start_date, end_date)
+    if batch is not None:
+        return batch.conditions
+    return ConditionEvaluator([employee])
+
+
+def get_attendances(employee, start_date, end_date, **filters):
+    """
+    Returns the attendances of the employee in the period matching the filters,
+    from the active payroll batch when there is one.
+    """
+    batch = get_payroll_batch(employee, start_date, end_date)
+    if batch is not None:
+        return batch.get_attendances(employee, start_date, end_date, **filters)
+    Attendance = get_horilla_model_class(app_label="attendance", model="attendance")
+    filters = {
+        **filters,
+        "employee_id": employee,
+        "attendance_date__range": (start_date, end_date),
+    }
+    return Attendance.objects.filter(**filters)
+
+
+def count_attendances(employee, start_date, end_date, **filters):
+    """
+    Returns the number of attendances of the employee in the period matching the filters
+    """
+    attendances = get_attendances(employee, start_date, end_date, **filters)
+    if isinstance(attendances, list):
+        return len(attendances)
+    return attendances.count()
+
+
 def calculate_gross_pay(*_args, **kwargs):
     """
     Calculate the gross pay for an employee within a given date range.
@@ -281,53 +321,38 @@ def calculate_allowance(**kwargs):
     end_date = kwargs["end_date"]
     basic_pay = kwargs["basic_pay"]
     day_dict = kwargs["day_dict"]
-    specific_allowances = Allowance.objects.filter(specific_employees=employee)
-    conditional_allowances = Allowance.objects.filter(is_condition_based=True).exclude(
-        exclude_employees=employee
-    )
-    active_employees = Allowance.objects.filter(include_active_employees=True).exclude(
-        exclude_employees=employee
-    )
-
-    allowances = specific_allowances | conditional_allowances | active_employees
-
-    allowances = (
-        allowances.exclude(one_time_date__lt=start_date)
-        .exclude(one_time_date__gt=end_date)
-        .distinct()
-    )
+    batch = get_payroll_batch(employee, start_date, end_date)
+    if batch is not None:
+        allowances = batch.get_allowances(employee, start_date, end_date)
+    else:
+        specific_allowances = Allowance.objects.filter(specific_employees=employee)
+        conditional_allowances = Allowance.objects.filter(
+            is_condition_based=True
+        ).exclude(exclude_employees=employee)
+        active_employees = Allowance.objects.filter(
+            include_active_employees=True
+        ).exclude(exclude_employees=employee)
+
+        allowances = specific_allowances | conditional_allowances | active_employees
+
+        allowances = (
+            allowances.exclude(one_time_date__lt=start_date)
+            .exclude(one_time_date__gt=end_date)
+            .distinct()
+            .prefetch_related("other_conditions")
+        )
 
     employee_allowances = []
     tax_allowances = []
     no_tax_allowances = []
     tax_allowances_amt = []
     no_tax_allowances_amt = []
+    conditions = get_condition_evaluator(employee, start_date, end_date)
+    conditions.compile(allowances)
     # Append allowances based on condition, or unconditionally to employee
     for allowance in allowances:
         if allowance.is_condition_based:
-            conditions = list(
-                allowance.other_conditions.values_list("field", "condition", "value")
-            )
-            condition_field = allowance.field
-            condition_operator = allowance.condition
-            condition_value = allowance.value.lower().replace(" ", "_")
-            conditions.append((condition_field, condition_operator, condition_value))
-            applicable = True
-            for condition in conditions:
-                val = dynamic_attr(employee, condition[0])
-                if val is not None:
-                    operator_func = operator_mapping.get(condition[1])
-                    condition_value = type(val)(condition[2])
-                    if operator_func(val, condition_value):
-                        applicable = applicable * True
-                        continue
-                    else:
-                        applicable = False
-                        break
-                else:
-                    applicable = False
-                    break
-            if applicable:
+            if conditions.applies(employee, allowance):
                 employee_allowances.append(allowance)
         else:
             if allowance.based_on in filter_mapping:
@@ -335,10 +360,7 @@ def calculate_allowance(**kwargs):
                     employee, allowance, start_date, end_date
                 )
                 if apps.is_installed("attendance"):
-                    Attendance = get_horilla_model_class(
-                        app_label="attendance", model="attendance"
-                    )
-                    if Attendance.objects.filter(**filter_params):
+                    if get_attendances(employee, start_date, end_date, **filter_params):
                         employee_allowances.append(allowance)
             else:
                 employee_allowances.append(allowance)
@@ -424,6 +446,42 @@ def calculate_allowance(**kwargs):
     return {"allowances": serialized_allowances}
 
 
+def get_period_deductions(employee, start_date, end_date, is_pretax, is_tax):
+    """
+    Returns the specific, condition based and all active employee deductions
+    of the employee for the period, excluding the ones that update the basic,
+    gross or net pay.
+    """
+    batch = get_payroll_batch(employee, start_date, end_date)
+    if batch is not None:
+        return batch.get_deductions(
+            employee, start_date, end_date, is_pretax=is_pretax, is_tax=is_tax
+        )
+    specific_deductions = models.Deduction.objects.filter(
+        specific_employees=employee, is_pretax=is_pretax, is_tax=is_tax
+    )
+    conditional_deduction = models.Deduction.objects.filter(
+        is_condition_based=True, is_pretax=is_pretax, is_tax=is_tax
+    ).exclude(exclude_employees=employee)
+    active_employee_deduction = models.Deduction.objects.filter(
+        include_active_employees=True, is_pretax=is_pretax, is_tax=is_tax
+    ).exclude(exclude_employees=employee)
+    deductions = specific_deductions | conditional_deduction | active_employee_deduction
+    return (
+        deductions.exclude(one_time_date__lt=start_date)
+        .exclude(one_time_date__gt=end_date)
+        .exclude(update_compensation__isnull=False)
+        .prefetch_related("other_conditions")
+    )
+
+
+def get_installments(deductions):
+    """
+    Returns the loan installment deductions as a set
+    """
+    return {deduction for deduction in deductions if deduction.is_installment}
+
+
 def calculate_tax_deduction(*_args, **kwargs):
     """
     Calculates the tax deductions for the specified employee within the given date range.
@@ -443,18 +501,29 @@ def calculate_tax_deduction(*_args, **kwargs):
     employee = kwargs["employee"]
     start_date = kwargs["start_date"]
     end_date = kwargs["end_date"]
-    specific_deductions = models.Deduction.objects.filter(
-        specific_employees=employee, is_pretax=False, is_tax=True
-    )
-    active_employee_deduction = models.Deduction.objects.filter(
-        include_active_employees=True, is_pretax=False, is_tax=True
-    ).exclude(exclude_employees=employee)
-    deductions = specific_deductions | active_employee_deduction
-    deductions = (
-        deductions.exclude(one_time_date__lt=start_date)
-        .exclude(one_time_date__gt=end_date)
-        .exclude(update_compensation__isnull=False)
-    )
+    batch = get_payroll_batch(employee, start_date, end_date)
+    if batch is not None:
+        deductions = batch.get_deductions(
+            employee,
+            start_date,
+            end_date,
+            is_pretax=False,
+            is_tax=True,
+            condition_based=False,
+        )
+    else:
+        specific_deductions = models.Deduction.objects.filter(
+            specific_employees=employee, is_pretax=False, is_tax=True
+        )
+        active_employee_deduction = models.Deduction.objects.filter(
+            include_active_employees=True, is_pretax=False, is_tax=True
+        ).exclude(exclude_employees=employee)
+        deductions = specific_deductions | active_employee_deduction
+        deductions = (
+            deductions.exclude(one_time_date__lt=start_date)
+            .exclude(one_time_date__gt=end_date)
+            .exclude(update_compensation__isnull=False)
+        )
     deductions_amt = []
     serialized_deductions = []
     for deduction in deductions:
@@ -505,55 +574,21 @@ def calculate_pre_tax_deduction(*_args, **kwargs):
     start_date = kwargs["start_date"]
     end_date = kwargs["end_date"]
 
-    specific_deductions = models.Deduction.objects.filter(
-        specific_employees=employee, is_pretax=True, is_tax=False
-    )
-    conditional_deduction = models.Deduction.objects.filter(
-        is_condition_based=True, is_pretax=True, is_tax=False
-    ).exclude(exclude_employees=employee)
-    active_employee_deduction = models.Deduction.objects.filter(
-        include_active_employees=True, is_pretax=True, is_tax=False
-    ).exclude(exclude_employees=employee)
-
-    deductions = specific_deductions | conditional_deduction | active_employee_deduction
-    deductions = (
-        deductions.exclude(one_time_date__lt=start_date)
-        .exclude(one_time_date__gt=end_date)
-        .exclude(update_compensation__isnull=False)
+    deductions = get_period_deductions(
+        employee, start_date, end_date, is_pretax=True, is_tax=False
     )
     # Installment deductions
-    installments = deductions.filter(is_installment=True)
+    installments = get_installments(deductions)
 
     pre_tax_deductions = []
     pre_tax_deductions_amt = []
     serialized_deductions = []
 
+    conditions = get_condition_evaluator(employee, start_date, end_date)
+    conditions.compile(deductions)
     for deduction in deductions:
         if deduction.is_condition_based:
-            conditions = list(
-                deduction.other_conditions.values_list("field", "condition", "value")
-            )
-            condition_field = deduction.field
-            condition_operator = deduction.condition
-            condition_value = deduction.value.lower().replace(" ", "_")
-            conditions.append((condition_field, condition_operator, condition_value))
-            operator_func = operator_mapping.get(condition_operator)
-            applicable = True
-            for condition in conditions:
-                val = dynamic_attr(employee, condition[0])
-                if val is not None:
-                    operator_func = operator_mapping.get(condition[1])
-                    condition_value = type(val)(condition[2])
-                    if operator_func(val, condition_value):
-                        applicable = applicable * True
-                        continue
-                    else:
-                        applicable = False
-                        break
-                else:
-                    applicable = False
-                    break
-            if applicable:
+            if conditions.applies(employee, deduction):
                 pre_tax_deductions.append(deduction)
         else:
             pre_tax_deductions.append(deduction)
@@ -613,40 +648,24 @@ def calculate_post_tax_deduction(*_args, **kwargs):
     total_allowance = kwargs["total_allowance"]
     basic_pay = kwargs["basic_pay"]
     day_dict = kwargs["day_dict"]
-    specific_deductions = models.Deduction.objects.filter(
-        specific_employees=employee, is_pretax=False, is_tax=False
-    )
-    conditional_deduction = models.Deduction.objects.filter(
-        is_condition_based=True, is_pretax=False, is_tax=False
-    ).exclude(exclude_employees=employee)
-    active_employee_deduction = models.Deduction.objects.filter(
-        include_active_employees=True, is_pretax=False, is_tax=False
-    ).exclude(exclude_employees=employee)
-    deductions = specific_deductions | conditional_deduction | active_employee_deduction
-    deductions = (
-        deductions.exclude(one_time_date__lt=start_date)
-        .exclude(one_time_date__gt=end_date)
-        .exclude(update_compensation__isnull=False)
+    deductions = get_period_deductions(
+        employee, start_date, end_date, is_pretax=False, is_tax=False
     )
     # Installment deductions
-    installments = deductions.filter(is_installment=True)
+    installments = get_installments(deductions)
 
     post_tax_deductions = []
     post_tax_deductions_amt = []
     serialized_deductions = []
     serialized_net_pay_deductions = []
 
+    # Only the main condition is checked for post tax deductions
+    conditions = get_condition_evaluator(employee, start_date, end_date)
+    conditions.compile(deductions, main_only=True)
     for deduction in deductions:
         if deduction.is_condition_based:
-            condition_field = deduction.field
-            condition_operator = deduction.condition
-            condition_value = deduction.value.lower().replace(" ", "_")
-            employee_value = dynamic_attr(employee, condition_field)
-            operator_func = operator_mapping.get(condition_operator)
-            if employee_value is not None:
-                condition_value = type(employee_value)(condition_value)
-                if operator_func(employee_value, condition_value):
-                    post_tax_deductions.append(deduction)
+            if conditions.applies(employee, deduction, main_only=True):
+                post_tax_deductions.append(deduction)
         else:
             post_tax_deductions.append(deduction)
     for deduction in post_tax_deductions:
@@ -883,18 +902,13 @@ def calculate_based_on_attendance(*_args, **kwargs):
     if not apps.is_installed("attendance"):
         return 0
 
-    Attendance = get_horilla_model_class(app_label="attendance", model="attendance")
     employee = kwargs["employee"]
     start_date = kwargs["start_date"]
     end_date = kwargs["end_date"]
     component = kwargs["component"]
     day_dict = kwargs["day_dict"]
 
-    count = Attendance.objects.filter(
-        employee_id=employee,
-        attendance_date__range=(start_date, end_date),
-        attendance_validated=True,
-    ).count()
+    count = count_attendances(employee, start_date, end_date, attendance_validated=True)
     amount = count * component.per_attendance_fixed_amount
     amount = compute_limit(component, amount, day_dict)
     return amount
@@ -917,7 +931,6 @@ def calculate_based_on_shift(*_args, **kwargs):
     if not apps.is_installed("attendance"):
         return 0
 
-    Attendance = get_horilla_model_class(app_label="attendance", model="attendance")
     employee = kwargs["employee"]
     start_date = kwargs["start_date"]
     end_date = kwargs["end_date"]
@@ -925,12 +938,13 @@ def calculate_based_on_shift(*_args, **kwargs):
     day_dict = kwargs["day_dict"]
 
     shift_id = component.shift_id.id
-    count = Attendance.objects.filter(
-        employee_id=employee,
-        shift_id=shift_id,
-        attendance_date__range=(start_date, end_date),
+    count = count_attendances(
+        employee,
+        start_date,
+        end_date,
+        shift_id__id=shift_id,
         attendance_validated=True,
-    ).count()
+    )
     amount = count * component.shift_per_attendance_amount
 
     amount = compute_limit(component, amount, day_dict)
@@ -954,17 +968,14 @@ def calculate_based_on_overtime(*_args, **kwargs):
     if not apps.is_installed("attendance"):
         return 0
 
-    Attendance = get_horilla_model_class(app_label="attendance", model="attendance")
     employee = kwargs["employee"]
     start_date = kwargs["start_date"]
     end_date = kwargs["end_date"]
     component = kwargs["component"]
     day_dict = kwargs["day_dict"]
 
-    attendances = Attendance.objects.filter(
-        employee_id=employee,
-        attendance_date__range=(start_date, end_date),
-        attendance_overtime_approve=True,
+    attendances = get_attendances(
+        employee, start_date, end_date, attendance_overtime_approve=True
     )
     overtime = sum(attendance.overtime_second for attendance in attendances)
     amount_per_hour = component.amount_per_one_hr
@@ -996,7 +1007,6 @@ def calculate_based_on_work_type(*_args, **kwargs):
     if not apps.is_installed("attendance"):
         return 0
 
-    Attendance = get_horilla_model_class(app_label="attendance", model="attendance")
     employee = kwargs["employee"]
     start_date = kwargs["start_date"]
     end_date = kwargs["end_date"]
@@ -1004,12 +1014,13 @@ def calculate_based_on_work_type(*_args, **kwargs):
     day_dict = kwargs["day_dict"]
 
     work_type_id = component.work_type_id.id
-    count = Attendance.objects.filter(
-        employee_id=employee,
-        work_type_id=work_type_id,
-        attendance_date__range=(start_date, end_date),
+    count = count_attendances(
+        employee,
+        start_date,
+        end_date,
+        work_type_id__id=work_type_id,
         attendance_validated=True,
-    ).count()
+    )
     amount = count * component.work_type_per_attendance_amount
 
     amount = compute_limit(component, amount, day_dict)
@@ -4,17 +4,15 @@ scheduler.py
 This module is used to register scheduled tasks
 """
 
-import json
 import sys
 from datetime import date, timedelta
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from dateutil.relativedelta import relativedelta
 
-from payroll.methods.methods import calculate_employer_contribution, save_payslip
-from payroll.views.component_views import payroll_calculation
+from payroll.methods.batch import generate_payslips
 
-from .models.models import Contract, Payslip
+from .models.models import Contract
 
 
 def expire_contract():
@@ -56,36 +54,8 @@ def generate_payslip(date, companies, all):
     # find the date range
     start_date = date - relativedelta(months=1)
     end_date = date - timedelta(days=1)
-    # Payslip creation
-    for employee in active_employees:
-        payslip = Payslip.objects.filter(
-            employee_id=employee, start_date=start_date, end_date=end_date
-        ).first()
-        if payslip:
-            continue
-        contract = Contract.objects.filter(
-            employee_id=employee, contract_status="active"
-        ).first()
-        if end_date < contract.contract_start_date:
-            continue
-        if start_date < contract.contract_start_date:
-            start_date = contract.contract_start_date
-        payslip_data = payroll_calculation(employee, start_date, end_date)
-        payslip_data["payslip"] = payslip
-        data = {}
-        data["employee"] = employee
-        data["start_date"] = payslip_data["start_date"]
-        data["end_date"] = payslip_data["end_date"]
-        data["status"] = "draft"
-        data["contract_wage"] = payslip_data["contract_wage"]
-        data["basic_pay"] = payslip_data["basic_pay"]
-        data["gross_pay"] = payslip_data["gross_pay"]
-        data["deduction"] = payslip_data["total_deductions"]
-        data["net_pay"] = payslip_data["net_pay"]
-        data["pay_data"] = json.loads(payslip_data["json_data"])
-        calculate_employer_contribution(data)
-        data["installments"] = payslip_data["installments"]
-        payslip_data["instance"] = save_payslip(**data)
+    # Payslip creation, computed for all the employees in one batch
+    generate_payslips(active_employees, start_date, end_date)
 
 
 def is_last_day_of_month(date):
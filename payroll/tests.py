@@ -1,5 +1,287 @@
 """test cases"""
 
-from django.test import TestCase
+import json
+from datetime import date, timedelta
 
-# Create your tests here.
+from django.test import RequestFactory, TestCase
+
+from attendance.models import Attendance
+from employee.models import Employee
+from horilla.horilla_middlewares import _thread_locals
+from leave.models import LeaveRequest, LeaveType
+from payroll.methods.batch import compute_payslips
+from payroll.models.models import Allowance, Contract, Deduction, LoanAccount
+from payroll.views.component_views import payroll_calculation
+
+
+class PayrollBatchParityTest(TestCase):
+    """
+    The batched payroll engine computes the same payslips as the per-employee
+    payroll calculation
+    """
+
+    start_date = date(2024, 1, 1)
+    end_date = date(2024, 1, 31)
+
+    @classmethod
+    def create_employee(cls, first_name, contract_start_date=None, gender="male"):
+        employee = Employee.objects.create(
+            employee_first_name=first_name,
+            employee_last_name="Payroll",
+            email=f"{first_name.lower()}.payroll@example.com",
+            phone="9999999999",
+            gender=gender,
+        )
+        if contract_start_date is not None:
+            Contract.objects.create(
+                contract_name=f"{first_name} contract",
+                employee_id=employee,
+                contract_start_date=contract_start_date,
+                wage_type="monthly",
+                pay_frequency="monthly",
+                wage=31000,
+                contract_status="active",
+            )
+        return employee
+
+    @classmethod
+    def setUpTestData(cls):
+        # The mid period employee is created first so that a start date
+        # leaking from one employee to the next would show
+        cls.mid_period = cls.create_employee("Mid", date(2024, 1, 15))
+        cls.full_period = cls.create_employee("Full", date(2023, 6, 1), "female")
+        cls.no_contract = cls.create_employee("None")
+        cls.employees = Employee.objects.filter(
+            pk__in=[cls.mid_period.pk, cls.full_period.pk, cls.no_contract.pk]
+        ).order_by("pk")
+
+        # Pay head and leave type saves read the selected company of the request
+        previous_request = getattr(_thread_locals, "request", None)
+        _thread_locals.request = RequestFactory().get("/")
+        _thread_locals.request.session = {}
+        try:
+            cls.create_pay_heads()
+            # The loan allowance on the provided date and one installment in
+            # the period
+            LoanAccount.objects.create(
+                title="Car loan",
+                employee_id=cls.full_period,
+                loan_amount=3000,
+                provided_date=date(2024, 1, 5),
+                installments=3,
+                installment_start_date=date(2024, 1, 31),
+            )
+            cls.create_leaves()
+        finally:
+            _thread_locals.request = previous_request
+        cls.create_attendances()
+
+    @staticmethod
+    def create_pay_head(model, specific=(), exclude=(), **fields):
+        pay_head = model(**fields)
+        pay_head.save()
+        pay_head.specific_employees.add(*specific)
+        pay_head.exclude_employees.add(*exclude)
+        return pay_head
+
+    @classmethod
+    def create_pay_heads(cls):
+        both = [cls.mid_period, cls.full_period]
+        cls.create_pay_head(
+            Allowance, specific=[cls.full_period], title="Travel", amount=1000
+        )
+        cls.create_pay_head(
+            Allowance,
+            exclude=[cls.mid_period],
+            title="Housing",
+            include_active_employees=True,
+            is_fixed=False,
+            based_on="basic_pay",
+            rate=10,
+        )
+        cls.create_pay_head(
+            Allowance,
+            title="Female",
+            is_condition_based=True,
+            field="gender",
+            condition="equal",
+            value="Female",
+            amount=500,
+            is_taxable=False,
+        )
+        cls.create_pay_head(
+            Allowance,
+            specific=both,
+            title="Per attendance",
+            include_active_employees=True,
+            is_fixed=False,
+            based_on="attendance",
+            per_attendance_fixed_amount=100,
+        )
+
+        cls.create_pay_head(
+            Deduction,
+            specific=both,
+            title="Pension",
+            is_pretax=True,
+            is_fixed=False,
+            based_on="basic_pay",
+            rate=5,
+        )
+        cls.create_pay_head(
+            Deduction,
+            title="Male welfare",
+            is_pretax=False,
+            is_condition_based=True,
+            field="gender",
+            condition="equal",
+            value="Male",
+            amount=200,
+        )
+        # All active employee deductions with specific employees come once
+        # per specific employee from the per employee queryset
+        cls.create_pay_head(
+            Deduction,
+            specific=both,
+            title="Professional tax",
+            is_pretax=False,
+            is_tax=True,
+            include_active_employees=True,
+            amount=300,
+        )
+        cls.create_pay_head(
+            Deduction,
+            exclude=[cls.full_period],
+            title="Canteen",
+            is_pretax=False,
+            include_active_employees=True,
+            amount=50,
+        )
+
+    @classmethod
+    def create_attendances(cls):
+        attendances = [
+            Attendance(
+                employee_id=employee,
+                attendance_date=attendance_date,
+                attendance_validated=validated,
+                attendance_worked_hour="08:00",
+                at_work_second=8 * 3600,
+            )
+            for employee, first_day, days in (
+                (cls.full_period, date(2024, 1, 2), 6),
+                (cls.mid_period, date(2024, 1, 16), 3),
+            )
+            for attendance_date, validated in (
+                (first_day + timedelta(days=day), day < days - 1) for day in range(days)
+            )
+        ]
+        Attendance.objects.bulk_create(attendances)
+
+    @classmethod
+    def create_leaves(cls):
+        unpaid = LeaveType.objects.create(name="Unpaid", payment="unpaid")
+        paid = LeaveType.objects.create(name="Casual", payment="paid")
+        leaves = [
+            (cls.full_period, unpaid, date(2024, 1, 10), date(2024, 1, 10), "approved"),
+            (cls.full_period, paid, date(2024, 1, 22), date(2024, 1, 23), "approved"),
+            (cls.full_period, paid, date(2024, 1, 24), date(2024, 1, 24), "requested"),
+            (cls.mid_period, unpaid, date(2024, 1, 18), date(2024, 1, 19), "approved"),
+        ]
+        LeaveRequest.objects.bulk_create(
+            [
+                LeaveRequest(
+                    employee_id=employee,
+                    leave_type_id=leave_type,
+                    start_date=start_date,
+                    end_date=end_date,
+                    requested_days=(end_date - start_date).days + 1,
+                    status=status,
+                    description="Payroll",
+                )
+                for employee, leave_type, start_date, end_date, status in leaves
+            ]
+            + [
+                # Unpaid half days on the start and on the end of a leave
+                LeaveRequest(
+                    employee_id=cls.full_period,
+                    leave_type_id=unpaid,
+                    start_date=date(2024, 1, 12),
+                    start_date_breakdown="second_half",
+                    end_date=date(2024, 1, 12),
+                    requested_days=0.5,
+                    status="approved",
+                    description="Payroll",
+                ),
+                LeaveRequest(
+                    employee_id=cls.mid_period,
+                    leave_type_id=unpaid,
+                    start_date=date(2024, 1, 25),
+                    end_date=date(2024, 1, 26),
+                    end_date_breakdown="first_half",
+                    requested_days=1.5,
+                    status="approved",
+                    description="Payroll",
+                ),
+            ]
+        )
+
+    def per_employee_payslip(self, employee):
+        contract = Contract.objects.filter(
+            employee_id=employee, contract_status="active"
+        ).first()
+        if contract is None:
+            return None
+        start_date = max(self.start_date, contract.contract_start_date)
+        return payroll_calculation(employee, start_date, self.end_date)
+
+    def test_batch_matches_per_employee_calculation(self):
+        batch_payslips = {
+            payslip["employee"].pk: payslip
+            for payslip in compute_payslips(
+                self.employees, self.start_date, self.end_date
+            )
+        }
+        for employee in self.employees:
+            payslip = self.per_employee_payslip(employee)
+            if payslip is None:
+                self.assertNotIn(employee.pk, batch_payslips)
+                continue
+            batch_payslip = batch_payslips[employee.pk]
+            self.assertEqual(batch_payslip["start_date"], payslip["start_date"])
+            self.assertEqual(batch_payslip["end_date"], payslip["end_date"])
+            self.assertEqual(batch_payslip["json_data"], payslip["json_data"])
+            self.assertEqual(
+                set(batch_payslip["installments"]), set(payslip["installments"])
+            )
+
+    def test_pay_heads_apply(self):
+        data = json.loads(self.per_employee_payslip(self.full_period)["json_data"])
+        self.assertEqual(
+            {allowance["title"] for allowance in data["allowances"]},
+            {"Travel", "Housing", "Female", "Per attendance", "Car loan"},
+        )
+        self.assertEqual(
+            [deduction["title"] for deduction in data["tax_deductions"]],
+            ["Professional tax", "Professional tax"],
+        )
+        self.assertNotIn(
+            "Canteen",
+            [deduction["title"] for deduction in data["post_tax_deductions"]],
+        )
+        self.assertTrue(data["unpaid_days"])
+
+    def test_contract_start_date_is_per_employee(self):
+        batch_payslips = {
+            payslip["employee"].pk: payslip
+            for payslip in compute_payslips(
+                self.employees, self.start_date, self.end_date
+            )
+        }
+        self.assertEqual(
+            batch_payslips[self.mid_period.pk]["start_date"], date(2024, 1, 15)
+        )
+        self.assertEqual(
+            batch_payslips[self.full_period.pk]["start_date"], self.start_date
+        )
+        self.assertNotIn(self.no_contract.pk, batch_payslips)
@@ -57,6 +57,7 @@ from payroll.filters import (
     ReimbursementFilter,
 )
 from payroll.forms import component_forms as forms
+from payroll.methods.batch import PayrollBatch
 from payroll.methods.deductions import create_deductions, update_compensation_deduction
 from payroll.methods.methods import (
     calculate_employer_contribution,
@@ -754,47 +755,50 @@ def generate_payslip(request):
             end_date = form.cleaned_data["end_date"]
 
             group_name = form.cleaned_data["group_name"]
-            for employee in employees:
-                contract = Contract.objects.filter(
-                    employee_id=employee, contract_status="active"
-                ).first()
-                if start_date < contract.contract_start_date:
-                    start_date = contract.contract_start_date
-                payslip = payroll_calculation(employee, start_date, end_date)
-                payslips.append(payslip)
-                json_data.append(payslip["json_data"])
-
-                payslip["payslip"] = payslip
-                data = {}
-                data["employee"] = employee
-                data["group_name"] = group_name
-                data["start_date"] = payslip["start_date"]
-                data["end_date"] = payslip["end_date"]
-                data["status"] = "draft"
-                data["contract_wage"] = payslip["contract_wage"]
-                data["basic_pay"] = payslip["basic_pay"]
-                data["gross_pay"] = payslip["gross_pay"]
-                data["deduction"] = payslip["total_deductions"]
-                data["net_pay"] = payslip["net_pay"]
-                data["pay_data"] = json.loads(payslip["json_data"])
-                calculate_employer_contribution(data)
-                data["installments"] = payslip["installments"]
-                instance = save_payslip(**data)
-                instances.append(instance)
-                notify.send(
-                    request.user.employee_get,
-                    recipient=employee.employee_user_id,
-                    verb="Payslip has been generated for you.",
-                    verb_ar="تم إصدار كشف راتب لك.",
-                    verb_de="Gehaltsabrechnung wurde für Sie erstellt.",
-                    verb_es="Se ha generado la nómina para usted.",
-                    verb_fr="La fiche de paie a été générée pour vous.",
-                    redirect=reverse(
-                        "view-created-payslip", kwargs={"payslip_id": instance.id}
-                    ),
-                    icon="close",
-                )
-            messages.success(request, f"{employees.count()} payslip saved as draft")
+            batch = PayrollBatch(employees, start_date, end_date)
+            with batch.activate():
+                for employee in batch.employees:
+                    contract = batch.contract(employee)
+                    if contract is None:
+                        continue
+                    employee_start_date = max(start_date, contract.contract_start_date)
+                    payslip = payroll_calculation(
+                        employee, employee_start_date, end_date
+                    )
+                    payslips.append(payslip)
+                    json_data.append(payslip["json_data"])
+
+                    payslip["payslip"] = payslip
+                    data = {}
+                    data["employee"] = employee
+                    data["group_name"] = group_name
+                    data["start_date"] = payslip["start_date"]
+                    data["end_date"] = payslip["end_date"]
+                    data["status"] = "draft"
+                    data["contract_wage"] = payslip["contract_wage"]
+                    data["basic_pay"] = payslip["basic_pay"]
+                    data["gross_pay"] = payslip["gross_pay"]
+                    data["deduction"] = payslip["total_deductions"]
+                    data["net_pay"] = payslip["net_pay"]
+                    data["pay_data"] = json.loads(payslip["json_data"])
+                    calculate_employer_contribution(data)
+                    data["installments"] = payslip["installments"]
+                    instance = save_payslip(**data)
+                    instances.append(instance)
+                    notify.send(
+                        request.user.employee_get,
+                        recipient=employee.employee_user_id,
+                        verb="Payslip has been generated for you.",
+                        verb_ar="تم إصدار كشف راتب لك.",
+                        verb_de="Gehaltsabrechnung wurde für Sie erstellt.",
+                        verb_es="Se ha generado la nómina para usted.",
+                        verb_fr="La fiche de paie a été générée pour vous.",
+                        redirect=reverse(
+                            "view-created-payslip", kwargs={"payslip_id": instance.id}
+                        ),
+                        icon="close",
+                    )
+            messages.success(request, f"{len(instances)} payslip saved as draft")
             return redirect(
                 f"/payroll/view-payslip?group_by=group_name&active_group={group_name}"
             )
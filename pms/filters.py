@@ -10,10 +10,12 @@ import datetime
 import django
 import django_filters
 from django import forms
+from django.db.models import Q
 from django_filters import DateFilter
 
 from base.filters import FilterSet
 from base.methods import reload_queryset
+from horilla.search import name_search_q
 from pms.models import (
     AnonymousFeedback,
     BonusPointSetting,
@@ -121,18 +123,14 @@ class ActualObjectiveFilter(FilterSet):
         """
         This method is used to search employees and objective
         """
-        values = value.split(" ")
-        empty = queryset.model.objects.none()
-        for split in values:
-            empty = empty | (
-                queryset.filter(managers__employee_first_name__icontains=split)
-                | queryset.filter(managers__employee_last_name__icontains=split)
-                | queryset.filter(assignees__employee_first_name__icontains=split)
-                | queryset.filter(assignees__employee_last_name__icontains=split)
-                | queryset.filter(title__icontains=split)
+        condition = Q()
+        for split in value.split():
+            condition |= (
+                name_search_q(split, "managers__")
+                | name_search_q(split, "assignees__")
+                | Q(title__icontains=split)
             )
-
-        return empty.distinct()
+        return queryset.filter(condition).distinct()
 
 
 class ObjectiveFilter(CustomFilterSet):
@@ -191,19 +189,12 @@ class ObjectiveFilter(CustomFilterSet):
         """
         This method is used to search in managers and objective
         """
-        values = value.split(" ")
-        empty = queryset.model.objects.none()
-        for split in values:
-            empty = empty | (
-                queryset.filter(objective_id__title__icontains=split)
-                | queryset.filter(
-                    objective_id__managers__employee_first_name__icontains=split
-                )
-                | queryset.filter(
-                    objective_id__managers__employee_last_name__icontains=split
-                )
+        condition = Q()
+        for split in value.split():
+            condition |= Q(objective_id__title__icontains=split) | name_search_q(
+                split, "objective_id__managers__"
             )
-        return empty
+        return queryset.filter(condition).distinct()
 
 
 class FeedbackFilter(CustomFilterSet):
@@ -351,17 +342,12 @@ class EmployeeObjectiveFilter(FilterSet):
         """
         This method is used to search employees and objective
         """
-        values = value.split(" ")
-        empty = queryset.model.objects.none()
-        for split in values:
-            empty = (
-                empty
-                | (queryset.filter(employee_id__employee_first_name__icontains=split))
-                | (queryset.filter(employee_id__employee_last_name__icontains=split))
-                | (queryset.filter(objective__icontains=split))
+        condition = Q()
+        for split in value.split():
+            condition |= name_search_q(split, "employee_id__") | Q(
+                objective__icontains=split
             )
-
-        return empty.distinct()
+        return queryset.filter(condition).distinct()
 
 
 class MeetingsFilter(FilterSet):
@@ -477,16 +463,10 @@ class BonusPointSettingFilter(FilterSet):
         """
         This method is used to search employees and objective
         """
-        values = value.split(" ")
-        empty = queryset.model.objects.none()
-        for split in values:
-            empty = (
-                empty
-                | (queryset.filter(employee_id__employee_first_name__icontains=split))
-                | (queryset.filter(employee_id__employee_last_name__icontains=split))
-            )
-
-        return empty.distinct()
+        condition = Q()
+        for split in value.split():
+            condition |= name_search_q(split, "employee_id__")
+        return queryset.filter(condition).distinct()
 
 
 class EmployeeBonusPointFilter(FilterSet):
@@ -502,13 +482,7 @@ class EmployeeBonusPointFilter(FilterSet):
         """
         This method is used to search employees and objective
         """
-        values = value.split(" ")
-        empty = queryset.model.objects.none()
-        for split in values:
-            empty = (
-                empty
-                | (queryset.filter(employee_id__employee_first_name__icontains=split))
-                | (queryset.filter(employee_id__employee_last_name__icontains=split))
-            )
-
-        return empty.distinct()
+        condition = Q()
+        for split in value.split():
+            condition |= name_search_q(split, "employee_id__")
+        return queryset.filter(condition).distinct()
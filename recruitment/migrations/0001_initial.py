@@ -0,0 +1,547 @@
+# Generated by Django 4.2.23 on 2026-10-17 16:15
+
+from django.conf import settings
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+import horilla.models
+import recruitment.models
+import simple_history.models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('horilla_audit', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('employee', '0001_initial'),
+        ('base', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Candidate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('name', models.CharField(max_length=100, null=True, verbose_name='Name')),
+                ('profile', models.ImageField(null=True, upload_to=horilla.models.upload_path)),
+                ('portfolio', models.URLField(blank=True)),
+                ('schedule_date', models.DateTimeField(blank=True, null=True, verbose_name='Schedule date')),
+                ('email', models.EmailField(max_length=254, verbose_name='Email')),
+                ('mobile', models.CharField(blank=True, max_length=15, validators=[recruitment.models.validate_mobile], verbose_name='Mobile')),
+                ('resume', models.FileField(upload_to=horilla.models.upload_path, validators=[recruitment.models.validate_pdf])),
+                ('address', models.TextField(blank=True, max_length=255, null=True, verbose_name='Address')),
+                ('country', models.CharField(blank=True, max_length=30, null=True, verbose_name='Country')),
+                ('dob', models.DateField(blank=True, null=True, verbose_name='Date of Birth')),
+                ('state', models.CharField(blank=True, max_length=30, null=True, verbose_name='State')),
+                ('city', models.CharField(blank=True, max_length=30, null=True, verbose_name='City')),
+                ('zip', models.CharField(blank=True, max_length=30, null=True, verbose_name='Zip Code')),
+                ('gender', models.CharField(choices=[('male', 'Male'), ('female', 'Female'), ('other', 'Other')], default='male', max_length=15, null=True, verbose_name='Gender')),
+                ('source', models.CharField(blank=True, choices=[('application', 'Application Form'), ('software', 'Inside software'), ('other', 'Other')], max_length=20, null=True, verbose_name='Source')),
+                ('start_onboard', models.BooleanField(default=False, verbose_name='Start Onboard')),
+                ('hired', models.BooleanField(default=False, verbose_name='Hired')),
+                ('canceled', models.BooleanField(default=False, verbose_name='Canceled')),
+                ('converted', models.BooleanField(default=False, verbose_name='Converted')),
+                ('joining_date', models.DateField(blank=True, null=True, verbose_name='Joining Date')),
+                ('sequence', models.IntegerField(default=0, null=True)),
+                ('probation_end', models.DateField(editable=False, null=True)),
+                ('offer_letter_status', models.CharField(choices=[('not_sent', 'Not Sent'), ('sent', 'Sent'), ('accepted', 'Accepted'), ('rejected', 'Rejected'), ('joined', 'Joined')], default='not_sent', editable=False, max_length=10, verbose_name='Offer Letter Status')),
+                ('last_updated', models.DateField(auto_now=True, null=True)),
+                ('hired_date', models.DateField(blank=True, editable=False, null=True)),
+                ('converted_employee_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='candidate_get', to='employee.employee', verbose_name='Employee')),
+                ('created_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('job_position_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to='base.jobposition', verbose_name='Job Position')),
+                ('modified_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+            ],
+            options={
+                'verbose_name': 'Candidate',
+                'verbose_name_plural': 'Candidates',
+                'ordering': ['sequence'],
+                'permissions': (('view_history', 'View Candidate History'), ('archive_candidate', 'Archive Candidate')),
+            },
+        ),
+        migrations.CreateModel(
+            name='LinkedInAccount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('username', models.CharField(max_length=250, verbose_name='App Name')),
+                ('email', models.EmailField(max_length=254, verbose_name='Email')),
+                ('api_token', models.CharField(max_length=500, verbose_name='API Token')),
+                ('sub_id', models.CharField(max_length=250, unique=True)),
+                ('company_id', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, to='base.company', verbose_name='Company')),
+                ('created_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('modified_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+            ],
+            options={
+                'verbose_name': 'LinkedIn Account',
+                'verbose_name_plural': 'LinkedIn Accounts',
+            },
+        ),
+        migrations.CreateModel(
+            name='Recruitment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('title', models.CharField(blank=True, max_length=50, null=True, verbose_name='Title')),
+                ('description', models.TextField(null=True, verbose_name='Description')),
+                ('is_event_based', models.BooleanField(default=False, help_text='To start recruitment for multiple job positions')),
+                ('closed', models.BooleanField(default=False, help_text='To close the recruitment, If closed then not visible on pipeline view.', verbose_name='Closed')),
+                ('is_published', models.BooleanField(default=True, help_text='To publish a recruitment in website, if false then it             will not appear on open recruitment page.', verbose_name='Is Published')),
+                ('vacancy', models.IntegerField(default=0, null=True, verbose_name='Vacancy')),
+                ('start_date', models.DateField(default=django.utils.timezone.now, verbose_name='Start Date')),
+                ('end_date', models.DateField(blank=True, null=True, verbose_name='End Date')),
+                ('linkedin_post_id', models.CharField(blank=True, max_length=150, null=True)),
+                ('publish_in_linkedin', models.BooleanField(default=True, help_text='To publish a recruitment in Linkedin, if active is false then it             will not post on LinkedIn.', verbose_name='Post on LinkedIn')),
+                ('optional_profile_image', models.BooleanField(default=False, help_text='Profile image not mandatory for candidate creation', verbose_name='Optional Profile Image')),
+                ('optional_resume', models.BooleanField(default=False, help_text='Resume not mandatory for candidate creation', verbose_name='Optional Resume')),
+                ('company_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to='base.company', verbose_name='Company')),
+                ('created_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('job_position_id', models.ForeignKey(blank=True, db_constraint=False, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='recruitment', to='base.jobposition', verbose_name='Job Position')),
+                ('linkedin_account_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, to='recruitment.linkedinaccount', verbose_name='LinkedIn Account')),
+                ('modified_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+                ('open_positions', models.ManyToManyField(blank=True, related_name='open_positions', to='base.jobposition', verbose_name='Job Position')),
+                ('recruitment_managers', models.ManyToManyField(to='employee.employee', verbose_name='Managers')),
+            ],
+            options={
+                'verbose_name': 'Recruitment',
+                'verbose_name_plural': 'Recruitments',
+                'permissions': (('archive_recruitment', 'Archive Recruitment'),),
+            },
+        ),
+        migrations.CreateModel(
+            name='SkillZone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('title', models.CharField(max_length=50, verbose_name='Skill Zone')),
+                ('description', models.TextField(max_length=255, verbose_name='Description')),
+                ('company_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='base.company', verbose_name='Company')),
+                ('created_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('modified_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+            ],
+            options={
+                'verbose_name': 'Skill Zone',
+                'verbose_name_plural': 'Skill Zones',
+            },
+        ),
+        migrations.CreateModel(
+            name='Stage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('stage', models.CharField(max_length=50, verbose_name='Stage')),
+                ('stage_type', models.CharField(choices=[('initial', 'Initial'), ('applied', 'Applied'), ('test', 'Test'), ('interview', 'Interview'), ('cancelled', 'Cancelled'), ('hired', 'Hired')], default='interview', max_length=20, verbose_name='Stage Type')),
+                ('sequence', models.IntegerField(default=0, null=True)),
+                ('created_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('modified_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+                ('recruitment_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stage_set', to='recruitment.recruitment', verbose_name='Recruitment')),
+                ('stage_managers', models.ManyToManyField(to='employee.employee', verbose_name='Stage Managers')),
+            ],
+            options={
+                'verbose_name': 'Stage',
+                'verbose_name_plural': 'Stages',
+                'ordering': ['sequence'],
+                'permissions': (('archive_Stage', 'Archive Stage'),),
+                'unique_together': {('recruitment_id', 'stage')},
+            },
+        ),
+        migrations.CreateModel(
+            name='StageFiles',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('files', models.FileField(blank=True, null=True, upload_to=horilla.models.upload_path)),
+                ('created_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('modified_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='SurveyTemplate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('title', models.CharField(max_length=50, unique=True)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('is_general_template', models.BooleanField(default=False, editable=False)),
+                ('company_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='base.company', verbose_name='Company')),
+                ('created_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('modified_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+            ],
+            options={
+                'verbose_name': 'Survey Template',
+                'verbose_name_plural': 'Survey Templates',
+            },
+        ),
+        migrations.CreateModel(
+            name='StageNote',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('description', models.TextField(verbose_name='Description')),
+                ('candidate_can_view', models.BooleanField(default=False)),
+                ('candidate_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='recruitment.candidate')),
+                ('created_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('modified_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+                ('stage_files', models.ManyToManyField(blank=True, to='recruitment.stagefiles')),
+                ('stage_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='recruitment.stage')),
+                ('updated_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='employee.employee')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='SkillZoneCandidate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('reason', models.CharField(max_length=200, verbose_name='Reason')),
+                ('added_on', models.DateField(auto_now_add=True)),
+                ('candidate_id', models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='skillzonecandidate_set', to='recruitment.candidate', verbose_name='Candidate')),
+                ('created_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('modified_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+                ('skill_zone_id', models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='skillzonecandidate_set', to='recruitment.skillzone', verbose_name='Skill Zone')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('title', models.CharField(max_length=100)),
+                ('created_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('modified_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+            ],
+            options={
+                'verbose_name': 'Skill',
+                'verbose_name_plural': 'Skills',
+            },
+        ),
+        migrations.CreateModel(
+            name='Resume',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('file', models.FileField(upload_to=horilla.models.upload_path, validators=[recruitment.models.validate_pdf])),
+                ('is_candidate', models.BooleanField(default=False)),
+                ('recruitment_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='resume', to='recruitment.recruitment')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RejectReason',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('title', models.CharField(max_length=50)),
+                ('description', models.TextField(blank=True, max_length=255, null=True)),
+                ('company_id', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='base.company', verbose_name='Company')),
+                ('created_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('modified_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+            ],
+            options={
+                'verbose_name': 'Reject Reason',
+                'verbose_name_plural': 'Reject Reasons',
+            },
+        ),
+        migrations.CreateModel(
+            name='RejectedCandidate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('description', models.TextField(max_length=255)),
+                ('candidate_id', models.OneToOneField(on_delete=django.db.models.deletion.PROTECT, related_name='rejected_candidate', to='recruitment.candidate', verbose_name='Candidate')),
+                ('created_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('modified_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+                ('reject_reason_id', models.ManyToManyField(blank=True, to='recruitment.rejectreason', verbose_name='Reject reason')),
+            ],
+            options={
+                'verbose_name': 'Rejected Candidate',
+                'verbose_name_plural': 'Rejected Candidates',
+            },
+        ),
+        migrations.CreateModel(
+            name='RecruitmentSurveyAnswer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('answer_json', models.JSONField()),
+                ('attachment', models.FileField(blank=True, null=True, upload_to=horilla.models.upload_path)),
+                ('candidate_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='recruitment.candidate')),
+                ('created_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('job_position_id', models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, to='base.jobposition', verbose_name='Job Position')),
+                ('modified_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+                ('recruitment_id', models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, to='recruitment.recruitment', verbose_name='Recruitment')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='RecruitmentSurvey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('is_mandatory', models.BooleanField(default=False)),
+                ('question', models.TextField()),
+                ('sequence', models.IntegerField(default=0, null=True)),
+                ('type', models.CharField(choices=[('checkbox', 'Yes/No'), ('options', 'Choices'), ('multiple', 'Multiple Choice'), ('text', 'Text'), ('number', 'Number'), ('percentage', 'Percentage'), ('date', 'Date'), ('textarea', 'Textarea'), ('file', 'File Upload'), ('rating', 'Rating')], max_length=15)),
+                ('options', models.TextField(default='', help_text="Separate choices by ',  '", max_length=255, null=True)),
+                ('created_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('job_position_ids', models.ManyToManyField(editable=False, to='base.jobposition', verbose_name='Job Positions')),
+                ('modified_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+                ('recruitment_ids', models.ManyToManyField(to='recruitment.recruitment', verbose_name='Recruitment')),
+                ('template_id', models.ManyToManyField(blank=True, to='recruitment.surveytemplate', verbose_name='Template')),
+            ],
+            options={
+                'ordering': ['sequence'],
+            },
+        ),
+        migrations.CreateModel(
+            name='RecruitmentGeneralSetting',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('candidate_self_tracking', models.BooleanField(default=False)),
+                ('show_overall_rating', models.BooleanField(default=False)),
+                ('company_id', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, to='base.company')),
+                ('created_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('modified_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='recruitment',
+            name='skills',
+            field=models.ManyToManyField(blank=True, to='recruitment.skill', verbose_name='Skills'),
+        ),
+        migrations.AddField(
+            model_name='recruitment',
+            name='survey_templates',
+            field=models.ManyToManyField(blank=True, to='recruitment.surveytemplate', verbose_name='Survey Templates'),
+        ),
+        migrations.CreateModel(
+            name='QuestionOrdering',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('sequence', models.IntegerField(default=0)),
+                ('created_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('modified_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+                ('question_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='recruitment.recruitmentsurvey')),
+                ('recruitment_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='recruitment.recruitment')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='InterviewSchedule',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('interview_date', models.DateField(verbose_name='Interview Date')),
+                ('interview_time', models.TimeField(verbose_name='Interview Time')),
+                ('description', models.TextField(blank=True, verbose_name='Description')),
+                ('completed', models.BooleanField(default=False, verbose_name='Is Interview Completed')),
+                ('candidate_id', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='candidate_interview', to='recruitment.candidate', verbose_name='Candidate')),
+                ('created_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('employee_id', models.ManyToManyField(to='employee.employee', verbose_name='Interviewer')),
+                ('modified_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+            ],
+            options={
+                'verbose_name': 'Schedule Interview',
+                'verbose_name_plural': 'Schedule Interviews',
+            },
+        ),
+        migrations.CreateModel(
+            name='HistoricalRejectedCandidate',
+            fields=[
+                ('id', models.BigIntegerField(auto_created=True, blank=True, db_index=True, verbose_name='ID')),
+                ('created_at', models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('history_title', models.CharField(blank=True, max_length=20, null=True)),
+                ('history_description', models.TextField(null=True)),
+                ('history_highlight', models.BooleanField(default=False, null=True)),
+                ('description', models.TextField(max_length=255)),
+                ('history_id', models.AutoField(primary_key=True, serialize=False)),
+                ('history_date', models.DateTimeField(db_index=True)),
+                ('history_change_reason', models.CharField(max_length=100, null=True)),
+                ('history_type', models.CharField(choices=[('+', 'Created'), ('~', 'Changed'), ('-', 'Deleted')], max_length=1)),
+                ('candidate_id', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='recruitment.candidate', verbose_name='Candidate')),
+                ('created_by', models.ForeignKey(blank=True, db_constraint=False, editable=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('history_relation', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='history_set', to='recruitment.rejectedcandidate')),
+                ('history_tags', models.ManyToManyField(to='horilla_audit.audittag')),
+                ('history_user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('modified_by', models.ForeignKey(blank=True, db_constraint=False, editable=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+            ],
+            options={
+                'verbose_name': 'historical Rejected Candidate',
+                'verbose_name_plural': 'historical Rejected Candidates',
+                'ordering': ('-history_date', '-history_id'),
+                'get_latest_by': ('history_date', 'history_id'),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name='HistoricalCandidate',
+            fields=[
+                ('id', models.BigIntegerField(auto_created=True, blank=True, db_index=True, verbose_name='ID')),
+                ('created_at', models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('history_title', models.CharField(blank=True, max_length=20, null=True)),
+                ('history_description', models.TextField(null=True)),
+                ('history_highlight', models.BooleanField(default=False, null=True)),
+                ('name', models.CharField(max_length=100, null=True, verbose_name='Name')),
+                ('profile', models.TextField(max_length=100, null=True)),
+                ('portfolio', models.URLField(blank=True)),
+                ('schedule_date', models.DateTimeField(blank=True, null=True, verbose_name='Schedule date')),
+                ('email', models.EmailField(max_length=254, verbose_name='Email')),
+                ('mobile', models.CharField(blank=True, max_length=15, validators=[recruitment.models.validate_mobile], verbose_name='Mobile')),
+                ('resume', models.TextField(max_length=100, validators=[recruitment.models.validate_pdf])),
+                ('address', models.TextField(blank=True, max_length=255, null=True, verbose_name='Address')),
+                ('country', models.CharField(blank=True, max_length=30, null=True, verbose_name='Country')),
+                ('dob', models.DateField(blank=True, null=True, verbose_name='Date of Birth')),
+                ('state', models.CharField(blank=True, max_length=30, null=True, verbose_name='State')),
+                ('city', models.CharField(blank=True, max_length=30, null=True, verbose_name='City')),
+                ('zip', models.CharField(blank=True, max_length=30, null=True, verbose_name='Zip Code')),
+                ('gender', models.CharField(choices=[('male', 'Male'), ('female', 'Female'), ('other', 'Other')], default='male', max_length=15, null=True, verbose_name='Gender')),
+                ('source', models.CharField(blank=True, choices=[('application', 'Application Form'), ('software', 'Inside software'), ('other', 'Other')], max_length=20, null=True, verbose_name='Source')),
+                ('start_onboard', models.BooleanField(default=False, verbose_name='Start Onboard')),
+                ('hired', models.BooleanField(default=False, verbose_name='Hired')),
+                ('canceled', models.BooleanField(default=False, verbose_name='Canceled')),
+                ('converted', models.BooleanField(default=False, verbose_name='Converted')),
+                ('joining_date', models.DateField(blank=True, null=True, verbose_name='Joining Date')),
+                ('sequence', models.IntegerField(default=0, null=True)),
+                ('probation_end', models.DateField(editable=False, null=True)),
+                ('offer_letter_status', models.CharField(choices=[('not_sent', 'Not Sent'), ('sent', 'Sent'), ('accepted', 'Accepted'), ('rejected', 'Rejected'), ('joined', 'Joined')], default='not_sent', editable=False, max_length=10, verbose_name='Offer Letter Status')),
+                ('last_updated', models.DateField(blank=True, editable=False, null=True)),
+                ('hired_date', models.DateField(blank=True, editable=False, null=True)),
+                ('history_id', models.AutoField(primary_key=True, serialize=False)),
+                ('history_date', models.DateTimeField(db_index=True)),
+                ('history_change_reason', models.CharField(max_length=100, null=True)),
+                ('history_type', models.CharField(choices=[('+', 'Created'), ('~', 'Changed'), ('-', 'Deleted')], max_length=1)),
+                ('converted_employee_id', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='employee.employee', verbose_name='Employee')),
+                ('created_by', models.ForeignKey(blank=True, db_constraint=False, editable=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('history_relation', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='history_set', to='recruitment.candidate')),
+                ('history_tags', models.ManyToManyField(to='horilla_audit.audittag')),
+                ('history_user', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('job_position_id', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='base.jobposition', verbose_name='Job Position')),
+                ('modified_by', models.ForeignKey(blank=True, db_constraint=False, editable=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+                ('recruitment_id', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='recruitment.recruitment', verbose_name='Recruitment')),
+                ('referral', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='employee.employee', verbose_name='Referral')),
+                ('stage_id', models.ForeignKey(blank=True, db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='recruitment.stage', verbose_name='Stage')),
+            ],
+            options={
+                'verbose_name': 'historical Candidate',
+                'verbose_name_plural': 'historical Candidates',
+                'ordering': ('-history_date', '-history_id'),
+                'get_latest_by': ('history_date', 'history_id'),
+            },
+            bases=(simple_history.models.HistoricalChanges, models.Model),
+        ),
+        migrations.CreateModel(
+            name='CandidateDocumentRequest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('title', models.CharField(max_length=100)),
+                ('format', models.CharField(choices=[('any', 'Any'), ('pdf', 'PDF'), ('txt', 'TXT'), ('docx', 'DOCX'), ('xlsx', 'XLSX'), ('jpg', 'JPG'), ('png', 'PNG'), ('jpeg', 'JPEG')], max_length=10)),
+                ('max_size', models.IntegerField(blank=True, null=True)),
+                ('description', models.TextField(blank=True, null=True)),
+                ('candidate_id', models.ManyToManyField(to='recruitment.candidate')),
+                ('created_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('modified_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='CandidateDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('title', models.CharField(max_length=250)),
+                ('document', models.FileField(null=True, upload_to=horilla.models.upload_path)),
+                ('status', models.CharField(choices=[('requested', 'Requested'), ('approved', 'Approved'), ('rejected', 'Rejected')], default='requested', max_length=10)),
+                ('reject_reason', models.TextField(blank=True, max_length=255, null=True)),
+                ('candidate_id', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='recruitment.candidate', verbose_name='Candidate')),
+                ('created_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('document_request_id', models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, to='recruitment.candidatedocumentrequest')),
+                ('modified_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+        migrations.AddField(
+            model_name='candidate',
+            name='recruitment_id',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='candidate', to='recruitment.recruitment', verbose_name='Recruitment'),
+        ),
+        migrations.AddField(
+            model_name='candidate',
+            name='referral',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='candidate_referral', to='employee.employee', verbose_name='Referral'),
+        ),
+        migrations.AddField(
+            model_name='candidate',
+            name='stage_id',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, to='recruitment.stage', verbose_name='Stage'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='recruitment',
+            unique_together={('job_position_id', 'start_date', 'company_id'), ('job_position_id', 'start_date')},
+        ),
+        migrations.CreateModel(
+            name='CandidateRating',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True, null=True, verbose_name='Created At')),
+                ('is_active', models.BooleanField(default=True, verbose_name='Is Active')),
+                ('rating', models.IntegerField(validators=[django.core.validators.MinValueValidator(0), django.core.validators.MaxValueValidator(5)])),
+                ('candidate_id', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='candidate_rating', to='recruitment.candidate')),
+                ('created_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL, verbose_name='Created By')),
+                ('employee_id', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='candidate_rating', to='employee.employee')),
+                ('modified_by', models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='%(class)s_modified_by', to=settings.AUTH_USER_MODEL, verbose_name='Modified By')),
+            ],
+            options={
+                'unique_together': {('employee_id', 'candidate_id')},
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='candidate',
+            unique_together={('email', 'recruitment_id')},
+        ),
+    ]
@@ -1012,10 +1012,36 @@ class Resume(models.Model):
         Recruitment, on_delete=models.CASCADE, related_name="resume"
     )
     is_candidate = models.BooleanField(default=False)
+    text_info = models.JSONField(null=True, editable=False)
+    token_count = models.PositiveIntegerField(null=True, editable=False)
 
     def __str__(self):
         return f"{self.recruitment_id} - Resume {self.pk}"
 
+    def is_indexed(self):
+        """
+        Whether the resume text has been extracted and indexed
+        """
+        return self.token_count is not None
+
+
+class ResumeToken(models.Model):
+    """
+    Number of occurrences of a word in a resume, the inverted index the
+    resumes are ranked with
+    """
+
+    resume = models.ForeignKey(Resume, on_delete=models.CASCADE, related_name="tokens")
+    token = models.CharField(max_length=100)
+    count = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        unique_together = ("resume", "token")
+        indexes = [models.Index(fields=["token", "resume"])]
+
+    def __str__(self):
+        return f"{self.resume_id} - {self.token}"
+
 
 STATUS = [
     ("requested", "Requested"),
@@ -0,0 +1,212 @@
+"""
+resume_index.py
+
+Resume text index and skill matching.
+
+A resume PDF is parsed once, when it is uploaded: the text spans with their
+font information (read by `extract_info`) are stored on the resume, and the
+number of occurrences of every word is stored as `ResumeToken` rows. The
+resumes of a recruitment are then ranked against its skills with one indexed
+query and BM25 scoring, without opening the PDF files again.
+"""
+
+import hashlib
+import math
+import re
+from collections import Counter, defaultdict
+
+import fitz  # type: ignore
+from django.core.cache import cache
+from django.db import transaction
+
+from recruitment.models import ResumeToken
+
+WORD_PATTERN = re.compile(r"\b\w+\b")
+TOKEN_MAX_LENGTH = 100
+TEXT_INFO_CACHE_TIMEOUT = 60 * 60
+
+# BM25 term frequency saturation and document length normalization
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text):
+    """
+    Lower cased words of the text
+    """
+    return WORD_PATTERN.findall(text.lower())
+
+
+def parse_pdf(pdf_bytes):
+    """
+    Read the text spans with their font information and the words of a PDF.
+
+    Returns:
+        tuple: (list of {"text", "font_size", "capitalization"}, list of words)
+    """
+    text_info = []
+    words = []
+    with fitz.open("pdf", pdf_bytes) as document:
+        for page in document:
+            words.extend(tokenize(page.get_text()))
+            for block in page.get_text("dict")["blocks"]:
+                for line in block.get("lines", []):
+                    for span in line["spans"]:
+                        if not span["text"]:
+                            continue
+                        text_info.append(
+                            {
+                                "text": span["text"],
+                                "font_size": span["size"],
+                                "capitalization": sum(
+                                    1 for c in span["text"] if c.isupper()
+                                )
+                                / len(span["text"]),
+                            }
+                        )
+    return text_info, words
+
+
+def read_file(file):
+    """
+    Content of an uploaded or stored file
+    """
+    if getattr(file, "closed", False) and hasattr(file, "open"):
+        file.open("rb")
+    file.seek(0)
+    content = file.read()
+    file.seek(0)
+    return content
+
+
+def pdf_text_info(file):
+    """
+    Text spans of an uploaded PDF, cached by the file content so a resume is
+    not parsed again when it is uploaded again
+    """
+    pdf_bytes = read_file(file)
+    cache_key = f"resume_text_info_{hashlib.sha256(pdf_bytes).hexdigest()}"
+    text_info = cache.get(cache_key)
+    if text_info is None:
+        text_info, _words = parse_pdf(pdf_bytes)
+        cache.set(cache_key, text_info, TEXT_INFO_CACHE_TIMEOUT)
+    return text_info
+
+
+def index_resume(resume):
+    """
+    Parse the resume PDF and store its text spans and word counts
+    """
+    try:
+        text_info, words = parse_pdf(read_file(resume.file))
+    except Exception:
+        # Not a readable PDF, ranked like a PDF without text
+        text_info, words = [], []
+    counts = Counter(word for word in words if len(word) <= TOKEN_MAX_LENGTH)
+    with transaction.atomic():
+        ResumeToken.objects.filter(resume=resume).delete()
+        ResumeToken.objects.bulk_create(
+            [
+                ResumeToken(resume=resume, token=token, count=count)
+                for token, count in counts.items()
+            ],
+            batch_size=1000,
+            ignore_conflicts=True,
+        )
+        resume.text_info = text_info
+        resume.token_count = len(words)
+        resume.save(update_fields=["text_info", "token_count"])
+    return resume
+
+
+def index_resumes(resumes):
+    """
+    Index the resumes that are not indexed yet
+    """
+    for resume in resumes:
+        if not resume.is_indexed():
+            index_resume(resume)
+
+
+def resume_text_info(resume):
+    """
+    Text spans of a stored resume, indexing it if needed
+    """
+    if not resume.is_indexed():
+        index_resume(resume)
+    return resume.text_info
+
+
+def rank_resumes(recruitment):
+    """
+    Rank the resumes of the recruitment against its skills with BM25.
+
+    A skill matches a resume when every word of the skill is in the resume.
+
+    Returns:
+        list: {"resume", "score", "matching_skills_count", "image_pdf"} dicts,
+        best score first
+    """
+    resumes = list(recruitment.resume.all())
+    index_resumes(resumes)
+    skills = [
+        terms
+        for terms in (
+            tokenize(title)
+            for title in recruitment.skills.values_list("title", flat=True)
+        )
+        if terms
+    ]
+    terms = {term for skill in skills for term in skill}
+
+    frequencies = defaultdict(dict)
+    for resume_id, token, count in ResumeToken.objects.filter(
+        resume__recruitment_id=recruitment.pk, token__in=terms
+    ).values_list("resume_id", "token", "count"):
+        frequencies[resume_id][token] = count
+
+    documents = len(resumes)
+    average_length = (
+        sum(resume.token_count for resume in resumes) / documents if documents else 0
+    )
+    document_frequency = Counter(
+        token for tokens in frequencies.values() for token in tokens
+    )
+    idf = {
+        term: math.log(
+            1
+            + (documents - document_frequency[term] + 0.5)
+            / (document_frequency[term] + 0.5)
+        )
+        for term in terms
+    }
+
+    ranks = []
+    for resume in resumes:
+        tokens = frequencies.get(resume.pk, {})
+        length_norm = BM25_K1 * (
+            1 - BM25_B + BM25_B * resume.token_count / (average_length or 1)
+        )
+        score = 0
+        matching_skills_count = 0
+        for skill in skills:
+            if all(term in tokens for term in skill):
+                matching_skills_count += 1
+            for term in skill:
+                frequency = tokens.get(term, 0)
+                score += (
+                    idf[term] * frequency * (BM25_K1 + 1) / (frequency + length_norm)
+                )
+        item = {
+            "resume": resume,
+            "score": round(score, 2),
+            "matching_skills_count": matching_skills_count,
+        }
+        if not resume.token_count:
+            item["image_pdf"] = True
+        ranks.append(item)
+    return sorted(
+        ranks,
+        key=lambda item: (item["score"], item["matching_skills_count"]),
+        reverse=True,
+    )
@@ -0,0 +1,31 @@
+"""
+threading.py
+
+This module is used to run recruitment tasks in the background
+"""
+
+from threading import Thread
+
+from django.db import connection
+
+
+class ResumeIndexThread(Thread):
+    """
+    Parse and index uploaded resumes in the background
+    """
+
+    def __init__(self, resume_ids):
+        Thread.__init__(self)
+        self.resume_ids = resume_ids
+
+    def run(self) -> None:
+        from recruitment.models import Resume
+        from recruitment.resume_index import index_resumes
+
+        super().run()
+        try:
+            index_resumes(
+                Resume.objects.filter(id__in=self.resume_ids, token_count__isnull=True)
+            )
+        finally:
+            connection.close()
@@ -13,7 +13,6 @@ provide the main entry points for interacting with the application's functionali
 
 import ast
 import contextlib
-import io
 import json
 import os
 import random
@@ -22,7 +21,6 @@ from datetime import date, datetime
 from itertools import chain
 from urllib.parse import parse_qs
 
-import fitz  # type: ignore
 from django import template
 from django.conf import settings
 from django.contrib import messages
@@ -119,6 +117,8 @@ from recruitment.models import (
     StageFiles,
     StageNote,
 )
+from recruitment.resume_index import pdf_text_info, rank_resumes, resume_text_info
+from recruitment.threading import ResumeIndexThread
 from recruitment.views.linkedin import delete_post, post_recruitment_in_linkedin
 from recruitment.views.paginator_qry import paginator_qry
 
@@ -2852,32 +2852,7 @@ def extract_text_with_font_info(pdf):
     Args:
         pdf (): pdf file to extract text from
     """
-    pdf_bytes = pdf.read()
-    pdf_doc = io.BytesIO(pdf_bytes)
-    doc = fitz.open("pdf", pdf_doc)
-    text_info = []
-
-    for page_num in range(len(doc)):
-        page = doc[page_num]
-        blocks = page.get_text("dict")["blocks"]
-        for block in blocks:
-            try:
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        text_info.append(
-                            {
-                                "text": span["text"],
-                                "font_size": span["size"],
-                                "capitalization": sum(
-                                    1 for c in span["text"] if c.isupper()
-                                )
-                                / len(span["text"]),
-                            }
-                        )
-            except:
-                pass
-
-    return text_info
+    return pdf_text_info(pdf)
 
 
 def rank_text(text_info):
@@ -2925,14 +2900,16 @@ def dob_matching(dob):
     return dob
 
 
-def extract_info(pdf):
+def extract_info(pdf, text_info=None):
     """
     This method creates the contact information dictionary from the provided pdf file
     Args:
         pdf_file: pdf file
+        text_info: text spans of the pdf already extracted, if any
     """
 
-    text_info = extract_text_with_font_info(pdf)
+    if text_info is None:
+        text_info = extract_text_with_font_info(pdf)
     ranked_text = rank_text(text_info)
 
     phone_pattern = re.compile(r"\b\+?\d{1,2}\s?\d{9,10}\b")
@@ -3121,11 +3098,14 @@ def add_bulk_resumes(request):
     recruitment = Recruitment.objects.get(id=rec_id)
     if request.method == "POST":
         files = request.FILES.getlist("files")
+        resume_ids = []
         for file in files:
-            Resume.objects.create(
+            resume = Resume.objects.create(
                 file=file,
                 recruitment_id=recruitment,
             )
+            resume_ids.append(resume.pk)
+        ResumeIndexThread(resume_ids).start()
 
         url = reverse("view-bulk-resume")
         query_params = f"?rec_id={rec_id}"
@@ -3150,30 +3130,6 @@ def delete_resume_file(request):
     return redirect(f"{url}{query_params}")
 
 
-def extract_words_from_pdf(pdf_file):
-    """
-    This method is used to extract the words from the pdf file into a list.
-    Args:
-        pdf_file: pdf file
-
-    """
-    pdf_document = fitz.open(pdf_file.path)
-
-    words = []
-
-    for page_num in range(len(pdf_document)):
-        page = pdf_document.load_page(page_num)
-        page_text = page.get_text()
-
-        page_words = re.findall(r"\b\w+\b", page_text.lower())
-
-        words.extend(page_words)
-
-    pdf_document.close()
-
-    return words
-
-
 @login_required
 @hx_request_required
 @manager_can_enter("recruitment.add_candidate")
@@ -3186,36 +3142,13 @@ def matching_resumes(request, rec_id):
 
     """
     recruitment = Recruitment.objects.filter(id=rec_id).first()
-    skills = recruitment.skills.values_list("title", flat=True)
-    resumes = recruitment.resume.all()
-    is_candidate = resumes.filter(is_candidate=True)
-    is_candidate_ids = set(is_candidate.values_list("id", flat=True))
-
-    resume_ranks = []
-    for resume in resumes:
-        words = extract_words_from_pdf(resume.file)
-        matching_skills_count = sum(skill.lower() in words for skill in skills)
-
-        item = {"resume": resume, "matching_skills_count": matching_skills_count}
-        if not len(words):
-            item["image_pdf"] = True
+    resume_ranks = rank_resumes(recruitment)
 
-        resume_ranks.append(item)
-
-    candidate_resumes = [
-        rank for rank in resume_ranks if rank["resume"].id in is_candidate_ids
-    ]
+    candidate_resumes = [rank for rank in resume_ranks if rank["resume"].is_candidate]
     non_candidate_resumes = [
-        rank for rank in resume_ranks if rank["resume"].id not in is_candidate_ids
+        rank for rank in resume_ranks if not rank["resume"].is_candidate
     ]
 
-    non_candidate_resumes = sorted(
-        non_candidate_resumes, key=lambda x: x["matching_skills_count"], reverse=True
-    )
-    candidate_resumes = sorted(
-        candidate_resumes, key=lambda x: x["matching_skills_count"], reverse=True
-    )
-
     ranked_resumes = non_candidate_resumes + candidate_resumes
 
     return render(
@@ -3237,7 +3170,7 @@ def matching_resume_completion(request):
     resume_id = request.GET.get("resume_id")
     resume_obj = get_object_or_404(Resume, id=resume_id)
     resume_file = resume_obj.file
-    contact_info = extract_info(resume_file)
+    contact_info = extract_info(resume_file, resume_text_info(resume_obj))
 
     return JsonResponse(contact_info)
 